@@ -0,0 +1,156 @@
+"""Synthetic benchmark corpus.
+
+Generates deterministic HTML pages that look like real article pages: a large
+navigation menu, cookie banner, sidebars, inline scripts and styles and a
+footer full of links around the article body, which mixes headings,
+paragraphs, lists and data tables. Pages are padded with further article
+sections until they reach the requested size, so the same seed always yields
+the same bytes.
+
+Usage:
+    python -m benchmarks.corpus --output corpus/ [--sizes 1KB 64KB 1MB]
+"""
+
+import argparse
+import random
+from pathlib import Path
+
+DEFAULT_SIZES = ("1KB", "16KB", "128KB", "1MB", "5MB")
+DEFAULT_SEED = 1234
+
+_UNITS = {"KB": 1024, "MB": 1024 * 1024}
+_MAX_NAV_LINKS = 40
+_LIST_PROBABILITY = 0.5
+_TABLE_PROBABILITY = 0.4
+
+_VOCABULARY = """
+the of and to in is that for it as was with be by on not he this are or his from at which but have an they you
+were her all she there would their we him been has when who will more no if out so said what up its about into
+than them can only other new some could time these two may then do first any my now such like our over man me
+even most made after also did many before must through back years where much your way well down should because
+each just those people how too little state good very make world still own see men work long get here between
+both life being under never day same another know while last might us great old year off come since against go
+came right used take three system data network server performance latency throughput request page content
+extraction engine parser document market policy research report analysis growth quarter revenue
+"""
+_WORDS = tuple(_VOCABULARY.split())
+
+_STYLE = """<style>
+body{font-family:Helvetica,Arial,sans-serif;margin:0;padding:0;color:#222}
+.nav a{display:inline-block;padding:4px 8px}.sidebar{float:right;width:25%}
+.cookie{position:fixed;bottom:0;background:#eee}.footer{font-size:small}
+table{border-collapse:collapse}td,th{border:1px solid #ccc;padding:2px 6px}
+</style>"""
+
+_SCRIPT = """<script>
+window.dataLayer=window.dataLayer||[];function gtag(){dataLayer.push(arguments);}
+gtag('js',new Date());gtag('config','UA-000000-1');
+document.addEventListener('DOMContentLoaded',function(){var b=document.querySelector('.cookie');
+if(localStorage.getItem('consent')){b.style.display='none';}});
+</script>"""
+
+
+def parse_size(value: str) -> int:
+    """Parse a size such as ``1KB``, ``5MB`` or ``2048`` into bytes."""
+    text = value.strip().upper()
+    for unit, factor in _UNITS.items():
+        if text.endswith(unit):
+            return int(float(text[: -len(unit)]) * factor)
+    return int(text.removesuffix("B"))
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _paragraph(rng: random.Random) -> str:
+    return "<p>" + " ".join(_sentence(rng, rng.randint(8, 24)) for _ in range(rng.randint(3, 7))) + "</p>"
+
+
+def _table(rng: random.Random) -> str:
+    columns = rng.randint(3, 6)
+    header = "".join(f"<th>{rng.choice(_WORDS).title()}</th>" for _ in range(columns))
+    rows = "".join(
+        "<tr>" + "".join(f"<td>{rng.randint(0, 99999) / 100:.2f}</td>" for _ in range(columns)) + "</tr>"
+        for _ in range(rng.randint(5, 25))
+    )
+    return f"<table><thead><tr>{header}</tr></thead><tbody>{rows}</tbody></table>"
+
+
+def _links(rng: random.Random, count: int) -> str:
+    return "".join(
+        f'<a href="/{rng.choice(_WORDS)}/{rng.randint(1, 9999)}">{rng.choice(_WORDS).title()}</a> '
+        for _ in range(count)
+    )
+
+
+def _section(rng: random.Random) -> str:
+    parts = [f"<h2>{_sentence(rng, rng.randint(3, 8))[:-1]}</h2>"]
+    for _ in range(rng.randint(2, 5)):
+        parts.append(_paragraph(rng))
+    if rng.random() < _LIST_PROBABILITY:
+        parts.append("<ul>" + "".join(f"<li>{_sentence(rng, rng.randint(4, 12))}</li>" for _ in range(5)) + "</ul>")
+    if rng.random() < _TABLE_PROBABILITY:
+        parts.append(_table(rng))
+    return "<section>" + "".join(parts) + "</section>"
+
+
+def generate_page(size: int, seed: int = DEFAULT_SEED) -> bytes:
+    """Generate an HTML article page of at least ``size`` bytes.
+
+    Args:
+        size: Minimum page size in bytes. Navigation, sidebar and footer
+            links grow with the size up to a typical news page, so small
+            pages stay close to the requested size.
+        seed: Seed of the page content.
+
+    Returns:
+        UTF-8 encoded HTML document.
+    """
+    rng = random.Random(seed ^ size)
+    links = min(_MAX_NAV_LINKS, max(2, size // 2048))
+    title = _sentence(rng, 6)[:-1]
+    head = (
+        f'<!DOCTYPE html><html lang="en"><head><meta charset="utf-8"><title>{title}</title>'
+        f"{_STYLE}{_SCRIPT}</head><body>"
+        f'<div class="cookie">We use cookies to improve your experience. <button>Accept</button></div>'
+        f'<header><nav class="nav">{_links(rng, links)}</nav></header>'
+        f'<aside class="sidebar"><h3>Related</h3>{_links(rng, links // 2)}<h3>Popular</h3>{_links(rng, links // 2)}</aside>'
+        f"<main><article><h1>{title}</h1>"
+    )
+    tail = (
+        f'</article></main><footer class="footer">{_links(rng, links * 3 // 2)}'
+        "<p>Copyright 2026. All rights reserved.</p></footer></body></html>"
+    )
+
+    body: list[str] = [_paragraph(rng)]
+    length = len(head) + len(tail) + len(body[0])
+    while length < size:
+        section = _section(rng)
+        body.append(section)
+        length += len(section)
+    return (head + "".join(body) + tail).encode("utf-8")
+
+
+def generate_corpus(sizes: tuple[str, ...] = DEFAULT_SIZES, seed: int = DEFAULT_SEED) -> dict[str, bytes]:
+    """Generate one page per size, keyed by a file name such as ``page-1mb.html``."""
+    return {f"page-{size.lower()}.html": generate_page(parse_size(size), seed) for size in sizes}
+
+
+def main() -> None:
+    """Write the corpus to a directory."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", type=Path, required=True, help="directory to write the pages to")
+    parser.add_argument("--sizes", nargs="+", default=list(DEFAULT_SIZES), help="page sizes, e.g. 1KB 5MB")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="content seed")
+    args = parser.parse_args()
+
+    args.output.mkdir(parents=True, exist_ok=True)
+    for name, content in generate_corpus(tuple(args.sizes), args.seed).items():
+        (args.output / name).write_bytes(content)
+        print(f"{name:<20} {len(content):>10} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Threaded local HTTP server for the benchmark corpus.
+
+Serves in-memory pages from a background thread, one handler thread per
+connection, with an optional artificial delay before each response to stand
+in for network latency. Keep-alive is supported so pooled fetchers reuse
+connections as they would against a real host.
+"""
+
+import http.server
+import threading
+import time
+from types import TracebackType
+from typing import ClassVar, Self
+
+
+class CorpusServer:
+    """Serve pages from memory on a free local port.
+
+    Examples:
+        >>> with CorpusServer({"page.html": b"<p>Hi</p>"}, latency=0.05) as server:
+        ...     url = server.url("page.html")
+    """
+
+    def __init__(self, pages: dict[str, bytes], latency: float = 0.0, host: str = "127.0.0.1") -> None:
+        """Create the server without starting it.
+
+        Args:
+            pages: Response bodies keyed by path, without the leading slash.
+            latency: Seconds to wait before answering each request.
+            host: Interface to listen on.
+        """
+        handler = type("_Handler", (_CorpusHandler,), {"pages": pages, "latency": latency})
+        self._httpd = http.server.ThreadingHTTPServer((host, 0), handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def __enter__(self) -> Self:
+        """Start serving."""
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop serving and release the port."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join()
+
+    def url(self, path: str) -> str:
+        """Return the URL a page is served at."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/{path}"
+
+
+class _CorpusHandler(http.server.BaseHTTPRequestHandler):
+    """Answer GET requests from the server's page table."""
+
+    protocol_version = "HTTP/1.1"
+    pages: ClassVar[dict[str, bytes]] = {}
+    latency: ClassVar[float] = 0.0
+
+    def do_GET(self) -> None:
+        """Serve a page, or 404 when it is unknown."""
+        if self.latency:
+            time.sleep(self.latency)
+        body = self.pages.get(self.path.lstrip("/"))
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Keep request logging out of the benchmark output."""
@@ -0,0 +1,203 @@
+"""Benchmark extraction throughput, latency and memory per engine and strategy.
+
+Serves the synthetic corpus (see benchmarks.corpus) from a local threaded
+server with optional artificial latency, then extracts every page ``rounds``
+times with each configuration: each engine on its own and ExtractorService
+with the fallback, race and hedge strategies. Every configuration runs in a
+fresh process so its peak RSS is not inflated by the ones before it.
+
+Reports pages per second, p50/p95/p99 latency per page (fetch and parse) and
+peak RSS. With ``--json`` the report is written to a file; with
+``--baseline`` it is compared against an earlier report and the command exits
+with status 1 when throughput drops or p95 latency grows by more than
+``--tolerance``, so CI can gate on it.
+
+Usage:
+    python -m benchmarks.extraction_throughput [--sizes 1KB 128KB 1MB 5MB] [--rounds 3]
+        [--workers 8] [--latency-ms 20] [--json results.json] [--baseline baseline.json]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+from benchmarks.corpus import DEFAULT_SEED, DEFAULT_SIZES, generate_corpus
+from benchmarks.corpus_server import CorpusServer
+
+CONFIGURATIONS = ("markitdown", "trafilatura", "fallback", "race", "hedge")
+DEFAULT_ROUNDS = 3
+DEFAULT_WORKERS = 8
+DEFAULT_TOLERANCE = 0.15
+
+
+def _peak_rss_mb() -> float:
+    """Return the peak resident set size of this process in MiB."""
+    import resource  # noqa: PLC0415
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def _engine_worker(name: str) -> Callable[[str], float]:
+    """Return a function that fetches a URL, runs one engine and returns its latency in ms."""
+    import py_web_text_extractor.service.markitdown_extractor as mk_extractor  # noqa: PLC0415
+    import py_web_text_extractor.service.trafilatura_extractor as tr_extractor  # noqa: PLC0415
+    from py_web_text_extractor.service.fetcher import HttpFetcher  # noqa: PLC0415
+
+    fetcher = HttpFetcher()
+    if name == "markitdown":
+        pool = mk_extractor.MarkItDownPool()
+
+        def parse(page: object) -> str:
+            return mk_extractor.extract_text_from_content(page, pool=pool)
+    else:
+        parse = tr_extractor.extract_text_from_content
+
+    def run(url: str) -> float:
+        started = time.perf_counter()
+        parse(fetcher.fetch_page(url))
+        return (time.perf_counter() - started) * 1000
+
+    return run
+
+
+def _run_configuration(name: str, urls: list[str], rounds: int, workers: int, hedge_delay: float) -> dict:
+    """Extract every URL ``rounds`` times with one configuration and return its measurements."""
+    from py_web_text_extractor.model.extraction_strategy import ExtractionStrategy  # noqa: PLC0415
+    from py_web_text_extractor.service.extractor_service import ExtractorService  # noqa: PLC0415
+
+    latencies: list[float] = []
+    errors = 0
+    if name in {"markitdown", "trafilatura"}:
+        worker = _engine_worker(name)
+        worker(urls[0])  # warm up imports and converters
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(worker, url) for _ in range(rounds) for url in urls]
+            for future in futures:
+                try:
+                    latencies.append(future.result())
+                except Exception:
+                    errors += 1
+        elapsed = time.perf_counter() - started
+    else:
+        service = ExtractorService(strategy=ExtractionStrategy(name), hedge_delay=hedge_delay)
+        service.extract_text_from_page_safe(urls[0])
+        started = time.perf_counter()
+        for result in service.extract_many((url for _ in range(rounds) for url in urls), max_workers=workers):
+            if result.ok:
+                latencies.append(result.elapsed_ms)
+            else:
+                errors += 1
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    pages = len(latencies)
+    return {
+        "name": name,
+        "pages": pages,
+        "errors": errors,
+        "seconds": round(elapsed, 4),
+        "pages_per_second": round(pages / elapsed, 3) if elapsed else 0.0,
+        "p50_ms": round(_percentile(latencies, 0.50), 2),
+        "p95_ms": round(_percentile(latencies, 0.95), 2),
+        "p99_ms": round(_percentile(latencies, 0.99), 2),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return a message per configuration that regressed against the baseline.
+
+    Args:
+        report: Report produced by this benchmark.
+        baseline: Earlier report to compare against.
+        tolerance: Allowed relative drop in pages/sec and growth in p95 latency.
+
+    Returns:
+        Regression messages; empty when every configuration is within tolerance.
+    """
+    previous = {result["name"]: result for result in baseline.get("results", [])}
+    regressions = []
+    for result in report["results"]:
+        base = previous.get(result["name"])
+        if base is None:
+            continue
+        if result["pages_per_second"] < base["pages_per_second"] * (1 - tolerance):
+            regressions.append(
+                f"{result['name']}: {result['pages_per_second']} pages/s, baseline {base['pages_per_second']}"
+            )
+        if result["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{result['name']}: p95 {result['p95_ms']} ms, baseline {base['p95_ms']} ms")
+    return regressions
+
+
+def main() -> None:
+    """Run the benchmark, print a table and optionally save and compare the JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", default=list(DEFAULT_SIZES), help="corpus page sizes, e.g. 1KB 5MB")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="corpus content seed")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="times each page is extracted")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="concurrent extractions")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="artificial server latency per request")
+    parser.add_argument("--hedge-delay", type=float, default=0.5, help="hedge delay of the hedge strategy, seconds")
+    parser.add_argument("--configs", nargs="+", choices=CONFIGURATIONS, default=list(CONFIGURATIONS))
+    parser.add_argument("--json", type=Path, help="write the report to this file")
+    parser.add_argument("--baseline", type=Path, help="report to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed relative regression")
+    args = parser.parse_args()
+
+    corpus = generate_corpus(tuple(args.sizes), args.seed)
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus": {name: len(content) for name, content in corpus.items()},
+        "rounds": args.rounds,
+        "workers": args.workers,
+        "latency_ms": args.latency_ms,
+        "results": [],
+    }
+
+    with CorpusServer(corpus, latency=args.latency_ms / 1000) as server:
+        urls = [server.url(name) for name in corpus]
+        for name in args.configs:
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+                result = executor.submit(
+                    _run_configuration, name, urls, args.rounds, args.workers, args.hedge_delay
+                ).result()
+            report["results"].append(result)
+            print(
+                f"{name:<12} {result['pages_per_second']:8.2f} pages/s   p50 {result['p50_ms']:8.2f} ms   "
+                f"p95 {result['p95_ms']:8.2f} ms   p99 {result['p99_ms']:8.2f} ms   "
+                f"peak RSS {result['peak_rss_mb']:7.1f} MiB   errors {result['errors']}"
+            )
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"report written to {args.json}")
+
+    if args.baseline:
+        regressions = compare(report, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            sys.exit(1)
+        print(f"no regressions beyond {args.tolerance:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
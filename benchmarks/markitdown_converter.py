@@ -0,0 +1,73 @@
+"""Benchmark MarkItDown per-call setup overhead.
+
+Compares converting the same downloaded page with a fresh ``MarkItDown()`` per
+call (the behaviour before converters were pooled) against borrowing a
+long-lived converter from ``MarkItDownPool``.
+
+Usage:
+    python -m benchmarks.markitdown_converter [--iterations 50]
+"""
+
+import argparse
+import io
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from markitdown import MarkItDown, StreamInfo
+
+from py_web_text_extractor.model.fetched_page import FetchedPage
+from py_web_text_extractor.service.markitdown_extractor import MarkItDownPool, extract_text_from_content
+
+RESOURCE = Path(__file__).parent.parent / "tests" / "resources" / "complex.html"
+
+
+def _load_page() -> FetchedPage:
+    """Build an in-memory page from the complex HTML test fixture."""
+    return FetchedPage(
+        url="http://localhost/complex.html",
+        final_url="http://localhost/complex.html",
+        status_code=200,
+        content=RESOURCE.read_bytes(),
+        headers={"Content-Type": "text/html; charset=utf-8"},
+    )
+
+
+def _convert_with_fresh_converter(page: FetchedPage) -> str:
+    """Convert the page the way it was done before pooling: one MarkItDown per call."""
+    stream_info = StreamInfo(mimetype=page.content_type, charset=page.charset, url=page.final_url)
+    return MarkItDown().convert_stream(io.BytesIO(page.content), stream_info=stream_info).text_content
+
+
+def _measure(label: str, func: Callable[[], object], iterations: int) -> float:
+    """Run func repeatedly and print timing statistics in milliseconds."""
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    mean = statistics.fmean(timings)
+    print(f"{label:<28} mean {mean:8.2f} ms   median {statistics.median(timings):8.2f} ms   max {max(timings):8.2f} ms")
+    return mean
+
+
+def main() -> None:
+    """Run the benchmark and print the per-call setup overhead."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=50, help="conversions per variant")
+    args = parser.parse_args()
+
+    page = _load_page()
+    pool = MarkItDownPool(size=1)
+    extract_text_from_content(page, pool=pool)  # warm the pooled converter
+
+    fresh = _measure("fresh MarkItDown() per call", lambda: _convert_with_fresh_converter(page), args.iterations)
+    pooled = _measure("pooled converter", lambda: extract_text_from_content(page, pool=pool), args.iterations)
+
+    print(f"setup overhead removed per call: {fresh - pooled:.2f} ms ({fresh / pooled:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
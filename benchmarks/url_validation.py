@@ -0,0 +1,106 @@
+"""Benchmark bulk URL validation.
+
+Compares pre-screening a synthetic seed list by calling the previous
+``is_valid_url`` implementation (an uncompiled regex, ``strip()`` and a full
+``urlparse`` per URL) in a loop against the current ``is_valid_url`` and the
+one-pass ``validate_urls``. All three must agree on every URL; the benchmark
+fails otherwise.
+
+Usage:
+    python -m benchmarks.url_validation [--urls 1000000] [--invalid-share 0.1] [--repeat 3]
+"""
+
+import argparse
+import random
+import re
+import time
+from collections.abc import Callable
+from urllib.parse import urlparse
+
+from py_web_text_extractor.tools.validation import is_valid_url, validate_urls
+
+DEFAULT_SEED = 7
+HTTPS_SHARE = 0.9
+QUERY_SHARE = 0.3
+_INVALID_SAMPLES = (
+    "",
+    "   ",
+    "example.com/page",
+    "ftp://example.com/file",
+    "https://",
+    "http:// example.com",
+    "https://example.com/a b",
+    "mailto:user@example.com",
+    None,
+)
+
+
+def _legacy_is_valid_url(value: str | None) -> bool:
+    """Validate a URL the way is_valid_url did before the bulk path was added."""
+    if value is None:
+        return False
+    if not isinstance(value, str):
+        return False
+    if len(value.strip()) == 0 or re.search(r"\s", value):
+        return False
+    if not (value.startswith("http://") or value.startswith("https://")):
+        return False
+    try:
+        result = urlparse(value)
+        return bool(result.scheme and result.netloc)
+    except ValueError:
+        return False
+
+
+def _generate_urls(count: int, invalid_share: float, seed: int) -> list[object]:
+    """Build a reproducible seed list with the given share of invalid entries."""
+    rng = random.Random(seed)
+    urls: list[object] = []
+    for i in range(count):
+        if rng.random() < invalid_share:
+            urls.append(rng.choice(_INVALID_SAMPLES))
+        else:
+            scheme = "https" if rng.random() < HTTPS_SHARE else "http"
+            query = f"?id={i}&utm_source=feed" if rng.random() < QUERY_SHARE else ""
+            urls.append(f"{scheme}://www.site{rng.randrange(10_000)}.example/news/{i}/story-{i}.html{query}")
+    return urls
+
+
+def _measure(label: str, func: Callable[[], bytes], repeat: int, count: int) -> tuple[float, bytes]:
+    """Run func repeat times, print the best time per URL, and return it with the validity mask."""
+    best = float("inf")
+    mask = b""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        mask = func()
+        best = min(best, time.perf_counter() - started)
+    print(f"{label:<32} {best:8.3f} s   {best / count * 1e9:7.1f} ns/URL   {count / best:12,.0f} URLs/s")
+    return best, mask
+
+
+def main() -> None:
+    """Run the benchmark and print the speedup of the bulk path over both per-URL loops."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--urls", type=int, default=1_000_000, help="URLs in the synthetic seed list")
+    parser.add_argument("--invalid-share", type=float, default=0.1, help="share of invalid entries")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per variant; the best is reported")
+    args = parser.parse_args()
+
+    urls = _generate_urls(args.urls, args.invalid_share, DEFAULT_SEED)
+
+    legacy, legacy_mask = _measure(
+        "previous is_valid_url loop", lambda: bytes(map(_legacy_is_valid_url, urls)), args.repeat, args.urls
+    )
+    current, current_mask = _measure(
+        "is_valid_url loop", lambda: bytes(map(is_valid_url, urls)), args.repeat, args.urls
+    )
+    bulk, bulk_mask = _measure("validate_urls", lambda: bytes(validate_urls(urls).mask), args.repeat, args.urls)
+
+    if not legacy_mask == current_mask == bulk_mask:
+        raise SystemExit("validation results differ between implementations")
+    print(f"validate_urls is {legacy / bulk:.1f}x faster than the previous per-URL loop")
+    print(f"validate_urls is {current / bulk:.2f}x as fast as the current is_valid_url loop")
+
+
+if __name__ == "__main__":
+    main()
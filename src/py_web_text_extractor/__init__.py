@@ -1,27 +1,143 @@
-"""Extract clean text content from web pages."""
+"""Extract clean text content from web pages.
+
+Only the exceptions and URL validation helpers are imported eagerly. Services,
+the CLI and everything that depends on the extraction engines or typer are
+loaded on first attribute access, so ``import py_web_text_extractor`` stays
+cheap.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 from py_web_text_extractor.exception.exceptions import (
+    CircuitOpenException,
+    EngineExtractionException,
+    LowQualityExtractionException,
     MarkItDownExtractionException,
+    PageConnectionException,
+    PageFetchException,
+    PageStatusException,
+    ResponseTooLargeException,
+    TextDensityExtractionException,
     TextExtractionError,
     TextExtractionFailure,
     TrafilaturaExtractionException,
+    UnsupportedContentTypeException,
     UrlIsNotValidException,
 )
-from py_web_text_extractor.main import Extractor, ExtractorService, app, create_extractor_service
 from py_web_text_extractor.tools.validation import is_blank_string, is_valid_url
 
+if TYPE_CHECKING:
+    from py_web_text_extractor.abstract.engine import ExtractionEngine
+    from py_web_text_extractor.cache.extraction_cache import CacheStats, ExtractionCache
+    from py_web_text_extractor.main import Extractor, ExtractorService, app, create_extractor_service
+    from py_web_text_extractor.metrics.extraction_metrics import ExtractionMetrics
+    from py_web_text_extractor.metrics.hooks import ExtractionHooks
+    from py_web_text_extractor.metrics.prometheus import to_prometheus_text
+    from py_web_text_extractor.model.batch_result import BatchResult
+    from py_web_text_extractor.model.extraction_result import ExtractionResult
+    from py_web_text_extractor.model.extraction_strategy import ExtractionStrategy
+    from py_web_text_extractor.server.extraction_server import ExtractionServer
+    from py_web_text_extractor.service.async_extractor_service import AsyncExtractorService
+    from py_web_text_extractor.service.engine_registry import EngineRegistry, register_engine
+    from py_web_text_extractor.service.engine_router import EngineRouter
+    from py_web_text_extractor.service.fetcher import HttpFetcher
+    from py_web_text_extractor.service.politeness import PoliteFetcher
+    from py_web_text_extractor.service.quality import QualityGate
+    from py_web_text_extractor.service.resilience import CircuitBreaker, RetryingFetcher
+    from py_web_text_extractor.service.response_limits import ResponseLimits
+    from py_web_text_extractor.tools.url_index import UrlIndex
+    from py_web_text_extractor.tools.url_normalization import normalize_url
+
 __version__ = "0.1.0"
 
+# Public name -> module that defines it, imported on first access.
+_LAZY_ATTRIBUTES = {
+    "AsyncExtractorService": "py_web_text_extractor.service.async_extractor_service",
+    "BatchResult": "py_web_text_extractor.model.batch_result",
+    "CacheStats": "py_web_text_extractor.cache.extraction_cache",
+    "CircuitBreaker": "py_web_text_extractor.service.resilience",
+    "EngineRegistry": "py_web_text_extractor.service.engine_registry",
+    "EngineRouter": "py_web_text_extractor.service.engine_router",
+    "ExtractionCache": "py_web_text_extractor.cache.extraction_cache",
+    "ExtractionEngine": "py_web_text_extractor.abstract.engine",
+    "ExtractionHooks": "py_web_text_extractor.metrics.hooks",
+    "ExtractionMetrics": "py_web_text_extractor.metrics.extraction_metrics",
+    "ExtractionResult": "py_web_text_extractor.model.extraction_result",
+    "ExtractionServer": "py_web_text_extractor.server.extraction_server",
+    "ExtractionStrategy": "py_web_text_extractor.model.extraction_strategy",
+    "Extractor": "py_web_text_extractor.main",
+    "ExtractorService": "py_web_text_extractor.service.extractor_service",
+    "HttpFetcher": "py_web_text_extractor.service.fetcher",
+    "PoliteFetcher": "py_web_text_extractor.service.politeness",
+    "QualityGate": "py_web_text_extractor.service.quality",
+    "ResponseLimits": "py_web_text_extractor.service.response_limits",
+    "RetryingFetcher": "py_web_text_extractor.service.resilience",
+    "UrlIndex": "py_web_text_extractor.tools.url_index",
+    "app": "py_web_text_extractor.cli",
+    "create_extractor_service": "py_web_text_extractor.main",
+    "normalize_url": "py_web_text_extractor.tools.url_normalization",
+    "register_engine": "py_web_text_extractor.service.engine_registry",
+    "to_prometheus_text": "py_web_text_extractor.metrics.prometheus",
+}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import a lazily exported attribute on first access and cache it."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including the ones not imported yet."""
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
+
+
 __all__ = [
+    "AsyncExtractorService",
+    "BatchResult",
+    "CacheStats",
+    "CircuitBreaker",
+    "CircuitOpenException",
+    "EngineExtractionException",
+    "EngineRegistry",
+    "EngineRouter",
+    "ExtractionCache",
+    "ExtractionEngine",
+    "ExtractionHooks",
+    "ExtractionMetrics",
+    "ExtractionResult",
+    "ExtractionServer",
+    "ExtractionStrategy",
     "Extractor",
     "ExtractorService",
+    "HttpFetcher",
+    "LowQualityExtractionException",
     "MarkItDownExtractionException",
+    "PageConnectionException",
+    "PageFetchException",
+    "PageStatusException",
+    "PoliteFetcher",
+    "QualityGate",
+    "ResponseLimits",
+    "ResponseTooLargeException",
+    "RetryingFetcher",
+    "TextDensityExtractionException",
     "TextExtractionError",
     "TextExtractionFailure",
     "TrafilaturaExtractionException",
+    "UnsupportedContentTypeException",
+    "UrlIndex",
     "UrlIsNotValidException",
     "app",
     "create_extractor_service",
     "is_blank_string",
     "is_valid_url",
+    "normalize_url",
+    "register_engine",
+    "to_prometheus_text",
 ]
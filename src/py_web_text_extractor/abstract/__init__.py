@@ -4,6 +4,8 @@ This module contains the foundational abstract classes that define the
 contracts and interfaces for all text extraction services in the library.
 """
 
-from py_web_text_extractor.abstract.extractor import Extractor
+from py_web_text_extractor.abstract.engine import ExtractionEngine
+from py_web_text_extractor.abstract.extractor import AsyncExtractor, Extractor
+from py_web_text_extractor.abstract.fetcher import Fetcher
 
-__all__ = ["Extractor"]
+__all__ = ["AsyncExtractor", "ExtractionEngine", "Extractor", "Fetcher"]
@@ -0,0 +1,47 @@
+"""Abstract base class for extraction engines.
+
+An engine turns an already downloaded page into text. ExtractorService runs a
+chain of engines on each page, cheapest or most reliable first, and moves on
+to the next engine when one fails. Implementations can be registered by name
+in an EngineRegistry or passed to ExtractorService directly.
+"""
+
+from abc import ABC, abstractmethod
+
+from py_web_text_extractor.model.fetched_page import FetchedPage
+
+
+class ExtractionEngine(ABC):
+    """Abstract base class for extraction engines.
+
+    Engines are shared by every thread of a service, so extract() must be
+    thread-safe. Heavy libraries should be imported on the first call rather
+    than at module import, so unused engines cost nothing.
+
+    Examples:
+        >>> class PlainTextEngine(ExtractionEngine):
+        ...     name = "plain"
+        ...
+        ...     def extract(self, page: FetchedPage) -> str:
+        ...         return page.body_bytes().decode(page.charset or "utf-8", errors="replace")
+    """
+
+    name: str
+    """Unique engine name, used in results, metrics, routing and circuit breakers."""
+
+    @abstractmethod
+    def extract(self, page: FetchedPage) -> str:
+        """Extract text from a downloaded page without any network I/O.
+
+        Args:
+            page: Downloaded page to extract text from.
+
+        Returns:
+            Extracted text, or an empty string if the page has no content the
+            engine recognises.
+
+        Raises:
+            EngineExtractionException: If the engine cannot process the page;
+                a subclass names the engine. Other exceptions are treated as
+                bugs and abort the extraction.
+        """
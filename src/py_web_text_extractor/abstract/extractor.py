@@ -10,8 +10,11 @@ from the Extractor ABC and implement its abstract methods to ensure compatibilit
 with the library's architecture and fallback strategies.
 """
 
+import time
 from abc import ABC, abstractmethod
 
+from py_web_text_extractor.model.extraction_result import ExtractionResult
+
 
 class Extractor(ABC):
     """Abstract base class for text extraction services.
@@ -23,6 +26,11 @@ class Extractor(ABC):
     - extract_text_from_page(): Main extraction with exception handling
     - extract_text_from_page_safe(): Safe extraction that returns empty string on error
 
+    and extract_result_from_page(), which also reports the engine, final URL,
+    HTTP status, content type, body size and timings. Its default
+    implementation wraps extract_text_from_page and leaves the response
+    details unknown; override it when they are available.
+
     Implementations should follow these guidelines:
     - Provide comprehensive error handling and logging
     - Support both strict (exception-raising) and safe (error-suppressing) modes
@@ -83,3 +91,102 @@ class Extractor(ABC):
             >>> extractor.extract_text_from_page("invalid-url")
             # Raises UrlIsNotValidException
         """
+
+    def extract_result_from_page(self, url: str) -> ExtractionResult:
+        """Extract text content from a web page together with how it was obtained.
+
+        Raises the same exceptions as extract_text_from_page. Use it instead of
+        fetching the page again when the final URL, status, content type, size
+        or timings are needed. The default implementation calls
+        extract_text_from_page and reports an empty engine name, the requested
+        URL as the final URL, status code 0 and the total time as ``extract``.
+
+        Args:
+            url: The URL of the web page to extract text from. Must be a
+                 valid HTTP/HTTPS URL string.
+
+        Returns:
+            ExtractionResult holding the text, the engine that produced it and
+            the metadata of the response.
+
+        Raises:
+            TextExtractionError: If text extraction fails.
+            UrlIsNotValidException: If the provided URL is invalid or malformed.
+
+        Example:
+            >>> result = extractor.extract_result_from_page("https://example.com")
+            >>> result.engine, result.status_code
+            ('markitdown', 200)
+        """
+        started = time.perf_counter()
+        text = self.extract_text_from_page(url)
+        return _unknown_response_result(url, text, time.perf_counter() - started)
+
+
+class AsyncExtractor(ABC):
+    """Abstract base class for asyncio-native text extraction services.
+
+    Mirrors the Extractor contract with coroutine methods, so an asyncio
+    application can await extraction without handing each page to a thread.
+
+    This ABC defines two core coroutines:
+    - extract_text_from_page(): Main extraction with exception handling
+    - extract_text_from_page_safe(): Safe extraction that returns empty string on error
+
+    and extract_result_from_page(), which also reports how the text was
+    obtained, with a default implementation like Extractor's.
+    """
+
+    @abstractmethod
+    async def extract_text_from_page_safe(self, url: str) -> str:
+        """Extract text content from a web page with safe error handling.
+
+        Args:
+            url: The URL of the web page to extract text from.
+
+        Returns:
+            The extracted text content, or an empty string if any error occurs.
+        """
+
+    @abstractmethod
+    async def extract_text_from_page(self, url: str) -> str:
+        """Extract text content from a web page.
+
+        Args:
+            url: The URL of the web page to extract text from. Must be a
+                 valid HTTP/HTTPS URL string.
+
+        Returns:
+            The extracted text content as a string.
+
+        Raises:
+            TextExtractionError: If text extraction fails.
+            UrlIsNotValidException: If the provided URL is invalid or malformed.
+        """
+
+    async def extract_result_from_page(self, url: str) -> ExtractionResult:
+        """Extract text content from a web page together with how it was obtained.
+
+        The default implementation awaits extract_text_from_page and leaves
+        the response details unknown, as Extractor.extract_result_from_page does.
+
+        Args:
+            url: The URL of the web page to extract text from. Must be a
+                 valid HTTP/HTTPS URL string.
+
+        Returns:
+            ExtractionResult holding the text, the engine that produced it and
+            the metadata of the response.
+
+        Raises:
+            TextExtractionError: If text extraction fails.
+            UrlIsNotValidException: If the provided URL is invalid or malformed.
+        """
+        started = time.perf_counter()
+        text = await self.extract_text_from_page(url)
+        return _unknown_response_result(url, text, time.perf_counter() - started)
+
+
+def _unknown_response_result(url: str, text: str, seconds: float) -> ExtractionResult:
+    """Describe text from an extractor that does not report the engine or response it came from."""
+    return ExtractionResult(url=url, text=text, engine="", final_url=url, status_code=0, timings={"extract": seconds})
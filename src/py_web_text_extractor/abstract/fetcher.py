@@ -0,0 +1,34 @@
+"""Abstract base class for page fetchers.
+
+A fetcher owns the HTTP layer: it downloads a page once and returns the body
+and headers as a FetchedPage, which every extraction engine then consumes.
+Implementations can be injected into ExtractorService to control connection
+pooling, timeouts and size limits.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+
+from py_web_text_extractor.model.fetched_page import FetchedPage
+
+
+class Fetcher(ABC):
+    """Abstract base class for page fetchers."""
+
+    @abstractmethod
+    def fetch_page(self, url: str, headers: Mapping[str, str] | None = None) -> FetchedPage:
+        """Download a web page.
+
+        Args:
+            url: HTTP/HTTPS URL to download.
+            headers: Extra request headers, e.g. If-None-Match/If-Modified-Since
+                for a conditional request.
+
+        Returns:
+            FetchedPage holding the response body, headers and final URL. For a
+            conditional request answered with 304 Not Modified the page has
+            ``not_modified`` set and an empty body.
+
+        Raises:
+            PageFetchException: If the page cannot be downloaded.
+        """
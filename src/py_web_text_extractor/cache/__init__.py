@@ -0,0 +1,13 @@
+"""Extraction result caching for the py_web_text_extractor library.
+
+This module provides an optional two-tier cache (in-memory LRU with TTL and a
+size-bounded on-disk tier) that ExtractorService consults before fetching and
+parsing a page, together with the hit/miss counters used to size it.
+"""
+
+from py_web_text_extractor.cache.disk_cache import DiskCache
+from py_web_text_extractor.cache.entry import CacheEntry
+from py_web_text_extractor.cache.extraction_cache import CacheStats, ExtractionCache, cache_key
+from py_web_text_extractor.cache.memory_cache import MemoryCache
+
+__all__ = ["CacheEntry", "CacheStats", "DiskCache", "ExtractionCache", "MemoryCache", "cache_key"]
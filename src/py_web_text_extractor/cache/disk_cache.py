@@ -0,0 +1,131 @@
+"""Size-bounded on-disk cache tier."""
+
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+
+from py_web_text_extractor.cache.entry import CacheEntry
+
+logger = logging.getLogger(__name__)
+
+# Eviction trims the directory to this share of max_bytes, so the directory
+# scan it costs is paid once per many puts rather than on every put once full.
+_LOW_WATER_RATIO = 0.9
+
+
+class DiskCache:
+    """Thread-safe cache of extraction results stored as JSON files.
+
+    Each entry is one file named after the SHA-256 of its key. Reading an entry
+    refreshes its modification time, and when the directory grows beyond
+    ``max_bytes`` the files with the oldest modification time are removed
+    until it is back under 90% of ``max_bytes``.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int) -> None:
+        """Initialize the cache, creating the directory if needed.
+
+        Args:
+            directory: Directory that holds the cache files.
+            max_bytes: Maximum total size of the cache files.
+
+        Raises:
+            ValueError: If max_bytes is less than 1.
+        """
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be at least 1, got {max_bytes}")
+
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size = sum(path.stat().st_size for path in self._directory.glob("*.json"))
+
+    @property
+    def size_bytes(self) -> int:
+        """Return the total size of the cache files."""
+        return self._size
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry stored for key, or None when absent or unreadable."""
+        path = self._path(key)
+        with self._lock:
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                path.touch()
+            except FileNotFoundError:
+                return None
+            except (OSError, ValueError) as e:
+                logger.warning("Discarding unreadable cache file %s: %s", path, e)
+                self._remove(path)
+                return None
+
+        if data.get("key") != key:
+            return None
+        return CacheEntry.from_dict(data)
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry and evict the oldest files when over max_bytes."""
+        path = self._path(key)
+        payload = json.dumps({"key": key, **entry.to_dict()}, ensure_ascii=False).encode("utf-8")
+        if len(payload) > self._max_bytes:
+            logger.debug("Not caching %s on disk: entry is larger than the cache", key)
+            return
+
+        with self._lock:
+            self._remove(path)
+            temp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            try:
+                temp_path.write_bytes(payload)
+                temp_path.replace(path)
+            except OSError as e:
+                logger.warning("Failed to write cache file %s: %s", path, e)
+                temp_path.unlink(missing_ok=True)
+                return
+            self._size += len(payload)
+            if self._size > self._max_bytes:
+                self._evict()
+
+    def clear(self) -> None:
+        """Remove every cache file."""
+        with self._lock:
+            for path in self._directory.glob("*.json"):
+                self._remove(path)
+
+    def _path(self, key: str) -> Path:
+        """Return the file that stores key."""
+        return self._directory / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    def _remove(self, path: Path) -> None:
+        """Delete a cache file and account for its size. Caller holds the lock."""
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            return
+        self._size -= size
+
+    def _evict(self) -> None:
+        """Delete the least recently used files until under the low-water mark. Caller holds the lock."""
+        files = []
+        for path in self._directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+
+        target = int(self._max_bytes * _LOW_WATER_RATIO)
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            total -= size
+        self._size = total
@@ -0,0 +1,79 @@
+"""Cached extraction result."""
+
+import time
+from dataclasses import dataclass, field, replace
+from http import HTTPStatus
+from typing import Any, Self
+
+
+@dataclass(frozen=True, slots=True)
+class CacheEntry:
+    """Extraction result stored in the cache together with HTTP validators.
+
+    Attributes:
+        text: Extracted text.
+        engine: Name of the engine that produced the text.
+        etag: ETag header of the response the text was extracted from.
+        last_modified: Last-Modified header of that response.
+        final_url: URL the response was served from after redirects, if recorded.
+        status_code: HTTP status code of that response.
+        content_type: MIME type of that response, if known.
+        content_bytes: Size of that response body, in bytes.
+        stored_at: Unix timestamp of when the entry was stored or last revalidated.
+    """
+
+    text: str
+    engine: str
+    etag: str | None = None
+    last_modified: str | None = None
+    final_url: str | None = None
+    status_code: int = HTTPStatus.OK
+    content_type: str | None = None
+    content_bytes: int = 0
+    stored_at: float = field(default_factory=time.time)
+
+    def is_fresh(self, ttl: float, now: float | None = None) -> bool:
+        """Return True while the entry is younger than ttl seconds."""
+        return ((time.time() if now is None else now) - self.stored_at) < ttl
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Return If-None-Match/If-Modified-Since headers for revalidating the entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def refreshed(self) -> Self:
+        """Return a copy of the entry stamped with the current time."""
+        return replace(self, stored_at=time.time())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the entry to a JSON-compatible dictionary."""
+        return {
+            "text": self.text,
+            "engine": self.engine,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "final_url": self.final_url,
+            "status_code": self.status_code,
+            "content_type": self.content_type,
+            "content_bytes": self.content_bytes,
+            "stored_at": self.stored_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """Deserialize an entry produced by to_dict."""
+        return cls(
+            text=data["text"],
+            engine=data["engine"],
+            etag=data.get("etag"),
+            last_modified=data.get("last_modified"),
+            final_url=data.get("final_url"),
+            status_code=int(data.get("status_code", HTTPStatus.OK)),
+            content_type=data.get("content_type"),
+            content_bytes=int(data.get("content_bytes", 0)),
+            stored_at=float(data["stored_at"]),
+        )
@@ -0,0 +1,181 @@
+"""Two-tier extraction result cache."""
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
+
+from py_web_text_extractor.cache.disk_cache import DiskCache
+from py_web_text_extractor.cache.entry import CacheEntry
+from py_web_text_extractor.cache.memory_cache import MemoryCache
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL = 3600.0
+DEFAULT_MAX_DISK_BYTES = 512 * 1024 * 1024
+
+_DEFAULT_PORT_SUFFIXES = {"http": ":80", "https": ":443"}
+
+
+def cache_key(url: str, config: str = "") -> str:
+    """Build a cache key from a normalized URL and the extractor configuration.
+
+    The scheme and host are lower-cased, default ports and fragments are
+    dropped, and an empty path becomes ``/``, so trivially different spellings
+    of one page share an entry. Paths and query strings are kept as they are:
+    unlike normalize_url, the key never merges URLs a server might answer
+    differently. The port is never parsed, so URLs with an out-of-range or
+    non-numeric port still get a key and fail later, when they are fetched.
+
+    Args:
+        url: URL of the extracted page.
+        config: Description of the extractor configuration that produced the
+            result; results of different configurations never share an entry.
+
+    Returns:
+        Cache key string.
+
+    Examples:
+        >>> cache_key("HTTPS://Example.com:443#top", "markitdown>trafilatura")
+        'markitdown>trafilatura|https://example.com/'
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = parts.netloc.rpartition("@")[2].lower()
+    default_port = _DEFAULT_PORT_SUFFIXES.get(scheme)
+    if default_port is not None and host.endswith(default_port):
+        host = host[: -len(default_port)]
+    elif host.endswith(":"):
+        host = host[:-1]
+    normalized = urlunsplit((scheme, host, parts.path or "/", parts.query, ""))
+    return f"{config}|{normalized}"
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Snapshot of cache counters.
+
+    Attributes:
+        hits: Lookups answered by a fresh entry without any network request.
+        misses: Lookups that found no usable entry and required a full extraction.
+        revalidations: Stale entries confirmed by a 304 response, so parsing was skipped.
+        memory_entries: Entries currently held in memory.
+        disk_bytes: Bytes currently used by the disk tier.
+    """
+
+    hits: int
+    misses: int
+    revalidations: int
+    memory_entries: int
+    disk_bytes: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Return the share of lookups that skipped parsing."""
+        total = self.hits + self.misses + self.revalidations
+        return (self.hits + self.revalidations) / total if total else 0.0
+
+
+class ExtractionCache:
+    """Extraction result cache with an in-memory LRU tier and an optional disk tier.
+
+    Entries younger than ``ttl`` are served without touching the network.
+    Older entries are kept, and when they carry an ETag or Last-Modified value
+    the service revalidates them with a conditional request; a 304 response
+    refreshes the entry and skips parsing entirely.
+
+    Examples:
+        >>> cache = ExtractionCache(max_entries=10_000, ttl=600, directory="/var/cache/extractor")
+        >>> service = ExtractorService(cache=cache)
+        >>> service.extract_text_from_page("https://example.com")
+        >>> cache.stats.hits
+        0
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float = DEFAULT_TTL,
+        directory: str | Path | None = None,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries in the memory tier.
+            ttl: Seconds an entry is served without revalidation.
+            directory: Directory for the disk tier. Only memory is used when omitted.
+            max_disk_bytes: Maximum total size of the disk tier.
+
+        Raises:
+            ValueError: If ttl is negative or a size limit is less than 1.
+        """
+        if ttl < 0:
+            raise ValueError(f"ttl must not be negative, got {ttl}")
+
+        self._ttl = ttl
+        self._memory = MemoryCache(max_entries)
+        self._disk = DiskCache(directory, max_disk_bytes) if directory is not None else None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+
+    @property
+    def ttl(self) -> float:
+        """Return the number of seconds an entry is served without revalidation."""
+        return self._ttl
+
+    @property
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                revalidations=self._revalidations,
+                memory_entries=len(self._memory),
+                disk_bytes=self._disk.size_bytes if self._disk else 0,
+            )
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry for key from memory or disk, without updating counters.
+
+        Entries found only on disk are promoted to the memory tier.
+        """
+        entry = self._memory.get(key)
+        if entry is None and self._disk is not None:
+            entry = self._disk.get(key)
+            if entry is not None:
+                self._memory.put(key, entry)
+        return entry
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Return True when entry can be served without revalidation."""
+        return entry.is_fresh(self._ttl)
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry in every tier."""
+        self._memory.put(key, entry)
+        if self._disk is not None:
+            self._disk.put(key, entry)
+
+    def record_hit(self) -> None:
+        """Count a lookup answered by a fresh entry."""
+        with self._lock:
+            self._hits += 1
+
+    def record_miss(self) -> None:
+        """Count a lookup that required a full extraction."""
+        with self._lock:
+            self._misses += 1
+
+    def record_revalidation(self) -> None:
+        """Count a stale entry confirmed by a 304 response."""
+        with self._lock:
+            self._revalidations += 1
+
+    def clear(self) -> None:
+        """Remove every entry from all tiers. Counters are kept."""
+        self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
@@ -0,0 +1,56 @@
+"""In-memory LRU cache tier."""
+
+import threading
+from collections import OrderedDict
+
+from py_web_text_extractor.cache.entry import CacheEntry
+
+
+class MemoryCache:
+    """Thread-safe least-recently-used cache of extraction results.
+
+    Entries are kept after their TTL expires so that they can still be
+    revalidated with a conditional request; the least recently used entry is
+    evicted once ``max_entries`` is reached.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of entries kept in memory.
+
+        Raises:
+            ValueError: If max_entries is less than 1.
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry for key and mark it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, evicting the least recently used one when full."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
@@ -1,19 +1,62 @@
 """Command-line interface for web text extraction."""
 
+import contextlib
+import json
 import logging
 import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TextIO
 
+import click
 import typer
+from typer.core import TyperGroup
 
+from py_web_text_extractor.abstract.engine import ExtractionEngine
 from py_web_text_extractor.exception.exceptions import (
+    PageFetchException,
     TextExtractionError,
     UrlIsNotValidException,
 )
-from py_web_text_extractor.service.extractor_service import ExtractorService
+from py_web_text_extractor.model.batch_result import BatchResult
+from py_web_text_extractor.server.extraction_server import (
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    DEFAULT_QUEUE_SIZE,
+    DEFAULT_WORKERS,
+    ExtractionServer,
+)
+from py_web_text_extractor.service.engine_registry import get_default_registry
+from py_web_text_extractor.service.engine_router import EngineRouter
+from py_web_text_extractor.service.extractor_service import DEFAULT_MAX_WORKERS, ExtractorService
+from py_web_text_extractor.service.fetcher import HttpFetcher
+from py_web_text_extractor.service.politeness import DEFAULT_MAX_CONNECTIONS_PER_HOST, PoliteFetcher, interleave_by_host
+from py_web_text_extractor.service.warc_reader import extract_warc
+from py_web_text_extractor.tools.url_index import UrlIndex
+
+DEFAULT_COMMAND = "extract"
+STDIN_PATH = "-"
+STDOUT_PATH = "-"
+
+
+class _DefaultCommandGroup(TyperGroup):
+    """Command group that runs the extract command when no subcommand is named.
+
+    Keeps ``py-web-text-extractor https://example.com`` working alongside
+    subcommands such as ``batch``.
+    """
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        """Insert the default command name when the first argument is not a subcommand."""
+        if args and args[0] not in self.commands and args[0] not in ctx.help_option_names:
+            args = [DEFAULT_COMMAND, *args]
+        return super().parse_args(ctx, args)
+
 
 app = typer.Typer(
     name="py-web-text-extractor",
     help="Extract clean text content from web pages",
+    cls=_DefaultCommandGroup,
     add_completion=False,
     no_args_is_help=True,
 )
@@ -33,7 +76,7 @@ def _setup_logging(verbose: bool = False) -> None:
     )
 
 
-@app.command()
+@app.command(DEFAULT_COMMAND)
 def main(
     url: str,
     safe: bool = False,
@@ -80,5 +123,244 @@ def main(
         sys.exit(4)
 
 
+def _read_urls(stream: TextIO) -> Iterator[str]:
+    """Yield URLs from a text stream, one per line, skipping blank and comment lines."""
+    for line in stream:
+        url = line.strip()
+        if url and not url.startswith("#"):
+            yield url
+
+
+def _to_json_line(result: BatchResult, **fields: object) -> str:
+    """Serialize a batch result, plus any extra fields, as one JSON line."""
+    record = {
+        "url": result.url,
+        **fields,
+        "status": "ok" if result.ok else "error",
+        "engine": result.engine,
+        "text": result.text,
+        "elapsed_ms": round(result.elapsed_ms, 1),
+    }
+    if result.error is not None:
+        record["error"] = f"{type(result.error).__name__}: {result.error}"
+    return json.dumps(record, ensure_ascii=False)
+
+
+def _parse_engine_chain(engines: str) -> list[ExtractionEngine]:
+    """Build the engine chain named by an --engines value, exiting with code 2 if it is invalid."""
+    try:
+        return get_default_registry().create_chain(name.strip() for name in engines.split(","))
+    except ValueError as e:
+        print(f"Error: Invalid --engines - {e}", file=sys.stderr)
+        sys.exit(2)
+
+
+@app.command()
+def batch(  # noqa: PLR0917
+    input_path: str = typer.Argument(STDIN_PATH, help="File with one URL per line; '-' reads from stdin."),
+    workers: int = DEFAULT_MAX_WORKERS,
+    ordered: bool = False,
+    host_rps: float | None = None,
+    host_connections: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    routing_table: Path | None = None,
+    max_bytes: int | None = None,
+    dedupe: bool = False,
+    engines: str | None = None,
+    verbose: bool = False,
+) -> None:
+    """Extract text from many URLs and stream one JSON line per URL.
+
+    URLs are read lazily and processed concurrently in one process, so memory
+    stays flat regardless of input size. Each line is written and flushed as
+    soon as its URL finishes, with the fields url, status ("ok" or "error"),
+    engine, text, elapsed_ms and, for failures, error.
+
+    Args:
+        input_path: File with one URL per line, or '-' for stdin. Blank lines
+            and lines starting with '#' are skipped.
+        workers: Number of URLs processed concurrently.
+        ordered: Emit results in input order instead of completion order.
+        host_rps: Limit requests per second to each host, honouring
+            robots.txt Crawl-delay and Retry-After. Unordered runs also
+            interleave URLs across hosts.
+        host_connections: Requests in flight per host when --host-rps is set.
+        routing_table: JSON file with per-domain engine statistics. It is
+            loaded (if it exists) before the run, so engines are tried in the
+            order that worked best on each domain, and saved afterwards.
+        max_bytes: Largest response body downloaded per URL (default 20 MiB);
+            larger responses are aborted and reported as errors.
+        dedupe: Skip URLs that repeat an earlier line once normalized (case,
+            default port, fragment, trailing slash and tracking parameters
+            ignored), so each page is fetched and reported once.
+        engines: Comma-separated extraction engines to try in order, e.g.
+            'density,trafilatura' (default 'markitdown,trafilatura').
+        verbose: Enable debug logging for troubleshooting.
+
+    Exit codes:
+        0: All URLs processed (individual failures are reported per line)
+        2: Invalid arguments
+        4: Input could not be read or an unexpected error occurred
+    """
+    _setup_logging(verbose)
+
+    if workers < 1:
+        print("Error: --workers must be at least 1", file=sys.stderr)
+        sys.exit(2)
+    if host_rps is not None and (host_rps <= 0 or host_connections < 1):
+        print("Error: --host-rps must be positive and --host-connections at least 1", file=sys.stderr)
+        sys.exit(2)
+    if max_bytes is not None and max_bytes < 1:
+        print("Error: --max-bytes must be at least 1", file=sys.stderr)
+        sys.exit(2)
+    chain = _parse_engine_chain(engines) if engines is not None else None
+
+    router = EngineRouter.load(routing_table) if routing_table is not None else None
+    try:
+        with (
+            contextlib.nullcontext(sys.stdin)
+            if input_path == STDIN_PATH
+            else Path(input_path).open(encoding="utf-8") as stream
+        ):
+            urls = _read_urls(stream)
+            if dedupe:
+                urls = UrlIndex().unique(urls)
+            fetcher = HttpFetcher(max_response_bytes=max_bytes) if max_bytes is not None else None
+            if host_rps is not None:
+                fetcher = PoliteFetcher(
+                    fetcher, requests_per_second=host_rps, max_connections_per_host=host_connections
+                )
+                if not ordered:
+                    urls = interleave_by_host(urls)
+            service = ExtractorService(fetcher=fetcher, router=router, engines=chain)
+            for result in service.extract_many(urls, max_workers=workers, ordered=ordered):
+                print(_to_json_line(result), flush=True)
+    except OSError as e:
+        print(f"Error: Cannot read input - {e}", file=sys.stderr)
+        sys.exit(4)
+    except Exception as e:
+        print(f"Error: Unexpected error - {e}", file=sys.stderr)
+        sys.exit(4)
+    finally:
+        if router is not None and routing_table is not None:
+            try:
+                router.save(routing_table)
+            except OSError as e:
+                print(f"Error: Cannot save routing table - {e}", file=sys.stderr)
+
+
+@app.command()
+def warc(
+    archive: str = typer.Argument(..., help="WARC file to read, plain or gzip-compressed."),
+    output: str = typer.Option(STDOUT_PATH, help="JSONL file to append results to; '-' writes to stdout."),
+    start_offset: int = 0,
+    workers: int = DEFAULT_MAX_WORKERS,
+    verbose: bool = False,
+) -> None:
+    """Extract text from every HTTP response in a WARC archive and stream JSONL.
+
+    Records are read one gzip member at a time and parsed concurrently, and
+    results are written in archive order with the same fields as the batch
+    command plus offset, next_offset and record_id. To resume an interrupted
+    run, pass the next_offset of the last line written as --start-offset.
+
+    Args:
+        archive: WARC file to read.
+        output: JSONL file to append results to, or '-' for stdout.
+        start_offset: Byte offset in the archive to resume from.
+        workers: Number of records parsed concurrently.
+        verbose: Enable debug logging for troubleshooting.
+
+    Exit codes:
+        0: All records processed (individual failures are reported per line)
+        2: Invalid arguments
+        4: Archive could not be read or an unexpected error occurred
+    """
+    _setup_logging(verbose)
+
+    if workers < 1:
+        print("Error: --workers must be at least 1", file=sys.stderr)
+        sys.exit(2)
+    if start_offset < 0:
+        print("Error: --start-offset must not be negative", file=sys.stderr)
+        sys.exit(2)
+
+    resume_offset = start_offset
+    try:
+        with (
+            contextlib.nullcontext(sys.stdout)
+            if output == STDOUT_PATH
+            else Path(output).open("a", encoding="utf-8") as stream
+        ):
+            for record, result in extract_warc(archive, start_offset=start_offset, max_workers=workers):
+                line = _to_json_line(
+                    result,
+                    offset=record.offset,
+                    next_offset=record.next_offset,
+                    record_id=record.record_id,
+                )
+                print(line, file=stream, flush=True)
+                resume_offset = record.next_offset
+    except (OSError, PageFetchException) as e:
+        print(f"Error: Cannot read archive - {e}", file=sys.stderr)
+        print(f"Resume with --start-offset {resume_offset}", file=sys.stderr)
+        sys.exit(4)
+    except Exception as e:
+        print(f"Error: Unexpected error - {e}", file=sys.stderr)
+        print(f"Resume with --start-offset {resume_offset}", file=sys.stderr)
+        sys.exit(4)
+
+
+@app.command()
+def serve(  # noqa: PLR0917
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    unix_socket: Path | None = None,
+    workers: int = DEFAULT_WORKERS,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    verbose: bool = False,
+) -> None:
+    """Serve extraction requests over HTTP with warm engines until interrupted.
+
+    The engines are loaded once at start-up, and connections and extracted
+    pages are reused across requests. Endpoints: GET /extract?url=..., POST
+    /extract with {"url": ...}, POST /batch with {"urls": [...]} (one JSON line
+    per URL), GET /health and GET /metrics (Prometheus text).
+
+    Args:
+        host: Interface to listen on.
+        port: TCP port to listen on.
+        unix_socket: Listen on this Unix domain socket instead of host and port.
+        workers: Requests handled at the same time.
+        queue_size: Requests waiting for a worker; further requests get 503.
+        verbose: Enable debug logging for troubleshooting.
+
+    Exit codes:
+        0: Server stopped with Ctrl+C
+        2: Invalid arguments
+        4: Socket could not be bound or an unexpected error occurred
+    """
+    _setup_logging(verbose)
+
+    try:
+        server = ExtractionServer(host=host, port=port, unix_socket=unix_socket, workers=workers, queue_size=queue_size)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+    except OSError as e:
+        print(f"Error: Cannot listen - {e}", file=sys.stderr)
+        sys.exit(4)
+
+    print(f"Serving on {unix_socket or server.url}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        print(f"Error: Unexpected error - {e}", file=sys.stderr)
+        sys.exit(4)
+    finally:
+        server.close()
+
+
 if __name__ == "__main__":
     app()
@@ -5,17 +5,35 @@ extraction process, providing a consistent error handling mechanism.
 """
 
 from py_web_text_extractor.exception.exceptions import (
+    CircuitOpenException,
+    EngineExtractionException,
+    LowQualityExtractionException,
     MarkItDownExtractionException,
+    PageConnectionException,
+    PageFetchException,
+    PageStatusException,
+    ResponseTooLargeException,
+    TextDensityExtractionException,
     TextExtractionError,
     TextExtractionFailure,
     TrafilaturaExtractionException,
+    UnsupportedContentTypeException,
     UrlIsNotValidException,
 )
 
 __all__ = [
+    "CircuitOpenException",
+    "EngineExtractionException",
+    "LowQualityExtractionException",
     "MarkItDownExtractionException",
+    "PageConnectionException",
+    "PageFetchException",
+    "PageStatusException",
+    "ResponseTooLargeException",
+    "TextDensityExtractionException",
     "TextExtractionError",
     "TextExtractionFailure",
     "TrafilaturaExtractionException",
+    "UnsupportedContentTypeException",
     "UrlIsNotValidException",
 ]
@@ -1,5 +1,9 @@
 """Custom exceptions for text extraction failures."""
 
+from collections.abc import Mapping
+
+from py_web_text_extractor.model.quality_score import QualityScore
+
 
 class TextExtractionError(Exception):
     """Base exception for all text extraction errors."""
@@ -9,13 +13,91 @@ class UrlIsNotValidException(TextExtractionError):
     """Invalid or malformed URL provided."""
 
 
-class MarkItDownExtractionException(TextExtractionError):
+class EngineExtractionException(TextExtractionError):
+    """An extraction engine failed on a page; the next engine in the chain is tried."""
+
+
+class MarkItDownExtractionException(EngineExtractionException):
     """MarkItDown extraction failed."""
 
 
-class TrafilaturaExtractionException(TextExtractionError):
+class TrafilaturaExtractionException(EngineExtractionException):
     """Trafilatura extraction failed."""
 
 
+class TextDensityExtractionException(EngineExtractionException):
+    """Text-density extraction failed."""
+
+
+class LowQualityExtractionException(TextExtractionError):
+    """Engine output was rejected by the quality gate, e.g. because it is mostly navigation.
+
+    Attributes:
+        engine: Name of the engine whose output was rejected.
+        score: Quality measurements of the rejected output.
+    """
+
+    def __init__(self, message: str, engine: str, score: QualityScore) -> None:
+        """Initialize the exception with the engine and the score of its rejected output."""
+        super().__init__(message)
+        self.engine = engine
+        self.score = score
+
+
 class TextExtractionFailure(TextExtractionError):
     """All extraction methods failed for a URL."""
+
+
+class PageFetchException(TextExtractionFailure):
+    """Page content could not be downloaded, so no extraction method could run."""
+
+
+class PageStatusException(PageFetchException):
+    """Server answered with an HTTP error status.
+
+    Attributes:
+        status_code: HTTP status code of the response.
+        headers: Response headers, e.g. to read Retry-After from.
+    """
+
+    def __init__(self, message: str, status_code: int, headers: Mapping[str, str] | None = None) -> None:
+        """Initialize the exception with the status and headers of the failed response."""
+        super().__init__(message)
+        self.status_code = status_code
+        self.headers: Mapping[str, str] = headers or {}
+
+
+class PageConnectionException(PageFetchException):
+    """Connection failed, was reset or timed out before the page was downloaded."""
+
+
+class ResponseTooLargeException(PageFetchException):
+    """Response body exceeds the fetcher's byte limit, so its download was refused or aborted.
+
+    Attributes:
+        limit: Largest body accepted, in bytes.
+        size: Bytes declared by Content-Length, or read before the download was aborted.
+    """
+
+    def __init__(self, message: str, limit: int, size: int) -> None:
+        """Initialize the exception with the byte limit and the size that exceeded it."""
+        super().__init__(message)
+        self.limit = limit
+        self.size = size
+
+
+class UnsupportedContentTypeException(PageFetchException):
+    """Response is not text, by its Content-Type header or by its first bytes.
+
+    Attributes:
+        content_type: Declared Content-Type, or the MIME type sniffed from the body.
+    """
+
+    def __init__(self, message: str, content_type: str | None) -> None:
+        """Initialize the exception with the refused content type."""
+        super().__init__(message)
+        self.content_type = content_type
+
+
+class CircuitOpenException(PageFetchException):
+    """Request skipped because the circuit breaker for its host is open."""
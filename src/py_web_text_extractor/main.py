@@ -1,8 +1,12 @@
 """Text extraction service factory and entry points."""
 
-from py_web_text_extractor.cli import app
+from typing import TYPE_CHECKING, Any
+
 from py_web_text_extractor.service.extractor_service import ExtractorService
 
+if TYPE_CHECKING:
+    from py_web_text_extractor.cli import app
+
 
 def create_extractor_service() -> ExtractorService:
     """Create a new text extraction service instance.
@@ -24,4 +28,13 @@ def create_extractor_service() -> ExtractorService:
 Extractor = ExtractorService
 
 
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import the typer application only when it is requested."""
+    if name == "app":
+        from py_web_text_extractor.cli import app  # noqa: PLC0415
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ["Extractor", "ExtractorService", "app", "create_extractor_service"]
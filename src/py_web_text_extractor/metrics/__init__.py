@@ -0,0 +1,28 @@
+"""Extraction metrics for the py_web_text_extractor library.
+
+This module provides the hooks interface ExtractorService reports stage
+timings, fallbacks, failures, quality scores and byte/character counts to, an in-process
+implementation with a Prometheus text renderer, and an optional OpenTelemetry
+exporter.
+"""
+
+from py_web_text_extractor.metrics.extraction_metrics import (
+    ExtractionMetrics,
+    MetricsSnapshot,
+    QualityStats,
+    StageStats,
+)
+from py_web_text_extractor.metrics.hooks import CompositeHooks, ExtractionHooks
+from py_web_text_extractor.metrics.otel import OpenTelemetryHooks
+from py_web_text_extractor.metrics.prometheus import to_prometheus_text
+
+__all__ = [
+    "CompositeHooks",
+    "ExtractionHooks",
+    "ExtractionMetrics",
+    "MetricsSnapshot",
+    "OpenTelemetryHooks",
+    "QualityStats",
+    "StageStats",
+    "to_prometheus_text",
+]
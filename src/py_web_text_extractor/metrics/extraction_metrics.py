@@ -0,0 +1,231 @@
+"""In-process extraction metrics."""
+
+import bisect
+import itertools
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import override
+
+from py_web_text_extractor.metrics.hooks import ExtractionHooks
+from py_web_text_extractor.model.fetched_page import FetchedPage
+from py_web_text_extractor.model.quality_score import QualityScore
+
+# Upper bounds, in seconds, of the latency histogram buckets.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+@dataclass(frozen=True, slots=True)
+class StageStats:
+    """Latency histogram of one stage.
+
+    Attributes:
+        count: Number of recorded durations.
+        total_seconds: Sum of recorded durations.
+        bucket_counts: Cumulative counts per bucket upper bound, in the order
+            of ``buckets``; durations above the last bound only appear in count.
+        buckets: Bucket upper bounds in seconds.
+    """
+
+    count: int
+    total_seconds: float
+    bucket_counts: tuple[int, ...]
+    buckets: tuple[float, ...]
+
+    @property
+    def mean_seconds(self) -> float:
+        """Return the mean duration, or 0 when nothing was recorded."""
+        return self.total_seconds / self.count if self.count else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class QualityStats:
+    """Quality scores of one engine's output.
+
+    Attributes:
+        checks: Outputs scored by the quality gate.
+        rejections: Outputs the quality gate rejected.
+        total_score: Sum of the scores.
+    """
+
+    checks: int
+    rejections: int
+    total_score: float
+
+    @property
+    def mean_score(self) -> float:
+        """Return the mean score, or 0 when nothing was scored."""
+        return self.total_score / self.checks if self.checks else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class MetricsSnapshot:
+    """Point-in-time copy of the extraction metrics.
+
+    Attributes:
+        stages: Latency histogram per stage name.
+        pages: Successful extractions per engine.
+        failures: Failed extractions per exception type name.
+        engine_failures: Engine runs that raised, per engine.
+        fallbacks: Pages whose text came from a lower-priority engine, per
+            (from_engine, to_engine) pair.
+        quality: Quality scores per engine, when a quality gate is configured.
+        bytes_fetched: Bytes downloaded across all pages.
+        characters_extracted: Characters of text produced across all pages.
+    """
+
+    stages: dict[str, StageStats]
+    pages: dict[str, int]
+    failures: dict[str, int]
+    engine_failures: dict[str, int]
+    fallbacks: dict[tuple[str, str], int]
+    quality: dict[str, QualityStats]
+    bytes_fetched: int
+    characters_extracted: int
+
+    @property
+    def characters_per_byte(self) -> float:
+        """Return the characters produced per byte downloaded, or 0 when nothing was fetched."""
+        return self.characters_extracted / self.bytes_fetched if self.bytes_fetched else 0.0
+
+
+class _Histogram:
+    """Mutable latency histogram guarded by the owning metrics lock."""
+
+    __slots__ = ("bucket_counts", "count", "total")
+
+    def __init__(self, size: int) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.bucket_counts = [0] * size
+
+
+class ExtractionMetrics(ExtractionHooks):
+    """Thread-safe hooks that aggregate counters and latency histograms in memory.
+
+    Pass an instance to ExtractorService and read ``snapshot()`` or render it
+    with ``to_prometheus_text``.
+
+    Examples:
+        >>> metrics = ExtractionMetrics()
+        >>> service = ExtractorService(hooks=metrics)
+        >>> service.extract_text_from_page_safe("https://example.com")
+        >>> metrics.snapshot().stages["fetch"].count
+        1
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Initialize empty metrics.
+
+        Args:
+            buckets: Ascending histogram bucket upper bounds, in seconds.
+
+        Raises:
+            ValueError: If buckets is empty or not strictly ascending.
+        """
+        if not buckets or any(lower >= upper for lower, upper in itertools.pairwise(buckets)):
+            raise ValueError(f"buckets must be non-empty and strictly ascending, got {buckets}")
+
+        self._buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._stages: dict[str, _Histogram] = {}
+        self._pages: Counter[str] = Counter()
+        self._failures: Counter[str] = Counter()
+        self._engine_failures: Counter[str] = Counter()
+        self._fallbacks: Counter[tuple[str, str]] = Counter()
+        self._quality_checks: Counter[str] = Counter()
+        self._quality_rejections: Counter[str] = Counter()
+        self._quality_totals: Counter[str] = Counter()
+        self._bytes_fetched = 0
+        self._characters_extracted = 0
+
+    @override
+    def on_stage(self, stage: str, seconds: float) -> None:
+        """Add a duration to the stage's histogram."""
+        index = bisect.bisect_left(self._buckets, seconds)
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = _Histogram(len(self._buckets))
+            histogram.count += 1
+            histogram.total += seconds
+            if index < len(self._buckets):
+                histogram.bucket_counts[index] += 1
+
+    @override
+    def on_fetch(self, page: FetchedPage) -> None:
+        """Count the downloaded bytes."""
+        with self._lock:
+            self._bytes_fetched += len(page.content)
+
+    @override
+    def on_engine_failure(self, engine: str, error: Exception) -> None:
+        """Count an engine failure."""
+        with self._lock:
+            self._engine_failures[engine] += 1
+
+    @override
+    def on_fallback(self, from_engine: str, to_engine: str) -> None:
+        """Count a fallback."""
+        with self._lock:
+            self._fallbacks[from_engine, to_engine] += 1
+
+    @override
+    def on_quality(self, url: str, engine: str, score: QualityScore, accepted: bool) -> None:
+        """Add a quality score to the engine's totals."""
+        with self._lock:
+            self._quality_checks[engine] += 1
+            self._quality_totals[engine] += score.score
+            if not accepted:
+                self._quality_rejections[engine] += 1
+
+    @override
+    def on_result(self, url: str, engine: str, characters: int) -> None:
+        """Count a successful page and its characters."""
+        with self._lock:
+            self._pages[engine] += 1
+            self._characters_extracted += characters
+
+    @override
+    def on_failure(self, url: str, error: Exception) -> None:
+        """Count a failed page by exception type."""
+        with self._lock:
+            self._failures[type(error).__name__] += 1
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Return a consistent copy of every metric."""
+        with self._lock:
+            stages = {}
+            for name, histogram in self._stages.items():
+                cumulative, running = [], 0
+                for count in histogram.bucket_counts:
+                    running += count
+                    cumulative.append(running)
+                stages[name] = StageStats(histogram.count, histogram.total, tuple(cumulative), self._buckets)
+            return MetricsSnapshot(
+                stages=stages,
+                pages=dict(self._pages),
+                failures=dict(self._failures),
+                engine_failures=dict(self._engine_failures),
+                fallbacks=dict(self._fallbacks),
+                quality={
+                    engine: QualityStats(checks, self._quality_rejections[engine], self._quality_totals[engine])
+                    for engine, checks in self._quality_checks.items()
+                },
+                bytes_fetched=self._bytes_fetched,
+                characters_extracted=self._characters_extracted,
+            )
+
+    def reset(self) -> None:
+        """Clear every metric."""
+        with self._lock:
+            self._stages.clear()
+            self._pages.clear()
+            self._failures.clear()
+            self._engine_failures.clear()
+            self._fallbacks.clear()
+            self._quality_checks.clear()
+            self._quality_rejections.clear()
+            self._quality_totals.clear()
+            self._bytes_fetched = 0
+            self._characters_extracted = 0
@@ -0,0 +1,99 @@
+"""Instrumentation hooks called by ExtractorService."""
+
+from typing import override
+
+from py_web_text_extractor.model.fetched_page import FetchedPage
+from py_web_text_extractor.model.quality_score import QualityScore
+
+
+class ExtractionHooks:
+    """Receiver for extraction events.
+
+    Every method is a no-op, so implementations override only the events they
+    need. ExtractorService skips instrumentation entirely when no hooks are
+    configured, so disabled hooks cost a single ``is None`` check per stage.
+
+    Stage names are ``extract`` (a whole URL), ``fetch`` (the download),
+    ``fetch.wait`` (request sent until response headers arrive, which covers
+    DNS, connect and TLS on a new connection), ``fetch.download`` (reading the
+    body), ``parse`` (all engines on one page) and ``parse.<engine>`` (one
+    engine run).
+
+    Hooks are called from worker threads and must be thread-safe.
+    """
+
+    def on_stage(self, stage: str, seconds: float) -> None:
+        """Record the wall-clock duration of a stage."""
+
+    def on_fetch(self, page: FetchedPage) -> None:
+        """Record a downloaded page, e.g. its size in bytes."""
+
+    def on_engine_failure(self, engine: str, error: Exception) -> None:
+        """Record an engine that raised on a page."""
+
+    def on_fallback(self, from_engine: str, to_engine: str) -> None:
+        """Record a page whose text came from a lower-priority engine."""
+
+    def on_quality(self, url: str, engine: str, score: QualityScore, accepted: bool) -> None:
+        """Record the quality score of an engine's output and whether the quality gate accepted it."""
+
+    def on_result(self, url: str, engine: str, characters: int) -> None:
+        """Record a successful extraction and the number of characters it produced."""
+
+    def on_failure(self, url: str, error: Exception) -> None:
+        """Record an extraction that failed."""
+
+
+class CompositeHooks(ExtractionHooks):
+    """Forward every event to several hooks, e.g. in-process metrics and OpenTelemetry.
+
+    Examples:
+        >>> metrics = ExtractionMetrics()
+        >>> service = ExtractorService(hooks=CompositeHooks(metrics, OpenTelemetryHooks()))
+    """
+
+    def __init__(self, *hooks: ExtractionHooks) -> None:
+        """Initialize with the hooks to forward to, called in the given order."""
+        self._hooks = hooks
+
+    @override
+    def on_stage(self, stage: str, seconds: float) -> None:
+        """Forward a stage duration."""
+        for hooks in self._hooks:
+            hooks.on_stage(stage, seconds)
+
+    @override
+    def on_fetch(self, page: FetchedPage) -> None:
+        """Forward a downloaded page."""
+        for hooks in self._hooks:
+            hooks.on_fetch(page)
+
+    @override
+    def on_engine_failure(self, engine: str, error: Exception) -> None:
+        """Forward an engine failure."""
+        for hooks in self._hooks:
+            hooks.on_engine_failure(engine, error)
+
+    @override
+    def on_fallback(self, from_engine: str, to_engine: str) -> None:
+        """Forward a fallback."""
+        for hooks in self._hooks:
+            hooks.on_fallback(from_engine, to_engine)
+
+    @override
+    def on_quality(self, url: str, engine: str, score: QualityScore, accepted: bool) -> None:
+        """Forward a quality score."""
+        for hooks in self._hooks:
+            hooks.on_quality(url, engine, score, accepted)
+
+    @override
+    def on_result(self, url: str, engine: str, characters: int) -> None:
+        """Forward a successful extraction."""
+        for hooks in self._hooks:
+            hooks.on_result(url, engine, characters)
+
+    @override
+    def on_failure(self, url: str, error: Exception) -> None:
+        """Forward a failed extraction."""
+        for hooks in self._hooks:
+            hooks.on_failure(url, error)
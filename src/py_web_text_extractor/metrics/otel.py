@@ -0,0 +1,107 @@
+"""OpenTelemetry export of extraction metrics.
+
+Built on opentelemetry-api, which is an optional dependency installed with the
+``otel`` extra. The SDK, exporters and meter provider are configured by the
+application as usual; without them every instrument is a no-op.
+"""
+
+from typing import TYPE_CHECKING, override
+
+from py_web_text_extractor.metrics.hooks import ExtractionHooks
+from py_web_text_extractor.model.fetched_page import FetchedPage
+from py_web_text_extractor.model.quality_score import QualityScore
+
+if TYPE_CHECKING:
+    from opentelemetry.metrics import MeterProvider
+
+METER_NAME = "py_web_text_extractor"
+
+
+class OpenTelemetryHooks(ExtractionHooks):
+    """Hooks that record extraction events on OpenTelemetry instruments.
+
+    Stage durations go to the ``py_web_text_extractor.stage.duration``
+    histogram with a ``stage`` attribute and quality scores to the
+    ``py_web_text_extractor.quality.score`` histogram; pages, failures, engine
+    failures, fallbacks, fetched bytes and extracted characters go to counters
+    of the same prefix.
+
+    Examples:
+        >>> service = ExtractorService(hooks=OpenTelemetryHooks())
+    """
+
+    def __init__(self, meter_provider: "MeterProvider | None" = None) -> None:
+        """Create the instruments.
+
+        Args:
+            meter_provider: Provider to get the meter from. The global provider
+                is used when omitted.
+
+        Raises:
+            ImportError: If opentelemetry-api is not installed.
+        """
+        try:
+            from opentelemetry import metrics  # noqa: PLC0415
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetry export requires opentelemetry-api. "
+                "Install it with: pip install 'py-web-text-extractor[otel]'"
+            ) from e
+
+        meter = metrics.get_meter(METER_NAME, meter_provider=meter_provider)
+        self._stage_duration = meter.create_histogram(
+            f"{METER_NAME}.stage.duration", unit="s", description="Duration of extraction stages."
+        )
+        self._pages = meter.create_counter(f"{METER_NAME}.pages", description="Pages extracted successfully.")
+        self._failures = meter.create_counter(f"{METER_NAME}.failures", description="Extractions that failed.")
+        self._engine_failures = meter.create_counter(
+            f"{METER_NAME}.engine.failures", description="Engine runs that raised."
+        )
+        self._fallbacks = meter.create_counter(
+            f"{METER_NAME}.fallbacks", description="Pages whose text came from a lower-priority engine."
+        )
+        self._fetched_bytes = meter.create_counter(
+            f"{METER_NAME}.fetched.bytes", unit="By", description="Bytes downloaded."
+        )
+        self._quality_score = meter.create_histogram(
+            f"{METER_NAME}.quality.score", description="Quality score of engine output, between 0 and 1."
+        )
+        self._extracted_characters = meter.create_counter(
+            f"{METER_NAME}.extracted.characters", description="Characters of text produced."
+        )
+
+    @override
+    def on_stage(self, stage: str, seconds: float) -> None:
+        """Record a stage duration."""
+        self._stage_duration.record(seconds, {"stage": stage})
+
+    @override
+    def on_fetch(self, page: FetchedPage) -> None:
+        """Count the downloaded bytes."""
+        self._fetched_bytes.add(len(page.content))
+
+    @override
+    def on_engine_failure(self, engine: str, error: Exception) -> None:
+        """Count an engine failure."""
+        self._engine_failures.add(1, {"engine": engine})
+
+    @override
+    def on_fallback(self, from_engine: str, to_engine: str) -> None:
+        """Count a fallback."""
+        self._fallbacks.add(1, {"from": from_engine, "to": to_engine})
+
+    @override
+    def on_quality(self, url: str, engine: str, score: QualityScore, accepted: bool) -> None:
+        """Record a quality score."""
+        self._quality_score.record(score.score, {"engine": engine, "accepted": accepted})
+
+    @override
+    def on_result(self, url: str, engine: str, characters: int) -> None:
+        """Count a successful page and its characters."""
+        self._pages.add(1, {"engine": engine})
+        self._extracted_characters.add(characters, {"engine": engine})
+
+    @override
+    def on_failure(self, url: str, error: Exception) -> None:
+        """Count a failed page by exception type."""
+        self._failures.add(1, {"error": type(error).__name__})
@@ -0,0 +1,84 @@
+"""Prometheus text exposition of extraction metrics."""
+
+from py_web_text_extractor.metrics.extraction_metrics import ExtractionMetrics, MetricsSnapshot
+
+DEFAULT_PREFIX = "py_web_text_extractor"
+
+
+def to_prometheus_text(metrics: ExtractionMetrics | MetricsSnapshot, prefix: str = DEFAULT_PREFIX) -> str:
+    """Render metrics in the Prometheus text exposition format (version 0.0.4).
+
+    The output can be served from any HTTP endpoint or written to a file for
+    the node exporter's textfile collector; no Prometheus client library is
+    needed.
+
+    Args:
+        metrics: Metrics to render, or a snapshot taken from them.
+        prefix: Prefix of every metric name.
+
+    Returns:
+        Exposition text ending with a newline.
+
+    Examples:
+        >>> print(to_prometheus_text(metrics))
+        # HELP py_web_text_extractor_stage_seconds Duration of extraction stages.
+        # TYPE py_web_text_extractor_stage_seconds histogram
+        ...
+    """
+    snapshot = metrics.snapshot() if isinstance(metrics, ExtractionMetrics) else metrics
+    lines: list[str] = []
+
+    def header(name: str, kind: str, description: str) -> str:
+        lines.append(f"# HELP {prefix}_{name} {description}")
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+        return f"{prefix}_{name}"
+
+    name = header("stage_seconds", "histogram", "Duration of extraction stages.")
+    for stage, stats in sorted(snapshot.stages.items()):
+        label = f'stage="{_escape(stage)}"'
+        for bound, count in zip(stats.buckets, stats.bucket_counts, strict=True):
+            lines.append(f'{name}_bucket{{{label},le="{bound:g}"}} {count}')
+        lines.append(f'{name}_bucket{{{label},le="+Inf"}} {stats.count}')
+        lines.append(f"{name}_sum{{{label}}} {stats.total_seconds!r}")
+        lines.append(f"{name}_count{{{label}}} {stats.count}")
+
+    name = header("pages_total", "counter", "Pages extracted successfully, by engine.")
+    lines.extend(f'{name}{{engine="{_escape(engine)}"}} {count}' for engine, count in sorted(snapshot.pages.items()))
+
+    name = header("failures_total", "counter", "Extractions that failed, by error type.")
+    lines.extend(f'{name}{{error="{_escape(error)}"}} {count}' for error, count in sorted(snapshot.failures.items()))
+
+    name = header("engine_failures_total", "counter", "Engine runs that raised, by engine.")
+    lines.extend(
+        f'{name}{{engine="{_escape(engine)}"}} {count}' for engine, count in sorted(snapshot.engine_failures.items())
+    )
+
+    name = header("fallbacks_total", "counter", "Pages whose text came from a lower-priority engine.")
+    lines.extend(
+        f'{name}{{from="{_escape(source)}",to="{_escape(target)}"}} {count}'
+        for (source, target), count in sorted(snapshot.fallbacks.items())
+    )
+
+    name = header("quality_score", "summary", "Quality score of engine output, between 0 and 1.")
+    for engine, stats in sorted(snapshot.quality.items()):
+        label = f'engine="{_escape(engine)}"'
+        lines.append(f"{name}_sum{{{label}}} {stats.total_score!r}")
+        lines.append(f"{name}_count{{{label}}} {stats.checks}")
+
+    name = header("quality_rejections_total", "counter", "Engine outputs rejected by the quality gate.")
+    lines.extend(
+        f'{name}{{engine="{_escape(engine)}"}} {stats.rejections}' for engine, stats in sorted(snapshot.quality.items())
+    )
+
+    name = header("fetched_bytes_total", "counter", "Bytes downloaded.")
+    lines.append(f"{name} {snapshot.bytes_fetched}")
+
+    name = header("extracted_characters_total", "counter", "Characters of text produced.")
+    lines.append(f"{name} {snapshot.characters_extracted}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the exposition format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
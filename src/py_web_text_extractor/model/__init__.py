@@ -0,0 +1,25 @@
+"""Data models shared across the py_web_text_extractor library.
+
+This module contains the plain data containers that are passed between the
+fetch layer, the individual extraction engines and batch callers.
+"""
+
+from py_web_text_extractor.model.batch_result import BatchResult
+from py_web_text_extractor.model.extraction_result import ExtractionResult
+from py_web_text_extractor.model.extraction_strategy import ExtractionStrategy
+from py_web_text_extractor.model.fetched_page import FetchedPage
+from py_web_text_extractor.model.quality_score import QualityScore
+from py_web_text_extractor.model.url_validation import InvalidUrl, InvalidUrlReason, UrlValidationReport
+from py_web_text_extractor.model.warc_record import WarcRecord
+
+__all__ = [
+    "BatchResult",
+    "ExtractionResult",
+    "ExtractionStrategy",
+    "FetchedPage",
+    "InvalidUrl",
+    "InvalidUrlReason",
+    "QualityScore",
+    "UrlValidationReport",
+    "WarcRecord",
+]
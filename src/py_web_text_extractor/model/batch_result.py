@@ -0,0 +1,31 @@
+"""Per-URL outcome of a batch extraction."""
+
+from dataclasses import dataclass
+
+from py_web_text_extractor.model.extraction_result import ExtractionResult
+
+
+@dataclass(frozen=True, slots=True)
+class BatchResult:
+    """Result of extracting a single URL as part of a batch.
+
+    Attributes:
+        url: URL that was processed.
+        text: Extracted text, or an empty string when extraction failed.
+        engine: Name of the extraction engine that produced the text, or None on failure.
+        error: Exception raised while processing the URL, or None on success.
+        elapsed_ms: Wall-clock time spent on the URL, in milliseconds.
+        result: Extracted text with the response metadata, or None on failure.
+    """
+
+    url: str
+    text: str = ""
+    engine: str | None = None
+    error: Exception | None = None
+    elapsed_ms: float = 0.0
+    result: ExtractionResult | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Return True when the URL was extracted without an error."""
+        return self.error is None
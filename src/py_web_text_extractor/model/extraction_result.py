@@ -0,0 +1,59 @@
+"""Extracted text together with the details of how it was obtained."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Self
+
+from py_web_text_extractor.model.fetched_page import FetchedPage
+
+
+@dataclass(frozen=True, slots=True)
+class ExtractionResult:
+    """Text extracted from a page and what is known about the response it came from.
+
+    Attributes:
+        url: URL that was requested.
+        text: Extracted text.
+        engine: Name of the extraction engine that produced the text.
+        final_url: URL the content was served from after redirects.
+        status_code: HTTP status code of the response the text was extracted from.
+        content_type: MIME type of that response without parameters, if known.
+        content_bytes: Size of the response body, in bytes.
+        timings: Seconds spent in each stage: the download phases of the page
+            (``wait``, ``download``) and ``parse``. Empty for cached results.
+        cached: True when the text was served from the extraction cache.
+    """
+
+    url: str
+    text: str
+    engine: str
+    final_url: str
+    status_code: int
+    content_type: str | None = None
+    content_bytes: int = 0
+    timings: Mapping[str, float] = field(default_factory=dict)
+    cached: bool = False
+
+    @classmethod
+    def from_page(cls, page: FetchedPage, text: str, engine: str, parse_seconds: float) -> Self:
+        """Describe text extracted from a downloaded page.
+
+        Args:
+            page: Page the text was extracted from.
+            text: Extracted text.
+            engine: Name of the engine that produced the text.
+            parse_seconds: Time the engines spent on the page.
+
+        Returns:
+            New ExtractionResult carrying the page's metadata and timings.
+        """
+        return cls(
+            url=page.url,
+            text=text,
+            engine=engine,
+            final_url=page.final_url,
+            status_code=page.status_code,
+            content_type=page.content_type,
+            content_bytes=len(page.content),
+            timings={**page.timings, "parse": parse_seconds},
+        )
@@ -0,0 +1,18 @@
+"""How ExtractorService schedules its extraction engines on a downloaded page."""
+
+from enum import StrEnum
+
+
+class ExtractionStrategy(StrEnum):
+    """Scheduling policy for the MarkItDown and Trafilatura engines.
+
+    Attributes:
+        FALLBACK: Run MarkItDown, and start Trafilatura only after it fails.
+        RACE: Run both engines at once and keep the first non-blank result.
+        HEDGE: Run MarkItDown, and also start Trafilatura if MarkItDown has
+            not produced a result within the configured hedge delay.
+    """
+
+    FALLBACK = "fallback"
+    RACE = "race"
+    HEDGE = "hedge"
@@ -0,0 +1,136 @@
+"""Downloaded web page container."""
+
+import io
+from collections.abc import Buffer, Mapping
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from pathlib import PurePosixPath
+from typing import BinaryIO, override
+from urllib.parse import urlparse
+
+
+class _MemoryViewReader(io.RawIOBase):
+    """Seekable read-only stream over a memoryview that copies only what is read."""
+
+    def __init__(self, view: memoryview) -> None:
+        super().__init__()
+        self._view = view
+        self._position = 0
+
+    @override
+    def readable(self) -> bool:
+        return True
+
+    @override
+    def seekable(self) -> bool:
+        return True
+
+    @override
+    def tell(self) -> int:
+        return self._position
+
+    @override
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._position, io.SEEK_END: len(self._view)}[whence]
+        self._position = max(0, base + offset)
+        return self._position
+
+    @override
+    def readinto(self, buffer: Buffer) -> int:
+        with memoryview(buffer) as target:
+            chunk = self._view[self._position : self._position + target.nbytes]
+            size = chunk.nbytes
+            target[:size] = chunk
+        self._position += size
+        return size
+
+
+@dataclass(frozen=True, slots=True)
+class FetchedPage:
+    """A web page downloaded once and shared between extraction engines.
+
+    Attributes:
+        url: URL that was requested.
+        final_url: URL the content was served from after redirects.
+        status_code: HTTP status code of the final response.
+        headers: Response headers (case-insensitive mapping when produced by the fetcher).
+        content: Raw response body. Pages read from large local files hold a
+            memoryview over a memory-mapped file instead of bytes.
+        timings: Seconds spent in each phase of the download, e.g. ``wait``
+            (request sent until response headers arrived) and ``download``
+            (reading the body). Empty for pages that were not fetched.
+    """
+
+    url: str
+    final_url: str
+    status_code: int
+    content: bytes | memoryview
+    headers: Mapping[str, str] = field(default_factory=dict)
+    timings: Mapping[str, float] = field(default_factory=dict)
+
+    def header(self, name: str) -> str | None:
+        """Look up a response header by case-insensitive name.
+
+        Args:
+            name: Header name, e.g. ``"Content-Type"``.
+
+        Returns:
+            Header value, or None when the header is absent.
+        """
+        value = self.headers.get(name)
+        if value is not None:
+            return value
+        lowered = name.lower()
+        for key, candidate in self.headers.items():
+            if key.lower() == lowered:
+                return candidate
+        return None
+
+    def open_stream(self) -> BinaryIO:
+        """Return a new binary stream positioned at the start of the body.
+
+        Each call returns an independent stream, so engines running at the same
+        time never share a read position. Memory-mapped bodies are read
+        directly from the mapping instead of being copied up front.
+        """
+        if isinstance(self.content, bytes):
+            return io.BytesIO(self.content)
+        return io.BufferedReader(_MemoryViewReader(self.content))
+
+    def body_bytes(self) -> bytes:
+        """Return the body as bytes, copying it only when it is memory-mapped."""
+        if isinstance(self.content, bytes):
+            return self.content
+        return self.content.tobytes()
+
+    @property
+    def not_modified(self) -> bool:
+        """Return True when a conditional request was answered with 304 Not Modified."""
+        return self.status_code == HTTPStatus.NOT_MODIFIED
+
+    @property
+    def content_type(self) -> str | None:
+        """Return the MIME type from the Content-Type header without parameters."""
+        value = self.header("content-type")
+        if not value:
+            return None
+        mimetype = value.split(";", 1)[0].strip().lower()
+        return mimetype or None
+
+    @property
+    def charset(self) -> str | None:
+        """Return the charset parameter from the Content-Type header, if present."""
+        value = self.header("content-type")
+        if not value:
+            return None
+        for parameter in value.split(";")[1:]:
+            key, _, charset = parameter.partition("=")
+            if key.strip().lower() == "charset" and charset.strip():
+                return charset.strip().strip("\"'")
+        return None
+
+    @property
+    def extension(self) -> str | None:
+        """Return the file extension of the final URL path, if any."""
+        suffix = PurePosixPath(urlparse(self.final_url).path).suffix
+        return suffix or None
@@ -0,0 +1,25 @@
+"""Quality measurements of extracted text."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class QualityScore:
+    """Cheap heuristics describing how much of an engine's output is real content.
+
+    Attributes:
+        characters: Visible characters of text, with Markdown link and image
+            targets removed and whitespace collapsed per line.
+        text_density: Share of the characters on lines that read like prose
+            (at least a sentence's worth of words) or table rows, rather than
+            short menu and button labels.
+        link_density: Share of the characters that are link text.
+        html_ratio: Characters of text per byte of the downloaded document.
+        score: Overall quality between 0 and 1 combining the above.
+    """
+
+    characters: int
+    text_density: float
+    link_density: float
+    html_ratio: float
+    score: float
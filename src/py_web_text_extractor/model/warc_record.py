@@ -0,0 +1,27 @@
+"""HTTP response record read from a WARC archive."""
+
+from dataclasses import dataclass
+
+from py_web_text_extractor.model.fetched_page import FetchedPage
+
+
+@dataclass(frozen=True, slots=True)
+class WarcRecord:
+    """A WARC response record turned into a page for the extraction engines.
+
+    Attributes:
+        offset: Byte offset in the archive file where the record starts. For
+            gzip-compressed archives this is the offset of the gzip member that
+            holds the record.
+        next_offset: Byte offset to resume reading from once this record has
+            been processed. When a gzip member holds several records, every
+            record but the last points back at the member start, so resuming
+            may replay records but never skips one.
+        record_id: Value of the WARC-Record-ID header, if present.
+        page: Archived HTTP response with transfer and content encodings removed.
+    """
+
+    offset: int
+    next_offset: int
+    record_id: str | None
+    page: FetchedPage
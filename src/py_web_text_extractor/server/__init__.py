@@ -0,0 +1,10 @@
+"""HTTP server mode for the py_web_text_extractor library.
+
+This module provides ExtractionServer, a long-running process that keeps the
+extraction engines, connection pools and result cache warm and serves
+extraction requests over HTTP on a TCP port or a Unix domain socket.
+"""
+
+from py_web_text_extractor.server.extraction_server import ExtractionServer
+
+__all__ = ["ExtractionServer"]
@@ -0,0 +1,504 @@
+"""Long-running HTTP extraction server module.
+
+Starting a process per page pays for importing MarkItDown and Trafilatura,
+building a service and opening connections every time. ExtractionServer keeps
+one ExtractorService, and with it the engines, the connection pools and the
+result cache, warm between requests. Requests are handled by a fixed pool of
+worker threads behind a bounded queue; when both are full the server answers
+503 with Retry-After instead of piling up work.
+
+Endpoints:
+    GET  /extract?url=...  Extract one page.
+    POST /extract          Same, with the JSON body ``{"url": "..."}``.
+    POST /batch            JSON body ``{"urls": [...], "ordered": false}``; streams one JSON line per URL.
+    GET  /health           Load and capacity as JSON.
+    GET  /metrics          Extraction metrics in the Prometheus text format.
+"""
+
+import http.server
+import json
+import logging
+import socket
+import socketserver
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self, override
+from urllib.parse import parse_qs, urlsplit
+
+from py_web_text_extractor.cache.extraction_cache import ExtractionCache
+from py_web_text_extractor.exception.exceptions import (
+    PageFetchException,
+    TextExtractionError,
+    UrlIsNotValidException,
+)
+from py_web_text_extractor.metrics.extraction_metrics import ExtractionMetrics
+from py_web_text_extractor.metrics.prometheus import to_prometheus_text
+from py_web_text_extractor.model.batch_result import BatchResult
+from py_web_text_extractor.model.extraction_result import ExtractionResult
+from py_web_text_extractor.service.extractor_service import DEFAULT_MAX_WORKERS, ExtractorService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+DEFAULT_WORKERS = 16
+DEFAULT_QUEUE_SIZE = 64
+DEFAULT_MAX_BATCH_URLS = 1000
+MAX_REQUEST_BYTES = 1024 * 1024
+KEEP_ALIVE_TIMEOUT = 5.0
+
+# Seconds an overloaded server waits for a rejected request before closing it.
+_REJECT_TIMEOUT = 1.0
+# Threads answering rejected requests, and rejected connections they may hold;
+# beyond that, rejected connections are closed without an answer.
+_REJECT_WORKERS = 2
+_MAX_PENDING_REJECTS = 64
+_RETRY_AFTER_SECONDS = 1
+_WARM_UP_HTML = (
+    "<html><head><title>Warm-up</title></head><body><h1>Warm-up</h1><p>Loading the engines.</p></body></html>"
+)
+_PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class ExtractionServer:
+    """HTTP server that extracts pages with one long-lived ExtractorService.
+
+    Listens on a TCP port or, when ``unix_socket`` is given, on a Unix domain
+    socket. Use it as a context manager to serve from a background thread, or
+    call serve_forever() to serve from the current one.
+
+    Examples:
+        >>> with ExtractionServer(port=0) as server:
+        ...     requests.get(f"{server.url}/extract", params={"url": "https://example.com"}).json()["text"]
+    """
+
+    def __init__(
+        self,
+        service: ExtractorService | None = None,
+        *,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        unix_socket: str | Path | None = None,
+        workers: int = DEFAULT_WORKERS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        batch_workers: int = DEFAULT_MAX_WORKERS,
+        max_batch_urls: int = DEFAULT_MAX_BATCH_URLS,
+    ) -> None:
+        """Bind the server socket without serving yet.
+
+        Args:
+            service: Service that extracts the pages. When omitted, one is
+                created with an in-memory ExtractionCache and ExtractionMetrics
+                hooks, which /metrics exposes.
+            host: Interface to listen on.
+            port: TCP port to listen on; 0 picks a free one.
+            unix_socket: Path of a Unix domain socket to listen on instead of
+                host and port. A stale socket file at the path is replaced.
+            workers: Requests handled at the same time.
+            queue_size: Requests waiting for a worker; further requests are
+                answered with 503.
+            batch_workers: URLs of all /batch requests extracted at the same
+                time, on one thread pool the requests share.
+            max_batch_urls: Largest number of URLs accepted by one /batch request.
+
+        Raises:
+            ValueError: If a limit is out of range.
+            OSError: If the socket cannot be bound.
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        if queue_size < 0:
+            raise ValueError(f"queue_size must not be negative, got {queue_size}")
+        if batch_workers < 1:
+            raise ValueError(f"batch_workers must be at least 1, got {batch_workers}")
+        if max_batch_urls < 1:
+            raise ValueError(f"max_batch_urls must be at least 1, got {max_batch_urls}")
+
+        self._metrics: ExtractionMetrics | None = None
+        if service is None:
+            self._metrics = ExtractionMetrics()
+            service = ExtractorService(cache=ExtractionCache(), hooks=self._metrics)
+        self._service = service
+        self._batch_workers = batch_workers
+        self._max_batch_urls = max_batch_urls
+        self._capacity = workers + queue_size
+        self._slots = threading.BoundedSemaphore(self._capacity)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="extraction-server")
+        self._batch_executor = ThreadPoolExecutor(max_workers=batch_workers, thread_name_prefix="extraction-batch")
+        self._reject_slots = threading.BoundedSemaphore(_MAX_PENDING_REJECTS)
+        self._reject_executor = ThreadPoolExecutor(
+            max_workers=_REJECT_WORKERS, thread_name_prefix="extraction-server-reject"
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._rejected = 0
+        self._thread: threading.Thread | None = None
+
+        self._unix_socket = Path(unix_socket) if unix_socket is not None else None
+        if self._unix_socket is not None:
+            if self._unix_socket.is_socket():
+                self._unix_socket.unlink()
+            self._httpd: socketserver.BaseServer = _UnixServer(str(self._unix_socket), _ExtractionHandler, self)
+        else:
+            self._httpd = _TcpServer((host, port), _ExtractionHandler, self)
+
+    @property
+    def service(self) -> ExtractorService:
+        """Return the service that extracts the pages."""
+        return self._service
+
+    @property
+    def batch_workers(self) -> int:
+        """Return how many URLs of all /batch requests are extracted at the same time."""
+        return self._batch_workers
+
+    @property
+    def max_batch_urls(self) -> int:
+        """Return the largest number of URLs accepted by one /batch request."""
+        return self._max_batch_urls
+
+    @property
+    def url(self) -> str:
+        """Return the base URL of a TCP server, e.g. ``http://127.0.0.1:8080``.
+
+        Raises:
+            ValueError: If the server listens on a Unix domain socket.
+        """
+        if self._unix_socket is not None:
+            raise ValueError(f"Server listens on the Unix socket {self._unix_socket}, not on a TCP port")
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def warm_up(self) -> None:
+        """Run the engines once on a small document so the first request does not pay for loading them."""
+        try:
+            self._service.extract_text_from_html(_WARM_UP_HTML)
+        except TextExtractionError as e:
+            logger.warning("Engine warm-up failed: %s", e)
+        if self._metrics is not None:
+            self._metrics.reset()
+
+    def serve_forever(self) -> None:
+        """Warm the engines up and handle requests until shutdown() is called."""
+        self.warm_up()
+        logger.info("Serving extraction requests on %s", self._unix_socket or self.url)
+        self._httpd.serve_forever()
+
+    def shutdown(self) -> None:
+        """Stop serve_forever(); requests already accepted are finished by close()."""
+        self._httpd.shutdown()
+
+    def close(self) -> None:
+        """Finish the accepted requests, then release the socket and the worker threads."""
+        self._executor.shutdown(wait=True)
+        self._batch_executor.shutdown(wait=True)
+        self._reject_executor.shutdown(wait=True)
+        self._httpd.server_close()
+        if self._unix_socket is not None:
+            self._unix_socket.unlink(missing_ok=True)
+
+    def __enter__(self) -> Self:
+        """Start serving from a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name="extraction-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop serving and release the socket."""
+        self.shutdown()
+        if self._thread is not None:
+            self._thread.join()
+        self.close()
+
+    def health(self) -> dict[str, Any]:
+        """Return the load of the server: requests pending, capacity and requests rejected so far."""
+        with self._lock:
+            return {
+                "status": "ok",
+                "pending": self._pending,
+                "capacity": self._capacity,
+                "rejected": self._rejected,
+            }
+
+    def metrics_text(self) -> str | None:
+        """Return the extraction metrics in the Prometheus text format, or None when not collected."""
+        if self._metrics is None:
+            return None
+        return to_prometheus_text(self._metrics)
+
+    def _admit(self) -> bool:
+        """Take a worker or queue slot for a new request, or count it as rejected."""
+        admitted = self._slots.acquire(blocking=False)
+        with self._lock:
+            if admitted:
+                self._pending += 1
+            else:
+                self._rejected += 1
+        return admitted
+
+    def _release(self) -> None:
+        """Free the slot of a finished request."""
+        with self._lock:
+            self._pending -= 1
+        self._slots.release()
+
+
+class _BoundedServerMixIn(socketserver.BaseServer):
+    """Hand requests to the extraction server's worker pool, answering 503 when it is full."""
+
+    app: ExtractionServer
+
+    def process_request(self, request: socket.socket, client_address: Any) -> None:  # noqa: ANN401
+        """Queue a request for a worker, or hand it to the reject threads so accepting never blocks on a client."""
+        if self.app._admit():
+            self.app._executor.submit(self._process_in_worker, request, client_address)
+        elif self.app._reject_slots.acquire(blocking=False):
+            self.app._reject_executor.submit(self._reject, request, client_address)
+        else:
+            logger.debug("Closing a rejected request unanswered: too many rejections pending")
+            self.shutdown_request(request)
+
+    def _process_in_worker(self, request: socket.socket, client_address: Any) -> None:  # noqa: ANN401
+        """Handle a request on a worker thread and free its slot afterwards."""
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self.app._release()
+
+    def _reject(self, request: socket.socket, client_address: Any) -> None:  # noqa: ANN401
+        """Answer 503 after reading the request, so the client sees the answer instead of a reset."""
+        request.settimeout(_REJECT_TIMEOUT)
+        try:
+            _OverloadedHandler(request, client_address, self)
+        except OSError as e:
+            logger.debug("Could not answer a rejected request: %s", e)
+        finally:
+            self.shutdown_request(request)
+            self.app._reject_slots.release()
+
+
+class _TcpServer(_BoundedServerMixIn, http.server.HTTPServer):
+    """TCP listener of an ExtractionServer."""
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        handler: type[http.server.BaseHTTPRequestHandler],
+        app: ExtractionServer,
+    ) -> None:
+        self.app = app
+        super().__init__(address, handler)
+
+
+class _UnixServer(_BoundedServerMixIn, socketserver.UnixStreamServer):
+    """Unix domain socket listener of an ExtractionServer."""
+
+    def __init__(self, path: str, handler: type[http.server.BaseHTTPRequestHandler], app: ExtractionServer) -> None:
+        self.app = app
+        super().__init__(path, handler)
+
+
+def _result_record(result: ExtractionResult) -> dict[str, Any]:
+    """Return the JSON fields describing a successful extraction."""
+    return {
+        "url": result.url,
+        "status": "ok",
+        "engine": result.engine,
+        "text": result.text,
+        "final_url": result.final_url,
+        "status_code": result.status_code,
+        "content_type": result.content_type,
+        "content_bytes": result.content_bytes,
+        "timings": dict(result.timings),
+        "cached": result.cached,
+    }
+
+
+def _error_record(url: object, error: BaseException) -> dict[str, Any]:
+    """Return the JSON fields describing a failed extraction."""
+    return {"url": url, "status": "error", "error": f"{type(error).__name__}: {error}"}
+
+
+def _batch_record(item: BatchResult) -> dict[str, Any]:
+    """Return the JSON fields of one /batch line, the same as the batch command writes."""
+    if item.error is not None:
+        record = _error_record(item.url, item.error)
+    elif item.result is not None:
+        record = _result_record(item.result)
+    else:
+        record = {"url": item.url, "status": "ok", "engine": item.engine, "text": item.text}
+    record["elapsed_ms"] = round(item.elapsed_ms, 1)
+    return record
+
+
+class _ExtractionHandler(http.server.BaseHTTPRequestHandler):
+    """Route requests to the extraction server's service."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "py-web-text-extractor"
+    # A kept-alive connection holds its worker until it has been idle this long.
+    timeout = KEEP_ALIVE_TIMEOUT
+    server: _TcpServer | _UnixServer
+
+    def do_GET(self) -> None:
+        """Serve /extract, /health and /metrics."""
+        route = urlsplit(self.path)
+        if route.path == "/extract":
+            urls = parse_qs(route.query).get("url")
+            if not urls:
+                self._send_json(HTTPStatus.BAD_REQUEST, {"status": "error", "error": "Missing url query parameter"})
+                return
+            self._extract(urls[0])
+        elif route.path == "/health":
+            self._send_json(HTTPStatus.OK, self.server.app.health())
+        elif route.path == "/metrics":
+            text = self.server.app.metrics_text()
+            if text is None:
+                self._send_json(HTTPStatus.NOT_FOUND, {"status": "error", "error": "Metrics are not collected"})
+                return
+            self._send_body(HTTPStatus.OK, text.encode("utf-8"), _PROMETHEUS_CONTENT_TYPE)
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"status": "error", "error": f"Unknown path {route.path}"})
+
+    def do_POST(self) -> None:
+        """Serve /extract and /batch with a JSON request body."""
+        route = urlsplit(self.path).path
+        body = self._read_json()
+        if body is None:
+            return
+        if route == "/extract":
+            url = body.get("url")
+            if not isinstance(url, str):
+                self._send_json(HTTPStatus.BAD_REQUEST, {"status": "error", "error": "Body must contain a url string"})
+                return
+            self._extract(url)
+        elif route == "/batch":
+            urls = body.get("urls")
+            if not isinstance(urls, list) or not all(isinstance(url, str) for url in urls):
+                self._send_json(HTTPStatus.BAD_REQUEST, {"status": "error", "error": "Body must contain a urls list"})
+                return
+            limit = self.server.app.max_batch_urls
+            if len(urls) > limit:
+                self._send_json(
+                    HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                    {"status": "error", "error": f"At most {limit} URLs are accepted per batch"},
+                )
+                return
+            self._batch(urls, ordered=bool(body.get("ordered")))
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"status": "error", "error": f"Unknown path {route}"})
+
+    def _extract(self, url: str) -> None:
+        """Extract one page and answer with its result, or with an error status."""
+        try:
+            result = self.server.app.service.extract_result_from_page(url)
+        except UrlIsNotValidException as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, _error_record(url, e))
+        except PageFetchException as e:
+            self._send_json(HTTPStatus.BAD_GATEWAY, _error_record(url, e))
+        except TextExtractionError as e:
+            self._send_json(HTTPStatus.UNPROCESSABLE_ENTITY, _error_record(url, e))
+        except Exception as e:
+            logger.exception("Unexpected error while extracting %s", url)
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, _error_record(url, e))
+        else:
+            self._send_json(HTTPStatus.OK, _result_record(result))
+
+    def _batch(self, urls: list[str], ordered: bool) -> None:
+        """Stream one JSON line per URL as a chunked response while the batch runs."""
+        app = self.server.app
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        results = app.service.extract_many(
+            urls, max_workers=app.batch_workers, ordered=ordered, executor=app._batch_executor
+        )
+        try:
+            for item in results:
+                line = json.dumps(_batch_record(item), ensure_ascii=False).encode("utf-8") + b"\n"
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+        except OSError as e:
+            logger.debug("Batch client went away: %s", e)
+            self.close_connection = True
+        finally:
+            results.close()
+
+    def _read_json(self) -> dict[str, Any] | None:
+        """Read a JSON object request body, answering 400 or 413 and returning None when it is unusable."""
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0 or length > MAX_REQUEST_BYTES:
+            self.close_connection = True
+            status = HTTPStatus.BAD_REQUEST if length < 0 else HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+            self._send_json(status, {"status": "error", "error": "Invalid or too large request body"})
+            return None
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"status": "error", "error": f"Invalid JSON body: {e}"})
+            return None
+        if not isinstance(body, dict):
+            self._send_json(HTTPStatus.BAD_REQUEST, {"status": "error", "error": "Body must be a JSON object"})
+            return None
+        return body
+
+    def _send_json(self, status: HTTPStatus, record: dict[str, Any]) -> None:
+        """Answer with a JSON object."""
+        self._send_body(status, json.dumps(record, ensure_ascii=False).encode("utf-8"), "application/json")
+
+    def _send_body(self, status: HTTPStatus, body: bytes, content_type: str) -> None:
+        """Answer with a complete body."""
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    @override
+    def log_message(self, format: str, *args: Any) -> None:
+        """Log requests at debug level instead of writing them to stderr."""
+        logger.debug("%s - %s", self.requestline, format % args)
+
+
+class _OverloadedHandler(_ExtractionHandler):
+    """Answer every request with 503 Service Unavailable and close the connection."""
+
+    def do_GET(self) -> None:
+        """Reject the request."""
+        self._reject()
+
+    def do_POST(self) -> None:
+        """Read and discard the body, then reject the request."""
+        try:
+            length = min(int(self.headers.get("Content-Length") or 0), MAX_REQUEST_BYTES)
+        except ValueError:
+            length = 0
+        self.rfile.read(length)
+        self._reject()
+
+    def _reject(self) -> None:
+        self.close_connection = True
+        self.send_response(HTTPStatus.SERVICE_UNAVAILABLE)
+        body = json.dumps({"status": "error", "error": "Server is overloaded, retry later"}).encode("utf-8")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Retry-After", str(_RETRY_AFTER_SECONDS))
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
@@ -1,12 +1,109 @@
 """Text extraction services for the py_web_text_extractor library.
 
 This module contains the core service implementations for web text extraction,
-including the main ExtractorService with fallback strategy and individual
-extractor implementations for different libraries.
+including the main ExtractorService with its configurable engine chain, its
+asyncio counterpart AsyncExtractorService, the shared page fetcher, the engine
+registry and individual extractor implementations for different libraries.
+Submodules are imported on first attribute access.
 """
 
-from py_web_text_extractor.service.extractor_service import ExtractorService
-from py_web_text_extractor.service.markitdown_extractor import extract_text as markitdown_extract
-from py_web_text_extractor.service.trafilatura_extractor import extract_text as trafilatura_extract
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["ExtractorService", "markitdown_extract", "trafilatura_extract"]
+if TYPE_CHECKING:
+    from py_web_text_extractor.service.async_extractor_service import AsyncExtractorService
+    from py_web_text_extractor.service.engine_registry import EngineRegistry, get_default_registry, register_engine
+    from py_web_text_extractor.service.engine_router import EngineRouter, registrable_domain
+    from py_web_text_extractor.service.engines import MarkItDownEngine, TextDensityEngine, TrafilaturaEngine
+    from py_web_text_extractor.service.extractor_service import ExtractorService
+    from py_web_text_extractor.service.fetcher import HttpFetcher, fetch_page
+    from py_web_text_extractor.service.local_page import open_local_page, page_from_html
+    from py_web_text_extractor.service.markitdown_extractor import extract_text as markitdown_extract
+    from py_web_text_extractor.service.politeness import PoliteFetcher, interleave_by_host
+    from py_web_text_extractor.service.process_parser import ProcessPoolParser
+    from py_web_text_extractor.service.quality import QualityGate, score_text
+    from py_web_text_extractor.service.resilience import CircuitBreaker, RetryingFetcher
+    from py_web_text_extractor.service.response_limits import ResponseLimits
+    from py_web_text_extractor.service.single_flight import AsyncSingleFlight, SingleFlight
+    from py_web_text_extractor.service.trafilatura_extractor import extract_text as trafilatura_extract
+    from py_web_text_extractor.service.warc_reader import extract_warc, iter_warc_records
+
+# Public name -> (module, attribute) imported on first access.
+_LAZY_ATTRIBUTES = {
+    "AsyncExtractorService": ("py_web_text_extractor.service.async_extractor_service", "AsyncExtractorService"),
+    "AsyncSingleFlight": ("py_web_text_extractor.service.single_flight", "AsyncSingleFlight"),
+    "CircuitBreaker": ("py_web_text_extractor.service.resilience", "CircuitBreaker"),
+    "EngineRegistry": ("py_web_text_extractor.service.engine_registry", "EngineRegistry"),
+    "EngineRouter": ("py_web_text_extractor.service.engine_router", "EngineRouter"),
+    "ExtractorService": ("py_web_text_extractor.service.extractor_service", "ExtractorService"),
+    "HttpFetcher": ("py_web_text_extractor.service.fetcher", "HttpFetcher"),
+    "MarkItDownEngine": ("py_web_text_extractor.service.engines", "MarkItDownEngine"),
+    "PoliteFetcher": ("py_web_text_extractor.service.politeness", "PoliteFetcher"),
+    "ProcessPoolParser": ("py_web_text_extractor.service.process_parser", "ProcessPoolParser"),
+    "QualityGate": ("py_web_text_extractor.service.quality", "QualityGate"),
+    "ResponseLimits": ("py_web_text_extractor.service.response_limits", "ResponseLimits"),
+    "RetryingFetcher": ("py_web_text_extractor.service.resilience", "RetryingFetcher"),
+    "SingleFlight": ("py_web_text_extractor.service.single_flight", "SingleFlight"),
+    "TextDensityEngine": ("py_web_text_extractor.service.engines", "TextDensityEngine"),
+    "TrafilaturaEngine": ("py_web_text_extractor.service.engines", "TrafilaturaEngine"),
+    "extract_warc": ("py_web_text_extractor.service.warc_reader", "extract_warc"),
+    "fetch_page": ("py_web_text_extractor.service.fetcher", "fetch_page"),
+    "get_default_registry": ("py_web_text_extractor.service.engine_registry", "get_default_registry"),
+    "interleave_by_host": ("py_web_text_extractor.service.politeness", "interleave_by_host"),
+    "iter_warc_records": ("py_web_text_extractor.service.warc_reader", "iter_warc_records"),
+    "markitdown_extract": ("py_web_text_extractor.service.markitdown_extractor", "extract_text"),
+    "open_local_page": ("py_web_text_extractor.service.local_page", "open_local_page"),
+    "page_from_html": ("py_web_text_extractor.service.local_page", "page_from_html"),
+    "register_engine": ("py_web_text_extractor.service.engine_registry", "register_engine"),
+    "registrable_domain": ("py_web_text_extractor.service.engine_router", "registrable_domain"),
+    "score_text": ("py_web_text_extractor.service.quality", "score_text"),
+    "trafilatura_extract": ("py_web_text_extractor.service.trafilatura_extractor", "extract_text"),
+}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import a lazily exported attribute on first access and cache it."""
+    target = _LAZY_ATTRIBUTES.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = target
+    value = getattr(import_module(module_name), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including the ones not imported yet."""
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
+
+
+__all__ = [
+    "AsyncExtractorService",
+    "AsyncSingleFlight",
+    "CircuitBreaker",
+    "EngineRegistry",
+    "EngineRouter",
+    "ExtractorService",
+    "HttpFetcher",
+    "MarkItDownEngine",
+    "PoliteFetcher",
+    "ProcessPoolParser",
+    "QualityGate",
+    "ResponseLimits",
+    "RetryingFetcher",
+    "SingleFlight",
+    "TextDensityEngine",
+    "TrafilaturaEngine",
+    "extract_warc",
+    "fetch_page",
+    "get_default_registry",
+    "interleave_by_host",
+    "iter_warc_records",
+    "markitdown_extract",
+    "open_local_page",
+    "page_from_html",
+    "register_engine",
+    "registrable_domain",
+    "score_text",
+    "trafilatura_extract",
+]
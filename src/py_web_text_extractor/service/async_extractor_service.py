@@ -0,0 +1,263 @@
+"""Asyncio-native web text extraction service.
+
+Fetches pages with non-blocking HTTP and hands only the CPU-bound parsing to an
+executor once the bytes have arrived, so many pages can be in flight without a
+thread per page. The MarkItDown/Trafilatura fallback is the one implemented by
+ExtractorService.
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
+from concurrent.futures import Executor
+from types import TracebackType
+from typing import TYPE_CHECKING, Self, override
+
+from py_web_text_extractor.abstract.extractor import AsyncExtractor
+from py_web_text_extractor.cache.extraction_cache import cache_key
+from py_web_text_extractor.exception.exceptions import (
+    PageFetchException,
+    TextExtractionFailure,
+    UrlIsNotValidException,
+)
+from py_web_text_extractor.model.batch_result import BatchResult
+from py_web_text_extractor.model.extraction_result import ExtractionResult
+from py_web_text_extractor.model.fetched_page import FetchedPage
+from py_web_text_extractor.service import async_fetcher
+from py_web_text_extractor.service.extractor_service import ExtractorService
+from py_web_text_extractor.service.fetcher import DEFAULT_TIMEOUT
+from py_web_text_extractor.service.response_limits import ResponseLimits
+from py_web_text_extractor.service.single_flight import AsyncSingleFlight
+from py_web_text_extractor.tools.validation import ensure_valid_url
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 100
+
+
+class AsyncExtractorService(AsyncExtractor):
+    """Asyncio text extraction service with MarkItDown/Trafilatura fallback strategy.
+
+    Use it as an async context manager, or call aclose() when done, so the
+    underlying HTTP client is closed.
+
+    Examples:
+        >>> async with AsyncExtractorService(max_concurrency=50) as service:
+        ...     text = await service.extract_text_from_page("https://example.com")
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: float = DEFAULT_TIMEOUT,
+        service: ExtractorService | None = None,
+        executor: Executor | None = None,
+        client: "httpx.AsyncClient | None" = None,
+        *,
+        limits: ResponseLimits | None = None,
+        coalesce: bool = True,
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            max_concurrency: Maximum number of pages fetched and parsed at once.
+            timeout: Connect and read timeout in seconds for the default client.
+            service: Synchronous service whose engines parse downloaded pages.
+                A default ExtractorService is created when omitted.
+            executor: Executor for the CPU-bound parsing stage. The event loop's
+                default executor is used when omitted.
+            client: httpx client to fetch pages with. A client is created on
+                first use when omitted and closed by aclose().
+            limits: Byte cap and accepted content types for downloaded pages.
+                The ResponseLimits defaults are used when omitted.
+            coalesce: Share one in-flight extraction between concurrent calls
+                for the same normalized URL. Callers waiting on another
+                caller's extraction do not take a concurrency slot.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        self._max_concurrency = max_concurrency
+        self._timeout = timeout
+        self._service = service or ExtractorService()
+        self._executor = executor
+        self._client = client
+        self._owns_client = client is None
+        self._limits = limits or ResponseLimits()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._flights: AsyncSingleFlight[ExtractionResult] | None = AsyncSingleFlight() if coalesce else None
+
+    async def __aenter__(self) -> Self:
+        """Enter the async context."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the HTTP client when leaving the async context."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if it was created by this service."""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
+    @override
+    async def extract_text_from_page(self, url: str) -> str:
+        """Extract text content from a web page.
+
+        Args:
+            url: HTTP/HTTPS URL to extract text from.
+
+        Returns:
+            Cleaned text content from the web page.
+
+        Raises:
+            UrlIsNotValidException: If url is None, empty, or not a valid HTTP/HTTPS URL.
+            PageFetchException: If the page cannot be downloaded.
+            TextExtractionFailure: If both extraction methods fail.
+        """
+        result = await self._extract(url)
+        return result.text
+
+    @override
+    async def extract_result_from_page(self, url: str) -> ExtractionResult:
+        """Extract text content from a web page together with the response metadata.
+
+        Args:
+            url: HTTP/HTTPS URL to extract text from.
+
+        Returns:
+            ExtractionResult holding the text, the engine that produced it, the
+            final URL, status, content type, body size and parse time.
+
+        Raises:
+            UrlIsNotValidException: If url is None, empty, or not a valid HTTP/HTTPS URL.
+            PageFetchException: If the page cannot be downloaded.
+            TextExtractionFailure: If both extraction methods fail.
+        """
+        return await self._extract(url)
+
+    @override
+    async def extract_text_from_page_safe(self, url: str) -> str:
+        """Extract text content with graceful error handling.
+
+        Args:
+            url: URL to extract text from (any value accepted).
+
+        Returns:
+            Extracted text if successful, empty string otherwise.
+        """
+        try:
+            return await self.extract_text_from_page(url)
+        except UrlIsNotValidException as e:
+            logger.warning("Invalid URL provided: %s", e)
+            return ""
+        except PageFetchException as e:
+            logger.warning("Page download failed: %s", e)
+            return ""
+        except TextExtractionFailure as e:
+            logger.warning("Text extraction failed: %s", e)
+            return ""
+        except Exception as e:
+            logger.warning("Unexpected error during text extraction: %s", e)
+            return ""
+
+    async def extract_many(self, urls: Iterable[str], ordered: bool = False) -> AsyncIterator[BatchResult]:
+        """Extract text from many web pages concurrently.
+
+        URLs are consumed lazily and at most ``2 * max_concurrency`` tasks exist
+        at any time; the semaphore limits how many of them fetch or parse at
+        once. A failing URL never stops the batch.
+
+        Args:
+            urls: URLs to extract text from.
+            ordered: Yield results in input order when True; yield them as
+                they finish when False.
+
+        Yields:
+            One BatchResult per input URL.
+        """
+        max_in_flight = self._max_concurrency * 2
+        queue: deque[asyncio.Task[BatchResult]] = deque()
+        pending: set[asyncio.Task[BatchResult]] = set()
+        try:
+            for url in urls:
+                task = asyncio.ensure_future(self._extract_batch_item(url))
+                if ordered:
+                    queue.append(task)
+                    if len(queue) >= max_in_flight:
+                        yield await queue.popleft()
+                else:
+                    pending.add(task)
+                    if len(pending) >= max_in_flight:
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for finished in done:
+                            yield finished.result()
+            while queue:
+                yield await queue.popleft()
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    yield finished.result()
+        finally:
+            for task in (*queue, *pending):
+                task.cancel()
+
+    async def _extract_batch_item(self, url: str) -> BatchResult:
+        """Extract a single URL for a batch, capturing any error in the result."""
+        started = time.perf_counter()
+        try:
+            result = await self._extract(url)
+        except Exception as e:
+            logger.warning("Batch extraction failed for %s: %s", url, e)
+            return BatchResult(url=url, error=e, elapsed_ms=(time.perf_counter() - started) * 1000)
+        return BatchResult(
+            url=url,
+            text=result.text,
+            engine=result.engine,
+            elapsed_ms=(time.perf_counter() - started) * 1000,
+            result=result,
+        )
+
+    async def _extract(self, url: str) -> ExtractionResult:
+        """Validate, fetch and extract a URL under the concurrency limit."""
+        try:
+            ensure_valid_url(url)
+        except UrlIsNotValidException as e:
+            logger.debug("Invalid URL provided: %s", e)
+            raise
+
+        if self._flights is None:
+            return await self._fetch_and_parse(url)
+        return await self._flights.do(cache_key(url), functools.partial(self._fetch_and_parse, url))
+
+    async def _fetch_and_parse(self, url: str) -> ExtractionResult:
+        """Fetch and extract a valid URL under the concurrency limit."""
+        async with self._semaphore:
+            page = await async_fetcher.fetch_page(url, self._get_client(), self._limits)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._parse, page)
+
+    def _parse(self, page: FetchedPage) -> ExtractionResult:
+        """Run the engines on a downloaded page on the executor, through the service's process pool and hooks."""
+        return self._service.parse_page_result(page)
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Return the HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = async_fetcher.create_client(self._timeout, self._max_concurrency)
+        return self._client
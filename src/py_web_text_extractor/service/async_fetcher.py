@@ -0,0 +1,105 @@
+"""Asynchronous HTTP fetch module.
+
+Non-blocking counterpart of the fetcher module built on httpx, which is an
+optional dependency installed with the ``async`` extra.
+"""
+
+import io
+import logging
+from typing import TYPE_CHECKING
+
+from py_web_text_extractor.exception.exceptions import (
+    PageFetchException,
+    ResponseTooLargeException,
+    UnsupportedContentTypeException,
+)
+from py_web_text_extractor.model.fetched_page import FetchedPage
+from py_web_text_extractor.service.response_limits import ResponseLimits
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+
+def create_client(timeout: float, max_connections: int) -> "httpx.AsyncClient":
+    """Create an httpx client suitable for fetching pages.
+
+    Args:
+        timeout: Connect and read timeout in seconds.
+        max_connections: Maximum number of open connections in the pool.
+
+    Returns:
+        New AsyncClient that follows redirects.
+
+    Raises:
+        ImportError: If httpx is not installed.
+    """
+    try:
+        import httpx  # noqa: PLC0415
+    except ImportError as e:
+        raise ImportError(
+            "Async extraction requires httpx. Install it with: pip install 'py-web-text-extractor[async]'"
+        ) from e
+
+    return httpx.AsyncClient(
+        timeout=timeout,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=max_connections),
+    )
+
+
+async def fetch_page(url: str, client: "httpx.AsyncClient", limits: ResponseLimits | None = None) -> FetchedPage:
+    """Download a web page without blocking the event loop.
+
+    The body is streamed under the same ResponseLimits policy as HttpFetcher.
+
+    Args:
+        url: HTTP/HTTPS URL to download.
+        client: httpx client used for the request.
+        limits: Byte cap and accepted content types; the defaults when omitted.
+
+    Returns:
+        FetchedPage holding the response body, headers and final URL.
+
+    Raises:
+        ResponseTooLargeException: If the body exceeds the byte cap.
+        UnsupportedContentTypeException: If the response is not text.
+        PageFetchException: If the request fails, the server answers with an
+            error status, or the response has no body.
+    """
+    import httpx  # noqa: PLC0415
+
+    limits = limits or ResponseLimits()
+    logger.debug("Fetching %s", url)
+
+    try:
+        async with client.stream("GET", url) as response:
+            response.raise_for_status()
+            limits.check_headers(url, response.headers)
+            body = io.BytesIO()
+            async for chunk in response.aiter_bytes():
+                if not body.tell():
+                    limits.check_prefix(url, chunk)
+                body.write(chunk)
+                limits.check_size(url, body.tell())
+    except (ResponseTooLargeException, UnsupportedContentTypeException) as e:
+        logger.warning("Refused response from %s: %s", url, e)
+        raise
+    except httpx.HTTPError as e:
+        logger.warning("Failed to fetch %s: %s", url, e)
+        raise PageFetchException(f"Failed to fetch {url}: {e!s}") from e
+
+    content = body.getvalue()
+    if not content:
+        logger.warning("Empty response body for %s (HTTP %s)", url, response.status_code)
+        raise PageFetchException(f"Empty response body for {url} (HTTP {response.status_code})")
+
+    logger.debug("Fetched %d bytes from %s", len(content), response.url)
+    return FetchedPage(
+        url=url,
+        final_url=str(response.url),
+        status_code=response.status_code,
+        content=content,
+        headers=response.headers,
+    )
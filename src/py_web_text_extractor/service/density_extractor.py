@@ -0,0 +1,107 @@
+"""Text-density extraction module.
+
+A single lxml pass that keeps headings and the text blocks (paragraphs, list
+items, quotes, preformatted text and long table cells) that are not mostly
+links, after dropping scripts, navigation, headers, footers and forms.
+It is far cheaper than MarkItDown or Trafilatura and does well on simple
+article pages, so it suits the front of an engine chain, with the heavier
+engines as fallbacks. lxml is installed with Trafilatura and imported on first
+use, so importing this module is cheap.
+"""
+
+import logging
+from typing import TYPE_CHECKING
+
+from py_web_text_extractor.exception.exceptions import TextDensityExtractionException
+from py_web_text_extractor.model.fetched_page import FetchedPage
+
+if TYPE_CHECKING:
+    from lxml.html import HtmlElement
+
+logger = logging.getLogger(__name__)
+
+ENGINE_NAME = "density"
+
+MAX_LINK_DENSITY = 0.5
+MIN_CELL_CHARACTERS = 40
+
+_REMOVED_TAGS = (
+    "script",
+    "style",
+    "noscript",
+    "template",
+    "svg",
+    "iframe",
+    "nav",
+    "header",
+    "footer",
+    "aside",
+    "form",
+    "button",
+    "select",
+)
+_HEADING_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+_CELL_TAGS = ("td", "th")
+_BLOCK_TAGS = (*_HEADING_TAGS, *_CELL_TAGS, "p", "li", "pre", "blockquote", "dd", "figcaption")
+_BLOCK_PREFIXES = {"li": "- ", "blockquote": "> "}
+
+
+def extract_text_from_content(page: FetchedPage) -> str:
+    """Extract the dense text blocks of an already downloaded page.
+
+    Args:
+        page: Downloaded page whose body is parsed without another request.
+
+    Returns:
+        Headings and text blocks in document order as Markdown.
+
+    Raises:
+        TextDensityExtractionException: If the content cannot be parsed as HTML
+            or no block is dense enough, so the next engine in a chain runs.
+    """
+    url = page.final_url
+    logger.debug("Scoring text density of %d bytes from %s", len(page.content), url)
+
+    try:
+        from lxml import etree, html  # noqa: PLC0415
+
+        parser = html.HTMLParser(encoding=page.charset) if page.charset else None
+        document = html.document_fromstring(page.body_bytes(), parser=parser)
+        etree.strip_elements(document, etree.Comment, *_REMOVED_TAGS, with_tail=False)
+        blocks = [block for element in document.iter(*_BLOCK_TAGS) if (block := _render_block(element))]
+    except Exception as e:
+        logger.warning("Text-density extraction failed for %s: %s", url, e)
+        raise TextDensityExtractionException(f"Text-density extraction failed for {url}: {e!s}") from e
+
+    if not blocks:
+        logger.debug("No dense text blocks found for %s", url)
+        raise TextDensityExtractionException(f"No dense text blocks found for {url}")
+
+    logger.info("Successfully extracted text from %s using text density", url)
+    return "\n\n".join(blocks)
+
+
+def _render_block(element: "HtmlElement") -> str:
+    """Render a block element as Markdown, or return an empty string when it should be skipped."""
+    if next(element.iterancestors(*_BLOCK_TAGS), None) is not None:
+        return ""  # rendered as part of its enclosing block
+    text = " ".join(element.text_content().split())
+    if not _is_dense(element, text):
+        return ""
+
+    tag = element.tag
+    if tag == "pre":
+        return f"```\n{element.text_content().strip()}\n```"
+    if tag in _HEADING_TAGS:
+        return f"{'#' * int(tag[1])} {text}"
+    return _BLOCK_PREFIXES.get(tag, "") + text
+
+
+def _is_dense(element: "HtmlElement", text: str) -> bool:
+    """Return True when a block has text that is not mostly links, and is long enough for a table cell."""
+    if not text:
+        return False
+    if element.tag in _CELL_TAGS and len(text) < MIN_CELL_CHARACTERS:
+        return False  # short cells are labels and values that read as noise out of their table
+    link_characters = sum(len(" ".join(link.text_content().split())) for link in element.iter("a"))
+    return link_characters <= MAX_LINK_DENSITY * len(text)
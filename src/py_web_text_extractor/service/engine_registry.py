@@ -0,0 +1,178 @@
+"""Extraction engine registry module.
+
+Maps engine names to factories, so the engines ExtractorService chains can be
+chosen by name per service instance, and third-party engines can be plugged in
+without changing the service. A factory is either a callable or a
+``"module:attribute"`` string naming one; string factories are imported only
+when the engine is first created, so a registered engine whose library is
+never used costs nothing.
+"""
+
+import threading
+from collections.abc import Callable, Iterable
+from importlib import import_module
+
+from py_web_text_extractor.abstract.engine import ExtractionEngine
+
+type EngineFactory = Callable[[], ExtractionEngine]
+
+DEFAULT_ENGINES = ("markitdown", "trafilatura")
+
+_BUILTIN_ENGINES = {
+    "density": "py_web_text_extractor.service.engines:TextDensityEngine",
+    "markitdown": "py_web_text_extractor.service.engines:MarkItDownEngine",
+    "trafilatura": "py_web_text_extractor.service.engines:TrafilaturaEngine",
+}
+
+
+class EngineRegistry:
+    """Thread-safe mapping of engine names to engine factories.
+
+    Examples:
+        >>> registry = EngineRegistry()
+        >>> registry.register("plain", PlainTextEngine)
+        >>> registry.register("readability", "my_package.engines:ReadabilityEngine")
+        >>> [engine.name for engine in registry.create_chain(["plain", "readability"])]
+        ['plain', 'readability']
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._factories: dict[str, EngineFactory | str] = {}
+
+    def __contains__(self, name: object) -> bool:
+        """Return True when an engine is registered under the name."""
+        return name in self._factories
+
+    def names(self) -> tuple[str, ...]:
+        """Return the registered engine names, in registration order."""
+        with self._lock:
+            return tuple(self._factories)
+
+    def register(self, name: str, factory: EngineFactory | str, *, replace: bool = False) -> None:
+        """Register an engine factory under a name.
+
+        Args:
+            name: Engine name. The engines the factory creates must report the
+                same name.
+            factory: Callable that returns a new engine, such as an
+                ExtractionEngine subclass, or a ``"module:attribute"`` string
+                naming one, imported on first use.
+            replace: Replace an engine already registered under the name
+                instead of raising.
+
+        Raises:
+            ValueError: If name is blank, the factory string is not in
+                ``"module:attribute"`` form, or the name is taken and replace
+                is False.
+        """
+        if not name or name.isspace():
+            raise ValueError("Engine name must not be blank")
+        if isinstance(factory, str) and not all(factory.partition(":")[::2]):
+            raise ValueError(f"Engine factory must be in 'module:attribute' form, got {factory!r}")
+        with self._lock:
+            if name in self._factories and not replace:
+                raise ValueError(f"An engine named {name!r} is already registered")
+            self._factories[name] = factory
+
+    def factory(self, name: str) -> EngineFactory | str:
+        """Return the factory registered under a name, e.g. to rebuild the registry in a worker process.
+
+        Raises:
+            ValueError: If no engine is registered under the name.
+        """
+        with self._lock:
+            factory = self._factories.get(name)
+        if factory is None:
+            raise ValueError(f"Unknown extraction engine {name!r}; registered engines: {', '.join(self.names())}")
+        return factory
+
+    def create(self, name: str) -> ExtractionEngine:
+        """Create a new instance of a registered engine.
+
+        Args:
+            name: Registered engine name.
+
+        Returns:
+            New engine instance.
+
+        Raises:
+            ValueError: If no engine is registered under the name, or the
+                engine reports a different name.
+            ImportError: If a string factory cannot be imported.
+        """
+        factory = self.factory(name)
+        if isinstance(factory, str):
+            factory = _import_factory(factory)
+            with self._lock:
+                if isinstance(self._factories.get(name), str):
+                    self._factories[name] = factory
+
+        engine = factory()
+        if engine.name != name:
+            raise ValueError(f"Engine registered as {name!r} reports the name {engine.name!r}")
+        return engine
+
+    def create_chain(self, engines: Iterable[str | ExtractionEngine]) -> list[ExtractionEngine]:
+        """Build an engine chain from engine names and ready-made engine instances.
+
+        Args:
+            engines: Engines in the order they are tried. Names are created
+                from this registry; instances are used as they are.
+
+        Returns:
+            Engine instances in the given order.
+
+        Raises:
+            ValueError: If the chain is empty, names an unknown engine or
+                contains two engines with the same name.
+        """
+        chain = [engine if isinstance(engine, ExtractionEngine) else self.create(engine) for engine in engines]
+        if not chain:
+            raise ValueError("The engine chain must contain at least one engine")
+        names = [engine.name for engine in chain]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"The engine chain contains duplicate engines: {', '.join(duplicates)}")
+        return chain
+
+
+def _import_factory(path: str) -> EngineFactory:
+    """Import the factory named by a ``"module:attribute"`` string."""
+    module_name, _, attribute = path.partition(":")
+    return getattr(import_module(module_name), attribute)
+
+
+_default_registry: EngineRegistry | None = None
+_default_registry_lock = threading.Lock()
+
+
+def get_default_registry() -> EngineRegistry:
+    """Return the process-wide registry, holding the built-in engines and any registered with register_engine."""
+    global _default_registry  # noqa: PLW0603
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = EngineRegistry()
+            for name, factory in _BUILTIN_ENGINES.items():
+                _default_registry.register(name, factory)
+        return _default_registry
+
+
+def register_engine(name: str, factory: EngineFactory | str, *, replace: bool = False) -> None:
+    """Register an engine in the process-wide registry, so services can chain it by name.
+
+    Args:
+        name: Engine name, reported by the engines the factory creates.
+        factory: Callable that returns a new engine, or a
+            ``"module:attribute"`` string naming one.
+        replace: Replace an engine already registered under the name.
+
+    Raises:
+        ValueError: If the name is blank or taken and replace is False.
+
+    Examples:
+        >>> register_engine("plain", PlainTextEngine)
+        >>> service = ExtractorService(engines=["plain", "trafilatura"])
+    """
+    get_default_registry().register(name, factory, replace=replace)
@@ -0,0 +1,271 @@
+"""Per-domain adaptive engine routing module.
+
+Sites built on the same template tend to suit the same engine: on some
+domains MarkItDown always returns boilerplate or fails while Trafilatura
+always succeeds. EngineRouter records every engine run per registrable domain
+(success rate and latency, both as moving averages so the table follows site
+changes) and orders the engines for the next page of that domain by what has
+worked before. The table is saved as JSON, so a crawl can start warm.
+"""
+
+import ipaddress
+import json
+import logging
+import random
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Self
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIN_SAMPLES = 5
+DEFAULT_EXPLORATION = 0.05
+DEFAULT_MAX_DOMAINS = 100_000
+
+# Weight of the newest sample in the moving averages once an engine has this many samples.
+_SMOOTHING = 0.1
+_FORMAT_VERSION = 1
+
+# Second-level labels under which registrations happen at the third level, e.g. example.co.uk.
+_SECOND_LEVEL_LABELS = frozenset({"ac", "co", "com", "edu", "gov", "govt", "ltd", "net", "nic", "nom", "org", "plc"})
+
+
+def registrable_domain(url: str) -> str:
+    """Return the registrable domain of a URL, e.g. ``example.co.uk`` for ``https://news.example.co.uk/a``.
+
+    Uses a built-in heuristic instead of the full Public Suffix List: the last
+    two labels, or the last three when the second-to-last is a common
+    second-level label under a country code (``co.uk``, ``com.au``). IP
+    addresses and single-label hosts are returned unchanged.
+
+    Args:
+        url: Page URL.
+
+    Returns:
+        Lower-cased registrable domain, or an empty string when the URL has no host.
+
+    Examples:
+        >>> registrable_domain("https://www.bbc.co.uk/news")
+        'bbc.co.uk'
+        >>> registrable_domain("http://127.0.0.1:8000/page")
+        '127.0.0.1'
+    """
+    try:
+        host = (urlparse(url).hostname or "").rstrip(".")
+    except ValueError:
+        return ""
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        pass
+    else:
+        return host
+
+    labels = host.split(".")
+    if len(labels) <= 2:  # noqa: PLR2004
+        return host
+    country_code_sld = len(labels[-1]) == 2 and labels[-2] in _SECOND_LEVEL_LABELS  # noqa: PLR2004
+    return ".".join(labels[-3:] if country_code_sld else labels[-2:])
+
+
+class _EngineStats:
+    """Moving averages of one engine's runs on one domain."""
+
+    __slots__ = ("latency", "samples", "success_rate")
+
+    def __init__(self, samples: int = 0, success_rate: float = 0.0, latency: float = 0.0) -> None:
+        self.samples = samples
+        self.success_rate = success_rate
+        self.latency = latency
+
+    def add(self, success: bool, seconds: float) -> None:
+        self.samples += 1
+        weight = max(1.0 / self.samples, _SMOOTHING)
+        self.success_rate += weight * ((1.0 if success else 0.0) - self.success_rate)
+        self.latency += weight * (seconds - self.latency)
+
+
+class EngineRouter:
+    """Thread-safe routing table that orders engines per registrable domain.
+
+    An engine is ranked by its success rate on the domain, then by its
+    latency, once it has ``min_samples`` recorded runs there; until then it
+    ranks as if it succeeded half of the time, and engines that tie keep
+    their default order. A small ``exploration`` share of pages still gets the
+    default order, so an engine that lost a domain can win it back.
+
+    Examples:
+        >>> router = EngineRouter.load("routing.json")
+        >>> service = ExtractorService(router=router)
+        >>> results = list(service.extract_many(urls))
+        >>> router.save("routing.json")
+    """
+
+    def __init__(
+        self,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        exploration: float = DEFAULT_EXPLORATION,
+        max_domains: int = DEFAULT_MAX_DOMAINS,
+    ) -> None:
+        """Initialize an empty routing table.
+
+        Args:
+            min_samples: Runs of an engine on a domain before they affect its rank.
+            exploration: Share of pages, between 0 and 1, routed in the default
+                order regardless of the table.
+            max_domains: Domains kept; the least recently used are dropped.
+
+        Raises:
+            ValueError: If a limit is out of range.
+        """
+        if min_samples < 1:
+            raise ValueError(f"min_samples must be at least 1, got {min_samples}")
+        if not 0 <= exploration <= 1:
+            raise ValueError(f"exploration must be between 0 and 1, got {exploration}")
+        if max_domains < 1:
+            raise ValueError(f"max_domains must be at least 1, got {max_domains}")
+
+        self._min_samples = min_samples
+        self._exploration = exploration
+        self._max_domains = max_domains
+        self._domains: OrderedDict[str, dict[str, _EngineStats]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of domains in the table."""
+        with self._lock:
+            return len(self._domains)
+
+    def order(self, url: str, engines: Sequence[str]) -> list[str]:
+        """Return the engines in the order to try them on a URL.
+
+        Args:
+            url: Page URL; its registrable domain selects the table row.
+            engines: Engine names in the default priority order.
+
+        Returns:
+            The same names, best-ranked first.
+        """
+        if self._exploration and random.random() < self._exploration:
+            return list(engines)
+        domain = registrable_domain(url)
+        with self._lock:
+            row = self._domains.get(domain)
+            if row is None:
+                return list(engines)
+            self._domains.move_to_end(domain)
+            ranks = {name: self._rank(row.get(name), position) for position, name in enumerate(engines)}
+        return sorted(engines, key=ranks.__getitem__)
+
+    def _rank(self, stats: _EngineStats | None, position: int) -> tuple[float, float, int]:
+        """Return a sort key: success rate, then latency, then default position."""
+        if stats is None or stats.samples < self._min_samples:
+            return (-0.5, 0.0, position)
+        return (-stats.success_rate, stats.latency, position)
+
+    def record(self, url: str, engine: str, success: bool, seconds: float) -> None:
+        """Record the outcome of one engine run.
+
+        Args:
+            url: Page URL the engine ran on.
+            engine: Engine name.
+            success: Whether the engine produced output that was returned or
+                accepted; failures and rejected output count as unsuccessful.
+            seconds: Duration of the run.
+        """
+        domain = registrable_domain(url)
+        with self._lock:
+            row = self._domains.get(domain)
+            if row is None:
+                row = self._domains[domain] = {}
+                if len(self._domains) > self._max_domains:
+                    self._domains.popitem(last=False)
+            else:
+                self._domains.move_to_end(domain)
+            row.setdefault(engine, _EngineStats()).add(success, seconds)
+
+    def stats(self, domain: str) -> dict[str, tuple[int, float, float]]:
+        """Return (samples, success_rate, latency_seconds) per engine for a registrable domain."""
+        with self._lock:
+            row = self._domains.get(domain, {})
+            return {name: (stats.samples, stats.success_rate, stats.latency) for name, stats in row.items()}
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the table to a JSON-compatible dict."""
+        with self._lock:
+            domains = {
+                domain: {
+                    name: {"samples": stats.samples, "success_rate": stats.success_rate, "latency": stats.latency}
+                    for name, stats in row.items()
+                }
+                for domain, row in self._domains.items()
+            }
+        return {"version": _FORMAT_VERSION, "domains": domains}
+
+    def update_from_dict(self, data: dict[str, Any]) -> None:
+        """Merge a table produced by to_dict, replacing rows for the same domains."""
+        if data.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported routing table version: {data.get('version')!r}")
+        with self._lock:
+            for domain, row in data.get("domains", {}).items():
+                self._domains[domain] = {
+                    name: _EngineStats(int(stats["samples"]), float(stats["success_rate"]), float(stats["latency"]))
+                    for name, stats in row.items()
+                }
+                self._domains.move_to_end(domain)
+            while len(self._domains) > self._max_domains:
+                self._domains.popitem(last=False)
+
+    def save(self, path: str | Path) -> None:
+        """Write the table to a JSON file atomically.
+
+        Args:
+            path: File to write; its directory must exist.
+
+        Raises:
+            OSError: If the file cannot be written.
+        """
+        path = Path(path)
+        temp_path = path.with_suffix(f"{path.suffix}.{threading.get_ident()}.tmp")
+        try:
+            temp_path.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+            temp_path.replace(path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            raise
+        logger.debug("Saved routing table with %d domains to %s", len(self), path)
+
+    @classmethod
+    def load(
+        cls,
+        path: str | Path,
+        *,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        exploration: float = DEFAULT_EXPLORATION,
+        max_domains: int = DEFAULT_MAX_DOMAINS,
+    ) -> Self:
+        """Create a router warm-started from a file written by save.
+
+        A missing or unreadable file yields an empty router, so the same call
+        works for the first run of a crawl.
+
+        Args:
+            path: File written by save.
+            min_samples: See the constructor.
+            exploration: See the constructor.
+            max_domains: See the constructor.
+
+        Returns:
+            New EngineRouter holding the saved table.
+        """
+        router = cls(min_samples=min_samples, exploration=exploration, max_domains=max_domains)
+        try:
+            router.update_from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            logger.debug("No routing table at %s, starting empty", path)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning("Ignoring unreadable routing table %s: %s", path, e)
+        return router
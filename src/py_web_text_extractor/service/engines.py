@@ -0,0 +1,80 @@
+"""Built-in extraction engines.
+
+Adapts the MarkItDown, Trafilatura and text-density extraction modules to the
+ExtractionEngine interface, so they can be registered in an EngineRegistry and
+chained in any order by ExtractorService. Each module imports its library on
+first use, so building an engine is cheap.
+"""
+
+from typing import override
+
+import py_web_text_extractor.service.density_extractor as dn_extractor
+import py_web_text_extractor.service.markitdown_extractor as mk_extractor
+import py_web_text_extractor.service.trafilatura_extractor as tr_extractor
+from py_web_text_extractor.abstract.engine import ExtractionEngine
+from py_web_text_extractor.model.fetched_page import FetchedPage
+
+
+class MarkItDownEngine(ExtractionEngine):
+    """Converts pages to Markdown with MarkItDown, keeping the whole document structure."""
+
+    name = mk_extractor.ENGINE_NAME
+
+    def __init__(self, pool: mk_extractor.MarkItDownPool | None = None) -> None:
+        """Initialize the engine.
+
+        Args:
+            pool: Pool of long-lived MarkItDown converters reused across
+                calls. A pool of ``mk_extractor.DEFAULT_POOL_SIZE`` converters
+                is created when omitted.
+        """
+        self._pool = pool or mk_extractor.MarkItDownPool()
+
+    @property
+    def pool(self) -> mk_extractor.MarkItDownPool:
+        """Return the converter pool the engine borrows MarkItDown instances from."""
+        return self._pool
+
+    @override
+    def extract(self, page: FetchedPage) -> str:
+        """Convert a downloaded page with MarkItDown.
+
+        Raises:
+            MarkItDownExtractionException: If MarkItDown cannot convert the content.
+        """
+        return mk_extractor.extract_text_from_content(page, pool=self._pool)
+
+
+class TrafilaturaEngine(ExtractionEngine):
+    """Extracts the main content of pages with Trafilatura, dropping boilerplate."""
+
+    name = tr_extractor.ENGINE_NAME
+
+    @override
+    def extract(self, page: FetchedPage) -> str:
+        """Extract the main content of a downloaded page with Trafilatura.
+
+        Raises:
+            TrafilaturaExtractionException: If Trafilatura cannot process the content.
+        """
+        return tr_extractor.extract_text_from_content(page)
+
+
+class TextDensityEngine(ExtractionEngine):
+    """Keeps the dense, link-poor text blocks of a page in a single lxml pass.
+
+    Much cheaper than the other engines, so it is meant to run first, with
+    MarkItDown or Trafilatura as fallbacks for pages it finds no text in.
+    """
+
+    name = dn_extractor.ENGINE_NAME
+
+    @override
+    def extract(self, page: FetchedPage) -> str:
+        """Extract the dense text blocks of a downloaded page.
+
+        Raises:
+            TextDensityExtractionException: If the content cannot be parsed as
+                HTML or has no dense text blocks.
+        """
+        return dn_extractor.extract_text_from_content(page)
@@ -1,35 +1,188 @@
 """Web text extraction service with fallback strategy.
 
 Provides a unified interface for extracting clean text content from web pages
-using MarkItDown (primary) and Trafilatura (fallback) extraction methods.
+using a chain of extraction engines, MarkItDown (primary) and Trafilatura
+(fallback) by default. Each page is downloaded once and the same response body
+is shared by every engine in the chain; the engines run one after the other or,
+with the race and hedge strategies, concurrently on a thread pool.
 """
 
+import functools
 import logging
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
 from typing import override
 
-import py_web_text_extractor.service.markitdown_extractor as mk_extractor
-import py_web_text_extractor.service.trafilatura_extractor as tr_extractor
+from py_web_text_extractor.abstract.engine import ExtractionEngine
 from py_web_text_extractor.abstract.extractor import Extractor
+from py_web_text_extractor.abstract.fetcher import Fetcher
+from py_web_text_extractor.cache.entry import CacheEntry
+from py_web_text_extractor.cache.extraction_cache import ExtractionCache, cache_key
 from py_web_text_extractor.exception.exceptions import (
-    MarkItDownExtractionException,
+    EngineExtractionException,
+    LowQualityExtractionException,
+    PageFetchException,
     TextExtractionFailure,
-    TrafilaturaExtractionException,
     UrlIsNotValidException,
 )
-from py_web_text_extractor.tools.validation import is_blank_string, is_valid_url
+from py_web_text_extractor.metrics.hooks import ExtractionHooks
+from py_web_text_extractor.model.batch_result import BatchResult
+from py_web_text_extractor.model.extraction_result import ExtractionResult
+from py_web_text_extractor.model.extraction_strategy import ExtractionStrategy
+from py_web_text_extractor.model.fetched_page import FetchedPage
+from py_web_text_extractor.service.engine_registry import DEFAULT_ENGINES, EngineRegistry, get_default_registry
+from py_web_text_extractor.service.engine_router import EngineRouter
+from py_web_text_extractor.service.engines import MarkItDownEngine
+from py_web_text_extractor.service.fetcher import HttpFetcher
+from py_web_text_extractor.service.local_page import open_local_page, page_from_html
+from py_web_text_extractor.service.markitdown_extractor import MarkItDownPool
+from py_web_text_extractor.service.process_parser import ProcessPoolParser
+from py_web_text_extractor.service.quality import QualityGate, score_text
+from py_web_text_extractor.service.resilience import CircuitBreaker
+from py_web_text_extractor.service.single_flight import SingleFlight
+from py_web_text_extractor.tools.validation import ensure_valid_url
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_ENGINE_WORKERS = 16
+DEFAULT_HEDGE_DELAY = 0.5
+
+_ENGINE_ERRORS = (EngineExtractionException, LowQualityExtractionException)
+
 
 class ExtractorService(Extractor):
-    """Text extraction service with MarkItDown/Trafilatura fallback strategy."""
+    """Text extraction service with a configurable engine chain, MarkItDown then Trafilatura by default."""
+
+    def __init__(
+        self,
+        fetcher: Fetcher | None = None,
+        markitdown_pool: MarkItDownPool | None = None,
+        cache: ExtractionCache | None = None,
+        process_parser: ProcessPoolParser | None = None,
+        *,
+        strategy: ExtractionStrategy = ExtractionStrategy.FALLBACK,
+        hedge_delay: float = DEFAULT_HEDGE_DELAY,
+        engine_executor: Executor | None = None,
+        engine_breaker: CircuitBreaker | None = None,
+        hooks: ExtractionHooks | None = None,
+        quality_gate: QualityGate | None = None,
+        router: EngineRouter | None = None,
+        coalesce: bool = True,
+        engines: Sequence[str | ExtractionEngine] | None = None,
+        registry: EngineRegistry | None = None,
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            fetcher: Component that downloads pages for the engines. A pooled,
+                keep-alive HttpFetcher with default limits is created when omitted.
+            markitdown_pool: Pool of long-lived MarkItDown converters reused across
+                calls by the ``markitdown`` engine. A pool of
+                ``mk_extractor.DEFAULT_POOL_SIZE`` converters is created when omitted.
+            cache: Optional extraction result cache consulted before fetching.
+                Stale entries are revalidated with conditional requests.
+            process_parser: Optional pool of worker processes that runs the
+                extraction engines, so parsing is not limited by the GIL while
+                fetching stays on the calling threads. The workers run the
+                engine chain the parser was created with.
+            strategy: How the engines are scheduled on a downloaded page. RACE
+                and HEDGE trade extra CPU for lower tail latency when the primary
+                engine is slow or unreliable.
+            hedge_delay: Seconds the HEDGE strategy gives the primary engine
+                before it also starts the others. Set it to about the p95
+                latency of the primary engine on your pages.
+            engine_executor: Executor the RACE and HEDGE strategies run engines
+                on. A thread pool of ``DEFAULT_ENGINE_WORKERS`` threads is
+                created on first use when omitted.
+            engine_breaker: Optional circuit breaker keyed by engine name. An
+                engine that keeps failing is skipped until its circuit
+                recovers, so pages go straight to the next engine.
+            hooks: Optional receiver of stage timings, fallbacks, failures and
+                byte/character counts, e.g. ExtractionMetrics. Nothing is
+                measured when omitted. With a process parser, per-engine
+                timings and engine failures are not reported.
+            quality_gate: Optional thresholds engine output must meet. Output
+                that is mostly links, too short or otherwise low quality is
+                rejected like an engine failure, so the next engine runs.
+                Scores are reported to the hooks.
+            router: Optional per-domain routing table. Every engine run is
+                recorded in it, and engines are tried in the order that has
+                worked best on the page's registrable domain. With RACE and
+                HEDGE the best-ranked engine is started first.
+            coalesce: Share one in-flight extraction between concurrent calls
+                for the same normalized URL, so a hot URL requested by many
+                threads at once is fetched and parsed only once. The callers
+                all receive its result or exception.
+            engines: Engine chain in the order the engines are tried, as
+                registered engine names or ExtractionEngine instances, e.g.
+                ``["density", "trafilatura"]`` to try a cheap text-density
+                pass before Trafilatura. Defaults to ``DEFAULT_ENGINES``,
+                MarkItDown then Trafilatura.
+            registry: Registry the engine names are looked up in. The
+                process-wide registry from get_default_registry is used when
+                omitted.
+
+        Raises:
+            ValueError: If hedge_delay is negative, the engine chain is empty,
+                names an unknown engine or repeats one, or an engine chain, a
+                concurrent strategy, an engine breaker, a quality gate or a
+                router is combined with a process parser.
+        """
+        if hedge_delay < 0:
+            raise ValueError(f"hedge_delay must not be negative, got {hedge_delay}")
+        if process_parser is not None and strategy is not ExtractionStrategy.FALLBACK:
+            raise ValueError(f"The {strategy} strategy cannot be combined with a process parser")
+        if process_parser is not None and engine_breaker is not None:
+            raise ValueError("An engine breaker cannot be combined with a process parser")
+        if process_parser is not None and quality_gate is not None:
+            raise ValueError("A quality gate cannot be combined with a process parser")
+        if process_parser is not None and router is not None:
+            raise ValueError("A router cannot be combined with a process parser")
+        if process_parser is not None and engines is not None:
+            raise ValueError("An engine chain cannot be combined with a process parser; pass it to the parser")
+
+        if process_parser is not None:
+            self._chain: list[ExtractionEngine] = []
+            self._engine_names = process_parser.engines
+        else:
+            chain = DEFAULT_ENGINES if engines is None else engines
+            self._chain = self._build_chain(chain, registry or get_default_registry(), markitdown_pool)
+            self._engine_names = tuple(engine.name for engine in self._chain)
+
+        self._fetcher = fetcher or HttpFetcher()
+        self._cache = cache
+        self._process_parser = process_parser
+        self._strategy = strategy
+        self._hedge_delay = hedge_delay
+        self._engine_executor = engine_executor
+        self._engine_executor_lock = threading.Lock()
+        self._engine_breaker = engine_breaker
+        self._hooks = hooks
+        self._quality_gate = quality_gate
+        self._router = router
+        self._flights: SingleFlight[ExtractionResult] | None = SingleFlight() if coalesce else None
+        self._cache_config = ">".join(self._engine_names)
+        if strategy is not ExtractionStrategy.FALLBACK:
+            self._cache_config = f"{self._cache_config}:{strategy}"
+
+    @property
+    def engine_names(self) -> tuple[str, ...]:
+        """Return the names of the engines in the chain, in the order they are tried."""
+        return self._engine_names
 
     @override
     def extract_text_from_page(self, url: str) -> str:
         """Extract text content from a web page.
 
-        Attempts extraction using MarkItDown first, falling back to Trafilatura
-        if the primary method fails. Raises an exception if both methods fail.
+        Downloads the page once, then attempts extraction using MarkItDown first,
+        falling back to Trafilatura on the same downloaded content if the primary
+        method fails, or tries the configured engine chain in the same way.
+        Raises an exception if every engine fails.
 
         Args:
             url: HTTP/HTTPS URL to extract text from. Must be a non-empty string
@@ -40,7 +193,8 @@ class ExtractorService(Extractor):
 
         Raises:
             UrlIsNotValidException: If url is None, empty, or not a valid HTTP/HTTPS URL.
-            TextExtractionFailure: If both extraction methods fail.
+            PageFetchException: If the page cannot be downloaded.
+            TextExtractionFailure: If every extraction engine fails.
 
         Examples:
             >>> service = ExtractorService()
@@ -48,33 +202,33 @@ class ExtractorService(Extractor):
             >>> len(text) > 0
             True
         """
-        if not isinstance(url, str):
-            logger.debug("Non-string URL provided: %s", url)
-            raise UrlIsNotValidException(f"URL must be a string, got {type(url).__name__}")
+        return self.extract_result_from_page(url).text
 
-        if is_blank_string(url):
-            logger.debug("Empty or blank URL provided")
-            raise UrlIsNotValidException("URL cannot be empty or blank")
+    @override
+    def extract_result_from_page(self, url: str) -> ExtractionResult:
+        """Extract text content from a web page together with the response metadata.
 
-        if not is_valid_url(url):
-            logger.debug("Invalid URL provided: %s", url)
-            raise UrlIsNotValidException(f"Invalid URL: {url}")
+        Works like extract_text_from_page, and additionally reports the engine
+        that produced the text, the final URL after redirects, the HTTP status,
+        content type, body size and stage timings.
 
-        try:
-            logger.debug("Attempting to extract text from %s using MarkItDown", url)
-            return mk_extractor.extract_text(url)
-        except MarkItDownExtractionException as e:
-            logger.info("MarkItDown extraction failed for %s: %s. Falling back to Trafilatura", url, e)
+        Args:
+            url: HTTP/HTTPS URL to extract text from.
 
-        try:
-            logger.debug("Attempting to extract text from %s using Trafilatura", url)
-            return tr_extractor.extract_text(url)
-        except TrafilaturaExtractionException as e:
-            logger.warning("Trafilatura extraction failed for %s: %s", url, e)
+        Returns:
+            ExtractionResult holding the text and how it was obtained.
 
-        error_msg = f"Failed to extract text from {url} using both MarkItDown and Trafilatura"
-        logger.error(error_msg)
-        raise TextExtractionFailure(error_msg)
+        Raises:
+            UrlIsNotValidException: If url is None, empty, or not a valid HTTP/HTTPS URL.
+            PageFetchException: If the page cannot be downloaded.
+            TextExtractionFailure: If every extraction engine fails.
+
+        Examples:
+            >>> result = ExtractorService().extract_result_from_page("https://example.com")
+            >>> result.status_code, result.engine
+            (200, 'markitdown')
+        """
+        return self._extract(url)
 
     @override
     def extract_text_from_page_safe(self, url: str) -> str:
@@ -104,9 +258,645 @@ class ExtractorService(Extractor):
         except UrlIsNotValidException as e:
             logger.warning("Invalid URL provided: %s", e)
             return ""
+        except PageFetchException as e:
+            logger.warning("Page download failed: %s", e)
+            return ""
         except TextExtractionFailure as e:
             logger.warning("Text extraction failed: %s", e)
             return ""
         except Exception as e:
             logger.warning("Unexpected error during text extraction: %s", e)
             return ""
+
+    def extract_text_from_html(self, html: bytes | str | memoryview, base_url: str | None = None) -> str:
+        r"""Extract text content from an HTML document that is already in memory.
+
+        Runs the same engines and strategy as extract_text_from_page, without
+        any network I/O and without consulting the cache.
+
+        Args:
+            html: HTML document as text, bytes or a memoryview.
+            base_url: URL the document was served from, if known.
+
+        Returns:
+            Cleaned text content from the document.
+
+        Raises:
+            TextExtractionFailure: If every extraction engine fails.
+
+        Examples:
+            >>> service = ExtractorService()
+            >>> service.extract_text_from_html("<html><body><h1>Title</h1><p>Body text</p></body></html>")
+            '# Title\n\nBody text'
+        """
+        return self.extract_result_from_html(html, base_url).text
+
+    def extract_result_from_html(self, html: bytes | str | memoryview, base_url: str | None = None) -> ExtractionResult:
+        """Extract text content from an in-memory HTML document together with the engine and timings.
+
+        Args:
+            html: HTML document as text, bytes or a memoryview.
+            base_url: URL the document was served from, if known.
+
+        Returns:
+            ExtractionResult holding the text and how it was obtained.
+
+        Raises:
+            TextExtractionFailure: If every extraction engine fails.
+        """
+        return self._parse(page_from_html(html, base_url))
+
+    def extract_text_from_path(self, path: str | os.PathLike[str]) -> str:
+        """Extract text content from a file on disk.
+
+        Large files are memory-mapped rather than read into memory before the
+        engines parse them. The Content-Type is guessed from the file extension.
+
+        Args:
+            path: File to extract text from, e.g. a page saved by a crawler.
+
+        Returns:
+            Cleaned text content from the file.
+
+        Raises:
+            PageFetchException: If the file cannot be read or is empty.
+            TextExtractionFailure: If every extraction engine fails.
+
+        Examples:
+            >>> service = ExtractorService()
+            >>> text = service.extract_text_from_path("crawl/example.html")
+        """
+        return self.extract_result_from_path(path).text
+
+    def extract_result_from_path(self, path: str | os.PathLike[str]) -> ExtractionResult:
+        """Extract text content from a file on disk together with the engine, content type and size.
+
+        Args:
+            path: File to extract text from.
+
+        Returns:
+            ExtractionResult holding the text and how it was obtained.
+
+        Raises:
+            PageFetchException: If the file cannot be read or is empty.
+            TextExtractionFailure: If every extraction engine fails.
+        """
+        with open_local_page(path) as page:
+            return self._parse(page)
+
+    def extract_many(
+        self,
+        urls: Iterable[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        ordered: bool = False,
+        executor: Executor | None = None,
+    ) -> Iterator[BatchResult]:
+        """Extract text from many web pages on a bounded thread pool.
+
+        Fetching and extraction for each URL run on worker threads, so network
+        I/O for several pages overlaps. URLs are consumed lazily and at most
+        ``2 * max_workers`` are in flight at any time, which keeps memory flat
+        for arbitrarily long inputs. A failing URL never stops the batch; its
+        error is reported in the corresponding result instead.
+
+        Args:
+            urls: URLs to extract text from.
+            max_workers: Maximum number of worker threads. Must be at least 1.
+                With an executor, only bounds the URLs in flight.
+            ordered: Yield results in input order when True; yield them as
+                they finish when False.
+            executor: Executor to run the URLs on instead of a thread pool
+                of the batch's own, e.g. one shared by concurrent batches to
+                bound their threads together. It is not shut down; URLs not
+                started when the batch is closed are cancelled.
+
+        Yields:
+            One BatchResult per input URL.
+
+        Raises:
+            ValueError: If max_workers is less than 1.
+
+        Examples:
+            >>> service = ExtractorService()
+            >>> for result in service.extract_many(["https://example.com", "invalid"], ordered=True):
+            ...     print(result.url, result.ok)
+            https://example.com True
+            invalid False
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        return self._iterate_batch(urls, self._extract_batch_item, max_workers, ordered, executor)
+
+    def extract_pages(
+        self,
+        pages: Iterable[FetchedPage],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        ordered: bool = False,
+    ) -> Iterator[BatchResult]:
+        """Extract text from many already downloaded pages on a bounded thread pool.
+
+        The offline counterpart of extract_many for pages read from disk or an
+        archive: no network I/O is performed and the cache is not consulted.
+        Pages are consumed lazily with the same in-flight bound.
+
+        Args:
+            pages: Pages to extract text from.
+            max_workers: Maximum number of worker threads. Must be at least 1.
+            ordered: Yield results in input order when True; yield them as
+                they finish when False.
+
+        Yields:
+            One BatchResult per input page, keyed by the page URL.
+
+        Raises:
+            ValueError: If max_workers is less than 1.
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        return self._iterate_batch(pages, self._parse_batch_item, max_workers, ordered)
+
+    def parse_page(self, page: FetchedPage) -> tuple[str, str]:
+        """Run the extraction engines on an already downloaded page.
+
+        With the default FALLBACK strategy, tries the engines of the chain in
+        order (MarkItDown, then Trafilatura, by default) on the same content.
+        RACE and HEDGE run the engines concurrently and return the first
+        non-blank result, preferring the earlier engine when several finish
+        together. With a router, the engine that has worked best on the page's
+        domain takes the first engine's place as the primary. This is the
+        CPU-bound half of extraction and performs no network I/O.
+
+        With a process parser, the engines run in a worker process with the
+        chain the parser was created with.
+
+        Args:
+            page: Downloaded page to extract text from.
+
+        Returns:
+            Tuple of extracted text and the name of the engine that produced it.
+
+        Raises:
+            TextExtractionFailure: If every extraction engine fails.
+        """
+        if self._process_parser is not None:
+            text, name = self._process_parser.parse(page)
+            primary = self._engine_names[0]
+        else:
+            engines = self._engines(page)
+            if self._strategy is ExtractionStrategy.RACE:
+                text, name = self._parse_concurrently(page, engines, delay=0.0)
+            elif self._strategy is ExtractionStrategy.HEDGE:
+                text, name = self._parse_concurrently(page, engines, delay=self._hedge_delay)
+            else:
+                text, name = self._parse_sequentially(page, engines)
+            primary = engines[0][0]
+
+        if self._hooks is not None and name != primary:
+            self._hooks.on_fallback(primary, name)
+        return text, name
+
+    def parse_page_result(self, page: FetchedPage) -> ExtractionResult:
+        """Run the extraction engines on an already downloaded page and describe the result.
+
+        Unlike parse_page, the parse is reported to the hooks like the parses
+        of extract_result_from_page.
+
+        Args:
+            page: Downloaded page to extract text from.
+
+        Returns:
+            ExtractionResult carrying the page's metadata and the parse time.
+
+        Raises:
+            TextExtractionFailure: If every extraction engine fails.
+        """
+        return self._parse(page)
+
+    @staticmethod
+    def _build_chain(
+        engines: Sequence[str | ExtractionEngine],
+        registry: EngineRegistry,
+        markitdown_pool: MarkItDownPool | None,
+    ) -> list[ExtractionEngine]:
+        """Create the engine chain, giving the markitdown engine the service's converter pool."""
+        if markitdown_pool is not None:
+            engines = [
+                MarkItDownEngine(markitdown_pool) if engine == MarkItDownEngine.name else engine for engine in engines
+            ]
+        return registry.create_chain(engines)
+
+    def _engines(self, page: FetchedPage) -> list[tuple[str, Callable[[], str]]]:
+        """Return the engines to run on a page in priority order, as (name, call) pairs.
+
+        The order is that of the engine chain; a router reorders it per
+        domain. Each call is wrapped with the configured quality gate, routing
+        table and hooks.
+        """
+        engines: list[tuple[str, Callable[[], str]]] = [
+            (engine.name, functools.partial(engine.extract, page)) for engine in self._chain
+        ]
+        if self._quality_gate is not None:
+            engines = [
+                (name, functools.partial(self._run_gated, self._quality_gate, page, name, engine))
+                for name, engine in engines
+            ]
+        router = self._router
+        if router is not None:
+            url = page.final_url
+            routed = {name: functools.partial(self._run_routed, router, url, name, engine) for name, engine in engines}
+            engines = [(name, routed[name]) for name in router.order(url, list(routed))]
+        if self._hooks is None:
+            return engines
+        return [(name, functools.partial(self._run_timed, self._hooks, name, engine)) for name, engine in engines]
+
+    def _run_gated(self, gate: QualityGate, page: FetchedPage, name: str, engine: Callable[[], str]) -> str:
+        """Run an engine and reject its output when it does not pass the quality gate."""
+        text = engine()
+        score = score_text(text, len(page.content))
+        reason = gate.rejection_reason(score)
+        if self._hooks is not None:
+            self._hooks.on_quality(page.url, name, score, accepted=reason is None)
+        if reason is not None:
+            logger.info("Rejected %s output for %s: %s", name, page.url, reason)
+            raise LowQualityExtractionException(f"{name} output for {page.url} rejected: {reason}", name, score)
+        return text
+
+    @staticmethod
+    def _run_routed(router: EngineRouter, url: str, name: str, engine: Callable[[], str]) -> str:
+        """Run an engine and record in the routing table whether it produced usable text."""
+        started = time.perf_counter()
+        try:
+            text = engine()
+        except _ENGINE_ERRORS:
+            router.record(url, name, success=False, seconds=time.perf_counter() - started)
+            raise
+        router.record(url, name, success=bool(text.strip()), seconds=time.perf_counter() - started)
+        return text
+
+    @staticmethod
+    def _run_timed(hooks: ExtractionHooks, name: str, engine: Callable[[], str]) -> str:
+        """Run an engine, reporting its duration and failure to the hooks."""
+        started = time.perf_counter()
+        try:
+            return engine()
+        except _ENGINE_ERRORS as e:
+            hooks.on_engine_failure(name, e)
+            raise
+        finally:
+            hooks.on_stage(f"parse.{name}", time.perf_counter() - started)
+
+    def _engine_allowed(self, name: str, url: str) -> bool:
+        """Return False when the engine's circuit breaker is open, so the engine is skipped."""
+        if self._engine_breaker is None or self._engine_breaker.allow(name):
+            return True
+        logger.info("Skipping %s for %s: too many recent failures", name, url)
+        return False
+
+    def _record_engine_outcome(self, name: str, future: Future[str]) -> None:
+        """Report a finished engine run to the engine circuit breaker."""
+        if self._engine_breaker is None or future.cancelled():
+            return
+        self._record_engine_error(name, future.exception())
+
+    def _record_engine_error(self, name: str, error: BaseException | None) -> None:
+        """Report an engine run to the engine circuit breaker.
+
+        Output rejected by the quality gate counts as a success: the engine
+        works, it just did not suit this page. Any other error, expected or
+        not, counts as a failure, so a half-open trial always settles.
+        """
+        breaker = self._engine_breaker
+        if breaker is None:
+            return
+        if error is None or isinstance(error, LowQualityExtractionException):
+            breaker.record_success(name)
+        else:
+            breaker.record_failure(name)
+
+    def _parse_sequentially(self, page: FetchedPage, engines: list[tuple[str, Callable[[], str]]]) -> tuple[str, str]:
+        """Run the engines in priority order until one succeeds."""
+        url = page.url
+
+        for name, engine in engines:
+            if not self._engine_allowed(name, url):
+                continue
+            try:
+                logger.debug("Attempting to extract text from %s using %s", url, name)
+                text = engine()
+            except _ENGINE_ERRORS as e:
+                self._record_engine_error(name, e)
+                logger.info("%s extraction failed for %s: %s", name, url, e)
+                continue
+            except BaseException as e:
+                self._record_engine_error(name, e)
+                raise
+            self._record_engine_error(name, None)
+            return text, name
+
+        error_msg = f"Failed to extract text from {url} using {', '.join(name for name, _ in engines)}"
+        logger.error(error_msg)
+        raise TextExtractionFailure(error_msg)
+
+    def _parse_concurrently(
+        self,
+        page: FetchedPage,
+        engines: list[tuple[str, Callable[[], str]]],
+        delay: float,
+    ) -> tuple[str, str]:
+        """Run the engines on the engine executor and keep the first non-blank result.
+
+        The secondary engine is started ``delay`` seconds after the primary
+        one, or as soon as the primary fails if that happens first. Python
+        threads cannot be interrupted, so the losing engine runs to completion
+        in the background. Engines whose circuit breaker is open are not
+        started.
+
+        Args:
+            page: Downloaded page to extract text from.
+            engines: Engines as (name, call) pairs, primary first.
+            delay: Seconds to wait for the primary engine before starting the others.
+
+        Returns:
+            Tuple of extracted text and the name of the engine that produced it.
+            If neither engine produces non-blank text, the first engine that
+            succeeded in priority order wins, as with the FALLBACK strategy.
+
+        Raises:
+            TextExtractionFailure: If every extraction engine fails.
+        """
+        url = page.url
+        executor = self._get_engine_executor()
+        started: list[tuple[str, Future[str]]] = []
+
+        def start(name: str, engine: Callable[[], str]) -> None:
+            if not self._engine_allowed(name, url):
+                return
+            logger.debug("Starting %s for %s", name, url)
+            future = executor.submit(engine)
+            future.add_done_callback(lambda done: self._record_engine_outcome(name, done))
+            started.append((name, future))
+
+        start(*engines[0])
+        if delay > 0 and started:
+            wait([started[0][1]], timeout=delay)
+            winner = self._first_acceptable(started)
+            if winner is not None:
+                return winner
+
+        for name, engine in engines[1:]:
+            start(name, engine)
+
+        pending = {future for _, future in started if not future.done()}
+        while True:
+            winner = self._first_acceptable(started)
+            if winner is not None:
+                return winner
+            if not pending:
+                break
+            _, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+        for name, future in started:
+            error = future.exception()
+            if error is None:
+                return future.result(), name
+            logger.warning("%s extraction failed for %s: %s", name, url, error)
+
+        error_msg = f"Failed to extract text from {url} using {', '.join(name for name, _ in engines)}"
+        logger.error(error_msg)
+        raise TextExtractionFailure(error_msg)
+
+    @staticmethod
+    def _first_acceptable(started: list[tuple[str, Future[str]]]) -> tuple[str, str] | None:
+        """Return the highest-priority finished engine result with non-blank text, if any."""
+        for name, future in started:
+            if not future.done():
+                continue
+            error = future.exception()
+            if error is None:
+                text = future.result()
+                if text.strip():
+                    return text, name
+            elif not isinstance(error, _ENGINE_ERRORS):
+                raise error
+        return None
+
+    def _get_engine_executor(self) -> Executor:
+        """Return the executor for concurrent engine runs, creating it on first use."""
+        with self._engine_executor_lock:
+            if self._engine_executor is None:
+                self._engine_executor = ThreadPoolExecutor(
+                    max_workers=DEFAULT_ENGINE_WORKERS,
+                    thread_name_prefix="engine",
+                )
+            return self._engine_executor
+
+    @staticmethod
+    def _iterate_batch[T](
+        items: Iterable[T],
+        worker: Callable[[T], BatchResult],
+        max_workers: int,
+        ordered: bool,
+        shared_executor: Executor | None = None,
+    ) -> Iterator[BatchResult]:
+        """Run the batch on a thread pool and yield results (see extract_many)."""
+        item_iterator = iter(items)
+        max_in_flight = max_workers * 2
+        executor = shared_executor or ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="extractor")
+        queue: deque[Future[BatchResult]] = deque()
+        pending: set[Future[BatchResult]] = set()
+        try:
+            if ordered:
+                for item in item_iterator:
+                    queue.append(executor.submit(worker, item))
+                    if len(queue) >= max_in_flight:
+                        yield queue.popleft().result()
+                while queue:
+                    yield queue.popleft().result()
+            else:
+                for item in item_iterator:
+                    pending.add(executor.submit(worker, item))
+                    if len(pending) >= max_in_flight:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield future.result()
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+        finally:
+            ExtractorService._stop_batch(executor, (*queue, *pending), owned=shared_executor is None)
+
+    @staticmethod
+    def _stop_batch(executor: Executor, futures: Iterable[Future[BatchResult]], owned: bool) -> None:
+        """Cancel the batch's unstarted work, shutting the executor down when the batch created it."""
+        if owned:
+            executor.shutdown(wait=True, cancel_futures=True)
+            return
+        for future in futures:
+            future.cancel()
+
+    def _extract_batch_item(self, url: str) -> BatchResult:
+        """Extract a single URL for a batch, capturing any error in the result."""
+        started = time.perf_counter()
+        try:
+            result = self._extract(url)
+        except Exception as e:
+            logger.warning("Batch extraction failed for %s: %s", url, e)
+            return BatchResult(url=url, error=e, elapsed_ms=(time.perf_counter() - started) * 1000)
+        return self._batch_result(url, result, started)
+
+    def _parse_batch_item(self, page: FetchedPage) -> BatchResult:
+        """Parse a single downloaded page for a batch, capturing any error in the result."""
+        started = time.perf_counter()
+        try:
+            result = self._parse(page)
+        except Exception as e:
+            logger.warning("Batch extraction failed for %s: %s", page.url, e)
+            return BatchResult(url=page.url, error=e, elapsed_ms=(time.perf_counter() - started) * 1000)
+        return self._batch_result(page.url, result, started)
+
+    @staticmethod
+    def _batch_result(url: str, result: ExtractionResult, started: float) -> BatchResult:
+        """Wrap a successful extraction in a BatchResult timed from started."""
+        return BatchResult(
+            url=url,
+            text=result.text,
+            engine=result.engine,
+            elapsed_ms=(time.perf_counter() - started) * 1000,
+            result=result,
+        )
+
+    def _extract(self, url: str) -> ExtractionResult:
+        """Validate, fetch and extract a URL.
+
+        Args:
+            url: URL to extract text from.
+
+        Returns:
+            Extracted text with the response metadata.
+
+        Raises:
+            UrlIsNotValidException: If url is not a valid HTTP/HTTPS URL.
+            PageFetchException: If the page cannot be downloaded.
+            TextExtractionFailure: If every extraction engine fails.
+        """
+        try:
+            ensure_valid_url(url)
+        except UrlIsNotValidException as e:
+            logger.debug("Invalid URL provided: %s", e)
+            raise
+
+        hooks = self._hooks
+        if hooks is None:
+            return self._extract_coalesced(url)
+
+        started = time.perf_counter()
+        try:
+            return self._extract_coalesced(url)
+        except PageFetchException as e:
+            hooks.on_failure(url, e)
+            raise
+        finally:
+            hooks.on_stage("extract", time.perf_counter() - started)
+
+    def _extract_coalesced(self, url: str) -> ExtractionResult:
+        """Extract a valid URL, joining a concurrent extraction of the same normalized URL if one is in flight."""
+        if self._flights is None:
+            return self._extract_validated(url)
+
+        return self._flights.do(cache_key(url, self._cache_config), functools.partial(self._extract_validated, url))
+
+    def _extract_validated(self, url: str) -> ExtractionResult:
+        """Fetch and extract a valid URL, through the cache when one is configured."""
+        if self._cache is None:
+            return self._parse(self._fetch(url))
+
+        return self._extract_cached(url, self._cache)
+
+    def _fetch(self, url: str, headers: dict[str, str] | None = None) -> FetchedPage:
+        """Download a page, reporting the download to the hooks."""
+        fetcher = self._fetcher
+        hooks = self._hooks
+        if hooks is None:
+            return fetcher.fetch_page(url, headers=headers) if headers else fetcher.fetch_page(url)
+
+        started = time.perf_counter()
+        try:
+            page = fetcher.fetch_page(url, headers=headers) if headers else fetcher.fetch_page(url)
+        finally:
+            hooks.on_stage("fetch", time.perf_counter() - started)
+        hooks.on_fetch(page)
+        for phase, seconds in page.timings.items():
+            hooks.on_stage(f"fetch.{phase}", seconds)
+        return page
+
+    def _extract_cached(self, url: str, cache: ExtractionCache) -> ExtractionResult:
+        """Extract a URL through the cache, revalidating stale entries."""
+        key = cache_key(url, self._cache_config)
+        entry = cache.get(key)
+
+        if entry is not None and cache.is_fresh(entry):
+            logger.debug("Cache hit for %s", url)
+            cache.record_hit()
+            return self._cached_result(url, entry)
+
+        validators = entry.conditional_headers() if entry is not None else {}
+        page = self._fetch(url, validators)
+
+        if entry is not None and page.not_modified:
+            logger.debug("Cached copy of %s revalidated", url)
+            cache.record_revalidation()
+            cache.put(key, entry.refreshed())
+            return self._cached_result(url, entry)
+
+        cache.record_miss()
+        result = self._parse(page)
+        cache.put(
+            key,
+            CacheEntry(
+                text=result.text,
+                engine=result.engine,
+                etag=page.header("ETag"),
+                last_modified=page.header("Last-Modified"),
+                final_url=result.final_url,
+                status_code=result.status_code,
+                content_type=result.content_type,
+                content_bytes=result.content_bytes,
+            ),
+        )
+        return result
+
+    @staticmethod
+    def _cached_result(url: str, entry: CacheEntry) -> ExtractionResult:
+        """Describe text served from the cache with the metadata stored alongside it."""
+        return ExtractionResult(
+            url=url,
+            text=entry.text,
+            engine=entry.engine,
+            final_url=entry.final_url or url,
+            status_code=entry.status_code,
+            content_type=entry.content_type,
+            content_bytes=entry.content_bytes,
+            cached=True,
+        )
+
+    def _parse(self, page: FetchedPage) -> ExtractionResult:
+        """Run the engines in-process, or in a worker process when configured, reporting to the hooks."""
+        hooks = self._hooks
+        started = time.perf_counter()
+        if hooks is None:
+            text, engine = self.parse_page(page)
+            return ExtractionResult.from_page(page, text, engine, time.perf_counter() - started)
+
+        try:
+            text, engine = self.parse_page(page)
+        except Exception as e:
+            hooks.on_failure(page.url, e)
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            hooks.on_stage("parse", elapsed)
+        hooks.on_result(page.url, engine, len(text))
+        return ExtractionResult.from_page(page, text, engine, elapsed)
@@ -0,0 +1,261 @@
+"""HTTP fetch module.
+
+Downloads a web page once so that the same response body can be handed to
+every extraction engine without a second network round trip. HttpFetcher keeps
+a pooled, keep-alive session so repeated pages from one host reuse connections
+and TLS sessions.
+"""
+
+import io
+import logging
+import threading
+import time
+from collections.abc import Mapping
+from http import HTTPStatus
+from types import TracebackType
+from typing import Self, override
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+from py_web_text_extractor.abstract.fetcher import Fetcher
+from py_web_text_extractor.exception.exceptions import (
+    PageConnectionException,
+    PageFetchException,
+    PageStatusException,
+    ResponseTooLargeException,
+    UnsupportedContentTypeException,
+)
+from py_web_text_extractor.model.fetched_page import FetchedPage
+from py_web_text_extractor.service.response_limits import DEFAULT_MAX_RESPONSE_BYTES, ResponseLimits
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 10
+DEFAULT_MAX_POOLED_HOSTS = 100
+CHUNK_SIZE = 64 * 1024
+
+
+class HttpFetcher(Fetcher):
+    """Fetcher backed by a shared, keep-alive requests session.
+
+    Connections are pooled per host and reused across calls and threads. The
+    session advertises every compression scheme urllib3 can decode (gzip,
+    deflate, and br when a brotli package is installed). Bodies are streamed
+    under a ResponseLimits policy: responses declaring too large a body or a
+    non-text type are refused before the body is read, bodies that start like
+    a binary format are refused after the first chunk, and the download is
+    aborted as soon as it exceeds the byte cap.
+
+    Examples:
+        >>> with HttpFetcher(max_connections_per_host=4, read_timeout=15) as fetcher:
+        ...     page = fetcher.fetch_page("https://example.com")
+    """
+
+    def __init__(
+        self,
+        *,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_TIMEOUT,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        max_pooled_hosts: int = DEFAULT_MAX_POOLED_HOSTS,
+        max_response_bytes: int | None = None,
+        limits: ResponseLimits | None = None,
+        session: requests.Session | None = None,
+    ) -> None:
+        """Initialize the fetcher.
+
+        Args:
+            connect_timeout: Seconds to wait for a connection to be established.
+            read_timeout: Seconds to wait between bytes received from the server.
+            max_connections_per_host: Connections kept open per host. Threads
+                wait for a free connection instead of opening more.
+            max_pooled_hosts: Number of per-host connection pools kept alive.
+            max_response_bytes: Largest decoded body accepted, in bytes
+                (20 MiB by default). Shorthand for ``limits=ResponseLimits(max_bytes=...)``.
+            limits: Byte cap and accepted content types. Only text types are
+                accepted by default; pass ``ResponseLimits(accepted_content_types=None)``
+                to fetch documents such as PDFs for MarkItDown.
+            session: Session to send requests with. A pooled session is created
+                when omitted; a session passed in is used as is.
+
+        Raises:
+            ValueError: If a limit is less than 1, or both max_response_bytes and limits are given.
+        """
+        if max_connections_per_host < 1:
+            raise ValueError(f"max_connections_per_host must be at least 1, got {max_connections_per_host}")
+        if max_pooled_hosts < 1:
+            raise ValueError(f"max_pooled_hosts must be at least 1, got {max_pooled_hosts}")
+        if max_response_bytes is not None and limits is not None:
+            raise ValueError("Pass either max_response_bytes or limits, not both")
+        if limits is None:
+            limits = ResponseLimits(
+                max_bytes=DEFAULT_MAX_RESPONSE_BYTES if max_response_bytes is None else max_response_bytes
+            )
+
+        self._timeout = (connect_timeout, read_timeout)
+        self._limits = limits
+        self._session = session or self._create_session(max_connections_per_host, max_pooled_hosts)
+
+    @staticmethod
+    def _create_session(max_connections_per_host: int, max_pooled_hosts: int) -> requests.Session:
+        """Create a session with bounded per-host connection pools."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=max_pooled_hosts,
+            pool_maxsize=max_connections_per_host,
+            pool_block=True,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        return session
+
+    @property
+    def max_response_bytes(self) -> int:
+        """Return the largest decoded body accepted, in bytes."""
+        return self._limits.max_bytes
+
+    @property
+    def limits(self) -> ResponseLimits:
+        """Return the byte cap and content-type policy applied to responses."""
+        return self._limits
+
+    def __enter__(self) -> Self:
+        """Enter the context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close pooled connections when leaving the context."""
+        self.close()
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self._session.close()
+
+    @override
+    def fetch_page(self, url: str, headers: Mapping[str, str] | None = None) -> FetchedPage:
+        """Download a web page and keep its body and headers in memory.
+
+        Args:
+            url: HTTP/HTTPS URL to download.
+            headers: Extra request headers, e.g. validators for a conditional request.
+
+        Returns:
+            FetchedPage holding the response body, headers, final URL and the
+            time spent waiting for the response and reading its body. A 304
+            answer to a conditional request yields an empty, ``not_modified`` page.
+
+        Raises:
+            PageStatusException: If the server answers with an error status.
+            PageConnectionException: If the connection fails, is reset or times out.
+            ResponseTooLargeException: If the body exceeds the byte cap.
+            UnsupportedContentTypeException: If the response is not text.
+            PageFetchException: If the request fails or the response has no body.
+
+        Examples:
+            >>> page = HttpFetcher().fetch_page("https://example.com")
+            >>> page.status_code
+            200
+        """
+        logger.debug("Fetching %s", url)
+
+        try:
+            with self._session.get(url, headers=headers, timeout=self._timeout, stream=True) as response:
+                response.raise_for_status()
+                if response.status_code == HTTPStatus.NOT_MODIFIED:
+                    logger.debug("%s not modified since the cached copy", url)
+                    return FetchedPage(
+                        url=url,
+                        final_url=response.url,
+                        status_code=response.status_code,
+                        content=b"",
+                        headers=response.headers,
+                    )
+                self._limits.check_headers(url, response.headers)
+                started = time.perf_counter()
+                content = self._read_body(url, response)
+                timings = {"wait": response.elapsed.total_seconds(), "download": time.perf_counter() - started}
+        except (ResponseTooLargeException, UnsupportedContentTypeException) as e:
+            logger.warning("Refused response from %s: %s", url, e)
+            raise
+        except requests.HTTPError as e:
+            logger.warning("Failed to fetch %s: %s", url, e)
+            status_code = e.response.status_code if e.response is not None else 0
+            headers = e.response.headers if e.response is not None else None
+            raise PageStatusException(f"Failed to fetch {url}: {e!s}", status_code, headers) from e
+        except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+            logger.warning("Failed to fetch %s: %s", url, e)
+            raise PageConnectionException(f"Failed to fetch {url}: {e!s}") from e
+        except requests.RequestException as e:
+            logger.warning("Failed to fetch %s: %s", url, e)
+            raise PageFetchException(f"Failed to fetch {url}: {e!s}") from e
+
+        if not content:
+            logger.warning("Empty response body for %s (HTTP %s)", url, response.status_code)
+            raise PageFetchException(f"Empty response body for {url} (HTTP {response.status_code})")
+
+        logger.debug("Fetched %d bytes from %s", len(content), response.url)
+        return FetchedPage(
+            url=url,
+            final_url=response.url,
+            status_code=response.status_code,
+            content=content,
+            headers=response.headers,
+            timings=timings,
+        )
+
+    def _read_body(self, url: str, response: requests.Response) -> bytes:
+        """Stream the decoded body, sniffing the first chunk and aborting once it exceeds the byte cap.
+
+        The chunks are written to a BytesIO, whose getvalue() hands over its
+        buffer instead of copying it, so a page costs its body size once.
+        """
+        body = io.BytesIO()
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            if not body.tell():
+                self._limits.check_prefix(url, chunk)
+            body.write(chunk)
+            self._limits.check_size(url, body.tell())
+        return body.getvalue()
+
+
+_default_fetcher: HttpFetcher | None = None
+_default_fetcher_lock = threading.Lock()
+
+
+def get_default_fetcher() -> HttpFetcher:
+    """Return the process-wide fetcher used by the module-level helpers."""
+    global _default_fetcher  # noqa: PLW0603
+    with _default_fetcher_lock:
+        if _default_fetcher is None:
+            _default_fetcher = HttpFetcher()
+        return _default_fetcher
+
+
+def fetch_page(url: str) -> FetchedPage:
+    """Download a web page with the process-wide default fetcher.
+
+    Args:
+        url: HTTP/HTTPS URL to download.
+
+    Returns:
+        FetchedPage holding the response body, headers and final URL.
+
+    Raises:
+        PageFetchException: If the page cannot be downloaded.
+
+    Examples:
+        >>> page = fetch_page("https://example.com")
+        >>> page.status_code
+        200
+    """
+    return get_default_fetcher().fetch_page(url)
@@ -1,16 +1,118 @@
 """MarkItDown text extraction module.
 
-Provides text extraction from web pages using the MarkItDown library.
+Provides text extraction from web pages using the MarkItDown library. The
+library itself is imported on first use, so importing this module is cheap.
 """
 
 import logging
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
 
-from markitdown import MarkItDown
+import py_web_text_extractor.service.fetcher as http_fetcher
+from py_web_text_extractor.exception.exceptions import MarkItDownExtractionException, PageFetchException
+from py_web_text_extractor.model.fetched_page import FetchedPage
 
-from py_web_text_extractor.exception.exceptions import MarkItDownExtractionException
+if TYPE_CHECKING:
+    from markitdown import MarkItDown
 
 logger = logging.getLogger(__name__)
 
+ENGINE_NAME = "markitdown"
+
+DEFAULT_POOL_SIZE = 8
+
+
+class MarkItDownPool:
+    """Thread-safe pool of reusable MarkItDown converters.
+
+    Building a MarkItDown instance registers every converter and loads its file
+    type detection model, which costs far more than converting a typical page.
+    The pool creates converters lazily, up to ``size`` instances, and hands each
+    one to a single thread at a time so they can be reused across calls.
+
+    Examples:
+        >>> pool = MarkItDownPool(size=4)
+        >>> with pool.acquire() as md:
+        ...     result = md.convert_stream(stream)
+    """
+
+    def __init__(self, size: int = DEFAULT_POOL_SIZE) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            size: Maximum number of converters the pool creates. Threads that
+                find every converter in use wait for one to be released.
+
+        Raises:
+            ValueError: If size is less than 1.
+        """
+        if size < 1:
+            raise ValueError(f"size must be at least 1, got {size}")
+
+        self._size = size
+        self._created = 0
+        self._available = threading.Condition()
+        self._idle: list[MarkItDown] = []
+
+    @property
+    def size(self) -> int:
+        """Return the maximum number of converters in the pool."""
+        return self._size
+
+    @contextmanager
+    def acquire(self) -> Iterator["MarkItDown"]:
+        """Borrow a converter for the duration of a ``with`` block.
+
+        Yields:
+            MarkItDown instance reserved for the calling thread.
+        """
+        md = self._take()
+        try:
+            yield md
+        finally:
+            with self._available:
+                self._idle.append(md)
+                self._available.notify()
+
+    def _take(self) -> "MarkItDown":
+        """Return an idle converter, creating one if the pool is not full yet.
+
+        Waiting threads re-check the pool whenever a converter is released or a
+        creation fails, so a failed creation lets a waiter try again.
+        """
+        with self._available:
+            while not self._idle and self._created >= self._size:
+                self._available.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+
+        logger.debug("Creating MarkItDown converter (pool size %d)", self._size)
+        try:
+            from markitdown import MarkItDown  # noqa: PLC0415
+
+            return MarkItDown()
+        except BaseException:
+            with self._available:
+                self._created -= 1
+                self._available.notify()
+            raise
+
+
+_default_pool: MarkItDownPool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_pool() -> MarkItDownPool:
+    """Return the process-wide converter pool used when no pool is passed."""
+    global _default_pool  # noqa: PLW0603
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = MarkItDownPool()
+        return _default_pool
+
 
 def extract_text(url: str) -> str:
     r"""Extract text content from a web page using MarkItDown.
@@ -35,8 +137,42 @@ def extract_text(url: str) -> str:
     logger.debug("Starting MarkItDown extraction for URL: %s", url)
 
     try:
-        md = MarkItDown()
-        text = md.convert(url)
+        page = http_fetcher.fetch_page(url)
+    except PageFetchException as e:
+        logger.warning("MarkItDown extraction failed for %s: %s", url, e)
+        raise MarkItDownExtractionException(f"MarkItDown extraction failed for {url}: {e!s}") from e
+
+    return extract_text_from_content(page)
+
+
+def extract_text_from_content(page: FetchedPage, pool: MarkItDownPool | None = None) -> str:
+    """Extract text content from an already downloaded page using MarkItDown.
+
+    Args:
+        page: Downloaded page whose body is converted without another request.
+        pool: Converter pool to borrow a MarkItDown instance from. The
+            process-wide default pool is used when omitted.
+
+    Returns:
+        Extracted text content from the page body.
+
+    Raises:
+        MarkItDownExtractionException: If MarkItDown cannot convert the content.
+    """
+    url = page.final_url
+    logger.debug("Converting %d bytes from %s using MarkItDown", len(page.content), url)
+
+    try:
+        from markitdown import StreamInfo  # noqa: PLC0415
+
+        stream_info = StreamInfo(
+            mimetype=page.content_type,
+            charset=page.charset,
+            extension=page.extension,
+            url=url,
+        )
+        with (pool or get_default_pool()).acquire() as md:
+            text = md.convert_stream(page.open_stream(), stream_info=stream_info)
         extracted_text = text.text_content
         logger.info("Successfully extracted text from %s using MarkItDown", url)
         return extracted_text
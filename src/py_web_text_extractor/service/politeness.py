@@ -0,0 +1,306 @@
+"""Per-host politeness module.
+
+Parallel extraction can easily send hundreds of simultaneous requests to one
+host and get throttled or banned. PoliteFetcher wraps another fetcher and
+spaces requests to each host according to a request rate, a cap on concurrent
+connections, robots.txt Crawl-delay and Retry-After answers, while requests to
+different hosts proceed independently. interleave_by_host reorders a URL stream
+so that worker threads are spread over many hosts instead of queueing behind a
+single slow one.
+"""
+
+import email.utils
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import UTC, datetime
+from http import HTTPStatus
+from typing import override
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+from py_web_text_extractor.abstract.fetcher import Fetcher
+from py_web_text_extractor.exception.exceptions import PageFetchException, PageStatusException
+from py_web_text_extractor.model.fetched_page import FetchedPage
+from py_web_text_extractor.service.fetcher import HttpFetcher
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REQUESTS_PER_SECOND = 2.0
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 2
+DEFAULT_MAX_RETRY_AFTER = 120.0
+DEFAULT_USER_AGENT = "*"
+DEFAULT_INTERLEAVE_WINDOW = 1000
+
+_THROTTLING_STATUSES = frozenset({HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE})
+
+
+class _HostState:
+    """Scheduling state for a single host."""
+
+    __slots__ = ("connections", "crawl_delay", "lock", "next_request_at", "robots_loaded", "robots_lock")
+
+    def __init__(self, max_connections: int) -> None:
+        self.connections = threading.BoundedSemaphore(max_connections)
+        self.lock = threading.Lock()
+        self.robots_lock = threading.Lock()
+        self.robots_loaded = False
+        self.crawl_delay = 0.0
+        self.next_request_at = 0.0
+
+
+class PoliteFetcher(Fetcher):
+    """Fetcher that limits the request rate and concurrency per host.
+
+    Each host gets its own connection cap and request schedule, and robots.txt
+    is downloaded once per host to honour its Crawl-delay. A 429 or 503 answer
+    with a Retry-After header pushes back every request to that host and the
+    URL is tried once more after the delay.
+
+    Examples:
+        >>> fetcher = PoliteFetcher(HttpFetcher(), requests_per_second=1, max_connections_per_host=2)
+        >>> service = ExtractorService(fetcher=fetcher)
+        >>> results = list(service.extract_many(interleave_by_host(urls), max_workers=64))
+    """
+
+    def __init__(
+        self,
+        fetcher: Fetcher | None = None,
+        *,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        obey_crawl_delay: bool = True,
+        user_agent: str = DEFAULT_USER_AGENT,
+        max_retry_after: float = DEFAULT_MAX_RETRY_AFTER,
+    ) -> None:
+        """Initialize the fetcher.
+
+        Args:
+            fetcher: Fetcher that performs the requests. A pooled HttpFetcher
+                is created when omitted.
+            requests_per_second: Requests started per second and host.
+            max_connections_per_host: Requests in flight per host at once.
+            obey_crawl_delay: Download robots.txt once per host and space
+                requests by its Crawl-delay (or Request-rate) when that is
+                longer than the configured rate.
+            user_agent: User agent whose robots.txt rules apply.
+            max_retry_after: Longest Retry-After, in seconds, that is waited
+                out. Longer delays fail the URL but still defer the host.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        if requests_per_second <= 0:
+            raise ValueError(f"requests_per_second must be positive, got {requests_per_second}")
+        if max_connections_per_host < 1:
+            raise ValueError(f"max_connections_per_host must be at least 1, got {max_connections_per_host}")
+        if max_retry_after < 0:
+            raise ValueError(f"max_retry_after must not be negative, got {max_retry_after}")
+
+        self._fetcher = fetcher or HttpFetcher()
+        self._interval = 1.0 / requests_per_second
+        self._max_connections = max_connections_per_host
+        self._obey_crawl_delay = obey_crawl_delay
+        self._user_agent = user_agent
+        self._max_retry_after = max_retry_after
+        self._hosts: dict[str, _HostState] = {}
+        self._hosts_lock = threading.Lock()
+
+    @override
+    def fetch_page(self, url: str, headers: Mapping[str, str] | None = None) -> FetchedPage:
+        """Download a web page once the host's rate and connection limits allow it.
+
+        Args:
+            url: HTTP/HTTPS URL to download.
+            headers: Extra request headers, passed to the wrapped fetcher.
+
+        Returns:
+            FetchedPage returned by the wrapped fetcher.
+
+        Raises:
+            PageFetchException: If the page cannot be downloaded, including when
+                the host is still throttling after its Retry-After delay.
+        """
+        state = self._host_state(url)
+        with state.connections:
+            self._wait_for_turn(state)
+            try:
+                return self._fetch(url, headers)
+            except PageStatusException as e:
+                retry_after = self._throttled_for(e)
+                if retry_after is None:
+                    raise
+                logger.info("%s throttled by the server, deferring its host by %.1fs", url, retry_after)
+                self._defer(state, retry_after)
+                if retry_after > self._max_retry_after:
+                    raise
+            self._wait_for_turn(state)
+            return self._fetch(url, headers)
+
+    def _fetch(self, url: str, headers: Mapping[str, str] | None) -> FetchedPage:
+        """Call the wrapped fetcher, passing headers only when there are any."""
+        if headers is None:
+            return self._fetcher.fetch_page(url)
+        return self._fetcher.fetch_page(url, headers=headers)
+
+    def _host_state(self, url: str) -> _HostState:
+        """Return the scheduling state for the URL's host, loading robots.txt on first use."""
+        parts = urlparse(url)
+        host = parts.netloc.lower()
+        with self._hosts_lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._hosts[host] = _HostState(self._max_connections)
+
+        if self._obey_crawl_delay and not state.robots_loaded:
+            with state.robots_lock:
+                if not state.robots_loaded:
+                    state.crawl_delay = self._load_crawl_delay(f"{parts.scheme}://{parts.netloc}/robots.txt")
+                    state.robots_loaded = True
+        return state
+
+    def _load_crawl_delay(self, robots_url: str) -> float:
+        """Download robots.txt and return its crawl delay for the user agent, or 0 when there is none."""
+        try:
+            page = self._fetch(robots_url, None)
+        except PageFetchException as e:
+            logger.debug("No usable robots.txt at %s: %s", robots_url, e)
+            return 0.0
+
+        parser = RobotFileParser(robots_url)
+        parser.parse(page.body_bytes().decode("utf-8", errors="replace").splitlines())
+        delay = parser.crawl_delay(self._user_agent)
+        if delay is not None:
+            crawl_delay = float(delay)
+        else:
+            rate = parser.request_rate(self._user_agent)
+            crawl_delay = rate.seconds / rate.requests if rate is not None and rate.requests else 0.0
+        if crawl_delay:
+            logger.debug("Using a %.1fs crawl delay from %s", crawl_delay, robots_url)
+        return crawl_delay
+
+    def _wait_for_turn(self, state: _HostState) -> None:
+        """Reserve the host's next request slot and sleep until it starts."""
+        with state.lock:
+            now = time.monotonic()
+            start = max(now, state.next_request_at)
+            state.next_request_at = start + max(self._interval, state.crawl_delay)
+        if start > now:
+            time.sleep(start - now)
+
+    @staticmethod
+    def _defer(state: _HostState, delay: float) -> None:
+        """Push the host's next request slot at least delay seconds into the future."""
+        with state.lock:
+            state.next_request_at = max(state.next_request_at, time.monotonic() + delay)
+
+    @staticmethod
+    def _throttled_for(error: PageStatusException) -> float | None:
+        """Return the Retry-After delay of a throttling answer, or None if it is not one."""
+        if error.status_code not in _THROTTLING_STATUSES:
+            return None
+        return retry_after_delay(error)
+
+
+def retry_after_delay(error: PageStatusException) -> float | None:
+    """Return the delay requested by the Retry-After header of a failed response, if any."""
+    value = next((value for name, value in error.headers.items() if name.lower() == "retry-after"), None)
+    return parse_retry_after(value) if value is not None else None
+
+
+def parse_retry_after(value: str) -> float | None:
+    """Parse a Retry-After header value into a delay in seconds.
+
+    Args:
+        value: Either a number of seconds or an HTTP date.
+
+    Returns:
+        Delay in seconds (0 for dates in the past), or None if the value is malformed.
+
+    Examples:
+        >>> parse_retry_after("120")
+        120.0
+        >>> parse_retry_after("soon") is None
+        True
+    """
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+def interleave_by_host(urls: Iterable[str], window: int = DEFAULT_INTERLEAVE_WINDOW) -> Iterator[str]:
+    """Reorder URLs so that consecutive URLs go to different hosts.
+
+    Up to ``window`` URLs are buffered in per-host queues and handed out
+    round-robin across hosts, so a long run of URLs for one host does not
+    leave every worker waiting on that host's rate limit. Input is consumed
+    lazily and each URL is yielded exactly once.
+
+    Args:
+        urls: URLs to reorder.
+        window: Maximum number of URLs buffered at once. Must be at least 1.
+
+    Yields:
+        The input URLs, interleaved across hosts.
+
+    Raises:
+        ValueError: If window is less than 1.
+
+    Examples:
+        >>> list(interleave_by_host(["https://a.com/1", "https://a.com/2", "https://b.com/1"], window=10))
+        ['https://a.com/1', 'https://b.com/1', 'https://a.com/2']
+    """
+    if window < 1:
+        raise ValueError(f"window must be at least 1, got {window}")
+
+    return _interleave(urls, window)
+
+
+def _interleave(urls: Iterable[str], window: int) -> Iterator[str]:
+    """Buffer URLs per host and yield them round-robin (see interleave_by_host)."""
+    queues: dict[str, deque[str]] = {}
+    ring: deque[str] = deque()
+    buffered = 0
+
+    def take() -> str:
+        host = ring.popleft()
+        queue = queues[host]
+        url = queue.popleft()
+        if queue:
+            ring.append(host)
+        else:
+            del queues[host]
+        return url
+
+    for url in urls:
+        host = _host_of(url)
+        if host not in queues:
+            queues[host] = deque()
+            ring.append(host)
+        queues[host].append(url)
+        buffered += 1
+        if buffered >= window:
+            buffered -= 1
+            yield take()
+
+    while ring:
+        yield take()
+
+
+def _host_of(url: object) -> str:
+    """Return the lower-cased host of a URL, or an empty string when it has none."""
+    if not isinstance(url, str):
+        return ""
+    try:
+        return urlparse(url).netloc.lower()
+    except ValueError:
+        return ""
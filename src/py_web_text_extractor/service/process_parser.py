@@ -0,0 +1,153 @@
+"""Process-pool parsing module.
+
+Trafilatura and MarkItDown spend most of their time in pure-Python and lxml
+code that holds the GIL, so adding threads stops scaling once fetching is no
+longer the bottleneck. ProcessPoolParser keeps fetching on the caller's threads
+and sends only the downloaded bytes to worker processes, each of which keeps a
+warm ExtractorService for the lifetime of the pool.
+"""
+
+import logging
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from types import TracebackType
+from typing import TYPE_CHECKING, Self
+
+from py_web_text_extractor.model.fetched_page import FetchedPage
+from py_web_text_extractor.service.engine_registry import (
+    DEFAULT_ENGINES,
+    EngineFactory,
+    EngineRegistry,
+    get_default_registry,
+)
+
+if TYPE_CHECKING:
+    from py_web_text_extractor.service.extractor_service import ExtractorService
+
+logger = logging.getLogger(__name__)
+
+# Fields sent to a worker: URL, final URL, status code, Content-Type header and body.
+type PagePayload = tuple[str, str, int, str | None, bytes]
+
+# Engine chain sent to a worker: (name, factory) pairs in the order the engines are tried.
+type EngineSpecs = tuple[tuple[str, EngineFactory | str], ...]
+
+_worker_service: "ExtractorService | None" = None
+
+
+def _init_worker(engines: EngineSpecs | None = None) -> "ExtractorService":
+    """Build the worker's ExtractorService and warm its MarkItDown converter if the chain uses MarkItDown."""
+    global _worker_service  # noqa: PLW0603
+    from py_web_text_extractor.service.extractor_service import ExtractorService  # noqa: PLC0415
+    from py_web_text_extractor.service.markitdown_extractor import ENGINE_NAME, MarkItDownPool  # noqa: PLC0415
+
+    registry = EngineRegistry()
+    for name, factory in engines or _engine_specs(DEFAULT_ENGINES, get_default_registry()):
+        registry.register(name, factory)
+
+    pool = MarkItDownPool(size=1)
+    if ENGINE_NAME in registry:
+        with pool.acquire():
+            pass
+    _worker_service = ExtractorService(markitdown_pool=pool, engines=registry.names(), registry=registry)
+    return _worker_service
+
+
+def _engine_specs(engines: Sequence[str], registry: EngineRegistry) -> EngineSpecs:
+    """Look up the factories of an engine chain, so worker processes can rebuild it."""
+    return tuple((name, registry.factory(name)) for name in engines)
+
+
+def _parse_in_worker(payload: PagePayload) -> tuple[str, str]:
+    """Rebuild the page from its payload and run the extraction engines on it."""
+    service = _worker_service or _init_worker()
+    url, final_url, status_code, content_type, content = payload
+    headers = {"Content-Type": content_type} if content_type else {}
+    page = FetchedPage(url=url, final_url=final_url, status_code=status_code, content=content, headers=headers)
+    return service.parse_page(page)
+
+
+def _to_payload(page: FetchedPage) -> PagePayload:
+    """Reduce a page to the fields the engines need, so IPC stays compact."""
+    return page.url, page.final_url, page.status_code, page.header("Content-Type"), page.body_bytes()
+
+
+class ProcessPoolParser:
+    """Runs the extraction engines for downloaded pages in worker processes.
+
+    Pass an instance to ExtractorService to parse in processes while fetching
+    stays on threads. Close it (or use it as a context manager) to stop the
+    workers.
+
+    Examples:
+        >>> with ProcessPoolParser(max_workers=32, engines=["density", "trafilatura"]) as parser:
+        ...     service = ExtractorService(process_parser=parser)
+        ...     results = list(service.extract_many(urls, max_workers=128))
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        engines: Sequence[str] = DEFAULT_ENGINES,
+        registry: EngineRegistry | None = None,
+    ) -> None:
+        """Start the worker pool.
+
+        Args:
+            max_workers: Number of worker processes. Defaults to the number of CPUs.
+            engines: Names of the engines the workers try, in order.
+            registry: Registry the engine names are looked up in. The
+                process-wide registry is used when omitted. Factories of
+                custom engines must be picklable, e.g. module-level classes
+                or ``"module:attribute"`` strings.
+
+        Raises:
+            ValueError: If engines is empty, repeats a name or names an unknown engine.
+        """
+        if not engines:
+            raise ValueError("The engine chain must contain at least one engine")
+        if len(set(engines)) != len(engines):
+            raise ValueError(f"The engine chain contains duplicate engines: {', '.join(engines)}")
+
+        self._engines = tuple(engines)
+        specs = _engine_specs(self._engines, registry or get_default_registry())
+        self._executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(specs,))
+
+    def __enter__(self) -> Self:
+        """Enter the context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop the worker processes when leaving the context."""
+        self.close()
+
+    @property
+    def engines(self) -> tuple[str, ...]:
+        """Return the names of the engines the workers try, in order."""
+        return self._engines
+
+    def parse(self, page: FetchedPage) -> tuple[str, str]:
+        """Extract text from a downloaded page in a worker process.
+
+        Blocks the calling thread until a worker has produced the result.
+
+        Args:
+            page: Downloaded page to extract text from.
+
+        Returns:
+            Tuple of extracted text and the name of the engine that produced it.
+
+        Raises:
+            TextExtractionFailure: If every extraction engine fails in the worker.
+        """
+        logger.debug("Parsing %s in a worker process", page.url)
+        return self._executor.submit(_parse_in_worker, _to_payload(page)).result()
+
+    def close(self) -> None:
+        """Stop the worker processes, waiting for running parses to finish."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
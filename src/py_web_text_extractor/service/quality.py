@@ -0,0 +1,128 @@
+"""Extraction quality scoring module.
+
+An engine that does not raise can still return junk: the site navigation, a
+cookie banner, or a few words from an otherwise empty page. score_text measures
+engine output with cheap line-based heuristics, and QualityGate decides whether
+the output is good enough to return or whether the next engine should run.
+"""
+
+import re
+
+from py_web_text_extractor.model.quality_score import QualityScore
+
+DEFAULT_MIN_SCORE = 0.35
+DEFAULT_MIN_CHARACTERS = 100
+DEFAULT_MAX_LINK_DENSITY = 0.6
+
+# Words a line needs to count as prose rather than a menu entry or label.
+PROSE_LINE_WORDS = 10
+
+# Characters of text per byte of HTML at which the html_ratio component is saturated.
+REFERENCE_HTML_RATIO = 0.05
+
+_TEXT_DENSITY_WEIGHT = 0.5
+_LINK_DENSITY_WEIGHT = 0.3
+_HTML_RATIO_WEIGHT = 0.2
+
+_IMAGE = re.compile(r"!\[([^\]]*)\]\([^)]*\)")
+_LINK = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+
+
+def score_text(text: str, document_bytes: int) -> QualityScore:
+    """Measure how much of an engine's output looks like real content.
+
+    Markdown images are dropped and links are reduced to their text, so the
+    measurements apply equally to MarkItDown's Markdown and Trafilatura's
+    plain text. The work is linear in the length of the text.
+
+    Args:
+        text: Text produced by an extraction engine.
+        document_bytes: Size of the downloaded document the text came from.
+
+    Returns:
+        QualityScore with the individual measurements and their combined score.
+
+    Examples:
+        >>> score_text("[Home](/) [News](/news) [Login](/login)", document_bytes=20_000).link_density
+        1.0
+    """
+    text = _IMAGE.sub("", text)
+    link_characters = sum(len(match.group(1).strip()) for match in _LINK.finditer(text))
+    text = _LINK.sub(r"\1", text)
+
+    characters = 0
+    dense_characters = 0
+    for raw_line in text.splitlines():
+        line = " ".join(raw_line.split())
+        if not line:
+            continue
+        characters += len(line)
+        if line.startswith("|") or len(line.split(" ")) >= PROSE_LINE_WORDS:
+            dense_characters += len(line)
+
+    if not characters:
+        return QualityScore(characters=0, text_density=0.0, link_density=0.0, html_ratio=0.0, score=0.0)
+
+    text_density = dense_characters / characters
+    link_density = min(1.0, link_characters / characters)
+    html_ratio = characters / document_bytes if document_bytes > 0 else 1.0
+    score = (
+        _TEXT_DENSITY_WEIGHT * text_density
+        + _LINK_DENSITY_WEIGHT * (1.0 - link_density)
+        + _HTML_RATIO_WEIGHT * min(1.0, html_ratio / REFERENCE_HTML_RATIO)
+    )
+    return QualityScore(
+        characters=characters,
+        text_density=text_density,
+        link_density=link_density,
+        html_ratio=html_ratio,
+        score=score,
+    )
+
+
+class QualityGate:
+    """Thresholds that engine output must meet to be returned.
+
+    Output that fails the gate is treated like an engine failure: the next
+    engine runs on the same page, and if no engine passes the extraction fails.
+
+    Examples:
+        >>> service = ExtractorService(quality_gate=QualityGate(min_score=0.4))
+    """
+
+    def __init__(
+        self,
+        min_score: float = DEFAULT_MIN_SCORE,
+        min_characters: int = DEFAULT_MIN_CHARACTERS,
+        max_link_density: float = DEFAULT_MAX_LINK_DENSITY,
+    ) -> None:
+        """Initialize the gate.
+
+        Args:
+            min_score: Lowest accepted overall score, between 0 and 1.
+            min_characters: Fewest visible characters accepted.
+            max_link_density: Highest accepted share of link text, between 0 and 1.
+
+        Raises:
+            ValueError: If a threshold is out of range.
+        """
+        if not 0 <= min_score <= 1:
+            raise ValueError(f"min_score must be between 0 and 1, got {min_score}")
+        if min_characters < 0:
+            raise ValueError(f"min_characters must not be negative, got {min_characters}")
+        if not 0 <= max_link_density <= 1:
+            raise ValueError(f"max_link_density must be between 0 and 1, got {max_link_density}")
+
+        self._min_score = min_score
+        self._min_characters = min_characters
+        self._max_link_density = max_link_density
+
+    def rejection_reason(self, score: QualityScore) -> str | None:
+        """Return why output with this score is rejected, or None when it is accepted."""
+        if score.characters < self._min_characters:
+            return f"only {score.characters} characters of text"
+        if score.link_density > self._max_link_density:
+            return f"{score.link_density:.0%} of the text is links"
+        if score.score < self._min_score:
+            return f"quality score {score.score:.2f} is below {self._min_score:.2f}"
+        return None
@@ -0,0 +1,285 @@
+"""Retry and circuit breaker module.
+
+A transient network error should not fail a page outright, and a host or
+engine that keeps failing should not keep consuming worker time. RetryingFetcher
+wraps another fetcher and retries timeouts, dropped connections and 5xx answers
+with jittered exponential backoff. CircuitBreaker tracks consecutive failures
+per key (a host or an engine name), fails fast while a key's circuit is open,
+and lets a single trial call through once the reset timeout has passed.
+"""
+
+import logging
+import random
+import threading
+import time
+from collections.abc import Mapping
+from enum import StrEnum
+from http import HTTPStatus
+from typing import override
+from urllib.parse import urlparse
+
+from py_web_text_extractor.abstract.fetcher import Fetcher
+from py_web_text_extractor.exception.exceptions import (
+    CircuitOpenException,
+    PageConnectionException,
+    PageFetchException,
+    PageStatusException,
+)
+from py_web_text_extractor.model.fetched_page import FetchedPage
+from py_web_text_extractor.service.fetcher import HttpFetcher
+from py_web_text_extractor.service.politeness import retry_after_delay
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_BASE = 0.5
+DEFAULT_BACKOFF_MAX = 30.0
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30.0
+
+RETRYABLE_STATUSES = frozenset(
+    {
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.INTERNAL_SERVER_ERROR,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    }
+)
+
+
+class CircuitState(StrEnum):
+    """State of a circuit breaker for one key.
+
+    Attributes:
+        CLOSED: Calls go through; consecutive failures are counted.
+        OPEN: Calls are rejected until the reset timeout has passed.
+        HALF_OPEN: A single trial call is in flight; its outcome closes or reopens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class _Circuit:
+    """Failure count and state of a single key."""
+
+    __slots__ = ("failures", "opened_at", "state")
+
+    def __init__(self) -> None:
+        self.failures = 0
+        self.opened_at = 0.0
+        self.state = CircuitState.CLOSED
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breakers keyed by host or engine name.
+
+    A key's circuit opens after ``failure_threshold`` consecutive failures.
+    While it is open, allow() returns False. Once ``reset_timeout`` seconds
+    have passed, allow() lets exactly one trial call through: its success
+    closes the circuit, its failure opens it again. Keys are only tracked
+    while they have recent failures, so memory stays proportional to the
+    number of failing keys.
+
+    Every call that allow() let through must be reported with
+    record_success() or record_failure().
+
+    Examples:
+        >>> breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+        >>> if breaker.allow("example.com"):
+        ...     breaker.record_failure("example.com")
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+    ) -> None:
+        """Initialize the breaker with every circuit closed.
+
+        Args:
+            failure_threshold: Consecutive failures that open a circuit.
+            reset_timeout: Seconds an open circuit rejects calls before a trial call.
+
+        Raises:
+            ValueError: If failure_threshold is less than 1 or reset_timeout is negative.
+        """
+        if failure_threshold < 1:
+            raise ValueError(f"failure_threshold must be at least 1, got {failure_threshold}")
+        if reset_timeout < 0:
+            raise ValueError(f"reset_timeout must not be negative, got {reset_timeout}")
+
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, key: str) -> bool:
+        """Return True if a call for the key may proceed.
+
+        Args:
+            key: Host or engine name.
+
+        Returns:
+            True when the circuit is closed, or when it is open, the reset
+            timeout has passed and this call becomes the trial call.
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit.state is CircuitState.CLOSED:
+                return True
+            if circuit.state is CircuitState.OPEN and time.monotonic() - circuit.opened_at >= self._reset_timeout:
+                circuit.state = CircuitState.HALF_OPEN
+                logger.info("Circuit for %s half-open, letting a trial call through", key)
+                return True
+            return False
+
+    def record_success(self, key: str) -> None:
+        """Close the key's circuit and forget its failures."""
+        with self._lock:
+            circuit = self._circuits.pop(key, None)
+        if circuit is not None and circuit.state is not CircuitState.CLOSED:
+            logger.info("Circuit for %s closed", key)
+
+    def record_failure(self, key: str) -> None:
+        """Count a failure for the key, opening its circuit at the threshold or after a failed trial."""
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            circuit.failures += 1
+            if circuit.state is CircuitState.HALF_OPEN or circuit.failures >= self._failure_threshold:
+                if circuit.state is not CircuitState.OPEN:
+                    logger.warning("Circuit for %s opened after %d consecutive failures", key, circuit.failures)
+                circuit.state = CircuitState.OPEN
+                circuit.opened_at = time.monotonic()
+
+    def state(self, key: str) -> CircuitState:
+        """Return the current state of the key's circuit."""
+        with self._lock:
+            circuit = self._circuits.get(key)
+            return circuit.state if circuit is not None else CircuitState.CLOSED
+
+
+def is_retryable(error: PageFetchException) -> bool:
+    """Return True for fetch failures that may succeed when tried again.
+
+    Timeouts, refused or reset connections, 429 and 5xx gateway/server errors
+    are retryable. Other error statuses, oversized or empty bodies and
+    malformed URLs are not.
+    """
+    if isinstance(error, PageConnectionException):
+        return True
+    return isinstance(error, PageStatusException) and error.status_code in RETRYABLE_STATUSES
+
+
+class RetryingFetcher(Fetcher):
+    """Fetcher that retries transient failures and fails fast for broken hosts.
+
+    Retryable failures (see is_retryable) are retried up to ``max_retries``
+    times with full-jitter exponential backoff: before retry ``n`` it sleeps a
+    random time between 0 and ``min(backoff_max, backoff_base * 2**n)``, or at
+    least the server's Retry-After when that is shorter than ``backoff_max``.
+    With a circuit breaker, a host whose requests keep failing after all
+    retries is skipped with CircuitOpenException until its circuit recovers.
+
+    Examples:
+        >>> fetcher = RetryingFetcher(HttpFetcher(), max_retries=2, circuit_breaker=CircuitBreaker())
+        >>> service = ExtractorService(fetcher=fetcher)
+    """
+
+    def __init__(
+        self,
+        fetcher: Fetcher | None = None,
+        *,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        circuit_breaker: CircuitBreaker | None = None,
+    ) -> None:
+        """Initialize the fetcher.
+
+        Args:
+            fetcher: Fetcher that performs the requests. A pooled HttpFetcher
+                is created when omitted.
+            max_retries: Retries after the first attempt. 0 disables retrying.
+            backoff_base: Upper bound of the first backoff, in seconds.
+            backoff_max: Largest backoff, in seconds.
+            circuit_breaker: Breaker keyed by host. Only failures that remain
+                after all retries count against a host.
+
+        Raises:
+            ValueError: If max_retries or a backoff is negative.
+        """
+        if max_retries < 0:
+            raise ValueError(f"max_retries must not be negative, got {max_retries}")
+        if backoff_base < 0 or backoff_max < 0:
+            raise ValueError(f"backoffs must not be negative, got {backoff_base} and {backoff_max}")
+
+        self._fetcher = fetcher or HttpFetcher()
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._circuit_breaker = circuit_breaker
+
+    @override
+    def fetch_page(self, url: str, headers: Mapping[str, str] | None = None) -> FetchedPage:
+        """Download a web page, retrying transient failures.
+
+        Args:
+            url: HTTP/HTTPS URL to download.
+            headers: Extra request headers, passed to the wrapped fetcher.
+
+        Returns:
+            FetchedPage returned by the wrapped fetcher.
+
+        Raises:
+            CircuitOpenException: If the circuit for the URL's host is open.
+            PageFetchException: If the page cannot be downloaded after all retries.
+        """
+        host = urlparse(url).netloc.lower()
+        breaker = self._circuit_breaker
+        if breaker is not None and not breaker.allow(host):
+            raise CircuitOpenException(f"Skipping {url}: too many recent failures for {host}")
+
+        attempt = 0
+        while True:
+            try:
+                page = self._fetch(url, headers)
+            except PageFetchException as e:
+                if not is_retryable(e):
+                    if breaker is not None:
+                        breaker.record_success(host)
+                    raise
+                if attempt >= self._max_retries:
+                    if breaker is not None:
+                        breaker.record_failure(host)
+                    raise
+                delay = self._backoff(attempt, e)
+                attempt += 1
+                logger.info("Retrying %s in %.2fs (attempt %d of %d): %s", url, delay, attempt, self._max_retries, e)
+                time.sleep(delay)
+                continue
+            except BaseException:
+                # Anything else, such as a bug in a custom fetcher or a
+                # KeyboardInterrupt, still settles a half-open trial.
+                if breaker is not None:
+                    breaker.record_failure(host)
+                raise
+            if breaker is not None:
+                breaker.record_success(host)
+            return page
+
+    def _fetch(self, url: str, headers: Mapping[str, str] | None) -> FetchedPage:
+        """Call the wrapped fetcher, passing headers only when there are any."""
+        if headers is None:
+            return self._fetcher.fetch_page(url)
+        return self._fetcher.fetch_page(url, headers=headers)
+
+    def _backoff(self, attempt: int, error: PageFetchException) -> float:
+        """Return the jittered delay before the retry following the given attempt."""
+        delay = random.uniform(0, min(self._backoff_max, self._backoff_base * 2**attempt))
+        retry_after = retry_after_delay(error) if isinstance(error, PageStatusException) else None
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self._backoff_max))
+        return delay
@@ -0,0 +1,188 @@
+"""Response size and content-type limits module.
+
+A mislabelled binary or an endless chunked response must not be read into a
+worker's memory. ResponseLimits is the policy both fetchers apply while
+streaming a body: a declared Content-Length over the byte cap or a non-text
+Content-Type is refused before the body is read, the first chunk is sniffed for
+binary formats served under a text type, and the download is aborted as soon
+as the cap is passed. The body of one page therefore never holds more than
+``max_bytes`` plus one chunk.
+"""
+
+from collections.abc import Iterable, Mapping
+from fnmatch import fnmatchcase
+
+from py_web_text_extractor.exception.exceptions import ResponseTooLargeException, UnsupportedContentTypeException
+
+DEFAULT_MAX_RESPONSE_BYTES = 20 * 1024 * 1024
+DEFAULT_ACCEPTED_CONTENT_TYPES = (
+    "text/*",
+    "application/xhtml+xml",
+    "application/xml",
+    "application/*+xml",
+    "application/json",
+)
+
+# Leading bytes of binary formats that servers commonly mislabel as text/html.
+_MAGIC_NUMBERS = (
+    (b"%PDF-", "application/pdf"),
+    (b"PK\x03\x04", "application/zip"),
+    (b"\x1f\x8b", "application/gzip"),
+    (b"BZh", "application/x-bzip2"),
+    (b"7z\xbc\xaf\x27\x1c", "application/x-7z-compressed"),
+    (b"Rar!", "application/vnd.rar"),
+    (b"\x89PNG", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF8", "image/gif"),
+    (b"RIFF", "application/octet-stream"),
+    (b"OggS", "audio/ogg"),
+    (b"ID3", "audio/mpeg"),
+    (b"wOFF", "font/woff"),
+    (b"wOF2", "font/woff2"),
+    (b"\x7fELF", "application/x-executable"),
+    (b"MZ", "application/x-msdownload"),
+)
+_UNICODE_BOMS = (b"\xef\xbb\xbf", b"\xff\xfe", b"\xfe\xff")
+_SNIFF_BYTES = 1024
+
+
+def sniff_binary_type(prefix: bytes) -> str | None:
+    """Return the MIME type of a binary format recognised from the first bytes of a body.
+
+    Args:
+        prefix: First bytes of the decoded body; 1 KiB is enough.
+
+    Returns:
+        MIME type of the detected binary format, ``application/octet-stream``
+        for unrecognised data containing NUL bytes, or None for text.
+
+    Examples:
+        >>> sniff_binary_type(b"%PDF-1.7")
+        'application/pdf'
+        >>> sniff_binary_type(b"<!doctype html>") is None
+        True
+    """
+    for magic, mimetype in _MAGIC_NUMBERS:
+        if prefix.startswith(magic):
+            return mimetype
+    if prefix[4:8] == b"ftyp":
+        return "video/mp4"
+    if not prefix.startswith(_UNICODE_BOMS) and b"\x00" in prefix[:_SNIFF_BYTES]:
+        return "application/octet-stream"
+    return None
+
+
+class ResponseLimits:
+    """Byte cap and content-type policy applied to every fetched response.
+
+    Examples:
+        >>> limits = ResponseLimits(max_bytes=5 * 1024 * 1024)
+        >>> fetcher = HttpFetcher(limits=limits)
+        >>> ResponseLimits(accepted_content_types=None)  # also fetch PDFs, images, ...
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_RESPONSE_BYTES,
+        accepted_content_types: Iterable[str] | None = DEFAULT_ACCEPTED_CONTENT_TYPES,
+    ) -> None:
+        """Initialize the limits.
+
+        Args:
+            max_bytes: Largest decoded body accepted, in bytes.
+            accepted_content_types: MIME type patterns, e.g. ``text/*``, a
+                response must match. Responses without a Content-Type are
+                accepted unless their first bytes look binary. None accepts
+                any type and disables sniffing.
+
+        Raises:
+            ValueError: If max_bytes is less than 1 or no content type is accepted.
+        """
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be at least 1, got {max_bytes}")
+        patterns = None if accepted_content_types is None else tuple(p.lower() for p in accepted_content_types)
+        if patterns == ():
+            raise ValueError("accepted_content_types must not be empty; pass None to accept any type")
+
+        self._max_bytes = max_bytes
+        self._accepted_content_types = patterns
+
+    @property
+    def max_bytes(self) -> int:
+        """Return the largest decoded body accepted, in bytes."""
+        return self._max_bytes
+
+    @property
+    def accepted_content_types(self) -> tuple[str, ...] | None:
+        """Return the accepted MIME type patterns, or None when any type is accepted."""
+        return self._accepted_content_types
+
+    def accepts_content_type(self, content_type: str | None) -> bool:
+        """Return True when a Content-Type header value is accepted.
+
+        Args:
+            content_type: Header value, parameters included, or None when absent.
+        """
+        if self._accepted_content_types is None or not content_type:
+            return True
+        mimetype = content_type.split(";", 1)[0].strip().lower()
+        return any(fnmatchcase(mimetype, pattern) for pattern in self._accepted_content_types)
+
+    def check_headers(self, url: str, headers: Mapping[str, str]) -> None:
+        """Refuse a response from its headers, before any of the body is read.
+
+        Args:
+            url: URL of the response, for error messages.
+            headers: Response headers.
+
+        Raises:
+            UnsupportedContentTypeException: If the Content-Type is not accepted.
+            ResponseTooLargeException: If the Content-Length exceeds max_bytes.
+                A compressed body is measured by its encoded length, which is
+                assumed not to exceed its decoded length.
+        """
+        content_type = headers.get("content-type")
+        if not self.accepts_content_type(content_type):
+            raise UnsupportedContentTypeException(f"Unsupported content type {content_type!r} for {url}", content_type)
+        try:
+            declared = int(headers.get("content-length") or -1)
+        except ValueError:
+            return
+        if declared > self._max_bytes:
+            raise ResponseTooLargeException(
+                f"Response from {url} declares {declared} bytes, over the {self._max_bytes} byte limit",
+                self._max_bytes,
+                declared,
+            )
+
+    def check_prefix(self, url: str, prefix: bytes) -> None:
+        """Refuse a response whose first bytes belong to a binary format.
+
+        Args:
+            url: URL of the response, for error messages.
+            prefix: First chunk of the decoded body.
+
+        Raises:
+            UnsupportedContentTypeException: If the body looks like a binary
+                format that is not accepted.
+        """
+        if self._accepted_content_types is None:
+            return
+        sniffed = sniff_binary_type(prefix)
+        if sniffed is not None and not self.accepts_content_type(sniffed):
+            raise UnsupportedContentTypeException(f"Response from {url} looks like {sniffed}, not text", sniffed)
+
+    def check_size(self, url: str, size: int) -> None:
+        """Abort a download once the bytes read exceed max_bytes.
+
+        Args:
+            url: URL of the response, for error messages.
+            size: Decoded bytes read so far.
+
+        Raises:
+            ResponseTooLargeException: If size exceeds max_bytes.
+        """
+        if size > self._max_bytes:
+            raise ResponseTooLargeException(
+                f"Response from {url} exceeds the {self._max_bytes} byte limit", self._max_bytes, size
+            )
@@ -0,0 +1,123 @@
+"""Request coalescing (single-flight) module.
+
+When several callers ask for the same hot URL at once, only the first one
+fetches and parses it; the others wait for that in-flight call and share its
+result or exception. A key is forgotten as soon as its call finishes, so this
+deduplicates concurrent work only and never serves stale results; caching
+finished results is the job of ExtractionCache.
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+
+
+class SingleFlight[T]:
+    """Thread-safe group of in-flight calls keyed by a string.
+
+    Examples:
+        >>> flights = SingleFlight[str]()
+        >>> flights.do("https://example.com/", lambda: "text")
+        'text'
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty group."""
+        self._lock = threading.Lock()
+        self._calls: dict[str, Future[T]] = {}
+        self._coalesced = 0
+
+    @property
+    def coalesced(self) -> int:
+        """Return how many calls were answered by another caller's in-flight call."""
+        return self._coalesced
+
+    def do(self, key: str, function: Callable[[], T]) -> T:
+        """Run function unless a call with the same key is in flight, and return its result.
+
+        Args:
+            key: Identity of the work, e.g. a normalized URL.
+            function: Work to run when no call with this key is in flight.
+
+        Returns:
+            Result of function, or of the in-flight call that was joined.
+
+        Raises:
+            Exception: Whatever function, or the joined call, raised.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self._coalesced += 1
+            else:
+                leader = self._calls[key] = Future()
+
+        if future is not None:
+            return future.result()
+
+        try:
+            result = function()
+        except BaseException as e:
+            self._forget(key)
+            leader.set_exception(e)
+            raise
+        self._forget(key)
+        leader.set_result(result)
+        return result
+
+    def _forget(self, key: str) -> None:
+        """Remove a finished call, so the next caller starts a fresh one."""
+        with self._lock:
+            del self._calls[key]
+
+
+class AsyncSingleFlight[T]:
+    """Group of in-flight coroutines keyed by a string, for use on one event loop.
+
+    The work runs in its own task, so a cancelled caller neither cancels nor
+    loses the call for the callers still waiting on it.
+
+    Examples:
+        >>> flights = AsyncSingleFlight[str]()
+        >>> await flights.do("https://example.com/", fetch_and_parse)
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty group."""
+        self._calls: dict[str, asyncio.Task[T]] = {}
+        self._coalesced = 0
+
+    @property
+    def coalesced(self) -> int:
+        """Return how many calls were answered by another caller's in-flight call."""
+        return self._coalesced
+
+    async def do(self, key: str, function: Callable[[], Awaitable[T]]) -> T:
+        """Await function unless a call with the same key is in flight, and return its result.
+
+        Args:
+            key: Identity of the work, e.g. a normalized URL.
+            function: Coroutine function to run when no call with this key is in flight.
+
+        Returns:
+            Result of function, or of the in-flight call that was joined.
+
+        Raises:
+            Exception: Whatever function, or the joined call, raised.
+        """
+        task = self._calls.get(key)
+        if task is not None:
+            self._coalesced += 1
+        else:
+            task = asyncio.ensure_future(function())
+            self._calls[key] = task
+            task.add_done_callback(lambda finished: self._forget(key, finished))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task[T]) -> None:
+        """Remove a finished call and mark its outcome as retrieved."""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()
@@ -1,16 +1,19 @@
 """Trafilatura text extraction module.
 
-Provides text extraction from web pages using the Trafilatura library.
+Provides text extraction from web pages using the Trafilatura library. The
+library itself is imported on first use, so importing this module is cheap.
 """
 
 import logging
 
-from trafilatura import extract, fetch_url
-
-from py_web_text_extractor.exception.exceptions import TrafilaturaExtractionException
+import py_web_text_extractor.service.fetcher as http_fetcher
+from py_web_text_extractor.exception.exceptions import PageFetchException, TrafilaturaExtractionException
+from py_web_text_extractor.model.fetched_page import FetchedPage
 
 logger = logging.getLogger(__name__)
 
+ENGINE_NAME = "trafilatura"
+
 
 def extract_text(url: str) -> str:
     r"""Extract text content from a web page using Trafilatura.
@@ -35,12 +38,34 @@ def extract_text(url: str) -> str:
     logger.debug("Starting Trafilatura extraction for URL: %s", url)
 
     try:
-        content = fetch_url(url)
-        if content is None:
-            logger.warning("Failed to fetch content from %s using Trafilatura", url)
-            raise TrafilaturaExtractionException(f"Failed to fetch content from {url}")
+        page = http_fetcher.fetch_page(url)
+    except PageFetchException as e:
+        logger.warning("Failed to fetch content from %s using Trafilatura", url)
+        raise TrafilaturaExtractionException(f"Trafilatura extraction failed for {url}: {e!s}") from e
+
+    return extract_text_from_content(page)
+
+
+def extract_text_from_content(page: FetchedPage) -> str:
+    """Extract text content from an already downloaded page using Trafilatura.
+
+    Args:
+        page: Downloaded page whose body is parsed without another request.
+
+    Returns:
+        Extracted text content in markdown format, or an empty string if
+        Trafilatura finds no extractable content.
+
+    Raises:
+        TrafilaturaExtractionException: If Trafilatura cannot process the content.
+    """
+    url = page.final_url
+    logger.debug("Parsing %d bytes from %s using Trafilatura", len(page.content), url)
+
+    try:
+        from trafilatura import extract  # noqa: PLC0415
 
-        text = extract(content, output_format="markdown")
+        text = extract(page.body_bytes(), url=url, output_format="markdown")
         extracted_text = text or ""
 
         if extracted_text:
@@ -0,0 +1,264 @@
+"""WARC ingestion module.
+
+Streams HTTP response records out of WARC archives and feeds them to the
+extraction engines without another network request. Gzip-compressed archives
+are decompressed one member at a time, so memory use is bounded by the largest
+record rather than the archive size, and every record carries the byte offset
+to resume from after an interruption.
+"""
+
+import http.client
+import io
+import logging
+import os
+import zlib
+from collections import deque
+from collections.abc import Iterator
+from http import HTTPStatus
+from pathlib import Path
+from typing import BinaryIO
+
+from py_web_text_extractor.exception.exceptions import PageFetchException
+from py_web_text_extractor.model.batch_result import BatchResult
+from py_web_text_extractor.model.fetched_page import FetchedPage
+from py_web_text_extractor.model.warc_record import WarcRecord
+from py_web_text_extractor.service.extractor_service import DEFAULT_MAX_WORKERS, ExtractorService
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+GZIP_MAGIC = b"\x1f\x8b"
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+AUTO_WBITS = 32 + zlib.MAX_WBITS
+
+# Headers describing the archived wire format, which no longer applies once the body is decoded.
+_WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+type _RawRecord = tuple[http.client.HTTPMessage, bytes]
+
+
+def iter_warc_records(path: str | os.PathLike[str], start_offset: int = 0) -> Iterator[WarcRecord]:
+    """Read the HTTP response records of a WARC archive one at a time.
+
+    Plain and gzip-compressed archives are both supported; compression is
+    detected from the bytes at ``start_offset``. Request, metadata, revisit
+    and other record types are skipped, as are responses without a 2xx status
+    or body. Transfer and content encodings are removed from each body.
+
+    Args:
+        path: WARC file to read, e.g. ``crawl-00001.warc.gz``.
+        start_offset: Byte offset to start reading from. Must be 0 or the
+            ``next_offset`` of a previously read record.
+
+    Yields:
+        One WarcRecord per archived HTTP response, in archive order.
+
+    Raises:
+        PageFetchException: If the archive cannot be read or is malformed.
+
+    Examples:
+        >>> for record in iter_warc_records("crawl-00001.warc.gz"):
+        ...     print(record.offset, record.page.url)
+    """
+    file_path = Path(path)
+    try:
+        file = file_path.open("rb")
+    except OSError as e:
+        logger.warning("Failed to open %s: %s", file_path, e)
+        raise PageFetchException(f"Failed to open {file_path}: {e!s}") from e
+
+    with file:
+        try:
+            file.seek(start_offset)
+            compressed = file.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+            file.seek(start_offset)
+            records = _iter_gzip_records(file, start_offset) if compressed else _iter_plain_records(file)
+            for offset, next_offset, headers, block in records:
+                record = _to_warc_record(offset, next_offset, headers, block)
+                if record is not None:
+                    yield record
+        except (OSError, zlib.error, http.client.HTTPException, ValueError) as e:
+            logger.warning("Failed to read %s: %s", file_path, e)
+            raise PageFetchException(f"Malformed WARC archive {file_path}: {e!s}") from e
+
+
+def extract_warc(
+    path: str | os.PathLike[str],
+    service: ExtractorService | None = None,
+    start_offset: int = 0,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Iterator[tuple[WarcRecord, BatchResult]]:
+    """Extract text from every HTTP response in a WARC archive.
+
+    Records are read lazily and parsed concurrently with
+    ExtractorService.extract_pages. Results are yielded in archive order, so
+    the ``next_offset`` of the last record handled is always a safe point to
+    resume from. A record that fails to extract never stops the run.
+
+    Args:
+        path: WARC file to read.
+        service: Service whose engines parse the records. A default
+            ExtractorService is created when omitted.
+        start_offset: Byte offset to resume reading from.
+        max_workers: Maximum number of records parsed at once.
+
+    Yields:
+        Each record together with its extraction result.
+
+    Raises:
+        PageFetchException: If the archive cannot be read or is malformed.
+        ValueError: If max_workers is less than 1.
+
+    Examples:
+        >>> for record, result in extract_warc("crawl-00001.warc.gz", max_workers=16):
+        ...     print(record.next_offset, result.url, result.ok)
+    """
+    records: deque[WarcRecord] = deque()
+
+    def pages() -> Iterator[FetchedPage]:
+        for record in iter_warc_records(path, start_offset):
+            records.append(record)
+            yield record.page
+
+    for result in (service or ExtractorService()).extract_pages(pages(), max_workers=max_workers, ordered=True):
+        yield records.popleft(), result
+
+
+def _iter_plain_records(file: BinaryIO) -> Iterator[tuple[int, int, http.client.HTTPMessage, bytes]]:
+    """Read records from an uncompressed archive, tracking offsets with tell()."""
+    while True:
+        offset = file.tell()
+        raw = _read_raw_record(file)
+        if raw is None:
+            return
+        headers, block = raw
+        yield offset, file.tell(), headers, block
+
+
+def _iter_gzip_records(
+    file: BinaryIO,
+    start_offset: int,
+) -> Iterator[tuple[int, int, http.client.HTTPMessage, bytes]]:
+    """Read records from a gzip-compressed archive, one gzip member at a time."""
+    for member_offset, member_end, member in _iter_gzip_members(file, start_offset):
+        stream = io.BytesIO(member)
+        raw_records: list[_RawRecord] = []
+        while (raw := _read_raw_record(stream)) is not None:
+            raw_records.append(raw)
+        for index, (headers, block) in enumerate(raw_records):
+            next_offset = member_end if index == len(raw_records) - 1 else member_offset
+            yield member_offset, next_offset, headers, block
+
+
+def _iter_gzip_members(file: BinaryIO, start_offset: int) -> Iterator[tuple[int, int, bytes]]:
+    """Yield the start offset, end offset and decompressed content of each gzip member."""
+    decompressor = zlib.decompressobj(wbits=GZIP_WBITS)
+    member_offset = position = start_offset
+    output: list[bytes] = []
+    data = b""
+    while True:
+        if not data:
+            data = file.read(CHUNK_SIZE)
+            if not data:
+                break
+        output.append(decompressor.decompress(data))
+        if decompressor.eof:
+            unused = decompressor.unused_data
+            position += len(data) - len(unused)
+            yield member_offset, position, b"".join(output)
+            decompressor = zlib.decompressobj(wbits=GZIP_WBITS)
+            member_offset = position
+            output = []
+            data = unused
+        else:
+            position += len(data)
+            data = b""
+
+    if position > member_offset:
+        raise ValueError(f"truncated gzip member at offset {member_offset}")
+
+
+def _read_raw_record(stream: BinaryIO) -> _RawRecord | None:
+    """Read the WARC headers and content block of the next record, or None at the end."""
+    line = stream.readline()
+    while line in (b"\r\n", b"\n"):
+        line = stream.readline()
+    if not line:
+        return None
+    if not line.startswith(b"WARC/"):
+        raise ValueError(f"expected a WARC version line, found {line[:32]!r}")
+
+    headers = http.client.parse_headers(stream)
+    length = int(headers.get("Content-Length", "0"))
+    block = stream.read(length)
+    if len(block) < length:
+        raise ValueError(f"record truncated after {len(block)} of {length} bytes")
+    return headers, block
+
+
+def _to_warc_record(
+    offset: int,
+    next_offset: int,
+    headers: http.client.HTTPMessage,
+    block: bytes,
+) -> WarcRecord | None:
+    """Turn a response record into a WarcRecord, or return None for records with nothing to extract."""
+    if headers.get("WARC-Type") != "response" or not headers.get("Content-Type", "").startswith("application/http"):
+        return None
+
+    url = headers.get("WARC-Target-URI", "").strip().strip("<>")
+    stream = io.BytesIO(block)
+    status_line = stream.readline().split(None, 2)
+    try:
+        status_code = int(status_line[1]) if len(status_line) > 1 else 0
+    except ValueError:
+        logger.warning("Skipping %s at offset %d: malformed HTTP status line", url, offset)
+        return None
+    http_headers = http.client.parse_headers(stream)
+    body = _decode_body(url, stream.read(), http_headers)
+
+    if not HTTPStatus.OK <= status_code < HTTPStatus.MULTIPLE_CHOICES or not body:
+        logger.debug("Skipping %s at offset %d (HTTP %s, %d bytes)", url, offset, status_code, len(body))
+        return None
+
+    page = FetchedPage(
+        url=url,
+        final_url=url,
+        status_code=status_code,
+        content=body,
+        headers={name: value for name, value in http_headers.items() if name.lower() not in _WIRE_HEADERS},
+    )
+    return WarcRecord(offset=offset, next_offset=next_offset, record_id=headers.get("WARC-Record-ID"), page=page)
+
+
+def _decode_body(url: str, body: bytes, headers: http.client.HTTPMessage) -> bytes:
+    """Remove chunked transfer encoding and gzip/deflate content encoding from an archived body.
+
+    Crawlers often decode the body before archiving but keep the original
+    headers, so a body that does not decode is returned unchanged.
+    """
+    try:
+        if "chunked" in headers.get("Transfer-Encoding", "").lower():
+            body = _dechunk(body)
+        encoding = headers.get("Content-Encoding", "").strip().lower()
+        if encoding in {"gzip", "x-gzip", "deflate"}:
+            try:
+                body = zlib.decompress(body, wbits=AUTO_WBITS)
+            except zlib.error:
+                body = zlib.decompress(body, wbits=-zlib.MAX_WBITS)
+    except (ValueError, zlib.error) as e:
+        logger.debug("Keeping archived body of %s as is: %s", url, e)
+    return body
+
+
+def _dechunk(body: bytes) -> bytes:
+    """Join the chunks of a chunked transfer-encoded body."""
+    stream = io.BytesIO(body)
+    chunks: list[bytes] = []
+    while size_line := stream.readline():
+        size = int(size_line.split(b";", 1)[0].strip(), 16)
+        if size == 0:
+            break
+        chunks.append(stream.read(size))
+        stream.readline()
+    return b"".join(chunks)
@@ -1,10 +1,21 @@
 """Utility functions and tools for the py_web_text_extractor library.
 
 This module provides helper functions and utilities used throughout the text
-extraction process, including validation, formatting, and other supporting
+extraction process, including validation, URL normalization and deduplication, formatting, and other supporting
 functionality.
 """
 
-from py_web_text_extractor.tools.validation import is_blank_string, is_valid_url
+from py_web_text_extractor.tools.url_index import UrlIndex
+from py_web_text_extractor.tools.url_normalization import is_tracking_parameter, normalize_url, normalize_urls
+from py_web_text_extractor.tools.validation import ensure_valid_url, is_blank_string, is_valid_url, validate_urls
 
-__all__ = ["is_blank_string", "is_valid_url"]
+__all__ = [
+    "UrlIndex",
+    "ensure_valid_url",
+    "is_blank_string",
+    "is_tracking_parameter",
+    "is_valid_url",
+    "normalize_url",
+    "normalize_urls",
+    "validate_urls",
+]
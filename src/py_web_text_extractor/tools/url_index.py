@@ -0,0 +1,143 @@
+"""Seen-URL index module.
+
+Batch and crawl inputs repeat URLs, often spelled differently. UrlIndex
+remembers the normalized form of every URL it is given, so duplicates can be
+skipped before any network I/O. By default it keeps an exact set of 64-bit
+fingerprints; with a capacity it becomes a Bloom filter of fixed size, about
+1.8 bytes per URL at the default 0.1% error rate, at the price of occasionally
+treating a new URL as already seen.
+"""
+
+import hashlib
+import math
+import threading
+from collections.abc import Callable, Iterable, Iterator
+
+from py_web_text_extractor.tools.url_normalization import normalize_url
+
+DEFAULT_ERROR_RATE = 0.001
+
+
+class UrlIndex:
+    """Thread-safe set of the URLs seen so far, keyed by their normalized form.
+
+    Examples:
+        >>> index = UrlIndex()
+        >>> list(index.unique(["https://example.com/a", "https://EXAMPLE.com/a/#top", "https://example.com/b"]))
+        ['https://example.com/a', 'https://example.com/b']
+        >>> UrlIndex(capacity=50_000_000).memory_bytes // 2**20  # Bloom filter, 0.1% false positives
+        85
+    """
+
+    def __init__(
+        self,
+        capacity: int | None = None,
+        error_rate: float = DEFAULT_ERROR_RATE,
+        normalize: Callable[[str], str] = normalize_url,
+    ) -> None:
+        """Initialize an empty index.
+
+        Args:
+            capacity: Number of URLs the index is sized for. None keeps an
+                exact set of fingerprints that grows with the input; a number
+                allocates a Bloom filter up front. Adding more URLs than the
+                capacity raises the false positive rate above error_rate.
+            error_rate: Share of new URLs a Bloom filter may report as already
+                seen. Ignored without a capacity.
+            normalize: Function mapping a URL to the key it is indexed by.
+
+        Raises:
+            ValueError: If capacity is less than 1 or error_rate is not between 0 and 1.
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        if not 0 < error_rate < 1:
+            raise ValueError(f"error_rate must be between 0 and 1, got {error_rate}")
+
+        self._normalize = normalize
+        self._lock = threading.Lock()
+        self._count = 0
+        self._fingerprints: set[int] | None = None
+        self._bits: bytearray | None = None
+        if capacity is None:
+            self._fingerprints = set()
+            self._bit_count = 0
+            self._hash_count = 0
+        else:
+            self._bit_count = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+            self._hash_count = max(1, round(self._bit_count / capacity * math.log(2)))
+            self._bits = bytearray((self._bit_count + 7) // 8)
+
+    def __len__(self) -> int:
+        """Return the number of distinct URLs added."""
+        return self._count
+
+    def __contains__(self, url: object) -> bool:
+        """Return True when the URL, or another spelling of it, was added before."""
+        if not isinstance(url, str):
+            return False
+        digest = _digest(self._normalize(url))
+        with self._lock:
+            if self._fingerprints is not None:
+                return int.from_bytes(digest[:8]) in self._fingerprints
+            return all(self._bits[i >> 3] & (1 << (i & 7)) for i in self._positions(digest))
+
+    @property
+    def memory_bytes(self) -> int:
+        """Return the approximate memory held by the index, in bytes."""
+        if self._bits is not None:
+            return len(self._bits)
+        return len(self._fingerprints) * 64
+
+    def add(self, url: str) -> bool:
+        """Record a URL.
+
+        Args:
+            url: URL to record.
+
+        Returns:
+            True if the URL was new, False if it, or another spelling of it,
+            was seen before.
+        """
+        digest = _digest(self._normalize(url))
+        with self._lock:
+            if self._fingerprints is not None:
+                fingerprint = int.from_bytes(digest[:8])
+                if fingerprint in self._fingerprints:
+                    return False
+                self._fingerprints.add(fingerprint)
+            else:
+                bits = self._bits
+                new = False
+                for i in self._positions(digest):
+                    mask = 1 << (i & 7)
+                    if not bits[i >> 3] & mask:
+                        bits[i >> 3] |= mask
+                        new = True
+                if not new:
+                    return False
+            self._count += 1
+            return True
+
+    def unique(self, urls: Iterable[str]) -> Iterator[str]:
+        """Yield the URLs not seen before, as written, skipping repeats lazily.
+
+        Args:
+            urls: URLs to filter, e.g. the input of a batch.
+
+        Yields:
+            Each URL whose normalized form was not added before.
+        """
+        add = self.add
+        return (url for url in urls if add(url))
+
+    def _positions(self, digest: bytes) -> Iterator[int]:
+        """Return the Bloom filter bit positions of a digest by double hashing."""
+        first = int.from_bytes(digest[:8])
+        second = int.from_bytes(digest[8:]) | 1
+        return ((first + i * second) % self._bit_count for i in range(self._hash_count))
+
+
+def _digest(key: str) -> bytes:
+    """Hash an index key to 16 bytes."""
+    return hashlib.blake2b(key.encode("utf-8", "surrogatepass"), digest_size=16).digest()
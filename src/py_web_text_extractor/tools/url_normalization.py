@@ -0,0 +1,138 @@
+"""URL normalization utilities.
+
+Links collected from feeds and pages often name one document in several ways:
+``HTTPS://Example.com:443/news/?utm_source=feed#comments`` and
+``https://example.com/news`` are the same page. normalize_url maps such
+spellings to one canonical form, so UrlIndex and ``batch --dedupe`` treat
+them as one URL. The result cache keeps its own, more conservative key (see
+cache_key), since a trailing slash or query parameter can change the page a
+server returns. The rules are purely syntactic; no request is made to confirm
+that two spellings really serve the same content.
+"""
+
+from collections.abc import Iterable, Iterator
+from urllib.parse import urlsplit, urlunsplit
+
+TRACKING_PARAMETERS = frozenset(
+    {
+        "_ga",
+        "_gl",
+        "_hsenc",
+        "_hsmi",
+        "dclid",
+        "fbclid",
+        "gbraid",
+        "gclid",
+        "gclsrc",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "mkt_tok",
+        "msclkid",
+        "oly_anon_id",
+        "oly_enc_id",
+        "ref_src",
+        "twclid",
+        "vero_id",
+        "wbraid",
+        "yclid",
+    }
+)
+TRACKING_PARAMETER_PREFIXES = ("utm_", "__hs")
+
+_DEFAULT_PORT_SUFFIXES = {"http": ":80", "https": ":443"}
+
+
+def normalize_url(url: str) -> str:
+    """Return the canonical spelling of a URL.
+
+    The scheme and host are lower-cased, user information, default ports and
+    the fragment are dropped, an empty path becomes ``/`` and trailing slashes
+    are removed from other paths. Tracking parameters (``utm_*``, ``fbclid``,
+    ``gclid`` and the others in TRACKING_PARAMETERS) are removed from the query
+    and the remaining parameters are sorted by name; values are kept exactly as
+    written, and repeated names keep their relative order.
+
+    Args:
+        url: URL to normalize. It is not validated.
+
+    Returns:
+        Normalized URL.
+
+    Examples:
+        >>> normalize_url("HTTPS://Example.com:443/News/?utm_source=feed&b=2&a=1#top")
+        'https://example.com/News?a=1&b=2'
+        >>> normalize_url("http://example.com")
+        'http://example.com/'
+    """
+    # Splitting with str.partition is several times faster than urlsplit for
+    # the common scheme://host/path form; anything else goes through urlsplit.
+    scheme, separator, rest = url.partition("://")
+    if not separator or not scheme.isalpha():
+        scheme, netloc, path, query, _ = urlsplit(url)
+    else:
+        rest = rest.partition("#")[0]
+        rest, _, query = rest.partition("?")
+        netloc, slash, path = rest.partition("/")
+        path = slash + path
+    scheme = scheme.lower()
+
+    host = netloc.rpartition("@")[2].lower()
+    default_port = _DEFAULT_PORT_SUFFIXES.get(scheme)
+    if default_port is not None and host.endswith(default_port):
+        host = host[: -len(default_port)]
+    elif host.endswith(":"):
+        host = host[:-1]
+
+    if not path:
+        path = "/"
+    elif len(path) > 1 and path[-1] == "/":
+        path = path.rstrip("/") or "/"
+
+    if query:
+        query = _normalize_query(query)
+    if not host and scheme not in _DEFAULT_PORT_SUFFIXES:
+        return urlunsplit((scheme, host, path, query, ""))
+    return f"{scheme}://{host}{path}?{query}" if query else f"{scheme}://{host}{path}"
+
+
+def normalize_urls(urls: Iterable[str]) -> Iterator[str]:
+    """Normalize many URLs lazily, in input order.
+
+    Args:
+        urls: URLs to normalize, e.g. the lines of a seed list.
+
+    Yields:
+        The normalized form of each URL.
+
+    Examples:
+        >>> list(normalize_urls(["https://example.com/a/", "https://EXAMPLE.com/a#b"]))
+        ['https://example.com/a', 'https://example.com/a']
+    """
+    return map(normalize_url, urls)
+
+
+def is_tracking_parameter(name: str) -> bool:
+    """Return True when a query parameter name only serves analytics or click tracking.
+
+    Args:
+        name: Raw query parameter name.
+
+    Examples:
+        >>> is_tracking_parameter("utm_campaign"), is_tracking_parameter("page")
+        (True, False)
+    """
+    name = name.lower()
+    return name in TRACKING_PARAMETERS or name.startswith(TRACKING_PARAMETER_PREFIXES)
+
+
+def _normalize_query(query: str) -> str:
+    """Drop empty and tracking parameters from a raw query string and sort the rest by name."""
+    pairs = [pair for pair in query.split("&") if pair and not is_tracking_parameter(pair.partition("=")[0])]
+    pairs.sort(key=_parameter_name)
+    return "&".join(pairs)
+
+
+def _parameter_name(pair: str) -> str:
+    """Return the raw name of a ``name=value`` query pair."""
+    return pair.partition("=")[0]
@@ -1,7 +1,26 @@
 """Input validation utilities."""
 
 import re
-from urllib.parse import urlparse
+from bisect import bisect_right
+from collections.abc import Iterable
+from itertools import accumulate, compress, repeat
+from urllib.parse import urlsplit
+
+from py_web_text_extractor.exception.exceptions import UrlIsNotValidException
+from py_web_text_extractor.model.url_validation import InvalidUrl, InvalidUrlReason, UrlValidationReport
+
+# Most valid URLs: an http(s) scheme, an ASCII network location without IPv6
+# brackets, and ASCII without whitespace everywhere. Everything else takes the
+# slower path that also names the problem. The classes are spelled as ASCII
+# ranges, which the regex engine tests faster than negated classes with \s.
+_PLAIN_HTTP_URL = re.compile(r"https?://[\x00-\x08\x0e-\x1b!\"$-.0->@-Z\\^-\x7f]+(?:[/?#][\x00-\x08\x0e-\x1b!-\x7f]*)?")
+_WHITESPACE = re.compile(r"\s")
+_NETLOC_END = re.compile(r"[/?#]")
+_SCHEMES = ("http://", "https://")
+_EMPTY_HOST_PREFIXES = ("http:///", "http://?", "http://#", "https:///", "https://?", "https://#")
+_SCHEME_ONLY = frozenset(_SCHEMES)
+# ASCII whitespace (what \s matches below 0x80) and brackets.
+_UNSAFE_BYTES = tuple(bytes([byte]) for byte in b" \t\n\x0b\x0c\r\x1c\x1d\x1e\x1f[]")
 
 
 def is_blank_string(value: str | None) -> bool:
@@ -23,7 +42,7 @@ def is_blank_string(value: str | None) -> bool:
         >>> is_blank_string("hello")
         False
     """
-    return value is None or len(value.strip()) == 0
+    return not value or value.isspace()
 
 
 def is_valid_url(value: str | None) -> bool:
@@ -41,8 +60,8 @@ def is_valid_url(value: str | None) -> bool:
         True
         >>> is_valid_url("http://sub.example.com/path")
         True
-        >>> is_blank_string("example.com")
-        True
+        >>> is_valid_url("example.com")
+        False
         >>> is_valid_url("")
         False
         >>> is_valid_url(None)
@@ -50,17 +69,154 @@ def is_valid_url(value: str | None) -> bool:
         >>> is_valid_url("ftp://example.com")
         False
     """
-    if value is None:
-        return False
+    return _url_problem(value) is None
+
+
+def ensure_valid_url(value: object) -> str:
+    """Validate a URL and return it, raising when it cannot be extracted.
+
+    Args:
+        value: Candidate URL (any value accepted).
+
+    Returns:
+        The URL unchanged when it is a valid HTTP/HTTPS URL.
+
+    Raises:
+        UrlIsNotValidException: If value is not a string, is blank, or is not a
+            valid HTTP/HTTPS URL.
+
+    Examples:
+        >>> ensure_valid_url("https://example.com")
+        'https://example.com'
+        >>> ensure_valid_url("example.com")
+        Traceback (most recent call last):
+        ...
+        py_web_text_extractor.exception.exceptions.UrlIsNotValidException: Invalid URL: example.com
+    """
     if not isinstance(value, str):
-        return False
-    if is_blank_string(value) or re.search(r"\s", value):
-        return False
-    if not (value.startswith("http://") or value.startswith("https://")):
-        return False
-
-    try:
-        result = urlparse(value)
-        return bool(result.scheme and result.netloc)
-    except ValueError:
-        return False
+        raise UrlIsNotValidException(f"URL must be a string, got {type(value).__name__}")
+    problem = _url_problem(value)
+    if problem is InvalidUrlReason.BLANK:
+        raise UrlIsNotValidException("URL cannot be empty or blank")
+    if problem is not None:
+        raise UrlIsNotValidException(f"Invalid URL: {value}")
+    return value
+
+
+def validate_urls(values: Iterable[object]) -> UrlValidationReport:
+    """Validate many candidate URLs in one pass, e.g. to pre-screen a seed list.
+
+    Applies exactly the rules of is_valid_url. Most valid URLs are accepted by
+    a few passes of string methods over the whole input, so no Python code or
+    regular expression call runs per value; the step-by-step checks that name
+    a problem, and urllib parsing, only run for the values those passes do not
+    accept.
+
+    Args:
+        values: Candidate URLs (any values accepted), consumed once.
+
+    Returns:
+        UrlValidationReport with a validity mask in input order, the valid URLs
+        and the rejected values with their positions and reasons.
+
+    Examples:
+        >>> report = validate_urls(["https://example.com", "ftp://example.com", None])
+        >>> list(report.mask), report.valid
+        ([1, 0, 0], ['https://example.com'])
+        >>> [(invalid.index, str(invalid.reason)) for invalid in report.invalid]
+        [(1, 'unsupported_scheme'), (2, 'not_a_string')]
+    """
+    values = values if isinstance(values, list) else list(values)
+    strings = bytearray(map(isinstance, values, repeat(str)))
+    texts = values
+    index = strings.find(0)
+    if index >= 0:
+        texts = values.copy()
+        while index >= 0:
+            texts[index] = ""
+            index = strings.find(0, index + 1)
+    mask = _plain_url_mask(texts)
+
+    invalid: list[InvalidUrl] = []
+    index = mask.find(0)
+    while index >= 0:
+        value = values[index]
+        problem = _diagnose(value) if strings[index] else InvalidUrlReason.NOT_A_STRING
+        if problem is None:
+            mask[index] = 1
+        else:
+            invalid.append(InvalidUrl(index, value, problem))
+        index = mask.find(0, index + 1)
+    return UrlValidationReport(mask, list(compress(values, mask)), invalid)
+
+
+def _plain_url_mask(texts: list[str]) -> bytearray:
+    """Return 1 for each text that is certainly a valid URL and 0 for each that needs _diagnose.
+
+    Scheme and host checks map a string method over all texts, combined into
+    one integer bit mask. Whitespace and brackets are found in all texts at
+    once with bytes.find on the joined, encoded texts, so only the texts
+    containing one cost a Python step. Like the texts _PLAIN_HTTP_URL does not
+    match, non-ASCII texts and texts with a bracket anywhere are left to
+    _diagnose.
+    """
+    count = len(texts)
+    accepted = int.from_bytes(bytes(map(str.startswith, texts, repeat(_SCHEMES))))
+    accepted &= ~int.from_bytes(bytes(map(str.startswith, texts, repeat(_EMPTY_HOST_PREFIXES))))
+    accepted &= ~int.from_bytes(bytes(map(_SCHEME_ONLY.__contains__, texts)))
+    joined = "".join(texts)
+    if not joined.isascii():
+        accepted &= int.from_bytes(bytes(map(str.isascii, texts)))
+    mask = bytearray(accepted.to_bytes(count))
+
+    # "replace" keeps one byte per character, so offsets still line up with the texts.
+    data = joined.encode("ascii", "replace")
+    present = [unsafe for unsafe in _UNSAFE_BYTES if unsafe in data]
+    if present:
+        ends = list(accumulate(map(len, texts)))
+        for unsafe in present:
+            position = data.find(unsafe)
+            while position >= 0:
+                index = bisect_right(ends, position)
+                mask[index] = 0
+                position = data.find(unsafe, ends[index])
+    return mask
+
+
+def _url_problem(value: object) -> InvalidUrlReason | None:
+    """Return why value is not a valid HTTP/HTTPS URL, or None when it is one."""
+    if not isinstance(value, str):
+        return InvalidUrlReason.NOT_A_STRING
+    if _PLAIN_HTTP_URL.fullmatch(value) is not None:
+        return None
+    return _diagnose(value)
+
+
+def _diagnose(value: str) -> InvalidUrlReason | None:
+    """Check a string that is not a plain http(s) URL step by step and name its problem."""
+    if not value or value.isspace():
+        return InvalidUrlReason.BLANK
+    if _WHITESPACE.search(value) is not None:
+        return InvalidUrlReason.CONTAINS_WHITESPACE
+    if value.startswith("https://"):
+        start = 8
+    elif value.startswith("http://"):
+        start = 7
+    else:
+        return InvalidUrlReason.UNSUPPORTED_SCHEME
+    return _host_problem(value, start)
+
+
+def _host_problem(url: str, start: int) -> InvalidUrlReason | None:
+    """Return why the network location of an http(s) URL starting at start is invalid, or None."""
+    end = _NETLOC_END.search(url, start)
+    netloc = url[start : end.start()] if end is not None else url[start:]
+    if not netloc:
+        return InvalidUrlReason.MISSING_HOST
+    # urlsplit only rejects bracketed (IPv6) and non-ASCII hosts; skip it for the rest.
+    if "[" in netloc or "]" in netloc or not netloc.isascii():
+        try:
+            urlsplit(url)
+        except ValueError:
+            return InvalidUrlReason.MALFORMED
+    return None
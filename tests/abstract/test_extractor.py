@@ -0,0 +1,52 @@
+"""
+Unit tests for the extractor interfaces.
+
+This module checks that extractors written against the original two-method
+interface can still be instantiated and get a working extract_result_from_page.
+"""
+
+import asyncio
+
+from py_web_text_extractor.abstract.extractor import AsyncExtractor, Extractor
+
+URL = "https://example.com/page"
+
+
+class TextOnlyExtractor(Extractor):
+    """Extractor that implements only the text methods."""
+
+    def extract_text_from_page(self, url: str) -> str:
+        return f"text of {url}"
+
+    def extract_text_from_page_safe(self, url: str) -> str:
+        return self.extract_text_from_page(url)
+
+
+class AsyncTextOnlyExtractor(AsyncExtractor):
+    """Async extractor that implements only the text coroutines."""
+
+    async def extract_text_from_page(self, url: str) -> str:
+        return f"text of {url}"
+
+    async def extract_text_from_page_safe(self, url: str) -> str:
+        return await self.extract_text_from_page(url)
+
+
+def test_default_extract_result_wraps_extract_text():
+    """
+    Test that the default extract_result_from_page reports the text with unknown response details.
+    """
+    result = TextOnlyExtractor().extract_result_from_page(URL)
+
+    assert (result.url, result.text, result.final_url) == (URL, f"text of {URL}", URL)
+    assert (result.engine, result.status_code, result.content_type) == ("", 0, None)
+    assert set(result.timings) == {"extract"}
+
+
+def test_async_default_extract_result_wraps_extract_text():
+    """
+    Test that the async default extract_result_from_page awaits the text coroutine.
+    """
+    result = asyncio.run(AsyncTextOnlyExtractor().extract_result_from_page(URL))
+
+    assert (result.text, result.engine, result.status_code) == (f"text of {URL}", "", 0)
@@ -67,6 +67,16 @@ class TestServer:
                 self._serve_file("complex.html", CONTENT_TYPE_HTML)
             elif self.path == "/no_html":
                 self._serve_file("no_html.txt", CONTENT_TYPE_PLAIN)
+            elif self.path == "/image":
+                self._send_body(b"\x89PNG\r\n\x1a\n" + bytes(256), "image/png")
+            elif self.path == "/mislabelled":
+                self._send_body(b"%PDF-1.7\n" + bytes(256), CONTENT_TYPE_HTML)
+            elif self.path == "/huge":
+                self.send_response(200)
+                self.send_header("Content-type", CONTENT_TYPE_HTML)
+                self.send_header("Content-Length", str(10**9))
+                self.end_headers()
+                self.wfile.write(b"<html>")
             elif self.path == "/empty":
                 self.send_response(204)
                 self.end_headers()
@@ -81,6 +91,20 @@ class TestServer:
                 self.end_headers()
                 self.wfile.write(b"<html><body><h1>Not Found</h1></body></html>")
 
+        def _send_body(self, body: bytes, content_type: str):
+            """
+            Send a 200 response with the given body.
+
+            Args:
+                body: The response body.
+                content_type: The content type of the body.
+            """
+            self.send_response(200)
+            self.send_header("Content-type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
         def _serve_file(self, filename: str, content_type: str):
             """
             Serve a file from the resources directory.
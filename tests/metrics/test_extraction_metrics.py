@@ -0,0 +1,202 @@
+"""
+Unit tests for extraction metrics.
+
+This module contains tests for the in-memory counters and latency histograms,
+the Prometheus text rendering, hook composition and the optional OpenTelemetry
+exporter.
+"""
+
+import importlib.util
+from unittest.mock import MagicMock
+
+import pytest
+
+from py_web_text_extractor.metrics.extraction_metrics import ExtractionMetrics
+from py_web_text_extractor.metrics.hooks import CompositeHooks, ExtractionHooks
+from py_web_text_extractor.metrics.otel import METER_NAME, OpenTelemetryHooks
+from py_web_text_extractor.metrics.prometheus import to_prometheus_text
+from py_web_text_extractor.model.fetched_page import FetchedPage
+from py_web_text_extractor.model.quality_score import QualityScore
+
+URL = "https://example.com/page"
+PAGE = FetchedPage(url=URL, final_url=URL, status_code=200, content=b"<p>Hello</p>")
+SCORE = QualityScore(characters=6, text_density=0.0, link_density=0.0, html_ratio=0.5, score=0.25)
+
+
+def test_stage_histogram_buckets_are_cumulative():
+    """
+    Test that stage durations land in cumulative buckets and overflow only counts towards the total.
+    """
+    metrics = ExtractionMetrics(buckets=(0.1, 1.0))
+
+    for seconds in (0.05, 0.5, 0.7, 5.0):
+        metrics.on_stage("fetch", seconds)
+
+    stats = metrics.snapshot().stages["fetch"]
+    assert stats.count == 4
+    assert stats.bucket_counts == (1, 3)
+    assert stats.total_seconds == pytest.approx(6.25)
+    assert stats.mean_seconds == pytest.approx(1.5625)
+
+
+def test_counters_and_reset():
+    """
+    Test that pages, failures, fallbacks, quality scores and byte/character counts accumulate until reset.
+    """
+    metrics = ExtractionMetrics()
+
+    metrics.on_fetch(PAGE)
+    metrics.on_engine_failure("markitdown", ValueError("broken"))
+    metrics.on_fallback("markitdown", "trafilatura")
+    metrics.on_result(URL, "trafilatura", 6)
+    metrics.on_failure(URL, ValueError("broken"))
+    metrics.on_quality(URL, "markitdown", SCORE, accepted=False)
+    metrics.on_quality(URL, "markitdown", SCORE, accepted=True)
+
+    snapshot = metrics.snapshot()
+    assert snapshot.quality["markitdown"].checks == 2
+    assert snapshot.quality["markitdown"].rejections == 1
+    assert snapshot.quality["markitdown"].mean_score == pytest.approx(0.25)
+    assert snapshot.pages == {"trafilatura": 1}
+    assert snapshot.failures == {"ValueError": 1}
+    assert snapshot.engine_failures == {"markitdown": 1}
+    assert snapshot.fallbacks == {("markitdown", "trafilatura"): 1}
+    assert snapshot.bytes_fetched == len(PAGE.content)
+    assert snapshot.characters_per_byte == pytest.approx(6 / len(PAGE.content))
+
+    metrics.reset()
+    assert metrics.snapshot().bytes_fetched == 0
+    assert metrics.snapshot().pages == {}
+
+
+def test_invalid_buckets():
+    """
+    Test that empty or unsorted histogram buckets are rejected.
+    """
+    with pytest.raises(ValueError):
+        ExtractionMetrics(buckets=())
+    with pytest.raises(ValueError):
+        ExtractionMetrics(buckets=(1.0, 0.5))
+
+
+def test_prometheus_text():
+    """
+    Test that metrics render as Prometheus text exposition with escaped labels.
+    """
+    metrics = ExtractionMetrics(buckets=(0.1, 1.0))
+    metrics.on_stage("parse.markitdown", 0.05)
+    metrics.on_fetch(PAGE)
+    metrics.on_result(URL, "trafilatura", 6)
+    metrics.on_fallback("markitdown", "trafilatura")
+    metrics.on_failure(URL, ValueError("broken"))
+    metrics.on_quality(URL, "markitdown", SCORE, accepted=False)
+
+    text = to_prometheus_text(metrics)
+
+    assert text.endswith("\n")
+    assert "# TYPE py_web_text_extractor_stage_seconds histogram" in text
+    assert 'py_web_text_extractor_stage_seconds_bucket{stage="parse.markitdown",le="0.1"} 1' in text
+    assert 'py_web_text_extractor_stage_seconds_bucket{stage="parse.markitdown",le="+Inf"} 1' in text
+    assert 'py_web_text_extractor_stage_seconds_count{stage="parse.markitdown"} 1' in text
+    assert 'py_web_text_extractor_pages_total{engine="trafilatura"} 1' in text
+    assert 'py_web_text_extractor_fallbacks_total{from="markitdown",to="trafilatura"} 1' in text
+    assert 'py_web_text_extractor_failures_total{error="ValueError"} 1' in text
+    assert f"py_web_text_extractor_fetched_bytes_total {len(PAGE.content)}" in text
+    assert "py_web_text_extractor_extracted_characters_total 6" in text
+    assert 'py_web_text_extractor_quality_score_count{engine="markitdown"} 1' in text
+    assert 'py_web_text_extractor_quality_rejections_total{engine="markitdown"} 1' in text
+
+    metrics.on_engine_failure('odd"engine\n', ValueError("broken"))
+    assert 'engine="odd\\"engine\\n"' in to_prometheus_text(metrics.snapshot(), prefix="extractor")
+
+
+def test_composite_hooks_forward_every_event():
+    """
+    Test that CompositeHooks forwards each event to every wrapped hook.
+    """
+    first, second = MagicMock(spec=ExtractionHooks), MagicMock(spec=ExtractionHooks)
+    hooks = CompositeHooks(first, second)
+
+    hooks.on_stage("fetch", 0.1)
+    hooks.on_fetch(PAGE)
+    hooks.on_result(URL, "markitdown", 5)
+
+    for inner in (first, second):
+        inner.on_stage.assert_called_once_with("fetch", 0.1)
+        inner.on_fetch.assert_called_once_with(PAGE)
+        inner.on_result.assert_called_once_with(URL, "markitdown", 5)
+
+
+@pytest.mark.skipif(importlib.util.find_spec("opentelemetry") is not None, reason="opentelemetry-api is installed")
+def test_opentelemetry_hooks_require_the_extra():
+    """
+    Test that OpenTelemetryHooks explains how to install the missing dependency.
+    """
+    with pytest.raises(ImportError, match=r"py-web-text-extractor\[otel\]"):
+        OpenTelemetryHooks()
+
+
+class _FakeInstrument:
+    """Counter or histogram that keeps every value it is given."""
+
+    def __init__(self, unit: str) -> None:
+        self.unit = unit
+        self.values: list[tuple[float, dict]] = []
+
+    def add(self, amount: float, attributes: dict | None = None) -> None:
+        self.values.append((amount, attributes or {}))
+
+    record = add
+
+
+class _FakeMeterProvider:
+    """Meter provider whose meter creates _FakeInstrument counters and histograms."""
+
+    def __init__(self) -> None:
+        self.meter_names: list[str] = []
+        self.counters: dict[str, _FakeInstrument] = {}
+        self.histograms: dict[str, _FakeInstrument] = {}
+
+    def get_meter(self, name: str, *args) -> "_FakeMeterProvider":
+        self.meter_names.append(name)
+        return self
+
+    def create_counter(self, name: str, unit: str = "", description: str = "") -> _FakeInstrument:
+        return self.counters.setdefault(name, _FakeInstrument(unit))
+
+    def create_histogram(self, name: str, unit: str = "", description: str = "") -> _FakeInstrument:
+        return self.histograms.setdefault(name, _FakeInstrument(unit))
+
+
+def test_opentelemetry_hooks_record_on_the_providers_instruments():
+    """
+    Test that OpenTelemetryHooks creates its instruments on the given provider and records every event on them.
+    """
+    pytest.importorskip("opentelemetry.metrics")
+    provider = _FakeMeterProvider()
+    hooks = OpenTelemetryHooks(meter_provider=provider)
+
+    hooks.on_stage("fetch", 0.25)
+    hooks.on_fetch(PAGE)
+    hooks.on_engine_failure("markitdown", RuntimeError("boom"))
+    hooks.on_fallback("markitdown", "trafilatura")
+    hooks.on_quality(URL, "trafilatura", SCORE, accepted=True)
+    hooks.on_result(URL, "trafilatura", 5)
+    hooks.on_failure(URL, ValueError("bad"))
+
+    assert provider.meter_names == [METER_NAME]
+    assert set(provider.histograms) == {f"{METER_NAME}.stage.duration", f"{METER_NAME}.quality.score"}
+    assert provider.histograms[f"{METER_NAME}.stage.duration"].unit == "s"
+    assert provider.histograms[f"{METER_NAME}.stage.duration"].values == [(0.25, {"stage": "fetch"})]
+    assert provider.histograms[f"{METER_NAME}.quality.score"].values == [
+        (0.25, {"engine": "trafilatura", "accepted": True})
+    ]
+    assert {name: counter.values for name, counter in provider.counters.items()} == {
+        f"{METER_NAME}.pages": [(1, {"engine": "trafilatura"})],
+        f"{METER_NAME}.failures": [(1, {"error": "ValueError"})],
+        f"{METER_NAME}.engine.failures": [(1, {"engine": "markitdown"})],
+        f"{METER_NAME}.fallbacks": [(1, {"from": "markitdown", "to": "trafilatura"})],
+        f"{METER_NAME}.fetched.bytes": [(len(PAGE.content), {})],
+        f"{METER_NAME}.extracted.characters": [(5, {"engine": "trafilatura"})],
+    }
+    assert provider.counters[f"{METER_NAME}.fetched.bytes"].unit == "By"
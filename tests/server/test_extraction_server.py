@@ -0,0 +1,247 @@
+"""
+Integration tests for the HTTP extraction server.
+
+This module starts ExtractionServer on a free port (or a Unix socket) and
+talks to it over HTTP: single and batch extraction against the local test
+server, error statuses, health and metrics endpoints, and the 503 answer
+when every worker and queue slot is taken.
+"""
+
+import json
+import socket
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from py_web_text_extractor.exception.exceptions import TextExtractionFailure
+from py_web_text_extractor.model.extraction_result import ExtractionResult
+from py_web_text_extractor.server.extraction_server import ExtractionServer
+from py_web_text_extractor.service.extractor_service import ExtractorService
+
+
+@pytest.fixture(scope="module")
+def server():
+    """Serves extraction requests with the default warm service."""
+    with ExtractionServer(port=0, workers=4, queue_size=4) as extraction_server:
+        yield extraction_server
+
+
+def test_extract_reports_text_and_metadata(server, test_server):
+    """
+    Test that GET and POST /extract return the text with the response metadata, the second time from the cache.
+    """
+    page_url = f"{test_server.base_url}/simple"
+
+    first = requests.get(f"{server.url}/extract", params={"url": page_url}, timeout=30)
+    second = requests.post(f"{server.url}/extract", json={"url": page_url}, timeout=30)
+
+    assert first.status_code == 200
+    body = first.json()
+    assert "This is a simple page." in body["text"]
+    assert (body["status"], body["final_url"], body["status_code"]) == ("ok", page_url, 200)
+    assert body["content_type"] == "text/html"
+    assert "parse" in body["timings"]
+    assert not body["cached"]
+    assert second.json()["cached"]
+    assert second.json()["text"] == body["text"]
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "payload", "status"),
+    [
+        ("get", "/extract?url=not-a-url", None, 400),
+        ("get", "/extract", None, 400),
+        ("post", "/extract", {"link": "https://example.com"}, 400),
+        ("post", "/batch", {"urls": "https://example.com"}, 400),
+        ("get", "/unknown", None, 404),
+    ],
+)
+def test_invalid_requests(server, method, path, payload, status):
+    """
+    Test that invalid URLs, missing fields and unknown paths are answered with client errors.
+    """
+    response = requests.request(method, f"{server.url}{path}", json=payload, timeout=30)
+
+    assert response.status_code == status
+    assert response.json()["status"] == "error"
+
+
+def test_download_failure_is_a_bad_gateway(server, test_server):
+    """
+    Test that a page that cannot be downloaded is answered with 502 and the error.
+    """
+    response = requests.get(f"{server.url}/extract", params={"url": f"{test_server.base_url}/error"}, timeout=30)
+
+    assert response.status_code == 502
+    assert response.json()["error"].startswith("PageStatusException")
+
+
+@pytest.mark.parametrize("url", ["http://127.0.0.1:99999/", "http://example.com:abc/"])
+def test_bad_port_is_a_bad_gateway(server, url):
+    """
+    Test that a URL whose port is out of range or not a number is answered with 502, not 500.
+    """
+    response = requests.get(f"{server.url}/extract", params={"url": url}, timeout=30)
+
+    assert response.status_code == 502
+    assert response.json()["error"].startswith("PageFetchException")
+
+
+def test_batch_streams_one_line_per_url(server, test_server):
+    """
+    Test that POST /batch streams one JSON line per URL in input order when ordered is set.
+    """
+    urls = [f"{test_server.base_url}/simple", f"{test_server.base_url}/not_found", f"{test_server.base_url}/no_html"]
+
+    response = requests.post(f"{server.url}/batch", json={"urls": urls, "ordered": True}, timeout=30)
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert response.headers["Content-Type"].startswith("application/x-ndjson")
+    assert [line["url"] for line in lines] == urls
+    assert [line["status"] for line in lines] == ["ok", "error", "ok"]
+    assert "elapsed_ms" in lines[0]
+
+
+def test_batches_share_one_bounded_executor():
+    """
+    Test that every /batch request runs its URLs on the server's one batch executor.
+    """
+    service = MagicMock(spec=ExtractorService)
+    service.extract_many.side_effect = lambda urls, **kwargs: iter(())
+
+    with ExtractionServer(service, port=0, workers=2, batch_workers=3) as extraction_server:
+        for _ in range(2):
+            requests.post(f"{extraction_server.url}/batch", json={"urls": ["https://example.com"]}, timeout=30)
+
+    first, second = (call.kwargs["executor"] for call in service.extract_many.call_args_list)
+    assert first is second
+    assert first._max_workers == 3
+
+
+def test_health_and_metrics(server, test_server):
+    """
+    Test that /health reports the capacity and /metrics renders the extraction metrics.
+    """
+    requests.get(f"{server.url}/extract", params={"url": f"{test_server.base_url}/complex"}, timeout=30)
+
+    health = requests.get(f"{server.url}/health", timeout=30).json()
+    metrics = requests.get(f"{server.url}/metrics", timeout=30)
+
+    assert health["status"] == "ok"
+    assert health["capacity"] == 8
+    assert metrics.headers["Content-Type"].startswith("text/plain")
+    assert "py_web_text_extractor_pages_total" in metrics.text
+
+
+def test_overloaded_server_answers_503():
+    """
+    Test that a request arriving while every worker and queue slot is busy gets 503 with Retry-After.
+    """
+    release = threading.Event()
+    started = threading.Event()
+    service = MagicMock(spec=ExtractorService)
+
+    def slow_extract(url):
+        started.set()
+        release.wait(timeout=10)
+        return ExtractionResult(url=url, text="done", engine="markitdown", final_url=url, status_code=200)
+
+    service.extract_result_from_page.side_effect = slow_extract
+
+    with ExtractionServer(service, port=0, workers=1, queue_size=0) as extraction_server:
+        url = f"{extraction_server.url}/extract?url=https://example.com"
+        busy = threading.Thread(target=requests.get, args=(url,), kwargs={"timeout": 30})
+        busy.start()
+        try:
+            assert started.wait(timeout=10)
+            rejected = requests.get(url, timeout=30)
+            metrics = requests.get(f"{extraction_server.url}/metrics", timeout=30)
+        finally:
+            release.set()
+            busy.join()
+        health = requests.get(f"{extraction_server.url}/health", timeout=30).json()
+
+    assert rejected.status_code == 503
+    assert rejected.headers["Retry-After"] == "1"
+    assert metrics.status_code == 503
+    assert health["rejected"] == 2
+
+
+def test_silent_rejected_client_does_not_stall_other_rejections():
+    """
+    Test that a rejected client that never sends its request does not delay the 503 of the next one.
+    """
+    release = threading.Event()
+    started = threading.Event()
+    service = MagicMock(spec=ExtractorService)
+
+    def slow_extract(url):
+        started.set()
+        release.wait(timeout=10)
+        return ExtractionResult(url=url, text="done", engine="markitdown", final_url=url, status_code=200)
+
+    service.extract_result_from_page.side_effect = slow_extract
+
+    with ExtractionServer(service, port=0, workers=1, queue_size=0) as extraction_server:
+        url = f"{extraction_server.url}/extract?url=https://example.com"
+        host, port = extraction_server.url.removeprefix("http://").split(":")
+        busy = threading.Thread(target=requests.get, args=(url,), kwargs={"timeout": 30})
+        busy.start()
+        try:
+            assert started.wait(timeout=10)
+            with socket.create_connection((host, int(port))):
+                started_at = time.monotonic()
+                rejected = requests.get(url, timeout=30)
+                elapsed = time.monotonic() - started_at
+        finally:
+            release.set()
+            busy.join()
+
+    assert rejected.status_code == 503
+    assert elapsed < 0.5
+
+
+def test_extraction_failure_is_unprocessable():
+    """
+    Test that a page no engine can extract is answered with 422.
+    """
+    service = MagicMock(spec=ExtractorService)
+    service.extract_result_from_page.side_effect = TextExtractionFailure("Both engines failed")
+
+    with ExtractionServer(service, port=0, workers=1) as extraction_server:
+        response = requests.post(f"{extraction_server.url}/extract", json={"url": "https://example.com"}, timeout=30)
+        metrics = requests.get(f"{extraction_server.url}/metrics", timeout=30)
+
+    assert response.status_code == 422
+    assert metrics.status_code == 404
+
+
+def test_unix_socket(tmp_path):
+    """
+    Test that the server answers on a Unix domain socket and removes it when closed.
+    """
+    path = tmp_path / "extractor.sock"
+
+    with ExtractionServer(MagicMock(spec=ExtractorService), unix_socket=path, workers=1):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(path))
+            client.sendall(b"GET /health HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n")
+            response = b""
+            while chunk := client.recv(4096):
+                response += chunk
+
+    assert response.startswith(b"HTTP/1.1 200")
+    assert b'"status": "ok"' in response
+    assert not path.exists()
+
+
+@pytest.mark.parametrize("kwargs", [{"workers": 0}, {"queue_size": -1}, {"batch_workers": 0}, {"max_batch_urls": 0}])
+def test_invalid_limits(kwargs):
+    """
+    Test that out-of-range limits are rejected before the socket is bound.
+    """
+    with pytest.raises(ValueError):
+        ExtractionServer(MagicMock(spec=ExtractorService), port=0, **kwargs)
@@ -0,0 +1,239 @@
+"""
+Tests for the AsyncExtractorService.
+
+This module contains unit tests for the asyncio service, which mock the
+async fetcher and the synchronous parsing stage, and an integration test that
+runs the full non-blocking fetch path against the live test server.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from py_web_text_extractor.exception.exceptions import (
+    PageFetchException,
+    TextExtractionFailure,
+    UrlIsNotValidException,
+)
+from py_web_text_extractor.metrics.extraction_metrics import ExtractionMetrics
+from py_web_text_extractor.model.extraction_result import ExtractionResult
+from py_web_text_extractor.model.fetched_page import FetchedPage
+from py_web_text_extractor.service.async_extractor_service import AsyncExtractorService
+from py_web_text_extractor.service.extractor_service import ExtractorService
+from py_web_text_extractor.service.process_parser import ProcessPoolParser
+
+VALID_URL = "https://example.com"
+FETCHED_PAGE = FetchedPage(
+    url=VALID_URL,
+    final_url=VALID_URL,
+    status_code=200,
+    content=b"<html><body><p>Hello</p></body></html>",
+    headers={"Content-Type": "text/html"},
+)
+
+
+def _make_service(max_concurrency: int = 10) -> tuple[AsyncExtractorService, MagicMock]:
+    parser = MagicMock(spec=ExtractorService)
+    parser.parse_page_result.side_effect = lambda page: ExtractionResult.from_page(page, "Hello", "markitdown", 0.01)
+    return AsyncExtractorService(max_concurrency=max_concurrency, service=parser, client=MagicMock()), parser
+
+
+@patch("py_web_text_extractor.service.async_extractor_service.async_fetcher")
+def test_extract_text_from_page_success(mock_fetcher: MagicMock):
+    """
+    GIVEN a valid URL
+    WHEN extract_text_from_page is awaited
+    THEN the page should be fetched once and parsed by the synchronous engines.
+    """
+    mock_fetcher.fetch_page = AsyncMock(return_value=FETCHED_PAGE)
+    service, parser = _make_service()
+
+    result = asyncio.run(service.extract_text_from_page(VALID_URL))
+
+    assert result == "Hello"
+    mock_fetcher.fetch_page.assert_awaited_once()
+    parser.parse_page_result.assert_called_once_with(FETCHED_PAGE)
+
+
+@patch("py_web_text_extractor.service.async_extractor_service.async_fetcher")
+def test_extract_result_from_page_reports_response_metadata(mock_fetcher: MagicMock):
+    """
+    GIVEN a valid URL
+    WHEN extract_result_from_page is awaited
+    THEN the result should carry the engine, the response metadata and the parse time.
+    """
+    mock_fetcher.fetch_page = AsyncMock(return_value=FETCHED_PAGE)
+    service, _ = _make_service()
+
+    result = asyncio.run(service.extract_result_from_page(VALID_URL))
+
+    assert (result.text, result.engine, result.status_code) == ("Hello", "markitdown", 200)
+    assert result.content_type == "text/html"
+    assert result.content_bytes == len(FETCHED_PAGE.content)
+    assert "parse" in result.timings
+
+
+@patch("py_web_text_extractor.service.async_extractor_service.async_fetcher")
+def test_parses_through_the_services_process_pool_and_hooks(mock_fetcher: MagicMock):
+    """
+    GIVEN an ExtractorService with a process parser and metrics hooks
+    WHEN the async service extracts a page through it
+    THEN the page should be parsed by the process parser and the parse reported to the hooks.
+    """
+    mock_fetcher.fetch_page = AsyncMock(return_value=FETCHED_PAGE)
+    process_parser = MagicMock(spec=ProcessPoolParser)
+    process_parser.engines = ("markitdown", "trafilatura")
+    process_parser.parse.return_value = ("Hello", "trafilatura")
+    metrics = ExtractionMetrics()
+    sync_service = ExtractorService(process_parser=process_parser, hooks=metrics)
+    service = AsyncExtractorService(service=sync_service, client=MagicMock())
+
+    result = asyncio.run(service.extract_result_from_page(VALID_URL))
+
+    assert (result.text, result.engine) == ("Hello", "trafilatura")
+    process_parser.parse.assert_called_once_with(FETCHED_PAGE)
+    snapshot = metrics.snapshot()
+    assert snapshot.pages == {"trafilatura": 1}
+    assert snapshot.fallbacks == {("markitdown", "trafilatura"): 1}
+
+
+@pytest.mark.parametrize("invalid_url", [None, "", "not_a_valid_url", "ftp://example.com"])
+def test_extract_text_from_page_invalid_url(invalid_url):
+    """
+    GIVEN an invalid URL
+    WHEN extract_text_from_page is awaited
+    THEN it should raise UrlIsNotValidException.
+    """
+    service, _ = _make_service()
+    with pytest.raises(UrlIsNotValidException):
+        asyncio.run(service.extract_text_from_page(invalid_url))
+
+
+@pytest.mark.parametrize("url", ["http://127.0.0.1:99999/", "http://example.com:abc/"])
+@patch("py_web_text_extractor.service.async_extractor_service.async_fetcher")
+def test_extract_text_from_page_bad_port(mock_fetcher: MagicMock, url: str):
+    """
+    GIVEN a URL whose port is out of range or not a number
+    WHEN extract_text_from_page is awaited
+    THEN the download's PageFetchException should propagate instead of the flight key raising ValueError.
+    """
+    mock_fetcher.fetch_page = AsyncMock(side_effect=PageFetchException("Failed to parse"))
+    service, _ = _make_service()
+
+    with pytest.raises(PageFetchException):
+        asyncio.run(service.extract_text_from_page(url))
+
+
+@pytest.mark.parametrize(
+    "exception",
+    [PageFetchException("Download failed"), TextExtractionFailure("Extraction failed"), Exception("Unexpected")],
+)
+@patch("py_web_text_extractor.service.async_extractor_service.async_fetcher")
+def test_extract_text_from_page_safe_failures(mock_fetcher: MagicMock, exception: Exception):
+    """
+    GIVEN a failing fetch
+    WHEN extract_text_from_page_safe is awaited
+    THEN it should return an empty string.
+    """
+    mock_fetcher.fetch_page = AsyncMock(side_effect=exception)
+    service, _ = _make_service()
+
+    assert asyncio.run(service.extract_text_from_page_safe(VALID_URL)) == ""
+
+
+@patch("py_web_text_extractor.service.async_extractor_service.async_fetcher")
+def test_extract_many_respects_concurrency_limit(mock_fetcher: MagicMock):
+    """
+    GIVEN more URLs than the concurrency limit
+    WHEN extract_many is iterated
+    THEN no more than max_concurrency fetches should be in flight at once and every URL yields a result.
+    """
+    in_flight = 0
+    peak = 0
+
+    async def fetch_page(url, client, limits):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if url.endswith("/bad"):
+            raise PageFetchException("Download failed")
+        return FETCHED_PAGE
+
+    mock_fetcher.fetch_page = fetch_page
+    service, _ = _make_service(max_concurrency=3)
+    urls = [f"https://example.com/{i}" for i in range(10)] + ["https://example.com/bad"]
+
+    async def collect():
+        return [result async for result in service.extract_many(urls, ordered=True)]
+
+    results = asyncio.run(collect())
+
+    assert [result.url for result in results] == urls
+    assert peak == 3
+    assert not results[-1].ok
+    assert all(result.ok for result in results[:-1])
+
+
+@patch("py_web_text_extractor.service.async_extractor_service.async_fetcher")
+def test_concurrent_calls_for_one_url_share_an_extraction(mock_fetcher: MagicMock):
+    """
+    GIVEN several concurrent calls for the same page under different spellings of its URL
+    WHEN they are awaited together
+    THEN the page should be fetched and parsed once and every caller should get its result.
+    """
+    mock_fetcher.fetch_page = AsyncMock(return_value=FETCHED_PAGE)
+    service, parser = _make_service()
+    urls = [VALID_URL, "https://EXAMPLE.com/", "https://example.com:443#top"]
+
+    async def extract_all():
+        return await asyncio.gather(*(service.extract_result_from_page(url) for url in urls))
+
+    results = asyncio.run(extract_all())
+
+    assert all(result is results[0] for result in results)
+    mock_fetcher.fetch_page.assert_awaited_once()
+    parser.parse_page_result.assert_called_once_with(FETCHED_PAGE)
+
+
+@patch("py_web_text_extractor.service.async_extractor_service.async_fetcher")
+def test_cancelled_caller_does_not_cancel_a_shared_extraction(mock_fetcher: MagicMock):
+    """
+    GIVEN two concurrent calls for the same page
+    WHEN the first caller is cancelled while the fetch is in flight
+    THEN the second caller should still get the result.
+    """
+
+    async def fetch_page(url, client, limits):
+        await asyncio.sleep(0.01)
+        return FETCHED_PAGE
+
+    mock_fetcher.fetch_page = fetch_page
+    service, _ = _make_service()
+
+    async def cancel_first():
+        first = asyncio.create_task(service.extract_text_from_page(VALID_URL))
+        second = asyncio.create_task(service.extract_text_from_page(VALID_URL))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second, first
+
+    text, first = asyncio.run(cancel_first())
+
+    assert text == "Hello"
+    assert first.cancelled()
+
+
+def test_extract_text_from_page_integration(test_server):
+    """
+    Test the full non-blocking fetch and parse path against the live test server.
+    """
+    pytest.importorskip("httpx")
+
+    async def extract():
+        async with AsyncExtractorService() as service:
+            return await service.extract_text_from_page(f"{test_server.base_url}/simple")
+
+    assert "This is a simple page." in asyncio.run(extract())
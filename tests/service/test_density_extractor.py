@@ -0,0 +1,93 @@
+"""
+Unit tests for the text-density extraction engine.
+
+This module runs the engine on the bundled test pages and on small documents
+built to exercise its boilerplate filtering.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from py_web_text_extractor.exception.exceptions import EngineExtractionException, TextDensityExtractionException
+from py_web_text_extractor.model.fetched_page import FetchedPage
+from py_web_text_extractor.service.density_extractor import extract_text_from_content
+
+RESOURCES_DIR = Path(__file__).parent.parent / "resources"
+URL = "http://localhost/page"
+
+
+def _page(content: bytes | str, content_type: str = "text/html; charset=utf-8") -> FetchedPage:
+    if isinstance(content, str):
+        content = content.encode()
+    return FetchedPage(url=URL, final_url=URL, status_code=200, content=content, headers={"Content-Type": content_type})
+
+
+def test_extracts_simple_page():
+    """
+    Test that the paragraph of the simple test page is extracted.
+    """
+    text = extract_text_from_content(_page((RESOURCES_DIR / "simple.html").read_bytes()))
+
+    assert text == "This is a simple page."
+
+
+def test_extracts_complex_page_as_markdown():
+    """
+    Test that headings, lists and code blocks of the complex test page are rendered as Markdown.
+    """
+    text = extract_text_from_content(_page((RESOURCES_DIR / "complex.html").read_bytes()))
+
+    assert "## 1. Introduction to Our Amazing Project" in text
+    assert "- High-performance data processing" in text
+    assert "```\n# Clone the repository" in text
+    assert "uv sync" in text
+
+
+def test_drops_boilerplate_and_link_lists():
+    """
+    Test that navigation, footers, scripts, link-heavy blocks and short table cells are dropped.
+    """
+    html = """
+    <html><head><script>var tracking = 1;</script></head><body>
+      <nav><p>Home News Sport</p></nav>
+      <ul><li><a href="/a">Related story one</a></li><li><a href="/b">Related story two</a></li></ul>
+      <article>
+        <h1>Headline</h1>
+        <p>The article body, with <a href="/more">one link</a>, is kept as a paragraph.</p>
+        <blockquote><p>A quotation from the article.</p></blockquote>
+        <table><tr><td>Price</td><td>5</td></tr></table>
+      </article>
+      <footer><p>Copyright notice</p></footer>
+    </body></html>
+    """
+
+    text = extract_text_from_content(_page(html))
+
+    assert text == "\n\n".join(
+        [
+            "# Headline",
+            "The article body, with one link, is kept as a paragraph.",
+            "> A quotation from the article.",
+        ]
+    )
+
+
+def test_decodes_with_declared_charset():
+    """
+    Test that the body is decoded with the charset from the Content-Type header.
+    """
+    page = _page("<p>Café crème</p>".encode("cp1252"), content_type="text/html; charset=windows-1252")
+
+    assert extract_text_from_content(page) == "Café crème"
+
+
+@pytest.mark.parametrize("content", ["<html><body><nav><a href='/'>Home</a></nav></body></html>", "   "])
+def test_raises_when_no_dense_text_is_found(content: str):
+    """
+    Test that a page without dense text blocks fails, so the next engine in a chain runs.
+    """
+    with pytest.raises(TextDensityExtractionException) as exc_info:
+        extract_text_from_content(_page(content))
+
+    assert isinstance(exc_info.value, EngineExtractionException)
@@ -0,0 +1,119 @@
+"""
+Unit tests for the extraction engine registry.
+
+This module registers small in-memory engines, by callable and by
+"module:attribute" string, and checks how the registry creates engines and
+engine chains and rejects invalid ones.
+"""
+
+import pytest
+
+from py_web_text_extractor.abstract.engine import ExtractionEngine
+from py_web_text_extractor.model.fetched_page import FetchedPage
+from py_web_text_extractor.service.engine_registry import DEFAULT_ENGINES, EngineRegistry, get_default_registry
+from py_web_text_extractor.service.engines import MarkItDownEngine, TextDensityEngine, TrafilaturaEngine
+
+
+class PlainTextEngine(ExtractionEngine):
+    """Engine that returns the page body as text."""
+
+    name = "plain"
+
+    def extract(self, page: FetchedPage) -> str:
+        return page.body_bytes().decode()
+
+
+@pytest.fixture
+def registry():
+    """Provides a registry holding the plain text engine."""
+    registry = EngineRegistry()
+    registry.register("plain", PlainTextEngine)
+    return registry
+
+
+def test_create_returns_new_engine_instances(registry: EngineRegistry):
+    """
+    Test that create calls the factory for every engine it returns.
+    """
+    first = registry.create("plain")
+    second = registry.create("plain")
+
+    assert isinstance(first, PlainTextEngine)
+    assert first is not second
+    assert "plain" in registry
+    assert registry.names() == ("plain",)
+
+
+def test_string_factories_are_imported_on_first_use(registry: EngineRegistry):
+    """
+    Test that a "module:attribute" factory is accepted without importing it, and resolved by create.
+    """
+    registry.register("density", "py_web_text_extractor.service.engines:TextDensityEngine")
+    registry.register("missing", "no_such_package.engines:MissingEngine")
+
+    assert isinstance(registry.create("density"), TextDensityEngine)
+    with pytest.raises(ImportError):
+        registry.create("missing")
+
+
+def test_register_rejects_duplicates_unless_replacing(registry: EngineRegistry):
+    """
+    Test that a taken name is rejected, and replaced when replace is True.
+    """
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register("plain", TextDensityEngine)
+
+    registry.register("plain", "py_web_text_extractor.service.engines:TextDensityEngine", replace=True)
+
+    with pytest.raises(ValueError, match="reports the name 'density'"):
+        registry.create("plain")
+
+
+@pytest.mark.parametrize("factory", ["no_colon", ":Engine", "module:"])
+def test_register_rejects_malformed_factory_strings(registry: EngineRegistry, factory: str):
+    """
+    Test that factory strings not in "module:attribute" form are rejected at registration.
+    """
+    with pytest.raises(ValueError, match="module:attribute"):
+        registry.register("other", factory)
+
+
+def test_create_chain_mixes_names_and_instances(registry: EngineRegistry):
+    """
+    Test that a chain keeps its order and uses engine instances as they are.
+    """
+    engine = TrafilaturaEngine()
+
+    chain = registry.create_chain(["plain", engine])
+
+    assert [type(item) for item in chain] == [PlainTextEngine, TrafilaturaEngine]
+    assert chain[1] is engine
+
+
+@pytest.mark.parametrize(
+    ("engines", "message"),
+    [
+        ([], "at least one engine"),
+        (["plain", "plain"], "duplicate engines: plain"),
+        (["plain", "unknown"], "Unknown extraction engine 'unknown'"),
+    ],
+)
+def test_create_chain_rejects_invalid_chains(registry: EngineRegistry, engines: list[str], message: str):
+    """
+    Test that empty chains, repeated engines and unknown names are rejected.
+    """
+    with pytest.raises(ValueError, match=message):
+        registry.create_chain(engines)
+
+
+def test_default_registry_holds_builtin_engines():
+    """
+    Test that the process-wide registry provides the built-in engines and the default chain.
+    """
+    registry = get_default_registry()
+
+    chain = registry.create_chain(DEFAULT_ENGINES)
+
+    assert {"density", "markitdown", "trafilatura"} <= set(registry.names())
+    assert [type(engine) for engine in chain] == [MarkItDownEngine, TrafilaturaEngine]
+    assert registry is get_default_registry()
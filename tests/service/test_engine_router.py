@@ -0,0 +1,131 @@
+"""
+Unit tests for per-domain engine routing.
+
+This module checks registrable domain extraction, how recorded engine runs
+reorder the engines for a domain, and that the routing table survives a save
+and load round trip. Exploration is disabled so the order is deterministic.
+"""
+
+import json
+
+import pytest
+
+from py_web_text_extractor.service.engine_router import EngineRouter, registrable_domain
+
+ENGINES = ["markitdown", "trafilatura"]
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://www.example.com/a", "example.com"),
+        ("https://news.bbc.co.uk/story", "bbc.co.uk"),
+        ("https://shop.example.com.au/", "example.com.au"),
+        ("https://blog.example.io/post", "example.io"),
+        ("http://127.0.0.1:8000/page", "127.0.0.1"),
+        ("http://localhost/page", "localhost"),
+        ("not a url", ""),
+    ],
+)
+def test_registrable_domain(url: str, expected: str):
+    """
+    Test that subdomains are folded into their registrable domain.
+    """
+    assert registrable_domain(url) == expected
+
+
+def test_failing_primary_is_demoted_per_domain():
+    """
+    Test that an engine that keeps failing on a domain is tried last there, and only there.
+    """
+    router = EngineRouter(min_samples=3, exploration=0)
+    for i in range(3):
+        router.record(f"https://a.example.com/{i}", "markitdown", success=False, seconds=2.0)
+        router.record(f"https://b.example.com/{i}", "trafilatura", success=True, seconds=0.1)
+
+    assert router.order("https://www.example.com/new", ENGINES) == ["trafilatura", "markitdown"]
+    assert router.order("https://other.org/", ENGINES) == ENGINES
+    assert router.stats("example.com")["markitdown"] == (3, 0.0, 2.0)
+
+
+def test_default_order_is_kept_until_min_samples():
+    """
+    Test that a few failures do not reorder the engines before min_samples runs.
+    """
+    router = EngineRouter(min_samples=5, exploration=0)
+    for _ in range(4):
+        router.record("https://example.com/", "markitdown", success=False, seconds=1.0)
+
+    assert router.order("https://example.com/", ENGINES) == ENGINES
+
+
+def test_latency_breaks_ties():
+    """
+    Test that between equally reliable engines the faster one goes first.
+    """
+    router = EngineRouter(min_samples=1, exploration=0)
+    router.record("https://example.com/", "markitdown", success=True, seconds=1.5)
+    router.record("https://example.com/", "trafilatura", success=True, seconds=0.2)
+
+    assert router.order("https://example.com/", ENGINES) == ["trafilatura", "markitdown"]
+
+
+def test_recovered_engine_wins_the_domain_back():
+    """
+    Test that the moving averages follow a site change that makes the other engine the better one.
+    """
+    router = EngineRouter(min_samples=1, exploration=0)
+    for _ in range(5):
+        router.record("https://example.com/", "markitdown", success=False, seconds=0.1)
+        router.record("https://example.com/", "trafilatura", success=True, seconds=0.5)
+    assert router.order("https://example.com/", ENGINES)[0] == "trafilatura"
+
+    for _ in range(10):
+        router.record("https://example.com/", "markitdown", success=True, seconds=0.1)
+        router.record("https://example.com/", "trafilatura", success=False, seconds=0.5)
+    assert router.order("https://example.com/", ENGINES)[0] == "markitdown"
+
+
+def test_save_and_load_round_trip(tmp_path):
+    """
+    Test that a saved table warm-starts a new router, and that missing or corrupt files start empty.
+    """
+    path = tmp_path / "routing.json"
+    router = EngineRouter(min_samples=1, exploration=0)
+    router.record("https://example.com/", "markitdown", success=False, seconds=1.0)
+    router.record("https://example.com/", "trafilatura", success=True, seconds=0.3)
+    router.save(path)
+
+    loaded = EngineRouter.load(path, min_samples=1, exploration=0)
+
+    assert json.loads(path.read_text(encoding="utf-8"))["version"] == 1
+    assert loaded.stats("example.com") == router.stats("example.com")
+    assert loaded.order("https://example.com/", ENGINES) == ["trafilatura", "markitdown"]
+
+    assert len(EngineRouter.load(tmp_path / "missing.json")) == 0
+    path.write_text("{not json", encoding="utf-8")
+    assert len(EngineRouter.load(path)) == 0
+
+
+def test_least_recently_used_domains_are_dropped():
+    """
+    Test that the table keeps at most max_domains domains.
+    """
+    router = EngineRouter(max_domains=2, exploration=0)
+    for domain in ("a.com", "b.com", "c.com"):
+        router.record(f"https://{domain}/", "markitdown", success=True, seconds=0.1)
+
+    assert len(router) == 2
+    assert router.stats("a.com") == {}
+
+
+def test_invalid_configuration():
+    """
+    Test that out-of-range settings are rejected.
+    """
+    with pytest.raises(ValueError):
+        EngineRouter(min_samples=0)
+    with pytest.raises(ValueError):
+        EngineRouter(exploration=1.5)
+    with pytest.raises(ValueError):
+        EngineRouter(max_domains=0)
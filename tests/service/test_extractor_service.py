@@ -3,26 +3,66 @@ Unit tests for the ExtractorService.
 
 This module contains unit tests for the ExtractorService, focusing on its
 fallback logic and error handling. The tests use mocking to isolate the
-service from its dependencies (MarkItDown and Trafilatura extractors).
+service from its dependencies (injected page fetcher, MarkItDown and
+Trafilatura extractors). The race and hedge strategy tests use events to hold
+an engine back deterministically instead of sleeping.
 """
 
-from unittest.mock import MagicMock, patch
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
+import py_web_text_extractor.service.markitdown_extractor as mk_extractor
+import py_web_text_extractor.service.trafilatura_extractor as tr_extractor
+from py_web_text_extractor.abstract.engine import ExtractionEngine
+from py_web_text_extractor.abstract.fetcher import Fetcher
+from py_web_text_extractor.cache.extraction_cache import ExtractionCache
 from py_web_text_extractor.exception.exceptions import (
     MarkItDownExtractionException,
+    PageFetchException,
+    TextDensityExtractionException,
     TextExtractionFailure,
     TrafilaturaExtractionException,
     UrlIsNotValidException,
 )
+from py_web_text_extractor.metrics.extraction_metrics import ExtractionMetrics
+from py_web_text_extractor.model.extraction_result import ExtractionResult
+from py_web_text_extractor.model.extraction_strategy import ExtractionStrategy
+from py_web_text_extractor.model.fetched_page import FetchedPage
+from py_web_text_extractor.service.engine_router import EngineRouter
 from py_web_text_extractor.service.extractor_service import ExtractorService
+from py_web_text_extractor.service.process_parser import ProcessPoolParser
+from py_web_text_extractor.service.quality import QualityGate
+from py_web_text_extractor.service.resilience import CircuitBreaker, CircuitState
 
 
 @pytest.fixture
-def extractor_service():
+def mock_fetcher():
+    """Provides a mocked page fetcher."""
+    return MagicMock(spec=Fetcher)
+
+
+@pytest.fixture
+def extractor_service(mock_fetcher: MagicMock):
     """Provides an instance of ExtractorService for testing."""
-    return ExtractorService()
+    return ExtractorService(fetcher=mock_fetcher)
+
+
+def _wait_for(condition: Callable[[], bool], timeout: float = 5.0) -> None:
+    """Polls condition until it holds, failing the test after timeout seconds."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        time.sleep(0.001)
+
+
+def _result(url: str, text: str, engine: str) -> ExtractionResult:
+    """Builds the result a successful extraction of url returns."""
+    return ExtractionResult(url=url, text=text, engine=engine, final_url=url, status_code=200)
 
 
 class TestExtractorService:
@@ -31,13 +71,24 @@ class TestExtractorService:
     VALID_URL = "https://example.com"
     MARKITDOWN_SUCCESS_TEXT = "Text from MarkItDown"
     TRAFILATURA_SUCCESS_TEXT = "Text from Trafilatura"
+    FETCHED_PAGE = FetchedPage(
+        url=VALID_URL,
+        final_url=VALID_URL,
+        status_code=200,
+        content=b"<html><body><p>Hello</p></body></html>",
+        headers={"Content-Type": "text/html; charset=utf-8"},
+    )
 
     # --- Tests for extract_text_from_page ---
 
-    @patch("py_web_text_extractor.service.extractor_service.tr_extractor")
-    @patch("py_web_text_extractor.service.extractor_service.mk_extractor")
+    @patch("py_web_text_extractor.service.engines.tr_extractor")
+    @patch("py_web_text_extractor.service.engines.mk_extractor")
     def test_extract_text_from_page_success_with_markitdown(
-        self, mock_mk_extractor: MagicMock, mock_tr_extractor: MagicMock, extractor_service: ExtractorService
+        self,
+        mock_mk_extractor: MagicMock,
+        mock_tr_extractor: MagicMock,
+        mock_fetcher: MagicMock,
+        extractor_service: ExtractorService,
     ):
         """
         GIVEN a valid URL
@@ -45,42 +96,53 @@ class TestExtractorService:
         THEN it should return the text from MarkItDown and not call Trafilatura.
         """
         # ARRANGE
-        mock_mk_extractor.extract_text.return_value = self.MARKITDOWN_SUCCESS_TEXT
+        mock_fetcher.fetch_page.return_value = self.FETCHED_PAGE
+        mock_mk_extractor.extract_text_from_content.return_value = self.MARKITDOWN_SUCCESS_TEXT
 
         # ACT
         result = extractor_service.extract_text_from_page(self.VALID_URL)
 
         # ASSERT
         assert result == self.MARKITDOWN_SUCCESS_TEXT
-        mock_mk_extractor.extract_text.assert_called_once_with(self.VALID_URL)
-        mock_tr_extractor.extract_text.assert_not_called()
+        mock_mk_extractor.extract_text_from_content.assert_called_once_with(self.FETCHED_PAGE, pool=ANY)
+        mock_tr_extractor.extract_text_from_content.assert_not_called()
 
-    @patch("py_web_text_extractor.service.extractor_service.tr_extractor")
-    @patch("py_web_text_extractor.service.extractor_service.mk_extractor")
+    @patch("py_web_text_extractor.service.engines.tr_extractor")
+    @patch("py_web_text_extractor.service.engines.mk_extractor")
     def test_extract_text_from_page_fallback_to_trafilatura_success(
-        self, mock_mk_extractor: MagicMock, mock_tr_extractor: MagicMock, extractor_service: ExtractorService
+        self,
+        mock_mk_extractor: MagicMock,
+        mock_tr_extractor: MagicMock,
+        mock_fetcher: MagicMock,
+        extractor_service: ExtractorService,
     ):
         """
         GIVEN a valid URL
         WHEN extract_text_from_page is called and MarkItDown fails
-        THEN it should fall back to Trafilatura and return its text.
+        THEN it should fall back to Trafilatura on the same fetched page and return its text.
         """
         # ARRANGE
-        mock_mk_extractor.extract_text.side_effect = MarkItDownExtractionException("MarkItDown failed")
-        mock_tr_extractor.extract_text.return_value = self.TRAFILATURA_SUCCESS_TEXT
+        mock_fetcher.fetch_page.return_value = self.FETCHED_PAGE
+        mock_mk_extractor.extract_text_from_content.side_effect = MarkItDownExtractionException("MarkItDown failed")
+        mock_tr_extractor.extract_text_from_content.return_value = self.TRAFILATURA_SUCCESS_TEXT
 
         # ACT
         result = extractor_service.extract_text_from_page(self.VALID_URL)
 
         # ASSERT
         assert result == self.TRAFILATURA_SUCCESS_TEXT
-        mock_mk_extractor.extract_text.assert_called_once_with(self.VALID_URL)
-        mock_tr_extractor.extract_text.assert_called_once_with(self.VALID_URL)
+        mock_fetcher.fetch_page.assert_called_once_with(self.VALID_URL)
+        mock_mk_extractor.extract_text_from_content.assert_called_once_with(self.FETCHED_PAGE, pool=ANY)
+        mock_tr_extractor.extract_text_from_content.assert_called_once_with(self.FETCHED_PAGE)
 
-    @patch("py_web_text_extractor.service.extractor_service.tr_extractor")
-    @patch("py_web_text_extractor.service.extractor_service.mk_extractor")
+    @patch("py_web_text_extractor.service.engines.tr_extractor")
+    @patch("py_web_text_extractor.service.engines.mk_extractor")
     def test_extract_text_from_page_both_extractors_fail(
-        self, mock_mk_extractor: MagicMock, mock_tr_extractor: MagicMock, extractor_service: ExtractorService
+        self,
+        mock_mk_extractor: MagicMock,
+        mock_tr_extractor: MagicMock,
+        mock_fetcher: MagicMock,
+        extractor_service: ExtractorService,
     ):
         """
         GIVEN a valid URL
@@ -88,15 +150,40 @@ class TestExtractorService:
         THEN it should raise a TextExtractionFailure.
         """
         # ARRANGE
-        mock_mk_extractor.extract_text.side_effect = MarkItDownExtractionException("MarkItDown failed")
-        mock_tr_extractor.extract_text.side_effect = TrafilaturaExtractionException("Trafilatura failed")
+        mock_fetcher.fetch_page.return_value = self.FETCHED_PAGE
+        mock_mk_extractor.extract_text_from_content.side_effect = MarkItDownExtractionException("MarkItDown failed")
+        mock_tr_extractor.extract_text_from_content.side_effect = TrafilaturaExtractionException("Trafilatura failed")
 
         # ACT & ASSERT
         with pytest.raises(TextExtractionFailure):
             extractor_service.extract_text_from_page(self.VALID_URL)
 
-        mock_mk_extractor.extract_text.assert_called_once_with(self.VALID_URL)
-        mock_tr_extractor.extract_text.assert_called_once_with(self.VALID_URL)
+        mock_mk_extractor.extract_text_from_content.assert_called_once_with(self.FETCHED_PAGE, pool=ANY)
+        mock_tr_extractor.extract_text_from_content.assert_called_once_with(self.FETCHED_PAGE)
+
+    @patch("py_web_text_extractor.service.engines.tr_extractor")
+    @patch("py_web_text_extractor.service.engines.mk_extractor")
+    def test_extract_text_from_page_fetch_failure(
+        self,
+        mock_mk_extractor: MagicMock,
+        mock_tr_extractor: MagicMock,
+        mock_fetcher: MagicMock,
+        extractor_service: ExtractorService,
+    ):
+        """
+        GIVEN a valid URL
+        WHEN the page cannot be downloaded
+        THEN it should raise PageFetchException without running any extractor.
+        """
+        # ARRANGE
+        mock_fetcher.fetch_page.side_effect = PageFetchException("Connection refused")
+
+        # ACT & ASSERT
+        with pytest.raises(PageFetchException):
+            extractor_service.extract_text_from_page(self.VALID_URL)
+
+        mock_mk_extractor.extract_text_from_content.assert_not_called()
+        mock_tr_extractor.extract_text_from_content.assert_not_called()
 
     @pytest.mark.parametrize(
         "invalid_url",
@@ -119,6 +206,161 @@ class TestExtractorService:
         with pytest.raises(UrlIsNotValidException):
             extractor_service.extract_text_from_page(invalid_url)
 
+    @patch("py_web_text_extractor.service.engines.tr_extractor")
+    @patch("py_web_text_extractor.service.engines.mk_extractor")
+    def test_extract_text_from_page_served_from_cache(
+        self, mock_mk_extractor: MagicMock, mock_tr_extractor: MagicMock, mock_fetcher: MagicMock
+    ):
+        """
+        GIVEN a service with a cache
+        WHEN the same URL is extracted twice within the TTL
+        THEN the second call should be served from the cache without fetching or parsing.
+        """
+        # ARRANGE
+        cache = ExtractionCache(ttl=60)
+        service = ExtractorService(fetcher=mock_fetcher, cache=cache)
+        mock_fetcher.fetch_page.return_value = self.FETCHED_PAGE
+        mock_mk_extractor.extract_text_from_content.return_value = self.MARKITDOWN_SUCCESS_TEXT
+
+        # ACT
+        first = service.extract_text_from_page(self.VALID_URL)
+        second = service.extract_text_from_page(self.VALID_URL + "#fragment")
+
+        # ASSERT
+        assert first == second == self.MARKITDOWN_SUCCESS_TEXT
+        mock_fetcher.fetch_page.assert_called_once_with(self.VALID_URL)
+        mock_mk_extractor.extract_text_from_content.assert_called_once()
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    @pytest.mark.parametrize("url", ["http://127.0.0.1:99999/", "http://example.com:abc/"])
+    def test_extraction_of_a_bad_port_is_a_fetch_failure(self, url: str):
+        """
+        GIVEN a service that coalesces concurrent calls and a URL whose port is out of range or not a number
+        WHEN extract_text_from_page is called
+        THEN the download should fail with PageFetchException instead of the flight key raising ValueError.
+        """
+        # ARRANGE
+        service = ExtractorService()
+
+        # ACT & ASSERT
+        with pytest.raises(PageFetchException):
+            service.extract_text_from_page(url)
+
+    @pytest.mark.parametrize("url", ["http://127.0.0.1:99999/", "http://example.com:abc/"])
+    def test_cached_extraction_of_a_bad_port_is_a_fetch_failure(self, url: str):
+        """
+        GIVEN a service with a cache and a URL whose port is out of range or not a number
+        WHEN extract_text_from_page is called
+        THEN the download should fail with PageFetchException instead of the cache key raising ValueError.
+        """
+        # ARRANGE
+        service = ExtractorService(coalesce=False, cache=ExtractionCache())
+
+        # ACT & ASSERT
+        with pytest.raises(PageFetchException):
+            service.extract_text_from_page(url)
+
+    @patch("py_web_text_extractor.service.engines.tr_extractor")
+    @patch("py_web_text_extractor.service.engines.mk_extractor")
+    def test_extract_text_from_page_revalidates_stale_entry(
+        self, mock_mk_extractor: MagicMock, mock_tr_extractor: MagicMock, mock_fetcher: MagicMock
+    ):
+        """
+        GIVEN a cached entry older than the TTL that carries an ETag
+        WHEN the URL is extracted again and the server answers 304
+        THEN the cached text should be returned without parsing the page again.
+        """
+        # ARRANGE
+        cache = ExtractionCache(ttl=0)
+        service = ExtractorService(fetcher=mock_fetcher, cache=cache)
+        tagged_page = FetchedPage(
+            url=self.VALID_URL,
+            final_url=self.VALID_URL,
+            status_code=200,
+            content=self.FETCHED_PAGE.content,
+            headers={"Content-Type": "text/html", "ETag": '"v1"'},
+        )
+        not_modified_page = FetchedPage(url=self.VALID_URL, final_url=self.VALID_URL, status_code=304, content=b"")
+        mock_fetcher.fetch_page.side_effect = [tagged_page, not_modified_page]
+        mock_mk_extractor.extract_text_from_content.return_value = self.MARKITDOWN_SUCCESS_TEXT
+
+        # ACT
+        service.extract_text_from_page(self.VALID_URL)
+        result = service.extract_text_from_page(self.VALID_URL)
+
+        # ASSERT
+        assert result == self.MARKITDOWN_SUCCESS_TEXT
+        mock_fetcher.fetch_page.assert_called_with(self.VALID_URL, headers={"If-None-Match": '"v1"'})
+        mock_mk_extractor.extract_text_from_content.assert_called_once()
+        assert cache.stats.revalidations == 1
+
+    # --- Tests for extract_result_from_page ---
+
+    @patch("py_web_text_extractor.service.engines.tr_extractor")
+    @patch("py_web_text_extractor.service.engines.mk_extractor")
+    def test_extract_result_from_page_reports_response_metadata(
+        self, mock_mk_extractor: MagicMock, mock_tr_extractor: MagicMock, mock_fetcher: MagicMock
+    ):
+        """
+        GIVEN a page served after a redirect on which MarkItDown fails
+        WHEN extract_result_from_page is called twice with a cache
+        THEN the result should carry the fallback engine, final URL, status, content type, size and timings,
+        and the cached result should carry the same metadata without fetching again.
+        """
+        # ARRANGE
+        redirected_page = FetchedPage(
+            url=self.VALID_URL,
+            final_url="https://www.example.com/",
+            status_code=200,
+            content=self.FETCHED_PAGE.content,
+            headers={"Content-Type": "text/html; charset=utf-8"},
+            timings={"wait": 0.2, "download": 0.1},
+        )
+        mock_fetcher.fetch_page.return_value = redirected_page
+        mock_mk_extractor.extract_text_from_content.side_effect = MarkItDownExtractionException("MarkItDown failed")
+        mock_tr_extractor.extract_text_from_content.return_value = self.TRAFILATURA_SUCCESS_TEXT
+        service = ExtractorService(fetcher=mock_fetcher, cache=ExtractionCache(ttl=60))
+
+        # ACT
+        result = service.extract_result_from_page(self.VALID_URL)
+        cached = service.extract_result_from_page(self.VALID_URL)
+
+        # ASSERT
+        assert result.text == self.TRAFILATURA_SUCCESS_TEXT
+        assert result.engine == tr_extractor.ENGINE_NAME
+        assert (result.url, result.final_url, result.status_code) == (self.VALID_URL, "https://www.example.com/", 200)
+        assert result.content_type == "text/html"
+        assert result.content_bytes == len(self.FETCHED_PAGE.content)
+        assert set(result.timings) == {"wait", "download", "parse"}
+        assert not result.cached
+        assert cached.cached
+        assert (cached.text, cached.engine, cached.final_url, cached.content_bytes) == (
+            result.text,
+            result.engine,
+            result.final_url,
+            result.content_bytes,
+        )
+        mock_fetcher.fetch_page.assert_called_once()
+
+    @patch("py_web_text_extractor.service.engines.mk_extractor")
+    def test_extract_result_from_html(self, mock_mk_extractor: MagicMock, extractor_service: ExtractorService):
+        """
+        GIVEN an HTML document in memory
+        WHEN extract_result_from_html is called
+        THEN the result should describe the document without any download timings.
+        """
+        # ARRANGE
+        mock_mk_extractor.extract_text_from_content.return_value = self.MARKITDOWN_SUCCESS_TEXT
+
+        # ACT
+        result = extractor_service.extract_result_from_html("<p>Hello</p>", base_url=self.VALID_URL)
+
+        # ASSERT
+        assert result.text == extractor_service.extract_text_from_html("<p>Hello</p>", base_url=self.VALID_URL)
+        assert result.final_url == self.VALID_URL
+        assert result.content_bytes == len(b"<p>Hello</p>")
+        assert list(result.timings) == ["parse"]
+
     # --- Tests for extract_text_from_page_safe ---
 
     @patch.object(ExtractorService, "extract_text_from_page")
@@ -142,6 +384,7 @@ class TestExtractorService:
         "exception",
         [
             UrlIsNotValidException("Invalid URL"),
+            PageFetchException("Download failed"),
             TextExtractionFailure("Extraction failed"),
             Exception("An unexpected error"),
         ],
@@ -164,3 +407,682 @@ class TestExtractorService:
         # ASSERT
         assert result == ""
         mock_extract.assert_called_once_with(self.VALID_URL)
+
+    # --- Tests for extract_many ---
+
+    @patch.object(ExtractorService, "_extract")
+    def test_extract_many_ordered_keeps_input_order(self, mock_extract: MagicMock, extractor_service: ExtractorService):
+        """
+        GIVEN several URLs
+        WHEN extract_many is called with ordered=True
+        THEN results should be yielded in input order with the engine that produced them.
+        """
+        # ARRANGE
+        urls = [f"https://example.com/{i}" for i in range(20)]
+        mock_extract.side_effect = lambda url: _result(url, f"text for {url}", "markitdown")
+
+        # ACT
+        results = list(extractor_service.extract_many(urls, max_workers=4, ordered=True))
+
+        # ASSERT
+        assert [result.url for result in results] == urls
+        assert all(result.ok for result in results)
+        assert results[3].text == "text for https://example.com/3"
+        assert results[3].engine == "markitdown"
+
+    @patch.object(ExtractorService, "_extract")
+    def test_extract_many_failure_does_not_stop_batch(
+        self, mock_extract: MagicMock, extractor_service: ExtractorService
+    ):
+        """
+        GIVEN a batch where one URL fails
+        WHEN extract_many is called
+        THEN the failure should be reported in its result and the other URLs should still succeed.
+        """
+        # ARRANGE
+        error = TextExtractionFailure("Extraction failed")
+
+        def extract(url: str) -> ExtractionResult:
+            if url.endswith("bad"):
+                raise error
+            return _result(url, "text", "trafilatura")
+
+        mock_extract.side_effect = extract
+        urls = ["https://example.com/a", "https://example.com/bad", "https://example.com/c"]
+
+        # ACT
+        results = {result.url: result for result in extractor_service.extract_many(urls, max_workers=2)}
+
+        # ASSERT
+        assert set(results) == set(urls)
+        assert results["https://example.com/bad"].error is error
+        assert results["https://example.com/bad"].text == ""
+        assert results["https://example.com/bad"].engine is None
+        assert results["https://example.com/a"].ok
+        assert results["https://example.com/c"].ok
+
+    @patch.object(ExtractorService, "_extract")
+    def test_extract_many_runs_concurrently(self, mock_extract: MagicMock, extractor_service: ExtractorService):
+        """
+        GIVEN as many URLs as workers
+        WHEN extract_many is called
+        THEN all URLs should be in flight at the same time.
+        """
+        # ARRANGE
+        barrier = threading.Barrier(4, timeout=5)
+
+        def extract(url: str) -> ExtractionResult:
+            barrier.wait()
+            return _result(url, "text", "markitdown")
+
+        mock_extract.side_effect = extract
+        urls = [f"https://example.com/{i}" for i in range(4)]
+
+        # ACT
+        results = list(extractor_service.extract_many(urls, max_workers=4))
+
+        # ASSERT
+        assert all(result.ok for result in results)
+
+    @patch.object(ExtractorService, "_extract")
+    def test_extract_many_on_a_shared_executor(self, mock_extract: MagicMock, extractor_service: ExtractorService):
+        """
+        GIVEN an executor shared by several batches
+        WHEN two batches run on it, one of them closed early
+        THEN both run on the executor's threads and it stays usable afterwards.
+        """
+        # ARRANGE
+        threads: set[str] = set()
+
+        def extract(url: str) -> ExtractionResult:
+            threads.add(threading.current_thread().name)
+            return _result(url, "text", "markitdown")
+
+        mock_extract.side_effect = extract
+        urls = [f"https://example.com/{i}" for i in range(10)]
+
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="shared") as executor:
+            # ACT
+            abandoned = extractor_service.extract_many(urls, max_workers=2, ordered=True, executor=executor)
+            next(abandoned)
+            abandoned.close()
+            results = list(extractor_service.extract_many(urls, max_workers=2, ordered=True, executor=executor))
+
+            # ASSERT
+            assert [result.url for result in results] == urls
+            assert executor.submit(lambda: "still running").result() == "still running"
+        assert threads and all(name.startswith("shared") for name in threads)
+
+    def test_extract_many_invalid_max_workers(self, extractor_service: ExtractorService):
+        """
+        GIVEN a non-positive max_workers
+        WHEN extract_many is called
+        THEN it should raise ValueError immediately.
+        """
+        with pytest.raises(ValueError):
+            extractor_service.extract_many(["https://example.com"], max_workers=0)
+
+    # --- Tests for the race and hedge strategies ---
+
+    @patch("py_web_text_extractor.service.engines.tr_extractor")
+    @patch("py_web_text_extractor.service.engines.mk_extractor")
+    def test_race_returns_first_acceptable_result(
+        self,
+        mock_mk_extractor: MagicMock,
+        mock_tr_extractor: MagicMock,
+        mock_fetcher: MagicMock,
+    ):
+        """
+        GIVEN the race strategy and a MarkItDown run that is still busy
+        WHEN extract_text_from_page is called
+        THEN it should return Trafilatura's result without waiting for MarkItDown.
+        """
+        # ARRANGE
+        release = threading.Event()
+
+        def slow_markitdown(page: FetchedPage, pool: object) -> str:
+            release.wait(timeout=5)
+            return self.MARKITDOWN_SUCCESS_TEXT
+
+        mock_fetcher.fetch_page.return_value = self.FETCHED_PAGE
+        mk_extractor.ENGINE_NAME = "markitdown"
+        mock_mk_extractor.extract_text_from_content.side_effect = slow_markitdown
+        tr_extractor.ENGINE_NAME = "trafilatura"
+        mock_tr_extractor.extract_text_from_content.return_value = self.TRAFILATURA_SUCCESS_TEXT
+        service = ExtractorService(fetcher=mock_fetcher, strategy=ExtractionStrategy.RACE)
+
+        # ACT
+        try:
+            result = service.extract_result_from_page(self.VALID_URL)
+        finally:
+            release.set()
+
+        # ASSERT
+        assert (result.text, result.engine) == (self.TRAFILATURA_SUCCESS_TEXT, "trafilatura")
+
+    @patch("py_web_text_extractor.service.engines.tr_extractor")
+    @patch("py_web_text_extractor.service.engines.mk_extractor")
+    def test_race_skips_blank_and_failed_results(
+        self,
+        mock_mk_extractor: MagicMock,
+        mock_tr_extractor: MagicMock,
+        mock_fetcher: MagicMock,
+    ):
+        """
+        GIVEN the race strategy
+        WHEN MarkItDown fails and Trafilatura returns blank text, or both fail
+        THEN the blank text is returned as a last resort, and a double failure raises.
+        """
+        # ARRANGE
+        mock_fetcher.fetch_page.return_value = self.FETCHED_PAGE
+        mock_mk_extractor.extract_text_from_content.side_effect = MarkItDownExtractionException("MarkItDown failed")
+        mock_tr_extractor.extract_text_from_content.return_value = "   "
+        service = ExtractorService(fetcher=mock_fetcher, strategy=ExtractionStrategy.RACE)
+
+        # ACT / ASSERT
+        assert service.extract_text_from_page(self.VALID_URL) == "   "
+
+        mock_tr_extractor.extract_text_from_content.side_effect = TrafilaturaExtractionException("Trafilatura failed")
+        with pytest.raises(TextExtractionFailure):
+            service.extract_text_from_page(self.VALID_URL)
+
+    @patch("py_web_text_extractor.service.engines.tr_extractor")
+    @patch("py_web_text_extractor.service.engines.mk_extractor")
+    def test_hedge_does_not_start_fallback_for_fast_primary(
+        self,
+        mock_mk_extractor: MagicMock,
+        mock_tr_extractor: MagicMock,
+        mock_fetcher: MagicMock,
+    ):
+        """
+        GIVEN the hedge strategy with a generous delay
+        WHEN MarkItDown succeeds before the delay expires
+        THEN Trafilatura should never be started.
+        """
+        # ARRANGE
+        mock_fetcher.fetch_page.return_value = self.FETCHED_PAGE
+        mock_mk_extractor.extract_text_from_content.return_value = self.MARKITDOWN_SUCCESS_TEXT
+        service = ExtractorService(fetcher=mock_fetcher, strategy=ExtractionStrategy.HEDGE, hedge_delay=5)
+
+        # ACT
+        result = service.extract_text_from_page(self.VALID_URL)
+
+        # ASSERT
+        assert result == self.MARKITDOWN_SUCCESS_TEXT
+        mock_tr_extractor.extract_text_from_content.assert_not_called()
+
+    @patch("py_web_text_extractor.service.engines.tr_extractor")
+    @patch("py_web_text_extractor.service.engines.mk_extractor")
+    def test_hedge_starts_fallback_after_delay(
+        self,
+        mock_mk_extractor: MagicMock,
+        mock_tr_extractor: MagicMock,
+        mock_fetcher: MagicMock,
+    ):
+        """
+        GIVEN the hedge strategy with a short delay
+        WHEN MarkItDown is still running once the delay expires
+        THEN Trafilatura should be started and its result returned.
+        """
+        # ARRANGE
+        release = threading.Event()
+
+        def slow_markitdown(page: FetchedPage, pool: object) -> str:
+            release.wait(timeout=5)
+            return self.MARKITDOWN_SUCCESS_TEXT
+
+        mock_fetcher.fetch_page.return_value = self.FETCHED_PAGE
+        mock_mk_extractor.extract_text_from_content.side_effect = slow_markitdown
+        mock_tr_extractor.extract_text_from_content.return_value = self.TRAFILATURA_SUCCESS_TEXT
+        service = ExtractorService(fetcher=mock_fetcher, strategy=ExtractionStrategy.HEDGE, hedge_delay=0.05)
+
+        # ACT
+        try:
+            result = service.extract_text_from_page(self.VALID_URL)
+        finally:
+            release.set()
+
+        # ASSERT
+        assert result == self.TRAFILATURA_SUCCESS_TEXT
+        mock_tr_extractor.extract_text_from_content.assert_called_once_with(self.FETCHED_PAGE)
+
+    # --- Tests for the engine circuit breaker ---
+
+    @patch("py_web_text_extractor.service.engines.tr_extractor")
+    @patch("py_web_text_extractor.service.engines.mk_extractor")
+    def test_engine_breaker_skips_failing_engine(
+        self,
+        mock_mk_extractor: MagicMock,
+        mock_tr_extractor: MagicMock,
+        mock_fetcher: MagicMock,
+    ):
+        """
+        GIVEN an engine breaker that opens after two failures
+        WHEN MarkItDown fails on every page
+        THEN later pages skip MarkItDown and go straight to Trafilatura.
+        """
+        # ARRANGE
+        mock_fetcher.fetch_page.return_value = self.FETCHED_PAGE
+        mk_extractor.ENGINE_NAME = "markitdown"
+        mock_mk_extractor.extract_text_from_content.side_effect = MarkItDownExtractionException("MarkItDown failed")
+        tr_extractor.ENGINE_NAME = "trafilatura"
+        mock_tr_extractor.extract_text_from_content.return_value = self.TRAFILATURA_SUCCESS_TEXT
+        service = ExtractorService(
+            fetcher=mock_fetcher,
+            engine_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60),
+        )
+
+        # ACT
+        results = [service.extract_text_from_page(self.VALID_URL) for _ in range(4)]
+
+        # ASSERT
+        assert results == [self.TRAFILATURA_SUCCESS_TEXT] * 4
+        assert mock_mk_extractor.extract_text_from_content.call_count == 2
+        assert mock_tr_extractor.extract_text_from_content.call_count == 4
+
+    @patch("py_web_text_extractor.service.engines.mk_extractor")
+    def test_engine_breaker_reopens_after_unexpected_trial_error(
+        self,
+        mock_mk_extractor: MagicMock,
+        mock_fetcher: MagicMock,
+    ):
+        """
+        GIVEN an engine breaker whose MarkItDown circuit has opened
+        WHEN the half-open trial call fails with an unexpected error
+        THEN the error propagates and the circuit opens again instead of staying half-open.
+        """
+        # ARRANGE
+        mock_fetcher.fetch_page.return_value = self.FETCHED_PAGE
+        mock_mk_extractor.extract_text_from_content.side_effect = [
+            MarkItDownExtractionException("MarkItDown failed"),
+            RuntimeError("converter crashed"),
+        ]
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        service = ExtractorService(fetcher=mock_fetcher, engines=["markitdown"], engine_breaker=breaker)
+        service.extract_text_from_page_safe(self.VALID_URL)
+
+        # ACT
+        with pytest.raises(RuntimeError):
+            service.extract_text_from_page(self.VALID_URL)
+
+        # ASSERT
+        assert breaker.state("markitdown") is CircuitState.OPEN
+
+    @patch("py_web_text_extractor.service.engines.tr_extractor")
+    @patch("py_web_text_extractor.service.engines.mk_extractor")
+    def test_hooks_record_stages_fallbacks_and_failures(
+        self,
+        mock_mk_extractor: MagicMock,
+        mock_tr_extractor: MagicMock,
+        mock_fetcher: MagicMock,
+    ):
+        """
+        GIVEN a service with metrics hooks
+        WHEN one page falls back to Trafilatura and one page cannot be downloaded
+        THEN stage timings, the fallback, the fetch failure and byte/character counts are recorded.
+        """
+        # ARRANGE
+        page = FetchedPage(
+            url=self.VALID_URL,
+            final_url=self.VALID_URL,
+            status_code=200,
+            content=self.FETCHED_PAGE.content,
+            timings={"wait": 0.02, "download": 0.001},
+        )
+        mock_fetcher.fetch_page.side_effect = [page, PageFetchException("Connection refused")]
+        mk_extractor.ENGINE_NAME = "markitdown"
+        mock_mk_extractor.extract_text_from_content.side_effect = MarkItDownExtractionException("MarkItDown failed")
+        tr_extractor.ENGINE_NAME = "trafilatura"
+        mock_tr_extractor.extract_text_from_content.return_value = self.TRAFILATURA_SUCCESS_TEXT
+        metrics = ExtractionMetrics()
+        service = ExtractorService(fetcher=mock_fetcher, hooks=metrics)
+
+        # ACT
+        results = [service.extract_text_from_page_safe(self.VALID_URL) for _ in range(2)]
+
+        # ASSERT
+        snapshot = metrics.snapshot()
+        assert results == [self.TRAFILATURA_SUCCESS_TEXT, ""]
+        assert snapshot.stages["extract"].count == 2
+        assert snapshot.stages["fetch"].count == 2
+        assert snapshot.stages["fetch.wait"].total_seconds == pytest.approx(0.02)
+        assert snapshot.stages["parse"].count == 1
+        assert snapshot.stages["parse.markitdown"].count == 1
+        assert snapshot.stages["parse.trafilatura"].count == 1
+        assert snapshot.pages == {"trafilatura": 1}
+        assert snapshot.failures == {"PageFetchException": 1}
+        assert snapshot.engine_failures == {"markitdown": 1}
+        assert snapshot.fallbacks == {("markitdown", "trafilatura"): 1}
+        assert snapshot.bytes_fetched == len(self.FETCHED_PAGE.content)
+        assert snapshot.characters_extracted == len(self.TRAFILATURA_SUCCESS_TEXT)
+
+    @pytest.mark.parametrize("strategy", [ExtractionStrategy.FALLBACK, ExtractionStrategy.RACE])
+    @patch("py_web_text_extractor.service.engines.tr_extractor")
+    @patch("py_web_text_extractor.service.engines.mk_extractor")
+    def test_quality_gate_falls_back_on_boilerplate(
+        self,
+        mock_mk_extractor: MagicMock,
+        mock_tr_extractor: MagicMock,
+        strategy: ExtractionStrategy,
+        mock_fetcher: MagicMock,
+    ):
+        """
+        GIVEN a quality gate and an engine breaker
+        WHEN MarkItDown returns only navigation links
+        THEN the output is rejected, Trafilatura's article is returned, both scores are
+        recorded and MarkItDown's circuit stays closed.
+        """
+        # ARRANGE
+        article = "The council approved the new budget on Monday after a long debate about school funding. " * 3
+        mock_fetcher.fetch_page.return_value = self.FETCHED_PAGE
+        mk_extractor.ENGINE_NAME = "markitdown"
+        mock_mk_extractor.extract_text_from_content.return_value = "\n".join(
+            f"[Section {i}](/section/{i})" for i in range(20)
+        )
+        tr_extractor.ENGINE_NAME = "trafilatura"
+        mock_tr_extractor.extract_text_from_content.return_value = article
+        metrics = ExtractionMetrics()
+        breaker = CircuitBreaker(failure_threshold=1)
+        service = ExtractorService(
+            fetcher=mock_fetcher,
+            strategy=strategy,
+            engine_breaker=breaker,
+            hooks=metrics,
+            quality_gate=QualityGate(),
+        )
+
+        # ACT
+        result = service.extract_text_from_page(self.VALID_URL)
+
+        # ASSERT
+        quality = metrics.snapshot().quality
+        assert result == article
+        assert quality["markitdown"].rejections == 1
+        assert quality["trafilatura"].rejections == 0
+        assert quality["trafilatura"].mean_score > quality["markitdown"].mean_score
+        assert breaker.allow("markitdown") is True
+
+    @patch("py_web_text_extractor.service.engines.tr_extractor")
+    @patch("py_web_text_extractor.service.engines.mk_extractor")
+    def test_quality_gate_fails_when_every_output_is_rejected(
+        self,
+        mock_mk_extractor: MagicMock,
+        mock_tr_extractor: MagicMock,
+        mock_fetcher: MagicMock,
+    ):
+        """
+        GIVEN a quality gate
+        WHEN both engines return only a few words
+        THEN extraction fails instead of returning junk.
+        """
+        mock_fetcher.fetch_page.return_value = self.FETCHED_PAGE
+        mock_mk_extractor.extract_text_from_content.return_value = "Accept cookies"
+        mock_tr_extractor.extract_text_from_content.return_value = "Accept cookies"
+        service = ExtractorService(fetcher=mock_fetcher, quality_gate=QualityGate())
+
+        with pytest.raises(TextExtractionFailure):
+            service.extract_text_from_page(self.VALID_URL)
+
+    @patch("py_web_text_extractor.service.engines.tr_extractor")
+    @patch("py_web_text_extractor.service.engines.mk_extractor")
+    def test_router_tries_the_engine_that_works_on_the_domain_first(
+        self,
+        mock_mk_extractor: MagicMock,
+        mock_tr_extractor: MagicMock,
+        mock_fetcher: MagicMock,
+    ):
+        """
+        GIVEN a router that needs two samples per engine
+        WHEN MarkItDown keeps failing on a domain
+        THEN later pages of that domain go to Trafilatura first and MarkItDown is no longer run.
+        """
+        # ARRANGE
+        mock_fetcher.fetch_page.return_value = self.FETCHED_PAGE
+        mk_extractor.ENGINE_NAME = "markitdown"
+        mock_mk_extractor.extract_text_from_content.side_effect = MarkItDownExtractionException("MarkItDown failed")
+        tr_extractor.ENGINE_NAME = "trafilatura"
+        mock_tr_extractor.extract_text_from_content.return_value = self.TRAFILATURA_SUCCESS_TEXT
+        metrics = ExtractionMetrics()
+        router = EngineRouter(min_samples=2, exploration=0)
+        service = ExtractorService(fetcher=mock_fetcher, router=router, hooks=metrics)
+
+        # ACT
+        results = [service.extract_text_from_page(self.VALID_URL) for _ in range(5)]
+
+        # ASSERT
+        assert results == [self.TRAFILATURA_SUCCESS_TEXT] * 5
+        assert mock_mk_extractor.extract_text_from_content.call_count == 2
+        assert router.stats("example.com")["trafilatura"][0] == 5
+        assert metrics.snapshot().fallbacks == {("markitdown", "trafilatura"): 2}
+
+    @patch("py_web_text_extractor.service.engines.mk_extractor")
+    def test_concurrent_calls_for_one_url_share_an_extraction(
+        self, mock_mk_extractor: MagicMock, mock_fetcher: MagicMock, extractor_service: ExtractorService
+    ):
+        """
+        GIVEN four threads asking for the same page under different spellings of its URL
+        WHEN the first fetch is still in flight as the others arrive
+        THEN the page should be fetched and parsed once and every caller should get its result.
+        """
+        # ARRANGE
+        release = threading.Event()
+
+        def fetch_page(url: str, headers: dict[str, str] | None = None) -> FetchedPage:
+            release.wait(timeout=5)
+            return self.FETCHED_PAGE
+
+        mock_fetcher.fetch_page.side_effect = fetch_page
+        mock_mk_extractor.extract_text_from_content.return_value = self.MARKITDOWN_SUCCESS_TEXT
+        urls = [self.VALID_URL, "https://EXAMPLE.com/", "https://example.com:443#top", self.VALID_URL]
+
+        # ACT
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(extractor_service.extract_result_from_page, url) for url in urls]
+            _wait_for(lambda: extractor_service._flights.coalesced == 3)
+            release.set()
+            results = [future.result() for future in futures]
+
+        # ASSERT
+        assert len({id(result) for result in results}) == 1
+        assert results[0].text == self.MARKITDOWN_SUCCESS_TEXT
+        mock_fetcher.fetch_page.assert_called_once()
+        mock_mk_extractor.extract_text_from_content.assert_called_once()
+
+    def test_concurrent_calls_share_a_failure_and_the_next_call_retries(
+        self, mock_fetcher: MagicMock, extractor_service: ExtractorService
+    ):
+        """
+        GIVEN two threads asking for the same page while its download fails
+        WHEN the failing fetch finishes
+        THEN both callers should get its exception and a later call should fetch again.
+        """
+        # ARRANGE
+        release = threading.Event()
+        error = PageFetchException("Download failed")
+
+        def fetch_page(url: str, headers: dict[str, str] | None = None) -> FetchedPage:
+            release.wait(timeout=5)
+            raise error
+
+        mock_fetcher.fetch_page.side_effect = fetch_page
+
+        # ACT
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(extractor_service.extract_text_from_page, self.VALID_URL) for _ in range(2)]
+            _wait_for(lambda: extractor_service._flights.coalesced == 1)
+            release.set()
+            errors = [future.exception() for future in futures]
+        with pytest.raises(PageFetchException):
+            extractor_service.extract_text_from_page(self.VALID_URL)
+
+        # ASSERT
+        assert errors == [error, error]
+        assert mock_fetcher.fetch_page.call_count == 2
+
+    def test_concurrent_calls_for_a_bad_port_share_one_flight(
+        self, mock_fetcher: MagicMock, extractor_service: ExtractorService
+    ):
+        """
+        GIVEN two threads asking for a URL with a non-numeric port under different spellings
+        WHEN the download fails
+        THEN they should share one fetch and both get its PageFetchException.
+        """
+        # ARRANGE
+        release = threading.Event()
+        error = PageFetchException("Failed to parse")
+
+        def fetch_page(url: str, headers: dict[str, str] | None = None) -> FetchedPage:
+            release.wait(timeout=5)
+            raise error
+
+        mock_fetcher.fetch_page.side_effect = fetch_page
+        urls = ["http://example.com:abc/", "http://EXAMPLE.com:abc/#top"]
+
+        # ACT
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(extractor_service.extract_text_from_page, url) for url in urls]
+            _wait_for(lambda: extractor_service._flights.coalesced == 1)
+            release.set()
+            errors = [future.exception() for future in futures]
+
+        # ASSERT
+        assert errors == [error, error]
+        mock_fetcher.fetch_page.assert_called_once()
+
+    @patch("py_web_text_extractor.service.engines.mk_extractor")
+    def test_coalescing_can_be_disabled(self, mock_mk_extractor: MagicMock, mock_fetcher: MagicMock):
+        """
+        GIVEN a service created with coalesce=False
+        WHEN two threads ask for the same page at once
+        THEN each of them should fetch it.
+        """
+        # ARRANGE
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch_page(url: str, headers: dict[str, str] | None = None) -> FetchedPage:
+            barrier.wait()
+            return self.FETCHED_PAGE
+
+        mock_fetcher.fetch_page.side_effect = fetch_page
+        mock_mk_extractor.extract_text_from_content.return_value = self.MARKITDOWN_SUCCESS_TEXT
+        service = ExtractorService(fetcher=mock_fetcher, coalesce=False)
+
+        # ACT
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(service.extract_text_from_page, [self.VALID_URL] * 2))
+
+        # ASSERT
+        assert results == [self.MARKITDOWN_SUCCESS_TEXT] * 2
+        assert mock_fetcher.fetch_page.call_count == 2
+
+    @patch("py_web_text_extractor.service.engines.tr_extractor")
+    @patch("py_web_text_extractor.service.engines.dn_extractor")
+    @patch("py_web_text_extractor.service.engines.mk_extractor")
+    def test_configured_engine_chain_is_tried_in_order(
+        self,
+        mock_mk_extractor: MagicMock,
+        mock_dn_extractor: MagicMock,
+        mock_tr_extractor: MagicMock,
+        mock_fetcher: MagicMock,
+    ):
+        """
+        GIVEN a service whose engine chain tries the text-density engine before Trafilatura
+        WHEN the density engine finds text on one page and no dense text on another
+        THEN the first page should be served by it and the second by Trafilatura, without running MarkItDown.
+        """
+        # ARRANGE
+        mock_fetcher.fetch_page.return_value = self.FETCHED_PAGE
+        mock_dn_extractor.extract_text_from_content.side_effect = [
+            "Dense text",
+            TextDensityExtractionException("No dense text blocks found"),
+            TextDensityExtractionException("No dense text blocks found"),
+        ]
+        mock_tr_extractor.extract_text_from_content.side_effect = [
+            self.TRAFILATURA_SUCCESS_TEXT,
+            TrafilaturaExtractionException("Trafilatura failed"),
+        ]
+        service = ExtractorService(fetcher=mock_fetcher, engines=["density", "trafilatura"])
+
+        # ACT
+        dense = service.extract_result_from_page(self.VALID_URL)
+        fallback = service.extract_result_from_page("https://example.com/other")
+        with pytest.raises(TextExtractionFailure, match="using density, trafilatura"):
+            service.extract_result_from_page("https://example.com/failing")
+
+        # ASSERT
+        assert service.engine_names == ("density", "trafilatura")
+        assert (dense.text, dense.engine) == ("Dense text", "density")
+        assert (fallback.text, fallback.engine) == (self.TRAFILATURA_SUCCESS_TEXT, "trafilatura")
+        mock_mk_extractor.extract_text_from_content.assert_not_called()
+
+    def test_engine_chain_accepts_engine_instances(self, mock_fetcher: MagicMock):
+        """
+        GIVEN a custom engine instance passed in the engine chain
+        WHEN a page is extracted
+        THEN the custom engine should produce the text under its own name.
+        """
+
+        # ARRANGE
+        class BodyEngine(ExtractionEngine):
+            name = "body"
+
+            def extract(self, page: FetchedPage) -> str:
+                return page.body_bytes().decode()
+
+        mock_fetcher.fetch_page.return_value = self.FETCHED_PAGE
+        service = ExtractorService(fetcher=mock_fetcher, engines=[BodyEngine(), "trafilatura"])
+
+        # ACT
+        result = service.extract_result_from_page(self.VALID_URL)
+
+        # ASSERT
+        assert (result.text, result.engine) == (self.FETCHED_PAGE.content.decode(), "body")
+
+    @pytest.mark.parametrize("engines", [[], ["trafilatura", "trafilatura"], ["unknown"]])
+    def test_engine_chain_configuration_errors(self, mock_fetcher: MagicMock, engines: list[str]):
+        """
+        GIVEN an empty engine chain, a chain repeating an engine or naming an unknown one
+        WHEN the service is created
+        THEN it should raise ValueError.
+        """
+        with pytest.raises(ValueError):
+            ExtractorService(fetcher=mock_fetcher, engines=engines)
+
+    def test_strategy_configuration_errors(self, mock_fetcher: MagicMock):
+        """
+        GIVEN an invalid strategy configuration
+        WHEN the service is created
+        THEN it should raise ValueError.
+        """
+        with pytest.raises(ValueError):
+            ExtractorService(fetcher=mock_fetcher, strategy=ExtractionStrategy.HEDGE, hedge_delay=-1)
+        with pytest.raises(ValueError):
+            ExtractorService(
+                fetcher=mock_fetcher,
+                process_parser=MagicMock(spec=ProcessPoolParser),
+                strategy=ExtractionStrategy.RACE,
+            )
+        with pytest.raises(ValueError):
+            ExtractorService(
+                fetcher=mock_fetcher,
+                process_parser=MagicMock(spec=ProcessPoolParser),
+                engine_breaker=CircuitBreaker(),
+            )
+        with pytest.raises(ValueError):
+            ExtractorService(
+                fetcher=mock_fetcher,
+                process_parser=MagicMock(spec=ProcessPoolParser),
+                quality_gate=QualityGate(),
+            )
+        with pytest.raises(ValueError):
+            ExtractorService(
+                fetcher=mock_fetcher,
+                process_parser=MagicMock(spec=ProcessPoolParser),
+                router=EngineRouter(),
+            )
+        with pytest.raises(ValueError):
+            ExtractorService(
+                fetcher=mock_fetcher,
+                process_parser=MagicMock(spec=ProcessPoolParser),
+                engines=["trafilatura"],
+            )
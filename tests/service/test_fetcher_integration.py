@@ -0,0 +1,141 @@
+"""
+Integration tests for the page fetcher.
+
+This module contains integration tests for the shared fetch layer. It uses a
+live test server to verify that pages are downloaded with their headers, that
+the pooled HttpFetcher enforces its limits, and that failed or empty responses
+are reported as PageFetchException.
+"""
+
+import asyncio
+import importlib.util
+
+import pytest
+
+from py_web_text_extractor.exception.exceptions import (
+    PageFetchException,
+    ResponseTooLargeException,
+    UnsupportedContentTypeException,
+)
+from py_web_text_extractor.service import async_fetcher, fetcher
+from py_web_text_extractor.service.response_limits import ResponseLimits
+
+
+def test_fetch_page_simple_page(test_server):
+    """
+    Test that a page body, status and headers are kept in memory.
+    """
+    url = f"{test_server.base_url}/simple"
+    page = fetcher.fetch_page(url)
+    assert page.url == url
+    assert page.final_url == url
+    assert page.status_code == 200
+    assert page.content_type == "text/html"
+    assert b"This is a simple page." in page.content
+
+
+def test_fetch_page_plain_text(test_server):
+    """
+    Test that the content type of non-HTML responses is preserved.
+    """
+    page = fetcher.fetch_page(f"{test_server.base_url}/no_html")
+    assert page.content_type == "text/plain"
+
+
+@pytest.mark.parametrize("path", ["/empty", "/error", "/not_found"])
+def test_fetch_page_failures(test_server, path):
+    """
+    Test that empty and error responses raise PageFetchException.
+    """
+    with pytest.raises(PageFetchException):
+        fetcher.fetch_page(f"{test_server.base_url}{path}")
+
+
+def test_fetch_page_invalid_url():
+    """
+    Test that fetching a completely invalid URL raises PageFetchException.
+    """
+    with pytest.raises(PageFetchException):
+        fetcher.fetch_page("invalid-url")
+
+
+def test_http_fetcher_advertises_compression(test_server):
+    """
+    Test that the pooled session asks servers for compressed responses.
+    """
+    with fetcher.HttpFetcher() as http_fetcher:
+        page = http_fetcher.fetch_page(f"{test_server.base_url}/simple")
+        assert "gzip" in http_fetcher._session.headers["Accept-Encoding"]
+    assert b"This is a simple page." in page.content
+
+
+def test_http_fetcher_aborts_oversized_response(test_server):
+    """
+    Test that a body larger than max_response_bytes raises PageFetchException.
+    """
+    with fetcher.HttpFetcher(max_response_bytes=16) as http_fetcher, pytest.raises(PageFetchException):
+        http_fetcher.fetch_page(f"{test_server.base_url}/complex")
+
+
+def test_http_fetcher_refuses_declared_oversize_before_reading(test_server):
+    """
+    Test that a Content-Length over the limit is refused from the headers, reporting the limit and declared size.
+    """
+    with fetcher.HttpFetcher(max_response_bytes=1024) as http_fetcher:
+        with pytest.raises(ResponseTooLargeException) as error:
+            http_fetcher.fetch_page(f"{test_server.base_url}/huge")
+        assert http_fetcher.limits.max_bytes == 1024
+    assert (error.value.limit, error.value.size) == (1024, 10**9)
+
+
+@pytest.mark.parametrize(("path", "content_type"), [("/image", "image/png"), ("/mislabelled", "application/pdf")])
+def test_http_fetcher_refuses_binary_responses(test_server, path, content_type):
+    """
+    Test that binary bodies are refused by their Content-Type or, when mislabelled as HTML, by their first bytes.
+    """
+    with fetcher.HttpFetcher() as http_fetcher, pytest.raises(UnsupportedContentTypeException) as error:
+        http_fetcher.fetch_page(f"{test_server.base_url}{path}")
+    assert error.value.content_type == content_type
+
+
+def test_http_fetcher_accepts_any_type_when_configured(test_server):
+    """
+    Test that accepted_content_types=None lets binary documents through.
+    """
+    with fetcher.HttpFetcher(limits=ResponseLimits(accepted_content_types=None)) as http_fetcher:
+        page = http_fetcher.fetch_page(f"{test_server.base_url}/mislabelled")
+    assert page.content.startswith(b"%PDF-")
+
+
+@pytest.mark.skipif(importlib.util.find_spec("httpx") is None, reason="httpx is not installed")
+def test_async_fetch_page_applies_limits(test_server):
+    """
+    Test that the async fetcher streams pages under the same limits.
+    """
+
+    async def fetch(path, limits=None):
+        async with async_fetcher.create_client(timeout=10, max_connections=2) as client:
+            return await async_fetcher.fetch_page(f"{test_server.base_url}{path}", client, limits)
+
+    assert b"This is a simple page." in asyncio.run(fetch("/simple")).content
+    with pytest.raises(UnsupportedContentTypeException):
+        asyncio.run(fetch("/mislabelled"))
+    with pytest.raises(ResponseTooLargeException):
+        asyncio.run(fetch("/complex", ResponseLimits(max_bytes=16)))
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_connections_per_host": 0},
+        {"max_pooled_hosts": 0},
+        {"max_response_bytes": 0},
+        {"max_response_bytes": 1024, "limits": ResponseLimits()},
+    ],
+)
+def test_http_fetcher_invalid_limits(kwargs):
+    """
+    Test that non-positive limits are rejected.
+    """
+    with pytest.raises(ValueError):
+        fetcher.HttpFetcher(**kwargs)
@@ -0,0 +1,86 @@
+"""
+Integration tests for local page sources.
+
+This module verifies that HTML held in memory or stored on disk runs through
+the real extraction engines without a network fetch, and that large files are
+memory-mapped instead of being read into memory.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from py_web_text_extractor.exception.exceptions import PageFetchException
+from py_web_text_extractor.service.extractor_service import ExtractorService
+from py_web_text_extractor.service.local_page import open_local_page, page_from_html
+
+RESOURCES_DIR = Path(__file__).resolve().parents[1] / "resources"
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        "<html><body><h1>Title</h1><p>Body text</p></body></html>",
+        b"<html><body><h1>Title</h1><p>Body text</p></body></html>",
+        memoryview(b"<html><body><h1>Title</h1><p>Body text</p></body></html>"),
+    ],
+)
+def test_extract_text_from_html(html):
+    """
+    Test that text, bytes and memoryview documents are extracted in memory.
+    """
+    text = ExtractorService().extract_text_from_html(html, base_url="https://example.com/post")
+    assert "Title" in text
+    assert "Body text" in text
+
+
+def test_page_from_html_defaults():
+    """
+    Test that in-memory pages report HTML and a placeholder URL.
+    """
+    page = page_from_html("<p>Hello</p>")
+    assert page.url == "about:blank"
+    assert page.content_type == "text/html"
+    assert page.charset == "utf-8"
+
+
+def test_extract_text_from_path():
+    """
+    Test that a page saved on disk is extracted without a server.
+    """
+    text = ExtractorService().extract_text_from_path(RESOURCES_DIR / "simple.html")
+    assert "This is a simple page." in text
+
+
+def test_open_local_page_memory_maps_large_files():
+    """
+    Test that files above the threshold are exposed as a memoryview over a mapping.
+    """
+    with open_local_page(RESOURCES_DIR / "complex.html", mmap_threshold=1) as page:
+        assert isinstance(page.content, memoryview)
+        assert page.content_type == "text/html"
+        assert page.url.startswith("file://")
+        stream = page.open_stream()
+        assert stream.read(1) == page.body_bytes()[:1]
+
+
+def test_open_local_page_reads_small_files():
+    """
+    Test that files below the threshold are read into bytes.
+    """
+    with open_local_page(RESOURCES_DIR / "no_html.txt") as page:
+        assert isinstance(page.content, bytes)
+        assert page.content_type == "text/plain"
+
+
+def test_open_local_page_failures(tmp_path: Path):
+    """
+    Test that missing and empty files raise PageFetchException.
+    """
+    empty = tmp_path / "empty.html"
+    empty.touch()
+
+    with pytest.raises(PageFetchException), open_local_page(tmp_path / "missing.html"):
+        pass
+    with pytest.raises(PageFetchException), open_local_page(empty):
+        pass
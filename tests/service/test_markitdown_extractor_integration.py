@@ -7,10 +7,12 @@ and verifies that the extractor behaves as expected under various conditions,
 including successful extraction, handling of non-HTML content, and server errors.
 """
 
+import threading
+
 import pytest
 
 from py_web_text_extractor.exception.exceptions import MarkItDownExtractionException
-from py_web_text_extractor.service import markitdown_extractor
+from py_web_text_extractor.service import fetcher, markitdown_extractor
 
 
 def test_extract_text_simple_page(test_server):
@@ -84,3 +86,88 @@ def test_extract_text_invalid_url():
     """
     with pytest.raises(MarkItDownExtractionException):
         markitdown_extractor.extract_text("invalid-url")
+
+
+def test_extract_text_from_content_reuses_pooled_converter(test_server):
+    """
+    Test that repeated extractions through one pool reuse the same converter.
+    """
+    pool = markitdown_extractor.MarkItDownPool(size=2)
+    page = fetcher.fetch_page(f"{test_server.base_url}/simple")
+
+    for _ in range(3):
+        assert "This is a simple page." in markitdown_extractor.extract_text_from_content(page, pool=pool)
+
+    with pool.acquire() as first, pool.acquire() as second:
+        assert first is not second
+    with pool.acquire() as reused:
+        assert reused in (first, second)
+
+
+def test_pool_blocks_when_all_converters_are_in_use():
+    """
+    Test that the pool never creates more converters than its size.
+    """
+    pool = markitdown_extractor.MarkItDownPool(size=1)
+    borrowed = []
+
+    def borrow():
+        with pool.acquire() as md:
+            borrowed.append(md)
+
+    with pool.acquire() as md:
+        thread = threading.Thread(target=borrow)
+        thread.start()
+        thread.join(timeout=0.2)
+        assert borrowed == []
+
+    thread.join(timeout=5)
+    assert borrowed == [md]
+
+
+def test_failed_creation_wakes_a_waiting_thread(monkeypatch):
+    """
+    Test that a thread waiting for a full pool creates the converter itself when the pending creation fails.
+    """
+    pool = markitdown_extractor.MarkItDownPool(size=1)
+    creating = threading.Event()
+    fail = threading.Event()
+    converter = object()
+    results = []
+
+    def create():
+        if not creating.is_set():
+            creating.set()
+            fail.wait(timeout=5)
+            raise RuntimeError("converter setup failed")
+        return converter
+
+    def borrow():
+        try:
+            with pool.acquire() as md:
+                results.append(md)
+        except RuntimeError as e:
+            results.append(e)
+
+    monkeypatch.setattr("markitdown.MarkItDown", create)
+    first = threading.Thread(target=borrow)
+    first.start()
+    creating.wait(timeout=5)
+    second = threading.Thread(target=borrow)
+    second.start()
+    second.join(timeout=0.1)
+    fail.set()
+    first.join(timeout=5)
+    second.join(timeout=5)
+
+    assert not second.is_alive()
+    assert converter in results
+    assert any(isinstance(result, RuntimeError) for result in results)
+
+
+def test_pool_invalid_size():
+    """
+    Test that a pool must hold at least one converter.
+    """
+    with pytest.raises(ValueError):
+        markitdown_extractor.MarkItDownPool(size=0)
@@ -0,0 +1,196 @@
+"""
+Unit tests for the per-host politeness layer.
+
+This module wraps a mocked fetcher in PoliteFetcher to verify request spacing,
+per-host connection caps, robots.txt Crawl-delay and Retry-After handling, and
+checks that interleave_by_host spreads URLs across hosts. Concurrency tests
+hold requests back with events instead of sleeping.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from py_web_text_extractor.abstract.fetcher import Fetcher
+from py_web_text_extractor.exception.exceptions import PageFetchException, PageStatusException
+from py_web_text_extractor.model.fetched_page import FetchedPage
+from py_web_text_extractor.service.politeness import PoliteFetcher, interleave_by_host, parse_retry_after
+
+
+def _page(url: str, content: bytes = b"<html><body><p>Hello</p></body></html>") -> FetchedPage:
+    return FetchedPage(url=url, final_url=url, status_code=200, content=content)
+
+
+@pytest.fixture
+def mock_fetcher():
+    """Provides a mocked fetcher that answers every URL and has no robots.txt."""
+    fetcher = MagicMock(spec=Fetcher)
+
+    def fetch_page(url, headers=None):
+        if url.endswith("/robots.txt"):
+            raise PageStatusException("not found", 404)
+        return _page(url)
+
+    fetcher.fetch_page.side_effect = fetch_page
+    return fetcher
+
+
+def test_requests_to_one_host_are_spaced(mock_fetcher: MagicMock):
+    """
+    Test that requests to the same host start at least one interval apart.
+    """
+    fetcher = PoliteFetcher(mock_fetcher, requests_per_second=20, obey_crawl_delay=False)
+
+    started = time.monotonic()
+    for index in range(3):
+        fetcher.fetch_page(f"https://a.com/{index}")
+
+    assert time.monotonic() - started >= 0.1
+
+
+def test_hosts_are_scheduled_independently(mock_fetcher: MagicMock):
+    """
+    Test that a slow schedule for one host does not delay another host.
+    """
+    fetcher = PoliteFetcher(mock_fetcher, requests_per_second=0.5, obey_crawl_delay=False)
+    fetcher.fetch_page("https://a.com/1")
+
+    started = time.monotonic()
+    fetcher.fetch_page("https://b.com/1")
+
+    assert time.monotonic() - started < 1
+
+
+def test_connections_per_host_are_capped():
+    """
+    Test that no more than max_connections_per_host requests to one host are in flight.
+    """
+    release = threading.Event()
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fetch_page(url, headers=None):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        release.wait(timeout=5)
+        with lock:
+            in_flight -= 1
+        return _page(url)
+
+    inner = MagicMock(spec=Fetcher)
+    inner.fetch_page.side_effect = fetch_page
+    fetcher = PoliteFetcher(inner, requests_per_second=1000, max_connections_per_host=2, obey_crawl_delay=False)
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        futures = [executor.submit(fetcher.fetch_page, f"https://a.com/{index}") for index in range(6)]
+        time.sleep(0.1)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(results) == 6
+    assert peak == 2
+
+
+def test_robots_crawl_delay_is_loaded_once_per_host():
+    """
+    Test that robots.txt is fetched once per host and its Crawl-delay spaces requests.
+    """
+    inner = MagicMock(spec=Fetcher)
+    inner.fetch_page.side_effect = lambda url, headers=None: (
+        _page(url, b"User-agent: *\nCrawl-delay: 1\n") if url.endswith("/robots.txt") else _page(url)
+    )
+    fetcher = PoliteFetcher(inner, requests_per_second=1000)
+
+    started = time.monotonic()
+    fetcher.fetch_page("https://a.com/1")
+    fetcher.fetch_page("https://a.com/2")
+
+    assert time.monotonic() - started >= 1
+    robots_calls = [call for call in inner.fetch_page.call_args_list if call.args[0].endswith("/robots.txt")]
+    assert len(robots_calls) == 1
+
+
+def test_retry_after_defers_host_and_retries_once():
+    """
+    Test that a 429 with Retry-After is waited out and the URL is fetched again.
+    """
+    inner = MagicMock(spec=Fetcher)
+    inner.fetch_page.side_effect = [
+        PageStatusException("throttled", 429, {"Retry-After": "0"}),
+        _page("https://a.com/1"),
+    ]
+    fetcher = PoliteFetcher(inner, requests_per_second=1000, obey_crawl_delay=False)
+
+    page = fetcher.fetch_page("https://a.com/1")
+
+    assert page.url == "https://a.com/1"
+    assert inner.fetch_page.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        PageStatusException("throttled", 429, {"Retry-After": "3600"}),
+        PageStatusException("server error", 500, {"Retry-After": "0"}),
+        PageFetchException("connection refused"),
+    ],
+)
+def test_failures_without_usable_retry_after_are_raised(error: PageFetchException):
+    """
+    Test that errors are raised without a retry unless they carry a usable Retry-After.
+    """
+    inner = MagicMock(spec=Fetcher)
+    inner.fetch_page.side_effect = error
+    fetcher = PoliteFetcher(inner, requests_per_second=1000, obey_crawl_delay=False, max_retry_after=60)
+
+    with pytest.raises(PageFetchException):
+        fetcher.fetch_page("https://a.com/1")
+    assert inner.fetch_page.call_count == 1
+
+
+def test_parse_retry_after():
+    """
+    Test that Retry-After accepts seconds and HTTP dates and rejects garbage.
+    """
+    future = format_datetime(datetime.now(UTC) + timedelta(seconds=30), usegmt=True)
+
+    assert parse_retry_after("120") == 120.0
+    assert 0 < parse_retry_after(future) <= 30
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+def test_interleave_by_host():
+    """
+    Test that URLs are handed out round-robin across hosts, each exactly once.
+    """
+    urls = ["https://a.com/1", "https://a.com/2", "https://a.com/3", "https://b.com/1", "https://c.com/1"]
+
+    assert list(interleave_by_host(urls, window=10)) == [
+        "https://a.com/1",
+        "https://b.com/1",
+        "https://c.com/1",
+        "https://a.com/2",
+        "https://a.com/3",
+    ]
+    assert sorted(interleave_by_host(urls, window=2)) == sorted(urls)
+
+
+def test_invalid_limits():
+    """
+    Test that non-positive limits are rejected.
+    """
+    with pytest.raises(ValueError):
+        PoliteFetcher(MagicMock(spec=Fetcher), requests_per_second=0)
+    with pytest.raises(ValueError):
+        PoliteFetcher(MagicMock(spec=Fetcher), max_connections_per_host=0)
+    with pytest.raises(ValueError):
+        interleave_by_host([], window=0)
@@ -0,0 +1,94 @@
+"""
+Tests for the process-pool parsing mode.
+
+This module runs the extraction engines in real worker processes to verify that
+downloaded pages survive the trip over IPC and that ExtractorService routes
+parsing to the pool.
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from py_web_text_extractor.abstract.fetcher import Fetcher
+from py_web_text_extractor.model.fetched_page import FetchedPage
+from py_web_text_extractor.service.extractor_service import ExtractorService
+from py_web_text_extractor.service.process_parser import ProcessPoolParser
+
+RESOURCES_DIR = Path(__file__).parent.parent / "resources"
+URL = "http://localhost/simple"
+
+
+@pytest.fixture(scope="module")
+def process_parser():
+    """Provides a small worker pool shared by the tests in this module."""
+    with ProcessPoolParser(max_workers=2) as parser:
+        yield parser
+
+
+def _page(content: bytes, content_type: str = "text/html; charset=utf-8") -> FetchedPage:
+    return FetchedPage(url=URL, final_url=URL, status_code=200, content=content, headers={"Content-Type": content_type})
+
+
+def test_parse_in_worker_process(process_parser: ProcessPoolParser):
+    """
+    Test that a page parsed in a worker yields the same text and engine as in-process parsing.
+    """
+    page = _page((RESOURCES_DIR / "simple.html").read_bytes())
+
+    text, engine = process_parser.parse(page)
+
+    assert "This is a simple page." in text
+    assert (text, engine) == ExtractorService().parse_page(page)
+
+
+def test_service_routes_parsing_to_process_pool(process_parser: ProcessPoolParser):
+    """
+    Test that ExtractorService parses fetched pages through the configured process pool.
+    """
+    fetcher = MagicMock(spec=Fetcher)
+    fetcher.fetch_page.return_value = _page((RESOURCES_DIR / "simple.html").read_bytes())
+    service = ExtractorService(fetcher=fetcher, process_parser=process_parser)
+
+    results = list(service.extract_many([URL, URL], max_workers=2))
+
+    assert all(result.ok for result in results)
+    assert all("This is a simple page." in result.text for result in results)
+
+
+def test_parse_page_runs_in_the_process_pool(process_parser: ProcessPoolParser):
+    """
+    Test that parse_page and parse_page_result of a service with a process parser parse in the pool.
+    """
+    page = _page((RESOURCES_DIR / "simple.html").read_bytes())
+    service = ExtractorService(process_parser=process_parser)
+
+    text, engine = service.parse_page(page)
+    result = service.parse_page_result(page)
+
+    assert (text, engine) == ExtractorService().parse_page(page)
+    assert (result.text, result.engine) == (text, engine)
+
+
+def test_workers_run_the_configured_engine_chain():
+    """
+    Test that worker processes build the engine chain the parser was created with.
+    """
+    page = _page((RESOURCES_DIR / "simple.html").read_bytes())
+
+    with ProcessPoolParser(max_workers=1, engines=["density", "trafilatura"]) as parser:
+        service = ExtractorService(process_parser=parser)
+        text, engine = parser.parse(page)
+
+    assert parser.engines == service.engine_names == ("density", "trafilatura")
+    assert (text, engine) == ("This is a simple page.", "density")
+
+
+@pytest.mark.parametrize("engines", [[], ["density", "density"], ["unknown"]])
+def test_invalid_engine_chain_is_rejected(engines: list[str]):
+    """
+    Test that an empty, repeating or unknown engine chain is rejected before any worker starts.
+    """
+    with pytest.raises(ValueError):
+        ProcessPoolParser(max_workers=1, engines=engines)
@@ -0,0 +1,92 @@
+"""
+Unit tests for extraction quality scoring.
+
+This module scores typical engine outputs (an article, a navigation menu, a
+data table, an empty result) and checks which of them the quality gate
+accepts.
+"""
+
+import pytest
+
+from py_web_text_extractor.service.quality import QualityGate, score_text
+
+ARTICLE = "\n\n".join(
+    [
+        "# Quarterly results",
+        "Revenue grew by twelve percent in the third quarter as demand for the new product line remained strong.",
+        "The company said that operating costs fell for the second year in a row, helped by lower energy prices.",
+        "Analysts had expected slower growth, and the shares rose by four percent in early trading on Tuesday.",
+    ]
+)
+NAVIGATION = "\n".join(f"* [{label}](/{label.lower()})" for label in ("Home", "News", "Sport", "Weather", "Login") * 8)
+TABLE = "\n".join(
+    ["| Quarter | Revenue | Margin |", "| --- | --- | --- |"] + [f"| Q{i} | {i}00.5 | 1{i}.2 |" for i in range(1, 9)]
+)
+
+
+def test_article_scores_high():
+    """
+    Test that prose without links gets a high score.
+    """
+    score = score_text(ARTICLE, document_bytes=4_000)
+
+    assert score.text_density > 0.9
+    assert score.link_density == 0.0
+    assert score.score > 0.8
+    assert QualityGate().rejection_reason(score) is None
+
+
+def test_navigation_is_rejected():
+    """
+    Test that a menu of links is measured as link-heavy, low-density text and rejected.
+    """
+    score = score_text(NAVIGATION, document_bytes=50_000)
+
+    assert score.link_density > 0.6
+    assert score.text_density == 0.0
+    assert "links" in QualityGate().rejection_reason(score)
+
+
+def test_tables_count_as_dense_text():
+    """
+    Test that Markdown table rows count as content even though they have few words.
+    """
+    score = score_text(TABLE, document_bytes=2_000)
+
+    assert score.text_density == 1.0
+    assert QualityGate().rejection_reason(score) is None
+
+
+@pytest.mark.parametrize("text", ["", "   \n\n", "![logo](/logo.png)"])
+def test_empty_output_scores_zero(text: str):
+    """
+    Test that blank output, or output that is only an image, scores zero and is rejected.
+    """
+    score = score_text(text, document_bytes=1_000)
+
+    assert score.characters == 0
+    assert score.score == 0.0
+    assert QualityGate().rejection_reason(score) is not None
+
+
+def test_gate_thresholds():
+    """
+    Test that each gate threshold can reject otherwise acceptable output.
+    """
+    score = score_text(ARTICLE, document_bytes=4_000)
+
+    assert "characters" in QualityGate(min_characters=10_000).rejection_reason(score)
+    assert "score" in QualityGate(min_score=1.0).rejection_reason(score)
+    assert QualityGate(min_score=0, min_characters=0, max_link_density=1).rejection_reason(score) is None
+
+
+def test_invalid_gate_configuration():
+    """
+    Test that out-of-range thresholds are rejected.
+    """
+    with pytest.raises(ValueError):
+        QualityGate(min_score=1.5)
+    with pytest.raises(ValueError):
+        QualityGate(min_characters=-1)
+    with pytest.raises(ValueError):
+        QualityGate(max_link_density=-0.1)
@@ -0,0 +1,161 @@
+"""
+Unit tests for retries and circuit breakers.
+
+This module wraps a mocked fetcher in RetryingFetcher to verify which failures
+are retried and how host circuits open and recover, and checks the circuit
+breaker state machine directly. Backoffs and reset timeouts are set to zero or
+a few milliseconds so the tests do not sleep.
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from py_web_text_extractor.abstract.fetcher import Fetcher
+from py_web_text_extractor.exception.exceptions import (
+    CircuitOpenException,
+    PageConnectionException,
+    PageFetchException,
+    PageStatusException,
+)
+from py_web_text_extractor.model.fetched_page import FetchedPage
+from py_web_text_extractor.service.resilience import CircuitBreaker, CircuitState, RetryingFetcher, is_retryable
+
+URL = "https://example.com/page"
+PAGE = FetchedPage(url=URL, final_url=URL, status_code=200, content=b"<p>Hello</p>")
+
+
+@pytest.mark.parametrize(
+    ("error", "retryable"),
+    [
+        (PageConnectionException("timed out"), True),
+        (PageStatusException("bad gateway", 502), True),
+        (PageStatusException("throttled", 429), True),
+        (PageStatusException("not found", 404), False),
+        (PageFetchException("response too large"), False),
+    ],
+)
+def test_is_retryable(error: PageFetchException, retryable: bool):
+    """
+    Test that only transient failures are classified as retryable.
+    """
+    assert is_retryable(error) is retryable
+
+
+def test_transient_failures_are_retried():
+    """
+    Test that a timeout followed by a 503 is retried until the page is downloaded.
+    """
+    inner = MagicMock(spec=Fetcher)
+    inner.fetch_page.side_effect = [PageConnectionException("timed out"), PageStatusException("down", 503), PAGE]
+    fetcher = RetryingFetcher(inner, max_retries=3, backoff_base=0)
+
+    assert fetcher.fetch_page(URL) is PAGE
+    assert inner.fetch_page.call_count == 3
+
+
+def test_retries_are_bounded_and_permanent_failures_are_not_retried():
+    """
+    Test that retries stop after max_retries and that a 404 is raised at once.
+    """
+    inner = MagicMock(spec=Fetcher)
+    inner.fetch_page.side_effect = PageStatusException("server error", 500)
+    fetcher = RetryingFetcher(inner, max_retries=2, backoff_base=0)
+
+    with pytest.raises(PageStatusException):
+        fetcher.fetch_page(URL)
+    assert inner.fetch_page.call_count == 3
+
+    inner.reset_mock()
+    inner.fetch_page.side_effect = PageStatusException("not found", 404)
+    with pytest.raises(PageStatusException):
+        fetcher.fetch_page(URL)
+    assert inner.fetch_page.call_count == 1
+
+
+def test_headers_are_passed_through():
+    """
+    Test that conditional request headers reach the wrapped fetcher.
+    """
+    inner = MagicMock(spec=Fetcher)
+    inner.fetch_page.return_value = PAGE
+
+    RetryingFetcher(inner).fetch_page(URL, headers={"If-None-Match": '"v1"'})
+
+    inner.fetch_page.assert_called_once_with(URL, headers={"If-None-Match": '"v1"'})
+
+
+def test_host_circuit_opens_and_recovers():
+    """
+    Test that a failing host fails fast once its circuit opens and recovers after a successful trial.
+    """
+    inner = MagicMock(spec=Fetcher)
+    inner.fetch_page.side_effect = PageConnectionException("connection refused")
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    fetcher = RetryingFetcher(inner, max_retries=0, circuit_breaker=breaker)
+
+    for _ in range(2):
+        with pytest.raises(PageConnectionException):
+            fetcher.fetch_page(URL)
+    with pytest.raises(CircuitOpenException):
+        fetcher.fetch_page(URL)
+    assert inner.fetch_page.call_count == 2
+    assert breaker.state("example.com") is CircuitState.OPEN
+
+    time.sleep(0.06)
+    inner.fetch_page.side_effect = None
+    inner.fetch_page.return_value = PAGE
+
+    assert fetcher.fetch_page(URL) is PAGE
+    assert breaker.state("example.com") is CircuitState.CLOSED
+
+
+def test_half_open_circuit_allows_a_single_trial():
+    """
+    Test that an open circuit lets exactly one trial through and reopens when it fails.
+    """
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure("engine")
+
+    assert breaker.allow("engine") is True
+    assert breaker.state("engine") is CircuitState.HALF_OPEN
+    assert breaker.allow("engine") is False
+
+    breaker.record_failure("engine")
+    assert breaker.state("engine") is CircuitState.OPEN
+
+
+def test_half_open_trial_settles_on_an_unexpected_error():
+    """
+    Test that a half-open trial that raises an unexpected error reopens the host circuit instead of leaving it stuck.
+    """
+    inner = MagicMock(spec=Fetcher)
+    inner.fetch_page.side_effect = RuntimeError("fetcher bug")
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure("example.com")
+    fetcher = RetryingFetcher(inner, max_retries=0, circuit_breaker=breaker)
+    time.sleep(0.06)
+
+    with pytest.raises(RuntimeError):
+        fetcher.fetch_page(URL)
+    assert breaker.state("example.com") is CircuitState.OPEN
+
+    time.sleep(0.06)
+    inner.fetch_page.side_effect = None
+    inner.fetch_page.return_value = PAGE
+
+    assert fetcher.fetch_page(URL) is PAGE
+    assert breaker.state("example.com") is CircuitState.CLOSED
+
+
+def test_invalid_configuration():
+    """
+    Test that invalid retry and breaker settings are rejected.
+    """
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_threshold=0)
+    with pytest.raises(ValueError):
+        CircuitBreaker(reset_timeout=-1)
+    with pytest.raises(ValueError):
+        RetryingFetcher(MagicMock(spec=Fetcher), max_retries=-1)
@@ -0,0 +1,96 @@
+"""
+Unit tests for response size and content-type limits.
+
+This module checks binary format sniffing, content-type matching and the
+header, prefix and size checks the fetchers apply while streaming a body.
+"""
+
+import pytest
+
+from py_web_text_extractor.exception.exceptions import ResponseTooLargeException, UnsupportedContentTypeException
+from py_web_text_extractor.service.response_limits import ResponseLimits, sniff_binary_type
+
+URL = "https://example.com/page"
+
+
+@pytest.mark.parametrize(
+    ("prefix", "expected"),
+    [
+        (b"<!DOCTYPE html><html>", None),
+        ("<p>Привіт</p>".encode(), None),
+        ("<p>hi</p>".encode("utf-16"), None),
+        (b"%PDF-1.4\n", "application/pdf"),
+        (b"PK\x03\x04rest", "application/zip"),
+        (b"\x89PNG\r\n\x1a\n", "image/png"),
+        (b"\x00\x00\x00\x18ftypmp42", "video/mp4"),
+        (b"data\x00\x01\x02", "application/octet-stream"),
+    ],
+)
+def test_sniff_binary_type(prefix: bytes, expected: str | None):
+    """
+    Test that binary formats are recognised from their first bytes and text, in any encoding, is not.
+    """
+    assert sniff_binary_type(prefix) == expected
+
+
+@pytest.mark.parametrize(
+    ("content_type", "accepted"),
+    [
+        ("text/html; charset=utf-8", True),
+        ("TEXT/PLAIN", True),
+        ("application/xhtml+xml", True),
+        ("application/rss+xml", True),
+        (None, True),
+        ("application/pdf", False),
+        ("image/png", False),
+        ("application/octet-stream", False),
+    ],
+)
+def test_default_accepted_content_types(content_type: str | None, accepted: bool):
+    """
+    Test that the default limits accept text and markup types only.
+    """
+    assert ResponseLimits().accepts_content_type(content_type) is accepted
+
+
+def test_checks_raise_with_the_observed_values():
+    """
+    Test that refusals carry the limit, the offending size and the refused type.
+    """
+    limits = ResponseLimits(max_bytes=100)
+
+    limits.check_headers(URL, {"content-type": "text/html", "content-length": "100"})
+    limits.check_headers(URL, {"content-length": "not a number"})
+    limits.check_size(URL, 100)
+    with pytest.raises(ResponseTooLargeException) as error:
+        limits.check_headers(URL, {"content-length": "101"})
+    assert (error.value.limit, error.value.size) == (100, 101)
+    with pytest.raises(ResponseTooLargeException):
+        limits.check_size(URL, 101)
+    with pytest.raises(UnsupportedContentTypeException) as type_error:
+        limits.check_headers(URL, {"content-type": "video/mp4"})
+    assert type_error.value.content_type == "video/mp4"
+
+
+def test_sniffing_respects_accepted_types():
+    """
+    Test that accepted_content_types=None lets any body through and a type list only the listed binary formats.
+    """
+    limits = ResponseLimits(accepted_content_types=None)
+
+    limits.check_headers(URL, {"content-type": "application/pdf"})
+    limits.check_prefix(URL, b"%PDF-1.7")
+    pdf_only = ResponseLimits(accepted_content_types=["application/pdf"])
+    pdf_only.check_prefix(URL, b"%PDF-1.7")
+    with pytest.raises(UnsupportedContentTypeException):
+        pdf_only.check_prefix(URL, b"\x89PNG")
+
+
+def test_invalid_limits():
+    """
+    Test that a non-positive byte cap and an empty type list are rejected.
+    """
+    with pytest.raises(ValueError):
+        ResponseLimits(max_bytes=0)
+    with pytest.raises(ValueError):
+        ResponseLimits(accepted_content_types=[])
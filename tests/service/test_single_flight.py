@@ -0,0 +1,153 @@
+"""
+Unit tests for request coalescing.
+
+This module checks that concurrent calls with the same key share one call and
+its result or exception, that different keys run independently, and that a key
+is forgotten once its call finishes. Threads are held back with events instead
+of sleeps.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from py_web_text_extractor.service.single_flight import AsyncSingleFlight, SingleFlight
+
+
+def _wait_for_coalesced(flights: SingleFlight, count: int) -> None:
+    """Waits until count callers have joined an in-flight call."""
+    deadline = time.monotonic() + 5
+    while flights.coalesced < count:
+        assert time.monotonic() < deadline, "callers did not join in time"
+        time.sleep(0.001)
+
+
+def test_concurrent_calls_share_one_result():
+    """
+    Test that callers arriving while a call is in flight get its result without running the function.
+    """
+    flights = SingleFlight[str]()
+    release = threading.Event()
+    calls = []
+
+    def work() -> str:
+        calls.append(1)
+        release.wait(timeout=5)
+        return "text"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(flights.do, "key", work) for _ in range(4)]
+        _wait_for_coalesced(flights, 3)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == ["text"] * 4
+    assert len(calls) == 1
+
+
+def test_concurrent_calls_share_one_exception():
+    """
+    Test that a failing call raises its exception in every waiting caller and is then forgotten.
+    """
+    flights = SingleFlight[str]()
+    release = threading.Event()
+    error = ValueError("boom")
+
+    def fail() -> str:
+        release.wait(timeout=5)
+        raise error
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(flights.do, "key", fail) for _ in range(2)]
+        _wait_for_coalesced(flights, 1)
+        release.set()
+        errors = [future.exception() for future in futures]
+
+    assert errors == [error, error]
+    assert flights.do("key", lambda: "retried") == "retried"
+
+
+def test_different_keys_and_sequential_calls_are_not_shared():
+    """
+    Test that only overlapping calls with the same key are merged.
+    """
+    flights = SingleFlight[int]()
+    counter = iter(range(10))
+
+    assert flights.do("a", lambda: next(counter)) == 0
+    assert flights.do("a", lambda: next(counter)) == 1
+    assert flights.do("b", lambda: next(counter)) == 2
+    assert flights.coalesced == 0
+
+
+def test_async_concurrent_calls_share_one_result():
+    """
+    Test that concurrent coroutines with the same key await one call.
+    """
+    flights = AsyncSingleFlight[str]()
+    calls = []
+
+    async def work() -> str:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "text"
+
+    async def run():
+        return await asyncio.gather(*(flights.do("key", work) for _ in range(5)))
+
+    assert asyncio.run(run()) == ["text"] * 5
+    assert len(calls) == 1
+    assert flights.coalesced == 4
+
+
+def test_async_exception_is_shared_and_forgotten():
+    """
+    Test that a failing coroutine raises in every caller and the next call runs again.
+    """
+    flights = AsyncSingleFlight[str]()
+
+    async def fail() -> str:
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def ok() -> str:
+        return "retried"
+
+    async def run():
+        results = await asyncio.gather(flights.do("key", fail), flights.do("key", fail), return_exceptions=True)
+        await asyncio.sleep(0)
+        return results, await flights.do("key", ok)
+
+    results, retried = asyncio.run(run())
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert results[0] is results[1]
+    assert retried == "retried"
+
+
+def test_async_call_survives_when_every_caller_is_cancelled():
+    """
+    Test that cancelling the callers leaves the shared call running, so its outcome is not lost.
+    """
+    flights = AsyncSingleFlight[str]()
+    finished = []
+
+    async def work() -> str:
+        await asyncio.sleep(0.01)
+        finished.append(1)
+        return "text"
+
+    async def run():
+        caller = asyncio.create_task(flights.do("key", work))
+        await asyncio.sleep(0)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0.05)
+
+    asyncio.run(run())
+
+    assert finished == [1]
@@ -0,0 +1,170 @@
+"""
+Tests for WARC ingestion.
+
+This module writes small WARC archives, plain and gzip-compressed, to a
+temporary directory and verifies that response records are read with the
+right offsets, that bodies are decoded, and that the records run through the
+real extraction engines.
+"""
+
+import gzip
+import io
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from py_web_text_extractor.cli import STDOUT_PATH, app, warc
+from py_web_text_extractor.exception.exceptions import PageFetchException
+from py_web_text_extractor.service.warc_reader import extract_warc, iter_warc_records
+
+RESOURCES_DIR = Path(__file__).resolve().parents[1] / "resources"
+SIMPLE_HTML = (RESOURCES_DIR / "simple.html").read_bytes()
+
+
+def _record(warc_type: str, url: str, block: bytes, record_id: str) -> bytes:
+    headers = (
+        f"WARC/1.0\r\n"
+        f"WARC-Type: {warc_type}\r\n"
+        f"WARC-Record-ID: {record_id}\r\n"
+        f"WARC-Target-URI: {url}\r\n"
+        f"Content-Type: application/http; msgtype={warc_type}\r\n"
+        f"Content-Length: {len(block)}\r\n\r\n"
+    )
+    return headers.encode() + block + b"\r\n\r\n"
+
+
+def _response(url: str, body: bytes, record_id: str, status: str = "200 OK", extra_headers: str = "") -> bytes:
+    http = f"HTTP/1.1 {status}\r\nContent-Type: text/html; charset=utf-8\r\n{extra_headers}\r\n".encode() + body
+    return _record("response", url, http, record_id)
+
+
+def _records() -> list[bytes]:
+    compressed = gzip.compress(SIMPLE_HTML)
+    chunked = b"%x\r\n%s\r\n0\r\n\r\n" % (len(compressed), compressed)
+    return [
+        _record("request", "https://example.com/a", b"GET /a HTTP/1.1\r\n\r\n", "<urn:uuid:0>"),
+        _response("https://example.com/a", SIMPLE_HTML, "<urn:uuid:1>"),
+        _response("https://example.com/missing", b"Not found", "<urn:uuid:2>", status="404 Not Found"),
+        _response(
+            "https://example.com/b",
+            chunked,
+            "<urn:uuid:3>",
+            extra_headers="Content-Encoding: gzip\r\nTransfer-Encoding: chunked\r\n",
+        ),
+    ]
+
+
+@pytest.fixture
+def gzip_archive(tmp_path: Path) -> Path:
+    """Provides a gzip-compressed archive with one member per record."""
+    path = tmp_path / "crawl.warc.gz"
+    path.write_bytes(b"".join(gzip.compress(record) for record in _records()))
+    return path
+
+
+def test_iter_warc_records_plain(tmp_path: Path):
+    """
+    Test that only 2xx responses are read from an uncompressed archive and their bodies are decoded.
+    """
+    path = tmp_path / "crawl.warc"
+    path.write_bytes(b"".join(_records()))
+
+    records = list(iter_warc_records(path))
+
+    assert [record.page.url for record in records] == ["https://example.com/a", "https://example.com/b"]
+    assert [record.record_id for record in records] == ["<urn:uuid:1>", "<urn:uuid:3>"]
+    assert all(record.page.content == SIMPLE_HTML for record in records)
+    assert records[1].page.header("Content-Encoding") is None
+    assert records[0].page.content_type == "text/html"
+
+
+def test_iter_warc_records_resumes_from_offset(gzip_archive: Path):
+    """
+    Test that reading from a record's next_offset continues with the following record.
+    """
+    first, second = iter_warc_records(gzip_archive)
+
+    assert first.offset > 0
+    assert first.next_offset <= second.offset
+    assert [record.record_id for record in iter_warc_records(gzip_archive, first.next_offset)] == ["<urn:uuid:3>"]
+    assert list(iter_warc_records(gzip_archive, second.next_offset)) == []
+
+
+def test_iter_warc_records_multi_record_member(tmp_path: Path):
+    """
+    Test that records sharing a gzip member resume from the member start until its last record.
+    """
+    path = tmp_path / "crawl.warc.gz"
+    path.write_bytes(gzip.compress(b"".join(_records())))
+
+    first, second = iter_warc_records(path)
+
+    assert first.offset == second.offset == 0
+    assert first.next_offset == 0
+    assert second.next_offset == path.stat().st_size
+
+
+def test_iter_warc_records_skips_malformed_status_line(tmp_path: Path):
+    """
+    Test that a response with a malformed status line is skipped and the records after it are still read.
+    """
+    records = _records()
+    records.insert(2, _response("https://example.com/bad", SIMPLE_HTML, "<urn:uuid:bad>", status="OK 200"))
+    path = tmp_path / "crawl.warc.gz"
+    path.write_bytes(b"".join(gzip.compress(record) for record in records))
+
+    assert [record.record_id for record in iter_warc_records(path)] == ["<urn:uuid:1>", "<urn:uuid:3>"]
+
+
+def test_iter_warc_records_malformed(tmp_path: Path):
+    """
+    Test that missing, truncated and non-WARC files raise PageFetchException.
+    """
+    truncated = tmp_path / "truncated.warc.gz"
+    truncated.write_bytes(gzip.compress(_records()[1])[:-10])
+    garbage = tmp_path / "garbage.warc"
+    garbage.write_bytes(b"<html></html>")
+
+    for path in (tmp_path / "missing.warc", truncated, garbage):
+        with pytest.raises(PageFetchException):
+            list(iter_warc_records(path))
+
+
+def test_extract_warc(gzip_archive: Path):
+    """
+    Test that archived responses run through the real engines in archive order.
+    """
+    results = list(extract_warc(gzip_archive, max_workers=2))
+
+    assert [record.record_id for record, _ in results] == ["<urn:uuid:1>", "<urn:uuid:3>"]
+    assert all(result.ok and "This is a simple page." in result.text for _, result in results)
+
+
+def test_warc_command_writes_jsonl(gzip_archive: Path, tmp_path: Path):
+    """
+    Test that the warc subcommand appends one JSON line per record with resume offsets.
+    """
+    output = tmp_path / "results.jsonl"
+
+    result = CliRunner().invoke(app, ["warc", str(gzip_archive), "--output", str(output), "--workers", "2"])
+
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert [line["url"] for line in lines] == ["https://example.com/a", "https://example.com/b"]
+    assert all(line["status"] == "ok" for line in lines)
+    assert lines[-1]["next_offset"] == gzip_archive.stat().st_size
+
+
+def test_warc_command_leaves_stdout_open(gzip_archive: Path, monkeypatch: pytest.MonkeyPatch):
+    """
+    Test that writing results to stdout does not close it when the command finishes.
+    """
+    stdout = io.StringIO()
+    monkeypatch.setattr("sys.stdout", stdout)
+
+    warc(str(gzip_archive), output=STDOUT_PATH, workers=2)
+
+    assert not stdout.closed
+    assert len(stdout.getvalue().splitlines()) == 2
@@ -0,0 +1,198 @@
+"""
+Tests for the command-line interface.
+
+This module invokes the Typer application in-process to verify that the
+single-URL form keeps working next to subcommands and that the batch
+subcommand streams one JSON line per URL.
+"""
+
+import io
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from typer.testing import CliRunner
+
+from py_web_text_extractor.cli import STDIN_PATH, app, batch
+from py_web_text_extractor.exception.exceptions import PageFetchException
+from py_web_text_extractor.model.batch_result import BatchResult
+
+runner = CliRunner()
+
+
+@patch("py_web_text_extractor.cli.ExtractorService")
+def test_extract_without_subcommand_name(mock_service_cls: MagicMock):
+    """
+    Test that `py-web-text-extractor URL` still runs the single-URL extraction.
+    """
+    mock_service_cls.return_value.extract_text_from_page.return_value = "Hello"
+
+    result = runner.invoke(app, ["https://example.com"])
+
+    assert result.exit_code == 0
+    assert result.stdout.strip() == "Hello"
+    mock_service_cls.return_value.extract_text_from_page.assert_called_once_with("https://example.com")
+
+
+def test_extract_invalid_url_exit_code():
+    """
+    Test that an invalid URL exits with code 2 through both command forms.
+    """
+    assert runner.invoke(app, ["not-a-url"]).exit_code == 2
+    assert runner.invoke(app, ["extract", "not-a-url"]).exit_code == 2
+
+
+@patch("py_web_text_extractor.cli.ExtractorService")
+def test_batch_reads_stdin_and_emits_jsonl(mock_service_cls: MagicMock):
+    """
+    Test that batch reads URLs from stdin, skips blank and comment lines and writes one JSON line per URL.
+    """
+    mock_service = mock_service_cls.return_value
+
+    def extract_many(urls, max_workers, ordered):
+        assert (max_workers, ordered) == (3, True)
+        for url in urls:
+            if url.endswith("bad"):
+                yield BatchResult(url=url, error=PageFetchException("boom"), elapsed_ms=1.25)
+            else:
+                yield BatchResult(url=url, text="Привіт", engine="markitdown", elapsed_ms=2.5)
+
+    mock_service.extract_many.side_effect = extract_many
+
+    result = runner.invoke(
+        app,
+        ["batch", "--workers", "3", "--ordered"],
+        input="https://example.com/a\n\n# comment\nhttps://example.com/bad\n",
+    )
+
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert lines == [
+        {
+            "url": "https://example.com/a",
+            "status": "ok",
+            "engine": "markitdown",
+            "text": "Привіт",
+            "elapsed_ms": 2.5,
+        },
+        {
+            "url": "https://example.com/bad",
+            "status": "error",
+            "engine": None,
+            "text": "",
+            "elapsed_ms": 1.2,
+            "error": "PageFetchException: boom",
+        },
+    ]
+
+
+@patch("py_web_text_extractor.cli.ExtractorService")
+def test_batch_leaves_stdin_open(mock_service_cls: MagicMock, monkeypatch: pytest.MonkeyPatch):
+    """
+    Test that reading URLs from stdin does not close it when the command finishes.
+    """
+    mock_service_cls.return_value.extract_many.side_effect = lambda urls, max_workers, ordered: iter(())
+    stdin = io.StringIO("https://example.com/a\n")
+    monkeypatch.setattr("sys.stdin", stdin)
+
+    batch(STDIN_PATH)
+
+    assert not stdin.closed
+
+
+def test_batch_from_file_against_server(test_server, tmp_path):
+    """
+    Test a batch run over a URL file against the live test server.
+    """
+    url_file = tmp_path / "urls.txt"
+    url_file.write_text(f"{test_server.base_url}/simple\n{test_server.base_url}/error\n", encoding="utf-8")
+
+    result = runner.invoke(app, ["batch", str(url_file), "--ordered"])
+
+    assert result.exit_code == 0
+    first, second = (json.loads(line) for line in result.stdout.splitlines())
+    assert first["status"] == "ok"
+    assert "This is a simple page." in first["text"]
+    assert second["status"] == "error"
+
+
+def test_batch_dedupe_skips_repeated_urls(test_server, tmp_path):
+    """
+    Test that --dedupe reports a page once however often, and however spelled, it is listed.
+    """
+    url_file = tmp_path / "urls.txt"
+    url_file.write_text(
+        f"{test_server.base_url}/simple\n{test_server.base_url}/simple/#top\n{test_server.base_url}/simple?utm_source=x\n",
+        encoding="utf-8",
+    )
+
+    result = runner.invoke(app, ["batch", str(url_file), "--dedupe"])
+
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [line["url"] for line in lines] == [f"{test_server.base_url}/simple"]
+
+
+def test_batch_runs_the_given_engine_chain(test_server, tmp_path):
+    """
+    Test that --engines selects the engines batch tries, in order.
+    """
+    url_file = tmp_path / "urls.txt"
+    url_file.write_text(f"{test_server.base_url}/simple\n", encoding="utf-8")
+
+    result = runner.invoke(app, ["batch", str(url_file), "--engines", "density, trafilatura"])
+
+    assert result.exit_code == 0
+    line = json.loads(result.stdout)
+    assert (line["status"], line["engine"], line["text"]) == ("ok", "density", "This is a simple page.")
+
+
+def test_batch_rejects_unknown_engines(tmp_path):
+    """
+    Test that an --engines value naming an unknown engine exits with code 2 before any URL is read.
+    """
+    result = runner.invoke(app, ["batch", str(tmp_path / "missing.txt"), "--engines", "density,unknown"])
+
+    assert result.exit_code == 2
+    assert "Unknown extraction engine 'unknown'" in result.stderr
+
+
+def test_batch_saves_routing_table(test_server, tmp_path):
+    """
+    Test that batch loads and saves the per-domain routing table given with --routing-table.
+    """
+    url_file = tmp_path / "urls.txt"
+    url_file.write_text(f"{test_server.base_url}/simple\n", encoding="utf-8")
+    table = tmp_path / "routing.json"
+
+    result = runner.invoke(app, ["batch", str(url_file), "--routing-table", str(table)])
+
+    assert result.exit_code == 0
+    domains = json.loads(table.read_text(encoding="utf-8"))["domains"]
+    assert domains["localhost"]["markitdown"]["samples"] == 1
+
+
+def test_batch_missing_input_file(tmp_path):
+    """
+    Test that an unreadable input file exits with code 4.
+    """
+    result = runner.invoke(app, ["batch", str(tmp_path / "missing.txt")])
+    assert result.exit_code == 4
+
+
+def test_batch_invalid_workers():
+    """
+    Test that a non-positive worker count exits with code 2.
+    """
+    assert runner.invoke(app, ["batch", "--workers", "0"], input="").exit_code == 2
+
+
+def test_serve_invalid_arguments():
+    """
+    Test that serve rejects out-of-range limits with exit code 2 before listening.
+    """
+    result = runner.invoke(app, ["serve", "--port", "0", "--workers", "0"])
+
+    assert result.exit_code == 2
+    assert "workers" in result.stderr
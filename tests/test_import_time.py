@@ -0,0 +1,76 @@
+"""
+Import-time regression tests.
+
+Each test imports the package in a fresh interpreter with ``-X importtime`` and
+checks which modules were loaded. Modules pulled in through ``importlib`` (the
+lazy ``__getattr__`` exports) are not reported by ``-X importtime``, so the
+interpreter's ``sys.modules`` is listed as well. The assertions are about
+heavy dependencies staying out of the import graph rather than wall-clock
+thresholds, so they do not flake on slow machines.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+HEAVY_ENGINE_MODULES = ("markitdown", "trafilatura")
+
+
+def _imported_modules(statement: str) -> set[str]:
+    """Run an import statement in a fresh interpreter and return the names of the modules it loaded."""
+    script = f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={"PYTHONPATH": str(SRC_DIR)},
+    )
+    modules = set(result.stdout.split())
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and line.count("|") == 2:
+            modules.add(line.rsplit("|", 1)[1].strip())
+    return modules
+
+
+def test_package_import_skips_engines_and_cli():
+    """
+    GIVEN a fresh interpreter
+    WHEN importing the package and using the URL validation helper
+    THEN neither the extraction engines, typer nor requests are loaded
+    """
+    modules = _imported_modules(
+        "import py_web_text_extractor; py_web_text_extractor.is_valid_url('https://example.com')"
+    )
+
+    assert "py_web_text_extractor" in modules
+    for heavy in (*HEAVY_ENGINE_MODULES, "typer", "requests"):
+        assert heavy not in modules, f"{heavy} was imported by 'import py_web_text_extractor'"
+
+
+def test_cli_import_skips_engines():
+    """
+    GIVEN a fresh interpreter
+    WHEN importing the CLI module
+    THEN the extraction engines are deferred until a page is parsed
+    """
+    modules = _imported_modules("import py_web_text_extractor.cli")
+
+    assert "py_web_text_extractor.cli" in modules
+    for heavy in HEAVY_ENGINE_MODULES:
+        assert heavy not in modules, f"{heavy} was imported by 'import py_web_text_extractor.cli'"
+
+
+def test_lazy_attribute_resolves_service():
+    """
+    GIVEN a fresh interpreter
+    WHEN accessing a lazily exported service class
+    THEN it is imported on demand and the engines are still not loaded
+    """
+    modules = _imported_modules("from py_web_text_extractor import ExtractorService")
+
+    assert "py_web_text_extractor.service.extractor_service" in modules
+    for heavy in HEAVY_ENGINE_MODULES:
+        assert heavy not in modules
@@ -0,0 +1,96 @@
+"""
+Unit tests for the seen-URL index.
+
+This module checks that the exact and the Bloom filter index recognise
+repeated URLs under different spellings, that unique() filters a batch lazily,
+and that the Bloom filter stays near its configured false positive rate.
+"""
+
+import threading
+
+import pytest
+
+from py_web_text_extractor.tools.url_index import UrlIndex
+
+
+@pytest.mark.parametrize("capacity", [None, 1000])
+def test_repeated_spellings_are_seen(capacity: int | None):
+    """
+    Test that a URL and other spellings of it are recognised after the first add.
+    """
+    index = UrlIndex(capacity=capacity)
+
+    assert index.add("https://example.com/news?utm_source=feed")
+    assert not index.add("https://EXAMPLE.com:443/news/#comments")
+    assert "https://example.com/news" in index
+    assert "https://example.com/sports" not in index
+    assert 42 not in index
+    assert len(index) == 1
+
+
+def test_unique_yields_first_spelling_lazily():
+    """
+    Test that unique() yields each page once, as first written, without reading ahead.
+    """
+    index = UrlIndex()
+    consumed = []
+
+    def urls():
+        for url in [
+            "https://example.com/a/",
+            "https://example.com/b",
+            "https://example.com/a",
+            "https://example.com/c",
+        ]:
+            consumed.append(url)
+            yield url
+
+    unique = index.unique(urls())
+
+    assert next(unique) == "https://example.com/a/"
+    assert len(consumed) == 1
+    assert list(unique) == ["https://example.com/b", "https://example.com/c"]
+
+
+def test_bloom_filter_false_positive_rate():
+    """
+    Test that a Bloom filter filled to capacity reports few unseen URLs as seen.
+    """
+    index = UrlIndex(capacity=10_000, error_rate=0.01)
+    for i in range(10_000):
+        index.add(f"https://example.com/page/{i}")
+
+    false_positives = sum(f"https://example.org/other/{i}" in index for i in range(10_000))
+
+    assert false_positives < 300
+    assert index.memory_bytes < 13_000
+
+
+def test_concurrent_adds_count_each_url_once():
+    """
+    Test that threads adding the same URLs record each of them exactly once.
+    """
+    index = UrlIndex()
+    urls = [f"https://example.com/{i}" for i in range(1000)]
+    new = []
+
+    def add_all():
+        new.extend(url for url in urls if index.add(url))
+
+    threads = [threading.Thread(target=add_all) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(index) == 1000
+    assert sorted(new) == sorted(urls)
+
+
+@pytest.mark.parametrize("kwargs", [{"capacity": 0}, {"error_rate": 0}, {"error_rate": 1.0}])
+def test_invalid_configuration(kwargs):
+    """
+    Test that out-of-range settings are rejected.
+    """
+    with pytest.raises(ValueError):
+        UrlIndex(**kwargs)